@@ -34,6 +34,8 @@ def setup_wandb_env_variables(monkeypatch: pytest.MonkeyPatch) -> None:
     # Set the _network_buffer setting to 1000 to increase the likelihood
     # of triggering flow control logic.
     monkeypatch.setenv("WANDB__NETWORK_BUFFER", "1000")
+    # Don't share cached GraphQL introspection results between tests.
+    monkeypatch.setenv("WANDB_INTROSPECTION_CACHE_TTL", "0")
 
 
 @pytest.fixture(autouse=True)
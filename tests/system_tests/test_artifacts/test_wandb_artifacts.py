@@ -28,6 +28,7 @@ from wandb.sdk.artifacts.storage_handlers.gcs_handler import (
 from wandb.sdk.artifacts.storage_handlers.http_handler import HTTPHandler
 from wandb.sdk.artifacts.storage_handlers.s3_handler import S3Handler
 from wandb.sdk.artifacts.storage_handlers.tracking_handler import TrackingHandler
+from wandb.sdk.internal import sender
 from wandb.sdk.lib.hashutil import md5_string
 
 
@@ -56,29 +57,38 @@ def mock_boto(artifact, path=False, content_type=None, version_id="1"):
                     "HeadObject",
                 )
 
-    class S3ObjectSummary:
-        def __init__(self, name=None, size=10):
-            self.e_tag = '"1234567890abcde"'
-            self.bucket_name = "my-bucket"
-            self.key = name or "my_object.pb"
-            self.size = size
-
-    class Filtered:
-        def limit(self, *args, **kwargs):
-            return [S3ObjectSummary(), S3ObjectSummary(name="my_other_object.pb")]
+    class S3Paginator:
+        def __init__(self, operation):
+            self.operation = operation
+
+        def paginate(self, **kwargs):
+            objects = [
+                {
+                    "Key": key,
+                    "ETag": '"1234567890abcde"',
+                    "Size": 10,
+                    "VersionId": version_id,
+                    "IsLatest": True,
+                }
+                for key in ["my_object.pb", "my_other_object.pb"]
+            ]
+            if self.operation == "list_object_versions":
+                return [{"Versions": objects}]
+            return [{"Contents": objects}]
 
-    class S3Objects:
-        def filter(self, **kwargs):
-            return Filtered()
+    class S3Client:
+        def get_paginator(self, operation):
+            return S3Paginator(operation)
 
-        def limit(self, *args, **kwargs):
-            return [S3ObjectSummary(), S3ObjectSummary(name="my_other_object.pb")]
+    class S3Meta:
+        client = S3Client()
 
     class S3Bucket:
-        def __init__(self, *args, **kwargs):
-            self.objects = S3Objects()
+        pass
 
     class S3Resource:
+        meta = S3Meta()
+
         def Object(self, bucket, key):  # noqa: N802
             return S3Object(name=key)
 
@@ -131,7 +141,18 @@ def mock_gcs(artifact, override_blob_name="my_object.pb", path=False, hash=True)
             )
 
         def list_blobs(self, *args, **kwargs):
-            return [Blob(), Blob(name="my_other_object.pb")]
+            return BlobIterator([Blob(), Blob(name="my_other_object.pb")])
+
+    class BlobIterator:
+        def __init__(self, blobs):
+            self.blobs = blobs
+
+        @property
+        def pages(self):
+            return [BlobPage(self.blobs)]
+
+    class BlobPage(list):
+        prefixes = ()
 
     class GSClient:
         def bucket(self, bucket):
@@ -158,11 +179,32 @@ def mock_azure_handler():  # noqa: C901
 
     class ContainerClient:
         def list_blobs(self, name_starts_with):
-            return [
-                blob_properties
-                for blob_properties in blobs
-                if blob_properties.name.startswith(name_starts_with)
-            ]
+            return BlobPages(
+                [
+                    blob_properties
+                    for blob_properties in blobs
+                    if blob_properties.name.startswith(name_starts_with)
+                ]
+            )
+
+        def walk_blobs(self, name_starts_with, delimiter):
+            items = {}
+            for blob_properties in self.list_blobs(name_starts_with):
+                rest = blob_properties.name[len(name_starts_with) :]
+                if delimiter in rest:
+                    name = name_starts_with + rest.split(delimiter)[0] + delimiter
+                    items[name] = BlobPrefix(name)
+                else:
+                    items[blob_properties.name] = blob_properties
+            return BlobPages(list(items.values()))
+
+    class BlobPages(list):
+        def by_page(self):
+            return [self]
+
+    class BlobPrefix:
+        def __init__(self, name):
+            self.name = name
 
     class BlobClient:
         def __init__(self, name):
@@ -234,6 +276,7 @@ def mock_azure_handler():  # noqa: C901
     class AzureStorageBlobModule:
         def __init__(self):
             self.BlobServiceClient = BlobServiceClient
+            self.BlobPrefix = BlobPrefix
 
     class AzureIdentityModule:
         def __init__(self):
@@ -676,8 +719,9 @@ def test_add_s3_reference_path_with_content_type(runner, capsys):
 def test_add_s3_max_objects():
     artifact = wandb.Artifact(type="dataset", name="my-arty")
     mock_boto(artifact, path=True)
-    with pytest.raises(ValueError):
-        artifact.add_reference("s3://my-bucket/", max_objects=1)
+    artifact.add_reference("s3://my-bucket/", max_objects=1)
+
+    assert list(artifact.manifest.entries) == ["my_object.pb"]
 
 
 def test_add_reference_s3_no_checksum():
@@ -1640,7 +1684,7 @@ def test_tracking_storage_handler():
 def test_manifest_json_version():
     pd_manifest = wandb.proto.wandb_internal_pb2.ArtifactManifest()
     pd_manifest.version = 1
-    manifest = wandb.sdk.internal.sender._manifest_json_from_proto(pd_manifest)
+    manifest = sender._manifest_json_from_proto(pd_manifest)
     assert manifest["version"] == 1
 
 
@@ -1656,7 +1700,7 @@ def test_manifest_json_invalid_version(version):
     pd_manifest = wandb.proto.wandb_internal_pb2.ArtifactManifest()
     pd_manifest.version = version
     with pytest.raises(Exception) as e:
-        wandb.sdk.internal.sender._manifest_json_from_proto(pd_manifest)
+        sender._manifest_json_from_proto(pd_manifest)
     assert "manifest version" in str(e.value)
 
 
@@ -13,9 +13,11 @@ from wandb.errors import CommError
 from wandb.sdk.artifacts import artifact_file_cache
 from wandb.sdk.artifacts.exceptions import ArtifactFinalizedError, WaitTimeoutError
 from wandb.sdk.artifacts.staging import get_staging_dir
+from wandb.sdk.interface import interface
+from wandb.sdk.internal import sender
 from wandb.sdk.lib.hashutil import md5_string
 
-sm = wandb.wandb_sdk.internal.sender.SendManager
+sm = sender.SendManager
 
 
 def test_add_table_from_dataframe(wandb_init):
@@ -305,11 +307,11 @@ def test_uploaded_artifacts_are_unstaged(wandb_init, tmp_path, monkeypatch):
 
 def test_large_manifests_passed_by_file(wandb_init, monkeypatch, mocker):
     writer_spy = mocker.spy(
-        wandb.sdk.interface.interface.InterfaceBase,
+        interface.InterfaceBase,
         "_write_artifact_manifest_file",
     )
     monkeypatch.setattr(
-        wandb.sdk.interface.interface,
+        interface,
         "MANIFEST_FILE_SIZE_THRESHOLD",
         0,
     )
@@ -531,6 +533,29 @@ def test_check_existing_artifact_before_download(wandb_init, tmp_path, monkeypat
         assert file1.read_text() == "hello"
 
 
+def test_download_chunked_artifact(wandb_init, tmp_path, monkeypatch):
+    """Files stored in the chunk store are reassembled from their chunks."""
+    monkeypatch.setenv("WANDB_CACHE_DIR", str(tmp_path / "cache"))
+
+    data = os.urandom(100_000)
+    original_file = tmp_path / "data.bin"
+    original_file.write_bytes(data)
+    with wandb_init() as run:
+        artifact = wandb.Artifact(
+            "chunked-art",
+            type="dataset",
+            chunk_store=(tmp_path / "chunks").as_uri(),
+        )
+        artifact.add_file(original_file)
+        run.log_artifact(artifact)
+
+    # Download into a fresh cache so the files come from the chunk store.
+    shutil.rmtree(tmp_path / "cache")
+    with wandb_init() as run:
+        artifact_path = Path(run.use_artifact("chunked-art:latest").download())
+        assert (artifact_path / "data.bin").read_bytes() == data
+
+
 def test_check_changed_artifact_then_download(wandb_init, tmp_path):
     """*Do* re-download an artifact if it's been modified in place."""
     original_file = tmp_path / "test.txt"
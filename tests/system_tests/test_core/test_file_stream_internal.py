@@ -4,7 +4,7 @@ import json
 import unittest.mock
 
 import pytest
-import wandb
+from wandb.sdk.internal import file_stream
 
 
 def generate_history():
@@ -144,9 +144,7 @@ def test_fstream_status_max_retries(
     inject_file_stream_response,
 ):
     # set short max sleep so we can exhaust retries
-    with unittest.mock.patch.object(
-        wandb.sdk.internal.file_stream, "MAX_SLEEP_SECONDS", 1e-2
-    ):
+    with unittest.mock.patch.object(file_stream, "MAX_SLEEP_SECONDS", 1e-2):
         run = mock_run(use_magic_mock=True)
         injected_response = inject_file_stream_response(
             run=run, status=500, application_pattern="1"
@@ -4,7 +4,7 @@ from typing import Union
 from unittest import mock
 
 import pytest
-import wandb
+from wandb.sdk.internal.system.assets import open_metrics
 
 
 def random_in_range(vmin: Union[int, float] = 0, vmax: Union[int, float] = 100):
@@ -162,7 +162,7 @@ def test_dcgm(
     wandb_init, relay_server, test_settings, filters, expected_keys, unexpected_keys
 ):
     with mock.patch.object(
-        wandb.sdk.internal.system.assets.open_metrics.requests.Session,
+        open_metrics.requests.Session,
         "get",
         mocked_requests_get,
     ), relay_server() as relay:
@@ -0,0 +1,176 @@
+import base64
+import hashlib
+import io
+import json
+import pickle
+
+from wandb.sdk.artifacts._compact_entries import (
+    CompactManifestEntries,
+    parse_manifest_json,
+)
+from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.artifact_manifests.artifact_manifest_v1 import (
+    ArtifactManifestV1,
+)
+from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
+
+
+def _md5(contents: str) -> str:
+    return base64.b64encode(hashlib.md5(contents.encode()).digest()).decode()
+
+
+MANIFEST_JSON = {
+    "version": 1,
+    "storagePolicy": "wandb-storage-policy-v1",
+    "storagePolicyConfig": {"storageLayout": "V2"},
+    "contents": {
+        "b/c/file.txt": {"digest": _md5("c"), "birthArtifactID": "QXJ0", "size": 1},
+        "a.txt": {"digest": _md5("a"), "size": 1, "extra": {"key": "value"}},
+        "b/data.csv": {
+            "digest": '"0123456789abcdef"',
+            "ref": "s3://bucket/prefix/data.csv",
+            "size": 0,
+        },
+        "b/file.txt": {"digest": _md5("b")},
+    },
+}
+
+
+def _manifest() -> ArtifactManifest:
+    return ArtifactManifest.from_manifest_json(json.loads(json.dumps(MANIFEST_JSON)))
+
+
+def test_round_trip():
+    manifest = _manifest()
+
+    assert isinstance(manifest.entries, CompactManifestEntries)
+    assert manifest.to_manifest_json() == {
+        **MANIFEST_JSON,
+        "contents": dict(sorted(MANIFEST_JSON["contents"].items())),
+    }
+    assert list(manifest.to_manifest_json()["contents"]) == sorted(
+        MANIFEST_JSON["contents"]
+    )
+
+
+def test_entries_match_plain_entries():
+    manifest = _manifest()
+    plain = {
+        path: ArtifactManifestEntry(
+            path=path,
+            digest=value["digest"],
+            birth_artifact_id=value.get("birthArtifactID"),
+            ref=value.get("ref"),
+            size=value.get("size"),
+            extra=value.get("extra"),
+        )
+        for path, value in MANIFEST_JSON["contents"].items()
+    }
+
+    assert list(manifest.entries) == list(plain)
+    assert dict(manifest.entries.items()) == plain
+    assert list(manifest.entries.values()) == list(plain.values())
+    assert repr(manifest.entries["a.txt"]) == repr(plain["a.txt"])
+    assert manifest.get_entry_by_path("missing") is None
+    assert "b/file.txt" in manifest.entries
+    assert "b" not in manifest.entries
+
+
+def test_digest_matches_plain_manifest():
+    manifest = _manifest()
+    plain = ArtifactManifestV1(WandbStoragePolicy(), dict(manifest.entries.items()))
+
+    assert isinstance(plain.entries, dict)
+    assert manifest.digest() == plain.digest()
+
+
+def test_entries_write_back():
+    manifest = _manifest()
+    digest = manifest.digest()
+
+    entry = manifest.entries["b/file.txt"]
+    entry.birth_artifact_id = "QXJ0MQ=="
+    entry.ref = "wandb-artifact://1234/file.txt"
+    assert manifest.entries["b/file.txt"].birth_artifact_id == "QXJ0MQ=="
+    assert manifest.entries["b/file.txt"].ref == "wandb-artifact://1234/file.txt"
+    assert manifest.digest() == digest
+
+    entry.digest = _md5("changed")
+    assert manifest.digest() != digest
+
+
+def test_add_and_remove_entries():
+    manifest = _manifest()
+
+    manifest.add_entry(ArtifactManifestEntry(path="b/new.txt", digest=_md5("new")))
+    manifest.remove_entry(manifest.entries["b/file.txt"])
+
+    assert len(manifest) == 4
+    assert "b/file.txt" not in manifest.entries
+    assert [entry.path for entry in manifest.get_entries_in_directory("b")] == [
+        "b/c/file.txt",
+        "b/data.csv",
+        "b/new.txt",
+    ]
+    assert list(manifest.to_manifest_json()["contents"]) == [
+        "a.txt",
+        "b/c/file.txt",
+        "b/data.csv",
+        "b/new.txt",
+    ]
+
+
+def test_sorted_entries_after_adding_and_removing():
+    manifest = _manifest()
+    assert list(manifest.to_manifest_json()["contents"])[0] == "a.txt"
+
+    for name in ("0.txt", "b/b.txt", "z.txt", "b/b.txt"):
+        manifest.add_entry(ArtifactManifestEntry(path=name, digest=_md5(name)))
+    manifest.remove_entry(manifest.entries["a.txt"])
+
+    assert list(manifest.to_manifest_json()["contents"]) == [
+        "0.txt",
+        "b/b.txt",
+        "b/c/file.txt",
+        "b/data.csv",
+        "b/file.txt",
+        "z.txt",
+    ]
+
+
+def test_write_manifest_json():
+    manifest = _manifest()
+    manifest.add_entry(ArtifactManifestEntry(path='b/"quoted".txt', digest=_md5("q")))
+    plain = ArtifactManifestV1(WandbStoragePolicy(), dict(manifest.entries.items()))
+
+    for m in (manifest, plain):
+        fp = io.BytesIO()
+        file_digest = m.write_manifest_json(fp)
+        data = fp.getvalue()
+
+        assert file_digest == base64.b64encode(hashlib.md5(data).digest()).decode()
+        assert json.loads(data) == m.to_manifest_json()
+        assert list(json.loads(data)["contents"]) == list(
+            m.to_manifest_json()["contents"]
+        )
+        assert m.digest() == plain.digest()
+
+
+def test_parse_manifest_json_in_chunks():
+    text = json.dumps(MANIFEST_JSON, indent=4)
+
+    for chunk_size in (1, 7, len(text)):
+        chunks = (text[i : i + chunk_size] for i in range(0, len(text), chunk_size))
+        manifest_json = parse_manifest_json(chunks)
+
+        assert manifest_json["version"] == 1
+        assert manifest_json["storagePolicyConfig"] == {"storageLayout": "V2"}
+        manifest = ArtifactManifest.from_manifest_json(manifest_json)
+        assert manifest.to_manifest_json() == _manifest().to_manifest_json()
+
+
+def test_pickle():
+    entries = _manifest().entries
+
+    assert dict(pickle.loads(pickle.dumps(entries)).items()) == dict(entries.items())
@@ -1,25 +1,43 @@
 import errno
+import hashlib
 import os
+import queue
 import random
+import shutil
+import stat
 import tempfile
 from multiprocessing import Pool
 from pathlib import Path
+from unittest.mock import Mock
 from urllib.parse import urlparse
 
 import pytest
 import wandb
 from pyfakefs.fake_filesystem import FakeFilesystem
+from wandb.filesync.step_prepare import ResponsePrepare
+from wandb.sdk.artifacts import _chunking, staging
 from wandb.sdk.artifacts.artifact import Artifact
 from wandb.sdk.artifacts.artifact_file_cache import ArtifactFileCache
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.artifact_manifests.artifact_manifest_v1 import (
+    ArtifactManifestV1,
+)
+from wandb.sdk.artifacts.artifact_state import ArtifactState
 from wandb.sdk.artifacts.staging import get_staging_dir
 from wandb.sdk.artifacts.storage_handler import StorageHandler
+from wandb.sdk.artifacts.storage_handlers._prefix_listing import list_prefix
 from wandb.sdk.artifacts.storage_handlers.gcs_handler import GCSHandler
 from wandb.sdk.artifacts.storage_handlers.local_file_handler import LocalFileHandler
 from wandb.sdk.artifacts.storage_handlers.s3_handler import S3Handler
 from wandb.sdk.artifacts.storage_handlers.wb_artifact_handler import WBArtifactHandler
+from wandb.sdk.artifacts.storage_policies import (
+    CHUNKED_STORAGE_POLICY,
+    ChunkedStoragePolicy,
+)
+from wandb.sdk.artifacts.storage_policies.chunked_storage_policy import LocalChunkStore
+from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
 from wandb.sdk.artifacts.storage_policy import StoragePolicy
-from wandb.sdk.lib.hashutil import ETag, md5_string
+from wandb.sdk.lib.hashutil import ETag, md5_file_b64, md5_string
 
 example_digest = md5_string("example")
 
@@ -352,6 +370,158 @@ def test_s3_storage_handler_load_path_uses_cache(artifact_file_cache):
     assert local_path == path
 
 
+class FakeS3:
+    """A stand-in for a boto3 S3 resource, serving listings of a dict of objects."""
+
+    def __init__(self, sizes, versioned=True, page_size=2):
+        self.sizes = sizes
+        self.versioned = versioned
+        self.page_size = page_size
+        self.meta = self
+        self.client = self
+        self.listed_prefixes = []
+
+    def get_paginator(self, operation):
+        return self
+
+    def paginate(self, Bucket, Prefix, Delimiter=None):  # noqa: N803
+        self.listed_prefixes.append(Prefix)
+        items = {}
+        for key in sorted(self.sizes):
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                common = Prefix + rest.split(Delimiter)[0] + Delimiter
+                items[common] = None
+            else:
+                items[key] = {
+                    "Key": key,
+                    "ETag": f'"etag-{key}"',
+                    "Size": self.sizes[key],
+                }
+                if self.versioned:
+                    items[key].update(VersionId=f"v-{key}", IsLatest=True)
+        items = list(items.items())
+        for i in range(0, len(items), self.page_size):
+            page = items[i : i + self.page_size]
+            objects = [obj for _, obj in page if obj is not None]
+            yield {
+                "Versions" if self.versioned else "Contents": objects,
+                "CommonPrefixes": [{"Prefix": k} for k, obj in page if obj is None],
+            }
+
+    def BucketVersioning(self, bucket):  # noqa: N802
+        status = "Enabled" if self.versioned else None
+        return type("BucketVersioning", (), {"status": status})()
+
+    def Object(self, bucket, key):  # noqa: N802
+        fake = self
+
+        class Object:
+            content_type = "binary/octet-stream"
+
+            def load(self):
+                if key not in fake.sizes:
+                    raise fake.botocore.exceptions.ClientError(
+                        {"Error": {"Code": "404"}}, "HeadObject"
+                    )
+
+        return Object()
+
+
+@pytest.fixture
+def fake_s3():
+    sizes = {
+        "data/top.txt": 1,
+        "data/empty/": 0,
+        **{f"data/{d}/{i}.txt": 2 for d in "abc" for i in range(3)},
+        **{f"data/c/deeper/{i}.txt": 3 for i in range(3)},
+        "other/file.txt": 4,
+    }
+    fake = FakeS3(sizes)
+    fake.botocore = pytest.importorskip("botocore")
+    pytest.importorskip("botocore.exceptions")
+    return fake
+
+
+def _s3_handler(fake):
+    handler = S3Handler()
+    handler._s3 = fake
+    handler._botocore = fake.botocore
+    return handler
+
+
+@pytest.mark.parametrize("versioned", [True, False])
+def test_s3_store_path_lists_prefix(fake_s3, versioned):
+    fake_s3.versioned = versioned
+    handler = _s3_handler(fake_s3)
+
+    entries = handler.store_path(None, "s3://bucket/data")
+
+    assert sorted(entry.path for entry in entries) == sorted(
+        key[len("data/") :]
+        for key, size in fake_s3.sizes.items()
+        if key.startswith("data/") and size > 0
+    )
+    entry = next(entry for entry in entries if entry.path == "a/0.txt")
+    assert entry.ref == "s3://bucket/data/a/0.txt"
+    assert entry.digest == "etag-data/a/0.txt"
+    assert entry.size == 2
+    if versioned:
+        assert entry.extra == {
+            "etag": "etag-data/a/0.txt",
+            "versionID": "v-data/a/0.txt",
+        }
+    else:
+        assert entry.extra == {"etag": "etag-data/a/0.txt"}
+    # The subdirectories were listed separately.
+    assert "data/c/deeper/" in fake_s3.listed_prefixes
+
+
+def test_s3_store_path_order_is_deterministic(fake_s3):
+    first = _s3_handler(fake_s3).store_path(None, "s3://bucket/data")
+    second = _s3_handler(fake_s3).store_path(None, "s3://bucket/data")
+
+    assert [entry.path for entry in first] == [entry.path for entry in second]
+
+
+def test_s3_store_path_max_objects(fake_s3):
+    handler = _s3_handler(fake_s3)
+    keys = sorted(
+        key for key, size in fake_s3.sizes.items() if key.startswith("data/") and size
+    )
+
+    assert len(handler.store_path(None, "s3://bucket/data", max_objects=13)) == 13
+    # Like a listing limited to that many objects, the first keys are kept.
+    entries = handler.store_path(None, "s3://bucket/data", max_objects=5)
+    assert [entry.ref for entry in entries] == [f"s3://bucket/{k}" for k in keys[:5]]
+
+
+def test_list_prefix_truncates_without_listing_later_prefixes():
+    keys = [f"p/{d}/{i}" for d in "fedcba" for i in range(5)] + ["p/top"]
+    listed = []
+
+    def list_level(prefix):
+        rest = [key[len(prefix) :] for key in keys if key.startswith(prefix)]
+        prefixes = sorted({prefix + r.split("/")[0] + "/" for r in rest if "/" in r})
+        yield [prefix + r for r in rest if "/" not in r], prefixes
+
+    def list_tree(prefix):
+        listed.append(prefix)
+        yield sorted(key for key in keys if key.startswith(prefix))
+
+    objects = list_prefix(
+        "p/", list_level, list_tree, max_objects=7, key=lambda k: k, threads=2
+    )
+
+    assert objects == sorted(keys)[:7]
+    assert sorted(listed) == ["p/a/", "p/b/"]
+    # Without a key to order the objects by, the limit is an error.
+    with pytest.raises(ValueError, match="max_objects"):
+        list_prefix("p/", list_level, list_tree, max_objects=7, threads=2)
+
+
 def test_gcs_storage_handler_load_path_nonlocal():
     uri = "gs://some-bucket/path/to/file.json"
     etag = "some etag"
@@ -553,6 +723,43 @@ def test_unwritable_staging_dir(monkeypatch):
         _ = get_staging_dir()
 
 
+@pytest.mark.parametrize("reflinks", [True, False])
+def test_stage_file(monkeypatch, tmp_path, reflinks):
+    def reflink(source_path, target_path):
+        if not reflinks:
+            raise OSError(errno.ENOTSUP, "no reflinks")
+        shutil.copyfile(source_path, target_path)
+
+    monkeypatch.setattr(staging, "_no_reflink_devices", set())
+    monkeypatch.setattr(staging.filesystem, "reflink", reflink)
+    source = tmp_path / "source.txt"
+    source.write_text("example")
+
+    staging_path, digest = staging.stage_file(source)
+    source.write_text("changed")
+
+    assert Path(staging_path).parent == Path(get_staging_dir())
+    assert Path(staging_path).read_text() == "example"
+    assert digest == example_digest
+    assert stat.S_IMODE(os.stat(staging_path).st_mode) == stat.S_IRUSR
+    assert bool(staging._no_reflink_devices) is not reflinks
+
+
+@pytest.mark.parametrize(
+    "kinds, expected",
+    [
+        (["solid_state", "solid_state"], min(32, max(8, os.cpu_count() or 1))),
+        (["network", "solid_state"], 32),
+        (["solid_state", "rotational"], 8),
+        ([None], 8),
+    ],
+)
+def test_get_staging_threads(monkeypatch, kinds, expected):
+    monkeypatch.setattr(staging, "_storage_kind", dict(enumerate(kinds)).get)
+
+    assert staging.get_staging_threads(*range(len(kinds))) == expected
+
+
 def test_invalid_upload_policy():
     path = "foo/bar"
     artifact = wandb.Artifact("test", type="dataset")
@@ -560,3 +767,263 @@ def test_invalid_upload_policy():
         artifact.add_file(local_path=path, name="file.json", policy="tmp")
     with pytest.raises(ValueError):
         artifact.add_dir(local_path=path, policy="tmp")
+
+
+# Small chunk sizes, so that small files split into many chunks.
+CHUNK_SIZES = {"min_size": 64, "avg_size": 256, "max_size": 1024}
+
+
+def random_bytes(size: int) -> bytes:
+    return random.Random(0).getrandbits(8 * size).to_bytes(size, "little")
+
+
+def test_chunk_file_covers_file(tmp_path):
+    data = random_bytes(100_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    chunks = _chunking.chunk_file(path, **CHUNK_SIZES)
+
+    assert [c.offset for c in chunks] == [0] + [c.offset + c.size for c in chunks[:-1]]
+    assert sum(c.size for c in chunks) == len(data)
+    assert all(64 <= c.size <= 1024 for c in chunks[:-1])
+    assert all(
+        c.digest == hashlib.md5(data[c.offset : c.offset + c.size]).hexdigest()
+        for c in chunks
+    )
+
+
+def test_chunk_file_does_not_depend_on_read_size(tmp_path, monkeypatch):
+    path = tmp_path / "data.bin"
+    path.write_bytes(random_bytes(100_000))
+    chunks = _chunking.chunk_file(path, **CHUNK_SIZES)
+
+    monkeypatch.setattr(_chunking, "_READ_SIZE", 1000)
+    assert _chunking.chunk_file(path, **CHUNK_SIZES) == chunks
+
+
+def test_chunk_file_edit_changes_nearby_chunks(tmp_path):
+    data = random_bytes(100_000)
+    (tmp_path / "before.bin").write_bytes(data)
+    (tmp_path / "after.bin").write_bytes(data[:50_000] + b"edit" + data[50_000:])
+
+    before = {
+        c.digest for c in _chunking.chunk_file(tmp_path / "before.bin", **CHUNK_SIZES)
+    }
+    after = {
+        c.digest for c in _chunking.chunk_file(tmp_path / "after.bin", **CHUNK_SIZES)
+    }
+
+    assert len(after - before) <= 2
+    assert len(before & after) >= len(before) - 2
+
+
+def test_chunk_file_rejects_bad_sizes(tmp_path):
+    with pytest.raises(ValueError, match="Chunk sizes"):
+        _chunking.chunk_file(tmp_path / "data.bin", 100, 50, 200)
+
+
+class CountingChunkStore(LocalChunkStore):
+    def __init__(self, root):
+        super().__init__(root)
+        self.puts = []
+
+    def put(self, digest, data):
+        self.puts.append(digest)
+        super().put(digest, data)
+
+
+@pytest.fixture
+def chunked_policy(tmp_path, artifact_file_cache):
+    return ChunkedStoragePolicy(
+        config={"minChunkSize": 64, "avgChunkSize": 256, "maxChunkSize": 1024},
+        cache=artifact_file_cache,
+        api=Mock(),
+        chunk_store=CountingChunkStore(tmp_path / "chunks"),
+    )
+
+
+def chunked_preparer(upload_url="http://wandb-test/upload-url"):
+    def prepare(spec):
+        q = queue.Queue()
+        q.put(
+            ResponsePrepare(
+                birth_artifact_id="artifact-id",
+                upload_url=upload_url,
+                upload_headers=[],
+                upload_id=None,
+                storage_path="wandb_artifact/123456789",
+                multipart_upload_urls=None,
+            )
+        )
+        return q
+
+    return Mock(prepare=Mock(wraps=prepare))
+
+
+def store_chunked(policy, path, preparer=None):
+    entry = ArtifactManifestEntry(
+        path=path.name,
+        digest=md5_file_b64(path),
+        local_path=str(path),
+        size=path.stat().st_size,
+    )
+    deduped = policy.store_file(
+        "artifact-id", "manifest-id", entry, preparer or chunked_preparer()
+    )
+    return entry, deduped
+
+
+def test_chunked_storage_policy_uploads_missing_chunks(tmp_path, chunked_policy):
+    data = random_bytes(100_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    store = chunked_policy._chunk_store
+
+    entry, _ = store_chunked(chunked_policy, path)
+    assert len(store.puts) == len({digest for digest, _ in entry.extra["chunks"]})
+
+    store.puts.clear()
+    store_chunked(chunked_policy, path)
+    assert store.puts == []
+
+    path.write_bytes(data + b"appended")
+    store_chunked(chunked_policy, path)
+    assert 1 <= len(store.puts) <= 2
+
+
+def test_chunked_storage_policy_uploads_files_to_wandb(tmp_path, chunked_policy):
+    path = tmp_path / "data.bin"
+    path.write_bytes(random_bytes(10_000))
+    preparer = chunked_preparer()
+
+    entry, deduped = store_chunked(chunked_policy, path, preparer)
+
+    assert not deduped
+    preparer.prepare.assert_called_once()
+    assert preparer.prepare.call_args[0][0]["name"] == "data.bin"
+    assert entry.birth_artifact_id == "artifact-id"
+    chunked_policy._api.upload_file_retry.assert_called_once()
+    assert chunked_policy._api.upload_file_retry.call_args[0][0] == (
+        "http://wandb-test/upload-url"
+    )
+
+    # The server already has the file, so only its chunks are stored.
+    _, deduped = store_chunked(chunked_policy, path, chunked_preparer(upload_url=None))
+    assert deduped
+    chunked_policy._api.upload_file_retry.assert_called_once()
+
+
+def test_chunked_storage_policy_load_file(tmp_path, chunked_policy):
+    data = random_bytes(100_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    entry, _ = store_chunked(chunked_policy, path)
+
+    # Download with an empty cache, so the file is reassembled from chunks.
+    policy = ChunkedStoragePolicy.from_config(chunked_policy.config(), api=Mock())
+    policy._cache = ArtifactFileCache(tmp_path / "other-cache")
+    loaded = policy.load_file(Mock(), entry)
+
+    assert Path(loaded).read_bytes() == data
+    assert loaded.startswith(str(tmp_path / "other-cache"))
+
+
+def test_chunked_storage_policy_load_file_checks_chunks(tmp_path, chunked_policy):
+    path = tmp_path / "data.bin"
+    path.write_bytes(random_bytes(10_000))
+    entry, _ = store_chunked(chunked_policy, path)
+    digest, _ = entry.extra["chunks"][0]
+    chunked_policy._chunk_store.put(digest, b"corrupt")
+
+    policy = ChunkedStoragePolicy.from_config(chunked_policy.config(), api=Mock())
+    policy._cache = ArtifactFileCache(tmp_path / "other-cache")
+    with pytest.raises(ValueError, match="doesn't match"):
+        policy.load_file(Mock(), entry)
+
+
+def test_chunked_storage_policy_load_file_without_chunks(
+    tmp_path, chunked_policy, monkeypatch
+):
+    path = tmp_path / "data.bin"
+    path.write_bytes(random_bytes(10_000))
+    entry, _ = store_chunked(chunked_policy, path)
+
+    # A chunk store that doesn't have the chunks, e.g. on another machine.
+    policy = ChunkedStoragePolicy(
+        config=chunked_policy.config(),
+        api=Mock(),
+        chunk_store=LocalChunkStore(tmp_path / "other-chunks"),
+    )
+    policy._cache = ArtifactFileCache(tmp_path / "other-cache")
+    load_file = Mock(return_value="downloaded")
+    monkeypatch.setattr(WandbStoragePolicy, "load_file", load_file)
+    artifact = Mock()
+
+    assert policy.load_file(artifact, entry) == "downloaded"
+
+    load_file.assert_called_once_with(artifact, entry, dest_path=None)
+
+
+def test_artifact_download_reassembles_chunked_files(tmp_path, monkeypatch):
+    data = random_bytes(100_000)
+    (tmp_path / "data.bin").write_bytes(data)
+    artifact = Artifact(
+        "test", type="dataset", chunk_store=(tmp_path / "chunks").as_uri()
+    )
+    artifact.add_file(str(tmp_path / "data.bin"))
+    policy = artifact.manifest.storage_policy
+    policy._api = Mock()
+    for entry in artifact.manifest.entries.values():
+        policy.store_file("artifact-id", "manifest-id", entry, chunked_preparer())
+
+    # The server doesn't list chunked files, and the cache starts out empty.
+    artifact._state = ArtifactState.COMMITTED
+    policy._cache = ArtifactFileCache(tmp_path / "other-cache")
+    monkeypatch.setattr(
+        artifact,
+        "_fetch_file_urls",
+        lambda cursor, per_page: {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "edges": [],
+        },
+    )
+    root = artifact._download(str(tmp_path / "download"))
+
+    assert (Path(root) / "data.bin").read_bytes() == data
+
+
+def test_chunked_storage_policy_from_manifest(tmp_path):
+    chunk_store = (tmp_path / "chunks").as_uri()
+    manifest = ArtifactManifestV1.from_manifest_json(
+        {
+            "version": 1,
+            "storagePolicy": CHUNKED_STORAGE_POLICY,
+            "storagePolicyConfig": {"chunkStore": chunk_store},
+            "contents": {},
+        },
+        api=Mock(),
+    )
+
+    assert isinstance(manifest.storage_policy, ChunkedStoragePolicy)
+    assert manifest.to_manifest_json()["storagePolicyConfig"] == {
+        "chunkStore": chunk_store
+    }
+
+
+def test_chunked_storage_policy_requires_chunk_store():
+    with pytest.raises(ValueError, match="chunkStore"):
+        ChunkedStoragePolicy(api=Mock())
+    with pytest.raises(ValueError, match="Unsupported chunk store"):
+        ChunkedStoragePolicy({"chunkStore": "s3://bucket/chunks"}, api=Mock())
+
+
+def test_artifact_chunk_store_is_opt_in(tmp_path):
+    artifact = wandb.Artifact(
+        "test", type="dataset", chunk_store=(tmp_path / "chunks").as_uri()
+    )
+
+    assert artifact.manifest.storage_policy.name() == CHUNKED_STORAGE_POLICY
+    assert wandb.Artifact("test", type="dataset").manifest.storage_policy.name() != (
+        CHUNKED_STORAGE_POLICY
+    )
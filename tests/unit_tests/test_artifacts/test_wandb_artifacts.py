@@ -377,6 +377,45 @@ class TestStoreFile:
             for etag in etags:
                 assert etag["hexMD5"] == hex_digests[etag["partNumber"]]
 
+    def test_records_url_wait_and_upload_time(
+        self, store_file: "StoreFileFixture", api, example_file: Path
+    ):
+        preparer = mock_preparer()
+        store_file(
+            WandbStoragePolicy(api=api),
+            entry_local_path=example_file,
+            preparer=preparer,
+        )
+        preparer.record_url_wait.assert_called_once()
+        preparer.record_upload.assert_called_once()
+
+    def test_prefetches_small_local_files(self, api, example_file: Path):
+        def entry(path, local_path=None, size=None):
+            return ArtifactManifestEntry(
+                path=path, digest=f"digest-{path}", local_path=local_path, size=size
+            )
+
+        entries = [
+            entry("small", str(example_file), 10),
+            entry("reference"),
+            entry("huge", str(example_file), 3 * 1024**3),
+        ]
+        preparer = mock_preparer()
+        WandbStoragePolicy(api=api).prefetch_files(
+            "my-artifact-id", "my-artifact-manifest-id", entries, preparer
+        )
+
+        (specs,) = preparer.prefetch.call_args[0]
+        assert list(specs) == [
+            {
+                "artifactID": "my-artifact-id",
+                "artifactManifestID": "my-artifact-manifest-id",
+                "name": "small",
+                "md5": "digest-small",
+                "uploadPartsInput": [],
+            }
+        ]
+
 
 @pytest.mark.parametrize("type", ["job", "wandb-history", "wandb-foo"])
 def test_invalid_artifact_type(type):
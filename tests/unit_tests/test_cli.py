@@ -1,5 +1,7 @@
+import base64
 import datetime
 import getpass
+import hashlib
 import importlib
 import netrc
 import os
@@ -8,6 +10,7 @@ import traceback
 from unittest import mock
 
 import pytest
+import requests
 import wandb
 from wandb.apis.internal import InternalApi
 from wandb.cli import cli
@@ -217,6 +220,54 @@ def test_sync_gc(runner):
         assert not os.path.exists(run1_dir)
 
 
+def test_pull(runner, monkeypatch):
+    contents = {"config.yaml": b"config", "media/table.json": b"table"}
+    urls = {
+        name: {
+            "url": f"https://example.com/{name}",
+            "md5": base64.b64encode(hashlib.md5(data).digest()).decode(),
+        }
+        for name, data in contents.items()
+    }
+
+    def download_file(self, url):
+        name = url[len("https://example.com/") :]
+        response = mock.MagicMock()
+        response.iter_content.return_value = [contents[name]]
+        return len(contents[name]), response
+
+    monkeypatch.setattr(InternalApi, "download_urls", lambda *args, **kwargs: urls)
+    monkeypatch.setattr(InternalApi, "download_file", download_file)
+
+    with runner.isolated_filesystem():
+        with open("config.yaml", "wb") as f:
+            f.write(b"config")
+        result = runner.invoke(cli.pull, ["test-run", "--project", "test"])
+        assert result.exit_code == 0
+        assert "Downloading: test/test-run" in result.output
+        assert "File config.yaml is up to date" in result.output
+        assert "File media/table.json\n" in result.output
+        with open("media/table.json", "rb") as f:
+            assert f.read() == b"table"
+
+
+def test_pull_failed_file(runner, monkeypatch):
+    urls = {"model.h5": {"url": "https://example.com/model.h5", "md5": "abc="}}
+
+    def download_file(self, url):
+        raise requests.ConnectionError("connection reset")
+
+    monkeypatch.setattr(InternalApi, "download_urls", lambda *args, **kwargs: urls)
+    monkeypatch.setattr(InternalApi, "download_file", download_file)
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli.pull, ["test-run", "--project", "test"])
+        assert result.exit_code == 1
+        assert "File model.h5 failed: connection reset" in result.output
+        assert "Failed to download 1 of 1 files" in result.output
+        assert not os.path.exists("model.h5")
+
+
 def test_cli_login_reprompts_when_no_key_specified(runner, mocker, dummy_api_key):
     with runner.isolated_filesystem():
         mocker.patch("wandb.wandb_lib.apikey.getpass", input)
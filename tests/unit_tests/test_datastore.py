@@ -6,9 +6,7 @@ import os
 import pytest
 import wandb
 from wandb.proto import wandb_internal_pb2  # type: ignore
-
-datastore = wandb.wandb_sdk.internal.datastore
-
+from wandb.sdk.internal import datastore
 
 FNAME = "test.dat"
 
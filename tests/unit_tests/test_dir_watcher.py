@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 import wandb.filesync.dir_watcher
+from wandb.filesync import inotify
 from wandb.filesync.dir_watcher import DirWatcher, PolicyEnd, PolicyLive, PolicyNow
 from wandb.sdk.internal.file_pusher import FilePusher
 
@@ -33,7 +34,8 @@ def tempdir():
 
 
 @pytest.fixture
-def dir_watcher(settings, file_pusher, tempdir: Path) -> DirWatcher:
+def dir_watcher(settings, file_pusher, tempdir: Path, monkeypatch) -> DirWatcher:
+    monkeypatch.setenv("WANDB_DIR_WATCHER", "polling")
     with patch.object(wandb.filesync.dir_watcher, "wd_polling", Mock()):
         yield DirWatcher(
             settings=settings,
@@ -258,3 +260,159 @@ def test_policynow_uploads_on_modified_iff_not_already_uploaded(
     write_with_mtime(f, b"content", mtime=99999)
     policy.on_modified()
     file_pusher.file_changed.assert_not_called()
+
+
+@pytest.mark.skipif(not inotify.is_supported(), reason="requires inotify")
+class TestInotifyWatcher:
+    @pytest.fixture
+    def events(self, tempdir: Path):
+        handler = Mock()
+        watcher = inotify.InotifyWatcher(
+            str(tempdir),
+            handler,
+            exclude=lambda path: os.path.basename(path) == "media",
+        )
+
+        def flush():
+            watcher.flush()
+            dispatched = [
+                (c.args[0].event_type, c.args[0].src_path)
+                for c in handler.dispatch.call_args_list
+            ]
+            handler.reset_mock()
+            return dispatched
+
+        yield flush
+        watcher.stop()
+
+    def test_coalesces_modifications(self, tempdir: Path, events):
+        f = tempdir / "a.txt"
+        f.write_text("a")
+        for _ in range(5):
+            with f.open("a") as fp:
+                fp.write("b")
+
+        assert events() == [("created", str(f))]
+
+    def test_watches_new_subdirectories(self, tempdir: Path, events):
+        (tempdir / "sub" / "dir").mkdir(parents=True)
+        (tempdir / "sub" / "dir" / "a.txt").write_text("a")
+        events()
+
+        (tempdir / "sub" / "dir" / "b.txt").write_text("b")
+
+        assert events() == [("created", str(tempdir / "sub" / "dir" / "b.txt"))]
+
+    def test_reports_moves(self, tempdir: Path, events):
+        (tempdir / "a.txt").write_text("a")
+        events()
+
+        (tempdir / "a.txt").rename(tempdir / "b.txt")
+
+        assert events() == [("moved", str(tempdir / "a.txt"))]
+
+    def test_ignores_excluded_dirs(self, tempdir: Path, events):
+        (tempdir / "media" / "images").mkdir(parents=True)
+        (tempdir / "media" / "images" / "a.png").write_bytes(b"png")
+        (tempdir / "media" / "b.png").write_bytes(b"png")
+
+        assert events() == []
+
+
+@pytest.mark.skipif(not inotify.is_supported(), reason="requires inotify")
+def test_dirwatcher_inotify_uploads_now_files(
+    tempdir: Path, settings, file_pusher: Mock, monkeypatch
+):
+    monkeypatch.setenv("WANDB_DIR_WATCHER", "inotify")
+    dir_watcher = DirWatcher(settings, file_pusher, file_dir=str(tempdir))
+    assert isinstance(dir_watcher._file_observer, inotify.InotifyWatcher)
+    dir_watcher.update_policy("my-file.txt", "now")
+
+    (tempdir / "my-file.txt").write_text("content")
+    (tempdir / "media").mkdir()
+    (tempdir / "media" / "image.png").write_bytes(b"png")
+    dir_watcher.finish()
+
+    file_pusher.file_changed.assert_called_once_with(
+        "my-file.txt", str(tempdir / "my-file.txt")
+    )
+
+
+class TestPolicyLiveAppend:
+    @pytest.fixture(autouse=True)
+    def enable(self, monkeypatch):
+        monkeypatch.setenv("WANDB_LIVE_APPEND_UPLOADS", "true")
+
+    @pytest.fixture
+    def log_file(self, tempdir: Path) -> Path:
+        f = tempdir / "train.log"
+        f.write_bytes(b"line 1\nline 2\n")
+        return f
+
+    @pytest.fixture
+    def policy(self, log_file: Path, file_pusher: Mock) -> PolicyLive:
+        policy = PolicyLive(str(log_file), log_file.name, file_pusher)
+        policy.on_modified()
+        file_pusher.file_changed.assert_called_once()
+        file_pusher.reset_mock()
+        return policy
+
+    def test_streams_appended_lines(self, log_file, file_pusher, policy):
+        with log_file.open("ab") as f:
+            f.write(b"line 3\nline 4\n")
+        policy.on_modified()
+
+        file_pusher.file_changed.assert_not_called()
+        file_pusher.file_appended.assert_called_once_with(
+            "train.log", ["line 3", "line 4"], 2, 28, 14
+        )
+
+    def test_strips_carriage_returns(self, log_file, file_pusher, policy):
+        with log_file.open("ab") as f:
+            f.write(b"line 3\r\nline 4\r\n")
+        policy.on_modified()
+
+        file_pusher.file_appended.assert_called_once_with(
+            "train.log", ["line 3", "line 4"], 2, 30, 16
+        )
+
+    def test_waits_for_complete_lines(self, log_file, file_pusher, policy):
+        with log_file.open("ab") as f:
+            f.write(b"line")
+        policy.on_modified()
+        file_pusher.file_appended.assert_not_called()
+
+        with log_file.open("ab") as f:
+            f.write(b" 3\n")
+        policy.on_modified()
+        file_pusher.file_appended.assert_called_once_with(
+            "train.log", ["line 3"], 2, 21, 7
+        )
+
+    def test_falls_back_when_prefix_changes(self, log_file, file_pusher, policy):
+        log_file.write_bytes(b"LINE 1\nline 2\nline 3\n")
+        policy.on_modified()
+        file_pusher.file_appended.assert_not_called()
+
+        with log_file.open("ab") as f:
+            f.write(b"line 4\n")
+        policy.on_modified()
+        file_pusher.file_appended.assert_not_called()
+
+    def test_uploads_in_full_on_finish(self, log_file, file_pusher, policy):
+        with log_file.open("ab") as f:
+            f.write(b"line 3\n")
+        policy.on_modified()
+        policy.finish()
+
+        file_pusher.file_changed.assert_called_once_with("train.log", str(log_file))
+
+    def test_disabled_by_default(self, log_file, file_pusher, monkeypatch):
+        monkeypatch.delenv("WANDB_LIVE_APPEND_UPLOADS")
+        policy = PolicyLive(str(log_file), log_file.name, file_pusher)
+        policy.on_modified()
+        with log_file.open("ab") as f:
+            f.write(b"line 3\n")
+        policy.on_modified()
+
+        file_pusher.file_appended.assert_not_called()
@@ -19,6 +19,8 @@ from wandb.sdk.data_types._dtypes import (
     TypeRegistry,
     UnionType,
     UnknownType,
+    assign_cached,
+    assign_column,
 )
 from wandb.sdk.data_types.image import _ImageFileType
 from wandb.sdk.data_types.table import _TableType
@@ -913,6 +915,64 @@ def test_table_typing_pandas():
     table.add_data(True)
 
 
+def test_assign_cached_matches_assign():
+    values = [None, 1, 2.5, float("nan"), "a", True, np.int64(3), np.float32(1)]
+    values += [np.bool_(False), datetime.date(2000, 1, 1), [1], {"a": 1}]
+    types = [UnknownType(), AnyType(), NumberType(), StringType()]
+    types += [OptionalType(NumberType()), ConstType(1), ListType(NumberType)]
+    for wb_type in types:
+        for value in values:
+            # Twice, to check the cached result too.
+            assert assign_cached(wb_type, value) == wb_type.assign(value)
+            assert assign_cached(wb_type, value) == wb_type.assign(value)
+
+
+def test_assign_column():
+    assert assign_column(UnknownType(), [1, 2.5, None]) == (InvalidType(), 2)
+    assert assign_column(OptionalType(UnknownType()), [1, 2.5, None]) == (
+        OptionalType(NumberType()),
+        None,
+    )
+    assert assign_column(OptionalType(StringType()), ["a", 1]) == (InvalidType(), 1)
+    assert assign_column(UnknownType(), np.arange(10)) == (NumberType(), None)
+    assert assign_column(StringType(), np.arange(10)) == (InvalidType(), 0)
+    assert assign_column(ConstType(1), np.ones(3)) == (ConstType(1), None)
+    assert assign_column(ConstType(1), np.array([1, 2])) == (InvalidType(), 1)
+
+
+def test_table_from_columns_matches_rows():
+    import pandas as pd
+
+    dataframe = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [1.5, np.nan, 2.0],
+            "c": ["x", "y", None],
+            "d": [True, False, True],
+            "e": pd.to_datetime(["2020-01-01", "2021-01-01", "2022-01-01"]),
+            "f": [[1], [2, 3], None],
+        }
+    )
+    by_rows = wandb.Table(columns=list(dataframe.columns))
+    for row in range(len(dataframe)):
+        by_rows.add_data(*(dataframe[col].values[row] for col in dataframe.columns))
+    table = wandb.Table(dataframe=dataframe)
+    assert table._column_types == by_rows._column_types
+    # Compared as strings since NaN != NaN.
+    assert str(table.data) == str(by_rows.data)
+
+    ndarray = np.arange(12).reshape(4, 3)
+    by_rows = wandb.Table(columns=["a", "b", "c"])
+    for row in ndarray:
+        by_rows.add_data(*row)
+    assert wandb.Table(columns=["a", "b", "c"], data=ndarray) == by_rows
+
+    with pytest.raises(TypeError, match="Data row contained incompatible types"):
+        wandb.Table(dataframe=pd.DataFrame({"a": [1, "x"]}, dtype=object))
+    with pytest.raises(TypeError, match="Data row contained incompatible types"):
+        wandb.Table(columns=["a", "b"], data=np.arange(4).reshape(2, 2), dtype=str)
+
+
 def test_artifact_type():
     artifact = wandb.Artifact("name", type="dataset")
     target_type = TypeRegistry.types_by_name().get("artifactVersion")()
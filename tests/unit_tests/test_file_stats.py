@@ -94,3 +94,29 @@ def test_failed_file_resets_summary_uploaded_bytes():
     s.update_failed_file("foo")
 
     assert s.summary().uploaded_bytes == 8
+
+
+def test_bandwidth_by_class():
+    s = stats.Stats()
+    s.init_file("wandb-summary.json", 10)
+    s.init_file("media/a.png", 100)
+    s.init_file("untracked", 1000)
+    s.set_upload_class("wandb-summary.json", "metadata")
+    s.set_upload_class("media/a.png", "media")
+    s.update_uploaded_file("wandb-summary.json", 10)
+    s.update_uploaded_file("media/a.png", 40)
+
+    bandwidth = s.bandwidth_by_class()
+
+    assert set(bandwidth) == {"metadata", "media"}
+    assert bandwidth["media"].uploaded_bytes == 40
+    assert bandwidth["media"].total_bytes == 100
+    assert bandwidth["metadata"].bytes_per_sec >= 0
+
+
+def test_delta_summary():
+    s = stats.Stats()
+    s.update_delta_upload(file_size=100, streamed_bytes=10)
+    s.update_delta_upload(file_size=120, streamed_bytes=20)
+
+    assert s.delta_summary() == stats.DeltaSummary(streamed_bytes=30, saved_bytes=190)
@@ -1,5 +1,9 @@
+import os
+import subprocess
 import sys
 
+import pytest
+
 
 def test_path_is_unchanged():
     # Ideally we would compare directly to the user's starting path,
@@ -9,3 +13,81 @@ def test_path_is_unchanged():
 
     for item in sys.path:
         assert "wandb/vendor" not in item
+
+
+def _fresh_interpreter_env():
+    import wandb
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(wandb.__file__)), env.get("PYTHONPATH", "")]
+    )
+    return env
+
+
+def test_import_is_lazy():
+    # Run in a new interpreter: the test session has imported everything.
+    code = (
+        "import sys, wandb;"
+        "print(','.join(m for m in ["
+        "'wandb.apis', 'wandb.data_types', 'wandb.sdk.wandb_run',"
+        "'wandb.sdk.wandb_init', 'wandb.sdk.internal.internal'"
+        "] if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_fresh_interpreter_env(),
+    )
+
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.skip_wandb_core
+def test_legacy_service_run_starts(tmp_path):
+    # The service process only imports what it uses, so make sure that is
+    # enough to run the internal process.
+    code = (
+        "import wandb;"
+        "run = wandb.init(mode='offline');"
+        "run.log({'a': 1});"
+        "run.finish();"
+        "print('finished')"
+    )
+    env = _fresh_interpreter_env()
+    env["WANDB__REQUIRE_LEGACY_SERVICE"] = "true"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+        cwd=tmp_path,
+        timeout=120,
+    )
+
+    assert result.stdout.strip().endswith("finished")
+
+
+def test_lazy_attributes():
+    import wandb
+    from wandb.apis.public import Api
+    from wandb.sdk.data_types.image import Image
+
+    assert wandb.Image is Image
+    assert wandb.Api is Api
+    assert "Image" in dir(wandb)
+    assert wandb.sdk.wandb_run.Run.detach
+    with pytest.raises(AttributeError):
+        wandb.no_such_attribute  # noqa: B018
+
+
+def test_lazy_preinit_callable():
+    import wandb
+
+    if wandb.run is not None:
+        pytest.skip("a run is active")
+    with pytest.raises(wandb.Error, match="wandb.init()"):
+        wandb.log({"a": 1})
@@ -90,6 +90,26 @@ def test_create_build_context_dockerfile_dot_wandb(mock_git_project):
     )  # This is the hash of the Dockerfile + image_source_string.
 
 
+def test_create_build_context_dockerfile_dot_wandb_ignored(mock_git_project):
+    """Tests that Dockerfile.wandb is staged even if .dockerignore matches it."""
+    mock_git_project.override_entrypoint.name = "subdir/entrypoint.py"
+    mock_git_project.override_entrypoint.command = ["python", "subdir/entrypoint.py"]
+    subdir = mock_git_project.project_dir / "subdir"
+    subdir.mkdir()
+    (subdir / "Dockerfile.wandb").write_text("FROM custom:3.8 # dockerfile.wandb")
+    (subdir / ".dockerignore").write_text("Dockerfile*\n.dockerignore\n")
+    (subdir / "entrypoint.py").write_text("import wandb")
+
+    build_context_manager = BuildContextManager(mock_git_project)
+    path, _ = build_context_manager.create_build_context("docker")
+
+    path = pathlib.Path(path)
+    dockerfile = (path / "Dockerfile.wandb").read_text()
+    assert dockerfile.strip() == "FROM custom:3.8 # dockerfile.wandb"
+    assert (path / ".dockerignore").exists()
+    assert (path / "entrypoint.py").exists()
+
+
 def test_create_build_context_job_dockerfile(mock_git_project):
     """Test that a custom Dockerfile is used when specified in the job config."""
     (mock_git_project.project_dir / "Dockerfile").write_text("FROM custom:3.8")
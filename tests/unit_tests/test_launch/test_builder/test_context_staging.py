@@ -0,0 +1,83 @@
+"""Tests for build context staging."""
+
+import os
+
+import pytest
+from wandb.sdk.launch.builder.context_staging import (
+    DockerIgnore,
+    replace_file,
+    stage_build_context,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    src = tmp_path / "project"
+    (src / "pkg").mkdir(parents=True)
+    (src / "main.py").write_text("print('hello')")
+    (src / "pkg" / "util.py").write_text("x = 1")
+    return src
+
+
+@pytest.mark.parametrize(
+    "patterns, path, expected",
+    [
+        (["*.pyc"], "a.pyc", True),
+        (["*.pyc"], "pkg/a.pyc", False),
+        (["**/*.pyc"], "pkg/a.pyc", True),
+        (["**/*.pyc"], "a.pyc", True),
+        ([".git"], ".git/HEAD", True),
+        (["data/"], "data/x.csv", True),
+        (["data", "!data/keep.csv"], "data/keep.csv", False),
+        (["data", "!data/keep.csv"], "data/drop.csv", True),
+        (["# comment", ""], "comment", False),
+        (["/build"], "build/out", True),
+    ],
+)
+def test_dockerignore(patterns, path, expected):
+    assert DockerIgnore(patterns).ignored(path) is expected
+
+
+def test_stage_build_context_links_files(project, tmp_path):
+    dst = tmp_path / "context"
+    stage_build_context(str(project), str(dst))
+
+    assert (dst / "main.py").read_text() == "print('hello')"
+    assert (dst / "pkg" / "util.py").read_text() == "x = 1"
+    assert os.path.samefile(dst / "main.py", project / "main.py")
+
+    # Replacing a staged file must not modify the project.
+    replace_file(str(dst / "main.py"), "changed")
+    assert (project / "main.py").read_text() == "print('hello')"
+
+
+def test_stage_build_context_honors_dockerignore(project, tmp_path):
+    (project / ".git").mkdir()
+    (project / ".git" / "HEAD").write_text("ref")
+    (project / "data").mkdir()
+    (project / "data" / "big.bin").write_bytes(b"0" * 10)
+    (project / "data" / "keep.csv").write_text("a,b")
+    (project / ".dockerignore").write_text(".git\ndata\n!data/keep.csv\n")
+    dst = tmp_path / "context"
+
+    stage_build_context(str(project), str(dst))
+
+    assert not (dst / ".git").exists()
+    assert not (dst / "data" / "big.bin").exists()
+    assert (dst / "data" / "keep.csv").exists()
+    assert (dst / "main.py").exists()
+
+
+def test_stage_build_context_always_includes(project, tmp_path):
+    (project / "Dockerfile.wandb").write_text("FROM python")
+    (project / ".dockerignore").write_text("Dockerfile*\n.dockerignore\n")
+    dst = tmp_path / "context"
+
+    stage_build_context(
+        str(project),
+        str(dst),
+        always_include=["Dockerfile.wandb"],
+    )
+
+    assert (dst / "Dockerfile.wandb").read_text() == "FROM python"
+    assert (dst / ".dockerignore").exists()
@@ -0,0 +1,126 @@
+import base64
+import hashlib
+import os
+from unittest import mock
+
+import requests
+import responses
+from wandb.sdk.lib import file_downloader, hashutil
+from wandb.sdk.lib.file_downloader import FileDownloader, RemoteFile
+
+
+def _md5(contents: bytes) -> str:
+    return base64.b64encode(hashlib.md5(contents).digest()).decode()
+
+
+def _download(url):
+    response = requests.get(url, stream=True)
+    response.raise_for_status()
+    return int(response.headers.get("content-length", 0)), response
+
+
+def _remote_file(name, contents):
+    return RemoteFile(name, f"https://example.com/{name}", _md5(contents))
+
+
+def test_downloads_files(tmp_path):
+    files = {"a.txt": b"a" * 100, "media/images/b.png": b"b" * 3_000_000}
+    with responses.RequestsMock() as rsps:
+        for name, contents in files.items():
+            rsps.add(responses.GET, f"https://example.com/{name}", body=contents)
+
+        results = FileDownloader(_download, root=str(tmp_path)).download(
+            _remote_file(name, contents) for name, contents in files.items()
+        )
+
+    assert sorted(result.name for result in results) == sorted(files)
+    assert all(result.downloaded and result.error is None for result in results)
+    for name, contents in files.items():
+        assert (tmp_path / name).read_bytes() == contents
+    assert not (tmp_path / file_downloader.MANIFEST_NAME).exists()
+    assert not list(tmp_path.glob("**/*.part"))
+
+
+def test_skips_current_files(tmp_path):
+    (tmp_path / "current.txt").write_bytes(b"current")
+    (tmp_path / "outdated.txt").write_bytes(b"outdated")
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.GET, "https://example.com/outdated.txt", body=b"new")
+
+        results = FileDownloader(_download, root=str(tmp_path)).download(
+            [
+                _remote_file("current.txt", b"current"),
+                _remote_file("outdated.txt", b"new"),
+            ]
+        )
+
+    assert {result.name: result.downloaded for result in results} == {
+        "current.txt": False,
+        "outdated.txt": True,
+    }
+    assert (tmp_path / "outdated.txt").read_bytes() == b"new"
+
+
+def test_keeps_existing_files_without_replace(tmp_path):
+    (tmp_path / "file.txt").write_bytes(b"local")
+
+    with responses.RequestsMock():
+        (result,) = FileDownloader(
+            _download, root=str(tmp_path), replace=False
+        ).download([_remote_file("file.txt", b"remote")])
+
+    assert not result.downloaded
+    assert (tmp_path / "file.txt").read_bytes() == b"local"
+
+
+def test_resumes_interrupted_download(tmp_path):
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.GET, "https://example.com/good.txt", body=b"good")
+        rsps.add(responses.GET, "https://example.com/bad.txt", status=500)
+
+        results = FileDownloader(_download, root=str(tmp_path)).download(
+            [_remote_file("good.txt", b"good"), _remote_file("bad.txt", b"bad")]
+        )
+
+    errors = {result.name: result.error for result in results}
+    assert errors["good.txt"] is None
+    assert isinstance(errors["bad.txt"], requests.HTTPError)
+    assert not (tmp_path / "bad.txt").exists()
+    assert (tmp_path / file_downloader.MANIFEST_NAME).exists()
+
+    # The downloaded file is in the manifest, so it isn't hashed again.
+    with responses.RequestsMock() as rsps, mock.patch.object(
+        hashutil, "md5_file_b64", side_effect=AssertionError
+    ):
+        rsps.add(responses.GET, "https://example.com/bad.txt", body=b"bad")
+
+        results = FileDownloader(_download, root=str(tmp_path)).download(
+            [_remote_file("good.txt", b"good"), _remote_file("bad.txt", b"bad")]
+        )
+
+    assert {result.name: result.downloaded for result in results} == {
+        "good.txt": False,
+        "bad.txt": True,
+    }
+    assert (tmp_path / "bad.txt").read_bytes() == b"bad"
+    assert not (tmp_path / file_downloader.MANIFEST_NAME).exists()
+
+
+def test_manifest_ignores_modified_files(tmp_path):
+    manifest = tmp_path / file_downloader.MANIFEST_NAME
+    (tmp_path / "file.txt").write_bytes(b"modified")
+    stat = os.stat(tmp_path / "file.txt")
+    manifest.write_text(
+        '{"name": "file.txt", "md5": "%s", "size": %d, "mtime_ns": %d}\n{"name": '
+        % (_md5(b"remote"), stat.st_size + 1, stat.st_mtime_ns)
+    )
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.GET, "https://example.com/file.txt", body=b"remote")
+
+        (result,) = FileDownloader(_download, root=str(tmp_path)).download(
+            [_remote_file("file.txt", b"remote")]
+        )
+
+    assert result.downloaded
+    assert (tmp_path / "file.txt").read_bytes() == b"remote"
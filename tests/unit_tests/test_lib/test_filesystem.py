@@ -528,6 +528,41 @@ def test_reflink_macos_corner_cases(monkeypatch, example_file):
         reflink(example_file, "link_file")
 
 
+def test_link_or_copy_copies_writable_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(filesystem, "reflink", Mock(side_effect=OSError))
+    source = tmp_path / "source.txt"
+    source.write_text("original")
+    target = tmp_path / "target.txt"
+
+    filesystem.link_or_copy(source, target)
+    source.write_text("changed")
+
+    assert target.read_text() == "original"
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="requires POSIX modes")
+def test_link_or_copy_hard_links_read_only_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(filesystem, "reflink", Mock(side_effect=OSError))
+    source = tmp_path / "source.txt"
+    source.write_text("original")
+    source.chmod(0o444)
+    target = tmp_path / "target.txt"
+    target.write_text("stale")
+
+    filesystem.link_or_copy(source, target)
+
+    assert os.path.samefile(source, target)
+    assert target.read_text() == "original"
+
+
+def test_link_or_copy_same_file(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("original")
+
+    with pytest.raises(shutil.SameFileError):
+        filesystem.link_or_copy(source, source)
+
+
 @pytest.mark.skipif(platform.system() == "Windows", reason="':' not allowed in paths.")
 def test_check_exists(tmp_path):
     path_with_colon = tmp_path / "file:name.txt"
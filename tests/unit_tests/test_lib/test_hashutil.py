@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import os
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -132,3 +134,52 @@ def test_md5_file_hashes_on_mounted_filesystem(filesize, tmp_path, fs: FakeFiles
 
     assert expected_b64_hash == hashutil.md5_file_b64(fpath_large)
     assert expected_hex_hash == hashutil.md5_file_hex(fpath_large)
+
+
+def test_sha256_md5_file(tmp_path, bin_data):
+    fpath = tmp_path / "binfile"
+    fpath.write_bytes(bin_data * 1000)
+
+    sha256, md5, size = hashutil.sha256_md5_file(fpath)
+
+    assert sha256 == hashlib.sha256(bin_data * 1000).hexdigest()
+    assert md5 == hashutil.md5_file_b64(fpath)
+    assert size == len(bin_data) * 1000
+
+
+def test_remembered_md5_is_reused_until_file_changes(tmp_path):
+    fpath = tmp_path / "file.txt"
+    fpath.write_text("old")
+    os.utime(fpath, (time.time() - 60, time.time() - 60))
+    hashutil.remember_md5(fpath, "not-the-real-digest")
+
+    assert hashutil.md5_file_b64(fpath) == "not-the-real-digest"
+
+    fpath.write_text("new content")
+    assert hashutil.recall_md5(fpath) is None
+    assert hashutil.md5_file_b64(fpath) == hashutil.md5_string("new content")
+
+
+def test_recently_modified_md5_is_not_remembered(tmp_path):
+    fpath = tmp_path / "file.txt"
+    fpath.write_text("old")
+    hashutil.remember_md5(fpath, "not-the-real-digest")
+
+    # A same-size write in the same mtime tick would go unnoticed.
+    assert hashutil.recall_md5(fpath) is None
+
+    hashutil.remember_md5(fpath, "not-the-real-digest", written=True)
+    assert hashutil.recall_md5(fpath) == "not-the-real-digest"
+
+
+def test_copy_md5_file(tmp_path, bin_data):
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.write_bytes(bin_data * 1000)
+
+    md5 = hashutil.copy_md5_file(source, target)
+
+    assert target.read_bytes() == bin_data * 1000
+    assert md5 == base64.b64encode(hashlib.md5(bin_data * 1000).digest()).decode()
+    assert hashutil.recall_md5(target) == md5
+    assert hashutil.recall_md5(source) is None
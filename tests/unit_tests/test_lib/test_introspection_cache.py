@@ -0,0 +1,203 @@
+from unittest import mock
+
+import pytest
+from wandb.sdk.internal import internal_api
+from wandb.sdk.lib import introspection_cache
+
+QUERY = """
+    query ProbeServerSettings {
+        ServerSettingsType: __type(name: "ServerSettings") {
+            fields { name }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def cache_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("WANDB_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("WANDB_INTROSPECTION_CACHE_TTL", "3600")
+
+
+def test_cache_roundtrip_across_instances(cache_env, tmp_path):
+    cache = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=3600
+    )
+    cache.set_server_version("0.50.0")
+    assert cache.get(QUERY) is None
+    cache.set(QUERY, {"ServerSettingsType": {"fields": [{"name": "a"}]}})
+
+    other = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=3600
+    )
+    # Results aren't used until the server's version is checked.
+    assert other.get(QUERY) is None
+    other.set_server_version("0.50.0")
+    # Whitespace differences in the query don't matter.
+    assert other.get(" ".join(QUERY.split())) == {
+        "ServerSettingsType": {"fields": [{"name": "a"}]}
+    }
+
+
+def test_cache_expires(cache_env, tmp_path):
+    cache = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=10
+    )
+    with mock.patch("time.time", return_value=1000):
+        cache.set_server_version("0.50.0")
+        cache.set(QUERY, {"a": 1})
+    with mock.patch("time.time", return_value=1005):
+        assert cache.get(QUERY) == {"a": 1}
+    with mock.patch("time.time", return_value=1011):
+        assert cache.get(QUERY) is None
+
+
+def test_server_version_change_invalidates(cache_env, tmp_path):
+    cache = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=3600
+    )
+    cache.set_server_version("0.50.0")
+    cache.set(QUERY, {"a": 1})
+    cache.set_server_version("0.50.0")
+    assert cache.get(QUERY) == {"a": 1}
+    cache.set_server_version("0.51.0")
+    assert cache.get(QUERY) is None
+
+
+def test_unreported_server_version_keeps_results(cache_env, tmp_path):
+    cache = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=3600
+    )
+    cache.set_server_version("0.50.0")
+    cache.set(QUERY, {"a": 1})
+    cache.set_server_version(None)
+    assert cache.get(QUERY) == {"a": 1}
+
+
+def test_version_check_expires(cache_env, tmp_path):
+    cache = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=3600
+    )
+    with mock.patch("time.time", return_value=1000):
+        cache.set_server_version("0.50.0")
+        cache.set(QUERY, {"a": 1})
+    interval = introspection_cache.VERSION_CHECK_INTERVAL
+    with mock.patch("time.time", return_value=1000 + interval - 1):
+        assert not cache.needs_version_check
+        assert cache.get(QUERY) == {"a": 1}
+    with mock.patch("time.time", return_value=1000 + interval):
+        assert cache.needs_version_check
+        assert cache.get(QUERY) is None
+
+
+def test_unversioned_server_uses_short_ttl(cache_env, tmp_path):
+    cache = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=86400
+    )
+    ttl = introspection_cache.UNVERSIONED_TTL
+    with mock.patch("time.time", return_value=1000):
+        cache.set_server_version(None)
+        cache.set(QUERY, {"a": 1})
+    with mock.patch("time.time", return_value=1000 + ttl - 1):
+        cache.set_server_version(None)
+        assert cache.get(QUERY) == {"a": 1}
+    with mock.patch("time.time", return_value=1000 + ttl):
+        assert cache.get(QUERY) is None
+
+
+def test_disabled_with_zero_ttl(tmp_path):
+    cache = introspection_cache.IntrospectionCache(
+        "https://api.example.com", str(tmp_path / "cache.json"), ttl=0
+    )
+    cache.set(QUERY, {"a": 1})
+    assert cache.get(QUERY) is None
+    assert not (tmp_path / "cache.json").exists()
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ('Cannot query field "foo" on type "Query".', True),
+        ('Unknown argument "bar" on field "createRun".', True),
+        ("permission denied", False),
+    ],
+)
+def test_is_schema_mismatch(message, expected):
+    assert introspection_cache.is_schema_mismatch(message) is expected
+
+
+def test_internal_api_shares_introspection_across_instances(cache_env):
+    response = {"ServerSettingsType": {"fields": [{"name": "sdkMessages"}]}}
+    with mock.patch.object(
+        internal_api.Api, "_server_version", return_value="0.50.0"
+    ) as mock_version, mock.patch.object(
+        internal_api.Api, "gql", return_value=response
+    ) as mock_gql:
+        internal_api.Api().server_settings_introspection()
+        api = internal_api.Api()
+        api.server_settings_introspection()
+
+    assert mock_version.call_count == 1
+    assert mock_gql.call_count == 1
+    assert api._server_settings_type == ["sdkMessages"]
+
+
+def test_internal_api_rechecks_after_server_upgrade(cache_env):
+    response = {"ServerSettingsType": {"fields": [{"name": "sdkMessages"}]}}
+    with mock.patch.object(
+        internal_api.Api, "_server_version", return_value="0.50.0"
+    ), mock.patch.object(internal_api.Api, "gql", return_value=response):
+        internal_api.Api().server_settings_introspection()
+
+    # A new process checks the server's version before trusting the cache.
+    introspection_cache._caches.clear()
+    upgraded = {"ServerSettingsType": {"fields": [{"name": "newField"}]}}
+    with mock.patch.object(
+        internal_api.Api, "_server_version", return_value="0.51.0"
+    ), mock.patch.object(internal_api.Api, "gql", return_value=upgraded) as mock_gql:
+        api = internal_api.Api()
+        api.server_settings_introspection()
+
+    assert mock_gql.call_count == 1
+    assert api._server_settings_type == ["newField"]
+
+
+def test_internal_api_keeps_cache_when_version_check_fails(cache_env):
+    response = {"ServerSettingsType": {"fields": [{"name": "sdkMessages"}]}}
+    with mock.patch.object(
+        internal_api.Api, "_server_version", return_value="0.50.0"
+    ), mock.patch.object(internal_api.Api, "gql", return_value=response):
+        internal_api.Api().server_settings_introspection()
+
+    # The version is unknown, so the cache isn't used but is kept.
+    introspection_cache._caches.clear()
+    api = internal_api.Api()
+    with mock.patch.object(
+        api.client, "execute", side_effect=ConnectionError("connection reset")
+    ), mock.patch.object(internal_api.Api, "gql", return_value=response) as mock_gql:
+        api.server_settings_introspection()
+    assert mock_gql.call_count == 1
+
+    introspection_cache._caches.clear()
+    with mock.patch.object(
+        internal_api.Api, "_server_version", return_value="0.50.0"
+    ), mock.patch.object(internal_api.Api, "gql") as mock_gql:
+        api = internal_api.Api()
+        api.server_settings_introspection()
+    mock_gql.assert_not_called()
+    assert api._server_settings_type == ["sdkMessages"]
+
+
+def test_internal_api_invalidates_on_schema_mismatch(cache_env):
+    api = internal_api.Api()
+    api.introspection_cache.set_server_version("0.50.0")
+    api.introspection_cache.set(QUERY, {"a": 1})
+    with mock.patch.object(
+        api.client,
+        "execute",
+        side_effect=Exception('Cannot query field "foo" on type "Query".'),
+    ):
+        with pytest.raises(Exception, match="Cannot query field"):
+            api.execute(QUERY)
+
+    assert api.introspection_cache.get(QUERY) is None
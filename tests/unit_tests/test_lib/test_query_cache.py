@@ -0,0 +1,127 @@
+import os
+import time
+from unittest import mock
+
+import pytest
+from wandb.apis.public.api import RetryingClient
+from wandb.sdk.lib import query_cache
+from wandb_gql import gql
+
+RUN_QUERY = "query Run($entity: String!, $project: String!, $name: String!) { run }"
+RUN_VARS = {"entity": "e", "project": "p", "name": "abc"}
+
+
+def _run_result(state, heartbeat="2024-01-01T00:00:00"):
+    return {
+        "project": {"run": {"name": "abc", "state": state, "heartbeatAt": heartbeat}}
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return query_cache.QueryCache(str(tmp_path / "queries"))
+
+
+def test_hit_and_miss(cache):
+    fetch = mock.Mock(return_value={"viewer": {"id": "1"}})
+
+    for _ in range(3):
+        assert cache.execute("Viewer", "query Viewer { viewer }", {}, fetch) == {
+            "viewer": {"id": "1"}
+        }
+
+    fetch.assert_called_once()
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_key_includes_variables(cache):
+    fetch = mock.Mock(side_effect=[{"a": 1}, {"a": 2}])
+
+    assert cache.execute("Run", RUN_QUERY, RUN_VARS, fetch) == {"a": 1}
+    assert cache.execute("Run", RUN_QUERY, {**RUN_VARS, "name": "x"}, fetch) == {"a": 2}
+    # Whitespace differences in the query don't matter.
+    assert cache.execute("Run", " ".join(RUN_QUERY.split()), RUN_VARS, fetch) == {
+        "a": 1
+    }
+
+
+def test_finished_runs_never_expire(cache):
+    fetch = mock.Mock(return_value=_run_result("finished"))
+    cache.execute("Run", RUN_QUERY, RUN_VARS, fetch)
+
+    with mock.patch.object(time, "time", return_value=time.time() + 10**9):
+        cache.execute("Run", RUN_QUERY, RUN_VARS, fetch)
+
+    fetch.assert_called_once()
+
+
+def test_running_runs_revalidate(cache):
+    fetch = mock.Mock(return_value=_run_result("running"))
+    validate = mock.Mock(return_value=("2024-01-01T00:00:00", "running"))
+    cache.execute("Run", RUN_QUERY, RUN_VARS, fetch, validate)
+
+    later = time.time() + query_cache.DEFAULT_TTLS["run"] + 1
+    with mock.patch.object(time, "time", return_value=later):
+        cache.execute("Run", RUN_QUERY, RUN_VARS, fetch, validate)
+    fetch.assert_called_once()
+    validate.assert_called_once_with(("e", "p", "abc"))
+    assert cache.stats()["revalidations"] == 1
+
+    # The run logged something since, so the result is fetched again.
+    validate.return_value = ("2024-01-01T00:05:00", "running")
+    later += query_cache.DEFAULT_TTLS["run"] + 1
+    with mock.patch.object(time, "time", return_value=later):
+        cache.execute("Run", RUN_QUERY, RUN_VARS, fetch, validate)
+    assert fetch.call_count == 2
+
+
+def test_signed_urls_expire(cache):
+    fetch = mock.Mock(
+        return_value={
+            "project": {
+                "run": {"state": "finished", "files": [{"directUrl": "https://x"}]}
+            }
+        }
+    )
+    cache.execute("RunFiles", "query RunFiles { run }", RUN_VARS, fetch)
+
+    later = time.time() + query_cache.DEFAULT_TTLS["signed_url"] + 1
+    with mock.patch.object(time, "time", return_value=later):
+        cache.execute("RunFiles", "query RunFiles { run }", RUN_VARS, fetch)
+
+    assert fetch.call_count == 2
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = query_cache.QueryCache(str(tmp_path))
+    big = {"data": "x" * 100}
+    for i, query in enumerate(["query A { a }", "query B { b }"]):
+        cache.execute("Q", query, {}, lambda: big)
+        # order the entries deterministically
+        os.utime(os.path.join(str(tmp_path), cache._key(query, {})), (i, i))
+    # room for two and a half entries
+    cache._max_size = cache.stats()["size"] * 5 // 4
+
+    cache.execute("Q", "query C { c }", {}, lambda: big)
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] <= cache._max_size
+    assert sorted(tmp_path.glob("*.json")) == sorted(
+        tmp_path / cache._key(query, {}) for query in ["query B { b }", "query C { c }"]
+    )
+
+
+def test_client_invalidates_on_mutation(cache):
+    base_client = mock.Mock()
+    base_client.execute.return_value = {"viewer": {"id": "1"}}
+    client = RetryingClient(base_client, query_cache=cache)
+    query = gql("query Viewer { viewer { id } }")
+
+    client.execute(query)
+    client.execute(query)
+    assert base_client.execute.call_count == 1
+
+    client.execute(gql("mutation Upsert { upsertBucket { inserted } }"))
+    client.execute(query)
+    assert base_client.execute.call_count == 3
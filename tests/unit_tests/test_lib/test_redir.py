@@ -8,13 +8,13 @@ import time
 import numpy as np
 import pytest
 import tqdm
-import wandb
+from wandb.sdk.lib import redirect
 
 pytestmark = pytest.mark.xfail
 
-impls = [wandb.wandb_sdk.lib.redirect.StreamWrapper]
+impls = [redirect.StreamWrapper]
 if os.name != "nt":
-    impls.append(wandb.wandb_sdk.lib.redirect.Redirect)
+    impls.append(redirect.Redirect)
 
 
 class CapList(list):
@@ -0,0 +1,127 @@
+import http.server
+import os
+import threading
+import time
+
+import pytest
+import requests.adapters
+from wandb.sdk.lib import shared_transport
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+
+    def do_GET(self):  # noqa: N802
+        time.sleep(self.delay)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_sessions_share_connections(server):
+    transport = shared_transport.SharedTransport()
+    first = transport.new_session()
+    second = transport.new_session()
+    second.headers["Authorization"] = "Bearer token"
+
+    for session in (first, second, first, second):
+        assert session.get(server).text == "ok"
+
+    (stats,) = transport.stats().values()
+    assert stats == {"requests": 4, "connections": 1, "reused": 3}
+
+
+def test_closing_a_session_keeps_shared_pools(server):
+    transport = shared_transport.SharedTransport()
+    session = transport.new_session()
+    session.get(server)
+    session.close()
+
+    transport.new_session().get(server)
+
+    (stats,) = transport.stats().values()
+    assert stats["connections"] == 1
+
+
+def test_max_concurrency_per_host(server, monkeypatch):
+    monkeypatch.setattr(_Handler, "delay", 0.05)
+    transport = shared_transport.SharedTransport(max_concurrency_per_host=2)
+    session = transport.new_session()
+
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    send = requests.adapters.HTTPAdapter.send
+
+    def counting_send(self, request, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            return send(self, request, **kwargs)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", counting_send)
+    threads = [threading.Thread(target=session.get, args=(server,)) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == 2
+
+
+def test_get_transport_is_configured_from_env(monkeypatch):
+    monkeypatch.setattr(shared_transport, "_transport", None)
+    monkeypatch.setenv("WANDB_HTTP_POOL_MAXSIZE", "7")
+    monkeypatch.setenv("WANDB_HTTP_MAX_CONCURRENCY_PER_HOST", "3")
+
+    transport = shared_transport.get_transport()
+
+    assert transport.pool_maxsize == 7
+    assert transport.max_concurrency_per_host == 3
+    assert shared_transport.get_transport() is transport
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_gets_fresh_pools(server, monkeypatch):
+    transport = shared_transport.SharedTransport()
+    monkeypatch.setattr(shared_transport, "_transport", transport)
+    session = transport.new_session()
+    session.get(server)
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            # The parent's connection isn't reused by a session made before
+            # the fork.
+            if transport.stats() == {} and session.get(server).text == "ok":
+                (stats,) = transport.stats().values()
+                code = 0 if stats["reused"] == 0 else 1
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WEXITSTATUS(status) == 0
+    (stats,) = transport.stats().values()
+    assert stats == {"requests": 1, "connections": 1, "reused": 0}
@@ -0,0 +1,113 @@
+import os
+
+from wandb.sdk.lib.redirect import TerminalEmulator
+
+
+def test_plain_text():
+    emulator = TerminalEmulator()
+    emulator.write("hello\nworld\n")
+
+    assert emulator.read() == f"hello{os.linesep}world{os.linesep}"
+    assert emulator.read() == ""
+
+
+def test_carriage_return_overwrites_line():
+    emulator = TerminalEmulator()
+    emulator.write(" 10%|#         |\r")
+    assert emulator.read() == f" 10%|#         |{os.linesep}"
+
+    emulator.write(" 20%|##        |\r")
+    assert emulator.read() == f"\r 20%|##        |{os.linesep}"
+
+    emulator.write("100%|##########|\n")
+    emulator.write("done\n")
+    assert emulator.read() == f"\r100%|##########|{os.linesep}done{os.linesep}"
+
+
+def test_backspace_overwrites_characters():
+    emulator = TerminalEmulator()
+    emulator.write("1/3\b\b\b2/3\b\b\b3/3\n")
+
+    assert emulator.display() == [list("3/3")]
+
+
+def test_formatting_round_trip():
+    emulator = TerminalEmulator()
+    emulator.write("\x1b[31m\x1b[40m\x1b[1mHello\x01\x1b[22m\x1b[39m world\n")
+
+    assert emulator.read() == (
+        f"\x1b[31m\x1b[40m\x1b[1mHello\x1b[39m\x1b[22m world{os.linesep}"
+    )
+
+
+def test_formatting_reset_between_lines():
+    emulator = TerminalEmulator()
+    emulator.write("\x1b[32mok\x1b[0m\nplain\n")
+
+    assert emulator.read() == f"\x1b[32mok{os.linesep}plain{os.linesep}"
+
+
+def test_overwrite_inside_styled_text():
+    emulator = TerminalEmulator()
+    emulator.write("\x1b[1mABCDEF\x1b[0m\r\x1b[2Cxy\n")
+
+    assert emulator.display() == [list("ABxyEF")]
+    assert emulator.read() == f"\x1b[1mAB\x1b[22mxy\x1b[1mEF{os.linesep}"
+
+
+def test_cursor_movement():
+    emulator = TerminalEmulator()
+    emulator.write("ABCD\nEFGH\nIJKX\nMNOP")
+    emulator.write("\x1b[1A\x1b[1DL")
+    emulator.write("\x1b[1BQ")
+
+    assert emulator.display() == [
+        list("ABCD"),
+        list("EFGH"),
+        list("IJKL"),
+        list("MNOPQ"),
+    ]
+
+
+def test_erase_line():
+    emulator = TerminalEmulator()
+    emulator.write("ABCDEF\x1b[3D\x1b[K\n")
+    emulator.write("ABCDEF\x1b[3D\x1b[1K\n")
+    emulator.write("ABCDEF\x1b[2K\n")
+    emulator.write("end\n")
+
+    assert emulator.display() == [list("ABC"), list("    EF"), [], list("end")]
+
+
+def test_erase_screen():
+    emulator = TerminalEmulator()
+    emulator.write("one\ntwo\nthree\x1b[1A\x1b[4D\x1b[J")
+
+    assert emulator.display()[:2] == [list("one"), list("t")]
+
+
+def test_trailing_spaces_are_trimmed():
+    emulator = TerminalEmulator()
+    emulator.write("text   \n")
+
+    assert emulator.display() == [list("text")]
+
+
+def test_writing_past_end_of_line_pads_with_spaces():
+    emulator = TerminalEmulator()
+    emulator.write("ab\x1b[3Ccd\n")
+
+    assert emulator.display() == [list("ab   cd")]
+
+
+def test_buffer_is_trimmed():
+    emulator = TerminalEmulator()
+    emulator.write("".join(f"line {i}\n" for i in range(250)))
+    emulator.read()
+
+    assert emulator.num_lines == TerminalEmulator._MAX_LINES
+    assert max(emulator.buffer) < TerminalEmulator._MAX_LINES
+
+    emulator.write("\x1b[1A\x1b[2Kupdated")
+    assert emulator.read() == f"\rupdated{os.linesep}"
+    assert emulator.display()[-1] == list("updated")
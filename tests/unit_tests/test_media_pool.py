@@ -0,0 +1,225 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+import wandb
+from wandb.sdk.data_types import _media_pool
+from wandb.sdk.data_types._media_pool import DeferredPublisher, MediaEncodingPool
+
+
+@pytest.fixture
+def async_media(monkeypatch):
+    monkeypatch.setenv("WANDB_ASYNC_MEDIA", "true")
+
+
+def test_pool_blocks_over_budget():
+    pool = MediaEncodingPool(max_workers=2, max_inflight_bytes=100)
+    release = threading.Event()
+    first = pool.submit(release.wait, nbytes=80)
+    submitted = threading.Event()
+
+    def submit_second():
+        pool.submit(lambda: None, nbytes=80).result()
+        submitted.set()
+
+    thread = threading.Thread(target=submit_second)
+    thread.start()
+
+    assert not submitted.wait(0.2)
+    assert pool.inflight_bytes == 80
+
+    release.set()
+    first.result()
+    thread.join(5)
+    assert submitted.is_set()
+    assert pool.inflight_bytes == 0
+
+
+def test_pool_accepts_job_larger_than_budget():
+    pool = MediaEncodingPool(max_workers=1, max_inflight_bytes=10)
+
+    assert pool.submit(lambda: 1, nbytes=1000).result() == 1
+
+
+def test_get_pool_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("WANDB_ASYNC_MEDIA", raising=False)
+
+    assert _media_pool.get_pool() is None
+
+
+def test_deferred_publisher_keeps_order():
+    publisher = DeferredPublisher()
+    release = threading.Event()
+    published = []
+
+    def deferred():
+        release.wait()
+        published.append("deferred")
+
+    publisher.publish(deferred, defer=True)
+    publisher.publish(lambda: published.append("inline"), defer=False)
+    assert published == []
+
+    release.set()
+    publisher.flush()
+    assert published == ["deferred", "inline"]
+
+    publisher.publish(lambda: published.append("now"), defer=False)
+    assert published == ["deferred", "inline", "now"]
+
+
+@pytest.mark.parametrize("mode", [None, "L"])
+def test_async_image_matches_sync(monkeypatch, async_media, mode):
+    data = np.random.randint(0, 255, size=(32, 48), dtype=np.uint8)
+
+    pending = wandb.Image(data, mode=mode)
+    assert pending._pending is not None
+    assert (pending._width, pending._height) == (48, 32)
+
+    monkeypatch.setenv("WANDB_ASYNC_MEDIA", "false")
+    expected = wandb.Image(data, mode=mode)
+
+    assert pending == expected
+    assert pending._sha256 == expected._sha256
+    assert pending._size == expected._size
+
+
+def test_has_pending_media(async_media):
+    release = threading.Event()
+    image = wandb.Image(np.zeros((4, 4), dtype=np.uint8))
+    image._pending = _media_pool.get_pool().submit(
+        lambda: (release.wait(), ("0" * 64, 1))[1], nbytes=0
+    )
+
+    assert _media_pool.has_pending_media({"img": image})
+    assert _media_pool.has_pending_media({"imgs": [image]})
+    assert not _media_pool.has_pending_media({"loss": 1.0})
+
+    release.set()
+    image._wait_for_file()
+    assert not _media_pool.has_pending_media({"img": image})
+
+
+def test_log_publishes_rows_in_order(async_media, mock_run, record_q, parse_records):
+    run = mock_run(settings={"mode": "offline"})
+    run._backend.interface._hack_set_run(run)
+    data = np.random.randint(0, 255, size=(16, 16, 3), dtype=np.uint8)
+
+    for step in range(3):
+        run.log({"img": wandb.Image(data), "loss": step})
+        run.log({"acc": step})
+    run._backend.interface._deferred_history.flush()
+
+    parsed = parse_records(record_q)
+    rows = [
+        {key: json.loads(value) for key, value in row.items()}
+        for row in parsed.partial_history
+    ]
+    assert [row.get("loss", row.get("acc")) for row in rows] == [0, 0, 1, 1, 2, 2]
+    expected = wandb.Image(data)
+    expected._wait_for_file()
+    assert rows[0]["img"]["sha256"] == expected._sha256
+
+
+def test_log_serializes_other_values_when_logged(
+    async_media, mock_run, record_q, parse_records
+):
+    run = mock_run(settings={"mode": "offline"})
+    run._backend.interface._hack_set_run(run)
+    release = threading.Event()
+    image = wandb.Image(np.zeros((4, 4), dtype=np.uint8))
+    encoded = image._pending
+    image._pending = _media_pool.get_pool().submit(
+        lambda: (release.wait(), encoded.result())[1], nbytes=0
+    )
+    values = [1, 2]
+    nested = {"img": image, "values": [3, 4]}
+
+    run.log({"img": image, "values": values, "nested": nested})
+    values.append(5)
+    nested["values"].append(6)
+    release.set()
+    run._backend.interface._deferred_history.flush()
+
+    (row,) = parse_records(record_q).partial_history
+    assert json.loads(row["values"]) == [1, 2]
+    assert json.loads(row["nested"])["values"] == [3, 4]
+
+
+def test_deferred_publisher_warns_on_failure(capsys):
+    publisher = DeferredPublisher()
+
+    def fail():
+        raise ValueError("bad row")
+
+    publisher.publish(fail, defer=True)
+    publisher.flush()
+
+    assert "Failed to log a history row: bad row" in capsys.readouterr().err
+
+
+def test_summary_and_config_wait_for_deferred_rows(
+    async_media, mock_run, record_q, parse_records
+):
+    run = mock_run(settings={"mode": "offline"})
+    run._backend.interface._hack_set_run(run)
+    release = threading.Event()
+    image = wandb.Image(np.zeros((4, 4), dtype=np.uint8))
+    encoded = image._pending
+    image._pending = _media_pool.get_pool().submit(
+        lambda: (release.wait(), encoded.result())[1], nbytes=0
+    )
+
+    run.log({"img": image, "loss": 1})
+    threading.Timer(0.2, release.set).start()
+    run.summary["loss"] = 5
+    run.config.update({"lr": 0.1})
+
+    record_types = [
+        record.WhichOneof("record_type")
+        for record in parse_records(record_q).records
+        if record.WhichOneof("record_type") in ("request", "summary", "config")
+    ]
+    assert record_types == ["request", "summary", "config"]
+
+
+def test_failed_background_encoding_is_retried(monkeypatch, async_media):
+    data = np.random.randint(0, 255, size=(4, 4), dtype=np.uint8)
+    image = wandb.Image(data)
+
+    def fail():
+        raise OSError("disk full")
+
+    image._pending.result()
+    image._pending = _media_pool.get_pool().submit(fail, nbytes=0)
+    image._wait_for_file()
+
+    monkeypatch.setenv("WANDB_ASYNC_MEDIA", "false")
+    assert image._sha256 == wandb.Image(data)._sha256
+    assert image._pending is None
+
+
+def test_log_skips_media_that_fails_to_encode(
+    async_media, mock_run, record_q, parse_records, capsys
+):
+    run = mock_run(settings={"mode": "offline"})
+    run._backend.interface._hack_set_run(run)
+    release = threading.Event()
+
+    def fail():
+        release.wait()
+        raise OSError("disk full")
+
+    image = wandb.Image(np.zeros((4, 4), dtype=np.uint8))
+    image._pending = _media_pool.get_pool().submit(fail, nbytes=0)
+    image._write_and_digest = fail
+
+    run.log({"img": image, "loss": 1})
+    release.set()
+    run._backend.interface._deferred_history.flush()
+
+    (row,) = parse_records(record_q).partial_history
+    assert "img" not in row
+    assert json.loads(row["loss"]) == 1
+    assert "Failed to log 'img' to history" in capsys.readouterr().err
@@ -1,9 +1,12 @@
+import json
 import sys
 from unittest import mock
 
 import pytest
 import wandb
 from wandb import Api
+from wandb.apis.paginator import Paginator
+from wandb.apis.public import runs
 from wandb.sdk.artifacts.artifact_download_logger import ArtifactDownloadLogger
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
 
@@ -183,3 +186,154 @@ def test_artifact_download_logger():
             assert termlog.call_args == call
         else:
             termlog.assert_not_called()
+
+
+class _NumbersPaginator(Paginator):
+    """Pages through the numbers below `total`."""
+
+    def __init__(self, client, total, **kwargs):
+        self.total = total
+        super().__init__(client, {}, per_page=2, **kwargs)
+
+    @property
+    def length(self):
+        return self.total
+
+    @property
+    def more(self):
+        return self.last_response is None or self.last_response["more"]
+
+    @property
+    def cursor(self):
+        return self.last_response and self.last_response["cursor"]
+
+    def convert_objects(self):
+        return self.last_response["numbers"]
+
+
+class _NumbersClient:
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    def execute(self, query, variable_values):
+        self.calls.append(variable_values)
+        start = variable_values["cursor"] or 0
+        end = min(start + variable_values["perPage"], self.total)
+        return {
+            "numbers": list(range(start, end)),
+            "cursor": end,
+            "more": end < self.total,
+        }
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginator_prefetch(prefetch):
+    client = _NumbersClient(total=100)
+
+    numbers = list(_NumbersPaginator(client, 100, prefetch=prefetch))
+
+    assert numbers == list(range(100))
+    if prefetch:
+        # pages are fast, so they get bigger
+        assert [call["perPage"] for call in client.calls] == [2, 4, 8, 16, 32, 64]
+    else:
+        assert len(client.calls) == 50
+
+
+def test_paginator_shrinks_slow_pages():
+    paginator = _NumbersPaginator(_NumbersClient(total=0), 0, prefetch=True)
+    paginator.per_page = 40
+
+    paginator._adjust_page_size(Paginator.MAX_PAGE_SECONDS + 1)
+    assert paginator.per_page == 20
+    paginator._adjust_page_size(Paginator.MIN_PAGE_SECONDS)
+    assert paginator.per_page == 20
+    paginator._adjust_page_size(0)
+    assert paginator.per_page == 40
+
+
+def _selected_run_fields(query):
+    (fragment,) = (
+        definition
+        for definition in query.definitions
+        if definition.name.value == "RunFragment"
+    )
+    return {selection.name.value for selection in fragment.selection_set.selections}
+
+
+def test_select_run_fields():
+    query = runs._select_run_fields(runs.Runs.QUERY, ["tags", "created_at"])
+
+    assert _selected_run_fields(query) == {
+        "id",
+        "name",
+        "displayName",
+        "state",
+        "sweepName",
+        "tags",
+        "createdAt",
+    }
+    # the original query is unchanged
+    assert "config" in _selected_run_fields(runs.Runs.QUERY)
+
+
+def test_select_unknown_run_field():
+    with pytest.raises(ValueError, match="Unknown run field"):
+        runs._select_run_fields(runs.Runs.QUERY, ["not_a_field"])
+
+
+def test_run_loads_unselected_fields():
+    attrs = {"id": "abc", "name": "run", "state": "finished", "sweepName": None}
+    full_attrs = {
+        **attrs,
+        "config": '{"lr": {"value": 0.1}}',
+        "summaryMetrics": '{"loss": 1}',
+        "systemMetrics": "{}",
+    }
+    client = mock.Mock()
+    client.execute.return_value = {"project": {"run": full_attrs}}
+    run = runs.Run(client, "entity", "project", "run", attrs, include_sweeps=False)
+    client.execute.assert_not_called()
+
+    assert run.config == {"lr": 0.1}
+    assert run.summary_metrics == {"loss": 1}
+    client.execute.assert_called_once()
+
+
+def test_run_loading_fields_keeps_local_changes():
+    attrs = {
+        "id": "abc",
+        "name": "run",
+        "state": "finished",
+        "sweepName": None,
+        "config": '{"lr": {"value": 1}}',
+    }
+    full_attrs = {
+        **attrs,
+        "tags": ["server"],
+        "description": None,
+        "notes": None,
+        "displayName": "run",
+        "group": None,
+        "summaryMetrics": '{"loss": 1}',
+        "systemMetrics": "{}",
+    }
+    client = mock.Mock()
+    client.execute.side_effect = lambda *args, **kwargs: {
+        "project": {"run": dict(full_attrs)},
+        "upsertBucket": {"bucket": dict(full_attrs)},
+    }
+    run = runs.Run(client, "entity", "project", "run", attrs, include_sweeps=False)
+
+    run.config["lr"] = 2
+    run.update()
+
+    (upsert,) = (
+        call
+        for call in client.execute.call_args_list
+        if "config" in call.kwargs["variable_values"]
+    )
+    assert upsert.kwargs["variable_values"]["tags"] == ["server"]
+    config = json.loads(upsert.kwargs["variable_values"]["config"])
+    assert config["lr"]["value"] == 2
@@ -0,0 +1,158 @@
+import re
+
+import pytest
+import requests
+import responses
+from wandb.sdk.internal import resumable_upload
+
+SIGNED_URL = (
+    "https://storage.googleapis.com/bucket/run/file.bin"
+    "?X-Goog-Signature=abc&X-Goog-SignedHeaders=host;x-goog-resumable"
+)
+SESSION_URL = "https://storage.googleapis.com/upload/bucket?upload_id=session-1"
+
+
+class FakeGCS:
+    """Serves the resumable upload protocol, optionally failing one chunk."""
+
+    def __init__(self, rsps, fail_at_offset=None):
+        self.data = b""
+        self.sessions_started = 0
+        self.fail_at_offset = fail_at_offset
+        rsps.add_callback(
+            responses.POST, re.compile(r".*/bucket/run/file\.bin.*"), self.start
+        )
+        rsps.add_callback(responses.PUT, re.compile(r".*upload_id=.*"), self.put)
+
+    def start(self, request):
+        assert request.headers["x-goog-resumable"] == "start"
+        self.sessions_started += 1
+        self.data = b""
+        return 201, {"Location": SESSION_URL}, ""
+
+    def put(self, request):
+        content_range = request.headers["Content-Range"]
+        match = re.match(r"bytes (\*|(\d+)-(\d+))/(\d+)", content_range)
+        total = int(match.group(4))
+        if match.group(1) != "*":
+            start = int(match.group(2))
+            if start == self.fail_at_offset:
+                self.fail_at_offset = None
+                return 503, {}, ""
+            assert start == len(self.data)
+            self.data += request.body
+        if len(self.data) == total:
+            return 200, {}, ""
+        headers = {"Range": f"bytes=0-{len(self.data) - 1}"} if self.data else {}
+        return 308, headers, ""
+
+
+@pytest.fixture
+def upload_file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(bytes(range(10)) * 3)
+    return path
+
+
+@pytest.fixture
+def store():
+    return resumable_upload.UploadSessionStore()
+
+
+def make_upload(path, store, url=SIGNED_URL, callback=None):
+    return resumable_upload.GCSResumableUpload(
+        requests.Session(),
+        url,
+        str(path),
+        {"x-goog-resumable": "start"},
+        store,
+        callback=callback,
+        chunk_size=8,
+    )
+
+
+@pytest.mark.parametrize(
+    "url, headers, expected",
+    [
+        (SIGNED_URL, {"x-goog-resumable": "start"}, "gcs"),
+        # Without the header the URL may only be signed for PUT.
+        (SIGNED_URL, {}, None),
+        (SESSION_URL, {}, "gcs"),
+        ("https://storage.googleapis.com/bucket/file?X-Goog-Signature=a", {}, None),
+        (
+            "https://storage.googleapis.com/bucket/file",
+            {"X-Goog-Resumable": "start"},
+            "gcs",
+        ),
+        ("https://bucket.s3.amazonaws.com/file?X-Amz-Signature=a", {}, None),
+    ],
+)
+def test_resumable_protocol(url, headers, expected):
+    assert resumable_upload.resumable_protocol(url, headers) == expected
+
+
+@responses.activate
+def test_uploads_in_chunks(upload_file, store):
+    gcs = FakeGCS(responses)
+    progress = []
+
+    make_upload(upload_file, store, callback=lambda _, t: progress.append(t)).upload()
+
+    assert gcs.data == upload_file.read_bytes()
+    assert progress == [0, 8, 16, 24, 30]
+    assert store.load(store.key(str(upload_file), SIGNED_URL)) is None
+
+
+@responses.activate
+def test_retry_resumes_from_last_acknowledged_chunk(upload_file, store):
+    gcs = FakeGCS(responses, fail_at_offset=16)
+
+    with pytest.raises(requests.HTTPError):
+        make_upload(upload_file, store).upload()
+    # A retry gets a freshly signed url for the same object.
+    make_upload(upload_file, store, url=SIGNED_URL + "&X-Goog-Date=later").upload()
+
+    assert gcs.sessions_started == 1
+    assert gcs.data == upload_file.read_bytes()
+
+
+@responses.activate
+def test_expired_session_restarts(upload_file, store):
+    gcs = FakeGCS(responses, fail_at_offset=8)
+    with pytest.raises(requests.HTTPError):
+        make_upload(upload_file, store).upload()
+
+    responses.replace(responses.PUT, re.compile(r".*upload_id=.*"), status=404)
+    responses.add_callback(responses.PUT, re.compile(r".*upload_id=.*"), gcs.put)
+    make_upload(upload_file, store).upload()
+
+    assert gcs.sessions_started == 2
+    assert gcs.data == upload_file.read_bytes()
+
+
+@responses.activate
+def test_modified_file_does_not_resume(upload_file, store):
+    gcs = FakeGCS(responses, fail_at_offset=16)
+    with pytest.raises(requests.HTTPError):
+        make_upload(upload_file, store).upload()
+
+    upload_file.write_bytes(b"x" * 20)
+    make_upload(upload_file, store).upload()
+
+    assert gcs.sessions_started == 2
+    assert gcs.data == b"x" * 20
+
+
+@responses.activate
+def test_file_growing_during_upload(upload_file, store):
+    gcs = FakeGCS(responses)
+    original = upload_file.read_bytes()
+
+    def append(new_bytes, total_bytes):
+        with open(upload_file, "ab") as f:
+            f.write(b"more")
+
+    make_upload(upload_file, store, callback=append).upload()
+
+    # The session's size is fixed when it starts.
+    assert gcs.data == original
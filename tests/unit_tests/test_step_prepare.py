@@ -2,11 +2,13 @@ import concurrent.futures
 import dataclasses
 import queue
 import threading
+import time
 from typing import TYPE_CHECKING, Iterable, Mapping, Tuple
 from unittest.mock import Mock, call
 
 import pytest
 from wandb.filesync.step_prepare import (
+    BatchSizer,
     Request,
     RequestFinish,
     RequestPrepare,
@@ -247,6 +249,36 @@ class TestGatherBatch:
         assert q.get.call_count == 2
 
 
+class TestBatchSizer:
+    def test_starts_at_initial_size(self):
+        assert BatchSizer(initial_size=10, max_size=100).size() == 10
+        assert BatchSizer(initial_size=1000, max_size=100).size() == 100
+
+    def test_grows_when_full_batches_are_fast(self):
+        sizer = BatchSizer(initial_size=10, max_size=35, target_latency=1)
+        sizer.observe(batch_size=10, latency=0.1)
+        assert sizer.size() == 20
+        sizer.observe(batch_size=20, latency=0.1)
+        assert sizer.size() == 35
+
+    def test_does_not_grow_from_partial_batches(self):
+        sizer = BatchSizer(initial_size=10, max_size=100, target_latency=1)
+        sizer.observe(batch_size=3, latency=0.1)
+        assert sizer.size() == 10
+
+    def test_holds_between_half_and_full_target(self):
+        sizer = BatchSizer(initial_size=10, max_size=100, target_latency=1)
+        sizer.observe(batch_size=10, latency=0.7)
+        assert sizer.size() == 10
+
+    def test_shrinks_when_batches_are_slow(self):
+        sizer = BatchSizer(initial_size=100, max_size=100, target_latency=1)
+        sizer.observe(batch_size=100, latency=4)
+        assert sizer.size() == 25
+        sizer.observe(batch_size=25, latency=100)
+        assert sizer.size() == 1
+
+
 class TestStepPrepare:
     @staticmethod
     def _bg_prepare(
@@ -345,3 +377,158 @@ class TestStepPrepare:
 
         step_prepare._thread.join()
         assert not step_prepare.is_alive()
+
+    def test_sends_batches_concurrently(self):
+        in_flight = threading.Semaphore(0)
+        release = threading.Event()
+
+        def create_artifact_files(specs):
+            in_flight.release()
+            release.wait()
+            return mock_create_artifact_files_result(s["name"] for s in specs)
+
+        api = Mock(create_artifact_files=Mock(side_effect=create_artifact_files))
+        step_prepare = StepPrepare(
+            api=api,
+            batch_time=1e-12,
+            inter_event_time=1e-12,
+            max_batch_size=1,
+            max_in_flight=2,
+        )
+        step_prepare.start()
+
+        future_a = self._bg_prepare(step_prepare, simple_file_spec(name="a"))
+        future_b = self._bg_prepare(step_prepare, simple_file_spec(name="b"))
+        assert in_flight.acquire(timeout=5)
+        assert in_flight.acquire(timeout=5)
+        release.set()
+
+        assert future_a.result(timeout=5).upload_url.endswith("upload-url-a")
+        assert future_b.result(timeout=5).upload_url.endswith("upload-url-b")
+        step_prepare.shutdown()
+        assert step_prepare.stats().batches == 2
+
+    def test_prefetches_upload_urls(self):
+        api = Mock(
+            create_artifact_files=Mock(
+                side_effect=lambda specs: mock_create_artifact_files_result(
+                    s["name"] for s in specs
+                )
+            )
+        )
+        step_prepare = StepPrepare(
+            api=api, batch_time=1, inter_event_time=1, max_batch_size=10
+        )
+        step_prepare.start()
+        step_prepare.prefetch([simple_file_spec(name="a"), simple_file_spec(name="b")])
+
+        for name in ["a", "b"]:
+            res = step_prepare.prepare(simple_file_spec(name=name)).get(timeout=5)
+            assert res.upload_url == f"http://wandb-test/upload-url-{name}"
+        step_prepare.shutdown()
+
+        api.create_artifact_files.assert_called_once()
+        stats = step_prepare.stats()
+        assert stats.files == 2
+        assert stats.prefetched_files == 2
+
+    def test_prefetch_stays_ahead_by_max_prefetch(self):
+        api = Mock(
+            create_artifact_files=Mock(
+                side_effect=lambda specs: mock_create_artifact_files_result(
+                    s["name"] for s in specs
+                )
+            )
+        )
+        step_prepare = StepPrepare(
+            api=api,
+            batch_time=1e-12,
+            inter_event_time=1e-12,
+            max_batch_size=10,
+            max_prefetch=2,
+        )
+        step_prepare.start()
+        consumed = []
+
+        def specs():
+            for i in range(100):
+                consumed.append(i)
+                yield simple_file_spec(name=str(i))
+
+        step_prepare.prefetch(specs())
+        for i in range(5):
+            step_prepare.prepare(simple_file_spec(name=str(i))).get(timeout=5)
+        step_prepare.shutdown()
+
+        # At most two files ahead of the last one prepared, plus the one the
+        # prefetcher is holding until there's room for it.
+        assert len(consumed) <= 8
+        assert step_prepare.stats().files <= 7
+
+    def test_prepare_before_prefetch(self):
+        api = Mock(
+            create_artifact_files=Mock(
+                side_effect=lambda specs: mock_create_artifact_files_result(
+                    s["name"] for s in specs
+                )
+            )
+        )
+        step_prepare = StepPrepare(
+            api=api, batch_time=1e-12, inter_event_time=1e-12, max_batch_size=10
+        )
+        step_prepare.start()
+        enqueued = threading.Event()
+
+        def specs():
+            yield simple_file_spec(name="a")
+            enqueued.wait()
+            yield simple_file_spec(name="b")
+            yield simple_file_spec(name="c")
+
+        step_prepare.prefetch(specs())
+        res_b = step_prepare.prepare(simple_file_spec(name="b"))
+        enqueued.set()
+        step_prepare.prepare(simple_file_spec(name="c")).get(timeout=5)
+        step_prepare.shutdown()
+
+        assert res_b.get(timeout=5).upload_url.endswith("upload-url-b")
+        # "b" was only requested once, by prepare().
+        requested = [
+            spec["name"]
+            for args in api.create_artifact_files.call_args_list
+            for spec in args[0][0]
+        ]
+        assert sorted(requested) == ["a", "b", "c"]
+
+    def test_claims_are_forgotten_after_prefetching(self):
+        api = Mock(
+            create_artifact_files=Mock(
+                side_effect=lambda specs: mock_create_artifact_files_result(
+                    s["name"] for s in specs
+                )
+            )
+        )
+        step_prepare = StepPrepare(
+            api=api, batch_time=1e-12, inter_event_time=1e-12, max_batch_size=10
+        )
+        step_prepare.start()
+        release = threading.Event()
+
+        def specs():
+            yield simple_file_spec(name="a")
+            release.wait()
+
+        step_prepare.prefetch(specs())
+        step_prepare.prepare(simple_file_spec(name="other")).get(timeout=5)
+        assert step_prepare._claimed == {"other"}
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while step_prepare._claimed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not step_prepare._claimed
+
+        # Nothing is recorded once no prefetcher is running.
+        step_prepare.prepare(simple_file_spec(name="later")).get(timeout=5)
+        step_prepare.shutdown()
+        assert not step_prepare._claimed
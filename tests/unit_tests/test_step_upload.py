@@ -4,7 +4,7 @@ import random
 import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, Iterable, MutableSequence, Optional
+from typing import Any, Callable, Iterable, List, MutableSequence, Optional
 from unittest.mock import DEFAULT, Mock
 
 import pytest
@@ -16,7 +16,7 @@ from wandb.filesync.step_upload import (
     RequestUpload,
     StepUpload,
 )
-from wandb.sdk.internal import file_stream, internal_api
+from wandb.sdk.internal import file_stream, internal_api, resumable_upload
 
 
 def mock_upload_urls(
@@ -95,6 +95,7 @@ def make_api(**kwargs: Any) -> Mock:
         **{
             "upload_urls": Mock(wraps=mock_upload_urls),
             "upload_file_retry": Mock(wraps=mock_upload_file_retry),
+            "upload_file_resumable_retry": Mock(),
             "_extra_http_headers": {},
             **kwargs,
         },
@@ -256,6 +257,69 @@ class TestUpload:
         api.upload_file_retry.assert_called_once()
         assert api.upload_file_retry.call_args[0][0] == get_upload_url(cmd.save_name)
 
+    @pytest.mark.parametrize(
+        "size, copied, headers, resumable",
+        [
+            (10, True, ["x-goog-resumable:start"], False),
+            (1000, True, ["x-goog-resumable:start"], True),
+            # The file may change while it's uploaded.
+            (1000, False, ["x-goog-resumable:start"], False),
+            # The URL may only be signed for PUT.
+            (1000, True, [], False),
+        ],
+    )
+    def test_large_files_use_resumable_upload(
+        self,
+        tmp_path: Path,
+        monkeypatch,
+        size: int,
+        copied: bool,
+        headers: List[str],
+        resumable: bool,
+    ):
+        monkeypatch.setattr(resumable_upload, "MIN_RESUMABLE_SIZE", 100)
+        url = "https://storage.googleapis.com/bucket/f?X-Goog-SignedHeaders=host;x-goog-resumable"
+        api = make_api(
+            upload_urls=Mock(
+                side_effect=lambda project, files, **kwargs: (
+                    "some-bucket",
+                    headers,
+                    {file: {"uploadUrl": url} for file in files},
+                )
+            ),
+        )
+        f = tmp_path / "file.bin"
+        f.write_bytes(b"0" * size)
+
+        run_step_upload([make_request_upload(f, copied=copied)], api=api)
+
+        assert api.upload_file_resumable_retry.called is resumable
+        assert api.upload_file_retry.called is not resumable
+        if resumable:
+            assert api.upload_file_resumable_retry.call_args[0][:2] == (url, str(f))
+
+    def test_failed_resumable_upload_discards_session(
+        self, tmp_path: Path, monkeypatch
+    ):
+        monkeypatch.setattr(resumable_upload, "MIN_RESUMABLE_SIZE", 100)
+        url = "https://storage.googleapis.com/bucket/f"
+        api = make_api(
+            upload_urls=Mock(
+                side_effect=lambda project, files, **kwargs: (
+                    "some-bucket",
+                    ["x-goog-resumable:start"],
+                    {file: {"uploadUrl": url} for file in files},
+                )
+            ),
+            upload_file_resumable_retry=Mock(side_effect=Exception("upload failed")),
+        )
+        f = tmp_path / "file.bin"
+        f.write_bytes(b"0" * 1000)
+
+        run_step_upload([make_request_upload(f, copied=True)], api=api)
+
+        api.discard_upload_session.assert_called_once_with(url, str(f))
+
     def test_reuploads_if_event_during_upload(self, tmp_path: Path):
         f = make_tmp_file(tmp_path)
 
@@ -285,6 +349,40 @@ class TestUpload:
         finish_and_wait(q)
         assert api.upload_file_retry.call_count == 2
 
+    def test_coalesces_saves_during_upload(self, tmp_path: Path):
+        f = make_tmp_file(tmp_path)
+
+        api = UploadBlockingMockApi()
+
+        q = queue.Queue()
+        q.put(make_request_upload(f))
+
+        step_upload = make_step_upload(api=api, event_queue=q)
+        scheduled = threading.Semaphore(0)
+        push = step_upload._scheduler.push
+
+        def counting_push(job):
+            superseded = push(job)
+            scheduled.release()
+            return superseded
+
+        step_upload._scheduler.push = counting_push
+        step_upload.start()
+
+        unblock = api.wait_for_upload(2)
+        for _ in range(3):
+            q.put(make_request_upload(f))
+        for _ in range(4):
+            assert scheduled.acquire(timeout=2)
+        unblock()
+
+        unblock = api.wait_for_upload(2)
+        assert unblock
+        unblock()
+
+        finish_and_wait(q)
+        assert api.upload_file_retry.call_count == 2
+
     @pytest.mark.parametrize("copied", [True, False])
     def test_deletes_after_upload_iff_copied(self, tmp_path: Path, copied: bool):
         f = make_tmp_file(tmp_path)
@@ -258,3 +258,181 @@ def test_datetime_conversion():
         [975628800000, 975628800000, 975628800000, 1],
         [975715200000, 975715200000, 975715200000, 2],
     ]
+
+
+class _LoggedArtifact:
+    """Gives a table the files added to a draft artifact as if downloaded."""
+
+    def __init__(self, artifact):
+        self.artifact = artifact
+        self.manifest = artifact.manifest
+        self.downloaded = []
+
+    def get_entry(self, name):
+        entry = self.artifact.manifest.entries[name]
+
+        def download(_):
+            self.downloaded.append(name)
+            return entry.local_path
+
+        return type("Entry", (), {"download": download})()
+
+
+def test_columnar_round_trip():
+    utc = datetime.timezone.utc
+    table = wandb.Table(
+        columns=["i", "f", "b", "s", "t"],
+        data=[
+            [1, 1.5, True, "héllo", datetime.datetime(2020, 1, 1, tzinfo=utc)],
+            [2, None, False, "", datetime.date(2021, 1, 2)],
+            [3, 2.5, None, None, np.datetime64("2022-01-03")],
+        ],
+        columnar=True,
+    )
+    artifact = wandb.Artifact("name", type="dataset")
+
+    json_obj = table.to_json(artifact)
+    assert json_obj["data"] == []
+    assert json_obj["nrows"] == 3
+    assert json_obj["columnar"]["path"] in artifact.manifest.entries
+
+    loaded = wandb.Table.from_json(json_obj, _LoggedArtifact(artifact))
+    assert loaded._column_types == table._column_types
+    assert loaded.data == [
+        [1, 1.5, True, "héllo", datetime.datetime(2020, 1, 1, tzinfo=utc)],
+        [2, None, False, "", datetime.datetime(2021, 1, 2, tzinfo=utc)],
+        [3, 2.5, None, None, datetime.datetime(2022, 1, 3, tzinfo=utc)],
+    ]
+
+    column = loaded.get_column("i", convert_to="numpy")
+    assert column.tolist() == [1, 2, 3]
+    assert not column.flags.writeable
+    assert loaded.get_column("f", convert_to="numpy").tolist() == [1.5, None, 2.5]
+
+    loaded.add_data(4, 3.5, True, "x", None)
+    assert loaded.get_column("i", convert_to="numpy").tolist() == [1, 2, 3, 4]
+
+
+def test_columnar_only_when_requested_for_scalar_tables():
+    artifact = wandb.Artifact("name", type="dataset")
+    table = wandb.Table(columns=["a"], data=[[1], [2], [3]])
+    json_obj = table.to_json(artifact)
+    assert "columnar" not in json_obj
+    assert json_obj["data"] == [[1], [2], [3]]
+
+    table = wandb.Table(columns=["a"], data=[[1], [2], [3]], columnar=True)
+    assert "columnar" in table.to_json(artifact)
+    run_table = wandb.Artifact("run-abc-key", type="run_table")
+    json_obj = table.to_json(run_table)
+    assert "columnar" not in json_obj
+    assert json_obj["data"] == [[1], [2], [3]]
+
+    table = wandb.Table(columns=["a"], data=[[[1]], [[2]], [[3]]], columnar=True)
+    json_obj = table.to_json(artifact)
+    assert "columnar" not in json_obj
+    assert json_obj["data"] == [[[1]], [[2]], [[3]]]
+
+
+def test_fk_add_data_with_keys():
+    table_a = wandb.Table(columns=["id", "col_1"], data=[["1", "a"], ["2", "b"]])
+    table_a.set_pk("id")
+
+    table = wandb.Table(columns=["fk", "col_2"])
+    for row in table_a.data:
+        table.add_data(row[0], "c")
+    table.add_data("1", "d")
+
+    assert isinstance(table._column_types.params["type_map"]["fk"], _ForeignKeyType)
+    assert [row[0] for row in table.data] == ["1", "2", "1"]
+    assert [row[0].get_row()["col_1"] for row in table.data] == ["a", "b", "a"]
+
+
+def test_pk_index():
+    table = wandb.Table(columns=["id", "col_1"], data=[["1", "a"], ["2", "b"]])
+    table.set_pk("id")
+    table.add_data("3", "c")
+    table.add_data("1", "d")
+
+    assert table._pk_index == {"1": 0, "2": 1, "3": 2}
+    assert table.data[3][0].get_row() == {"id": "1", "col_1": "a"}
+
+
+def test_joined_table_get_table():
+    table_1 = wandb.Table(columns=["id", "a"], data=[["1", 1], ["2", 2], ["3", 3]])
+    table_1.set_pk("id")
+    table_2 = wandb.Table(columns=["key", "b"], data=[["2", "x"], ["1", "y"]])
+    table_2.add_data("2", "z")
+
+    joined = wandb.JoinedTable(table_1, table_2, ["id", "key"]).get_table()
+    assert joined.columns == ["0.id", "0.a", "1.key", "1.b"]
+    assert joined.data == [
+        ["1", 1, "1", "y"],
+        ["2", 2, "2", "x"],
+        ["2", 2, "2", "z"],
+    ]
+    assert joined._pk_col is None
+
+    with pytest.raises(ValueError):
+        wandb.JoinedTable("t1.table.json", table_2, "id").get_table()
+
+
+def _make_partitioned_table():
+    artifact = wandb.Artifact("name", type="dataset")
+    for part in range(3):
+        table = wandb.Table(
+            columns=["id", "value"],
+            data=[[part * 10 + i, float(i)] for i in range(5)],
+        )
+        artifact.add(table, f"parts/{part}")
+    logged = _LoggedArtifact(artifact)
+    return wandb.data_types.PartitionedTable.from_json(
+        {"parts_path": "parts"}, logged
+    ), logged
+
+
+def test_table_iter_batches():
+    table = wandb.Table(columns=["a", "b"], data=[[i, str(i)] for i in range(5)])
+
+    assert list(table.iter_batches(2, columns=["b"])) == [
+        [["0"], ["1"]],
+        [["2"], ["3"]],
+        [["4"]],
+    ]
+    batches = list(table.iter_batches(3, convert_to="numpy"))
+    assert batches[1]["a"].tolist() == [3, 4]
+    assert batches[1]["b"].tolist() == ["3", "4"]
+    batches = list(table.iter_batches(3, convert_to="pandas"))
+    assert batches[0]["a"].tolist() == [0, 1, 2]
+
+
+def test_partitioned_table_iter_batches():
+    partitioned, logged = _make_partitioned_table()
+
+    batches = list(partitioned.iter_batches(3, columns=["id"]))
+    assert [len(batch) for batch in batches] == [3, 2, 3, 2, 3, 2]
+    assert [row[0] for batch in batches for row in batch] == [
+        part * 10 + i for part in range(3) for i in range(5)
+    ]
+    # Parts read ahead are downloaded again from the cache when they're loaded.
+    assert sorted(set(logged.downloaded)) == [
+        "parts/0.table.json",
+        "parts/1.table.json",
+        "parts/2.table.json",
+    ]
+
+
+def test_partitioned_table_iter_batches_filters_parts():
+    partitioned, logged = _make_partitioned_table()
+
+    batches = list(
+        partitioned.iter_batches(
+            convert_to="numpy",
+            part_filter=lambda entry: entry.path != "parts/1.table.json",
+            read_ahead=0,
+        )
+    )
+    assert [batch["id"].tolist() for batch in batches] == [
+        [0, 1, 2, 3, 4],
+        [20, 21, 22, 23, 24],
+    ]
+    assert logged.downloaded == ["parts/0.table.json", "parts/2.table.json"]
@@ -0,0 +1,141 @@
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from wandb.filesync import upload_scheduler
+from wandb.filesync.step_upload import RequestUpload
+from wandb.filesync.upload_scheduler import UploadClass, UploadScheduler
+from wandb.sdk.lib.paths import LogicalPath
+
+
+def make_job(tmp_path: Path, save_name: str, size: int = 10, **kwargs: Any):
+    path = tmp_path / save_name.replace("/", "_")
+    path.write_bytes(b"0" * size)
+    return RequestUpload(
+        path=str(path),
+        save_name=LogicalPath(save_name),
+        **{
+            "artifact_id": None,
+            "md5": None,
+            "copied": False,
+            "save_fn": None,
+            "digest": None,
+            **kwargs,
+        },
+    )
+
+
+def drain(scheduler: UploadScheduler) -> List[str]:
+    order = []
+    while True:
+        job = scheduler.pop(busy=())
+        if job is None:
+            return order
+        order.append(job.save_name)
+        scheduler.done(job)
+
+
+@pytest.mark.parametrize(
+    "save_name, size, artifact_id, expected",
+    [
+        ("wandb-summary.json", 10, None, UploadClass.METADATA),
+        ("config.yaml", 10, None, UploadClass.METADATA),
+        ("media/images/a.png", 10, None, UploadClass.MEDIA),
+        ("notes.txt", 10, None, UploadClass.MEDIA),
+        ("model.pt", 10, "art-1", UploadClass.ARTIFACT),
+        ("model.pt", 10**9, "art-1", UploadClass.BULK),
+        ("checkpoint.pt", 10**9, None, UploadClass.BULK),
+    ],
+)
+def test_classify(tmp_path, save_name, size, artifact_id, expected):
+    job = make_job(tmp_path, save_name, artifact_id=artifact_id)
+    assert upload_scheduler.classify(job, size) == expected
+
+
+def test_metadata_goes_before_bulk(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_scheduler, "BULK_THRESHOLD", 1000)
+    scheduler = UploadScheduler(max_running=4)
+    scheduler.push(make_job(tmp_path, "checkpoint.pt", size=5000))
+    scheduler.push(make_job(tmp_path, "model.pt", artifact_id="art-1"))
+    scheduler.push(make_job(tmp_path, "media/a.png"))
+    scheduler.push(make_job(tmp_path, "wandb-summary.json"))
+
+    assert drain(scheduler) == [
+        "wandb-summary.json",
+        "media/a.png",
+        "model.pt",
+        "checkpoint.pt",
+    ]
+
+
+def test_bulk_is_not_starved(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_scheduler, "BULK_THRESHOLD", 1000)
+    scheduler = UploadScheduler(max_running=4)
+    scheduler.push(make_job(tmp_path, "checkpoint.pt", size=5000))
+    for i in range(20):
+        scheduler.push(make_job(tmp_path, f"media/{i}.png"))
+
+    order = drain(scheduler)
+
+    assert order.index("checkpoint.pt") < len(order) - 1
+
+
+def test_low_priority_uploads_leave_a_slot_free(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_scheduler, "BULK_THRESHOLD", 1000)
+    scheduler = UploadScheduler(max_running=4)
+    for i in range(4):
+        scheduler.push(make_job(tmp_path, f"checkpoint-{i}.pt", size=5000))
+    # A metadata upload is waiting for an earlier upload of the same file.
+    scheduler.push(make_job(tmp_path, "wandb-summary.json"))
+    busy = [LogicalPath("wandb-summary.json")]
+
+    started = [scheduler.pop(busy=busy) for _ in range(4)]
+    assert started[-1] is None
+
+    assert scheduler.pop(busy=()).save_name == "wandb-summary.json"
+
+
+def test_low_priority_uploads_borrow_idle_slots(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_scheduler, "BULK_THRESHOLD", 1000)
+    scheduler = UploadScheduler(max_running=4)
+    for i in range(5):
+        scheduler.push(make_job(tmp_path, f"checkpoint-{i}.pt", size=5000))
+
+    started = [scheduler.pop(busy=()) for _ in range(5)]
+    assert all(job is not None for job in started[:4])
+    assert started[4] is None
+
+    scheduler.push(make_job(tmp_path, "wandb-summary.json"))
+    assert scheduler.pop(busy=()) is None
+    scheduler.done(started[0])
+    assert scheduler.pop(busy=()).save_name == "wandb-summary.json"
+
+
+def test_coalesces_pending_versions_of_a_file(tmp_path):
+    scheduler = UploadScheduler(max_running=4)
+    first = make_job(tmp_path, "media/a.png")
+    second = first._replace(path=first.path + ".v2")
+
+    assert scheduler.push(first) is None
+    assert scheduler.push(second) is first
+    assert len(scheduler) == 1
+    assert scheduler.pop(busy=()) == second
+
+
+def test_does_not_coalesce_artifact_files(tmp_path):
+    scheduler = UploadScheduler(max_running=4)
+    job = make_job(tmp_path, "model.pt", artifact_id="art-1")
+
+    assert scheduler.push(job) is None
+    assert scheduler.push(job) is None
+    assert len(scheduler) == 2
+
+
+def test_skips_busy_files(tmp_path):
+    scheduler = UploadScheduler(max_running=4)
+    scheduler.push(make_job(tmp_path, "wandb-summary.json"))
+    scheduler.push(make_job(tmp_path, "media/a.png"))
+
+    job = scheduler.pop(busy={LogicalPath("wandb-summary.json")})
+
+    assert job.save_name == "media/a.png"
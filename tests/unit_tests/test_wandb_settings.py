@@ -568,6 +568,59 @@ def test_copy_update_linked_properties():
     assert "offline-run" in s2.sync_dir
 
 
+def test_copy_keeps_sources():
+    s = Settings()
+    s.update(project="env-project", source=Source.ENV)
+    s.update(_disable_service=True, source=Source.INIT)
+
+    s2 = s.copy()
+    # lower priority sources don't override the copied values
+    s2.update(project="base-project", source=Source.BASE)
+    s2.update(_disable_service=False, source=Source.SETTINGS)
+    assert s2.project == "env-project"
+    assert s2._disable_service is True
+
+
+def test_proto_round_trip():
+    from wandb.sdk.internal.settings_static import SettingsStatic
+
+    s = Settings(
+        project="test",
+        run_tags=("a", "b"),
+        _stats_open_metrics_filters={"metric": {"label": "value"}},
+    )
+    s.update(fork_from="abc?_step=3")
+    static = SettingsStatic(s.to_proto())
+
+    assert static.project == "test"
+    assert static.run_tags == ("a", "b")
+    assert static._stats_open_metrics_filters == {"metric": {"label": "value"}}
+    assert static.fork_from == wandb_settings.RunMoment(
+        run="abc", value=3, metric="_step"
+    )
+    assert static.resume_from is None
+    assert static.run_notes is None
+    assert set(s.keys()) <= set(static.keys())
+
+
+def test_load_config_file_cache(tmp_path):
+    config_file = tmp_path / "settings"
+    config_file.write_text("[default]\nproject = first\nignore_globs = a,b\n")
+    config = Settings._load_config_file(str(config_file))
+    assert config == {"project": "first", "ignore_globs": ["a", "b"]}
+
+    # the returned dict is a copy of the cached one
+    config["ignore_globs"].append("c")
+    assert Settings._load_config_file(str(config_file))["ignore_globs"] == ["a", "b"]
+
+    config_file.write_text("[default]\nproject = second\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert Settings._load_config_file(str(config_file)) == {"project": "second"}
+
+    assert Settings._load_config_file(str(tmp_path / "missing")) == {}
+
+
 def test_invalid_dict():
     s = Settings()
     with pytest.raises(KeyError):
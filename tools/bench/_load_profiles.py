@@ -11,6 +11,12 @@ VARIANTS = {
     "core=true": {
         "core": "true",
     },
+    "introspection_cache=false": {
+        "introspection_cache": "false",
+    },
+    "introspection_cache=true": {
+        "introspection_cache": "true",
+    },
 }
 
 ALL_VARIANTS = {
@@ -37,6 +43,16 @@ PROFILES = {
         },
         "variants": ALL_VARIANTS,
     },
+    "v1-startup": {
+        "all": {
+            "num_sequential": 10,
+        },
+        "variants": {
+            "mode": ("online",),
+            "core": ("false",),
+            "introspection_cache": ("false", "true"),
+        },
+    },
     "v1-images": {
         "all": {
             "history_images": 10,
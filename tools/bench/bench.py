@@ -73,11 +73,17 @@ def setup(args):
         os.environ["WANDB__REQUIRE_LEGACY_SERVICE"] = "false"
     elif args.core == "false":
         os.environ["WANDB__REQUIRE_LEGACY_SERVICE"] = "true"
+    if args.introspection_cache == "false":
+        os.environ["WANDB_INTROSPECTION_CACHE_TTL"] = "0"
+    elif args.introspection_cache == "true":
+        # Warm the on-disk cache so the timed runs measure cache hits.
+        run_one(args)
 
 
 def teardown(args):
     wandb.teardown()
     os.environ.pop("WANDB__REQUIRE_LEGACY_SERVICE", None)
+    os.environ.pop("WANDB_INTROSPECTION_CACHE_TTL", None)
 
 
 @_timing.timeit(TIMING_DATA)
@@ -118,6 +124,9 @@ def main():
         "--mode", type=str, default="online", choices=("online", "offline")
     )
     parser.add_argument("--core", type=str, default="", choices=("true", "false"))
+    parser.add_argument(
+        "--introspection_cache", type=str, default="", choices=("true", "false")
+    )
     parser.add_argument("--use-spawn", action="store_true")
 
     args = parser.parse_args()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Measure how fast files are staged when a directory is added to an artifact.
+
+With the default "mutable" policy every file is copied to the staging area and
+hashed before the artifact is logged.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import _timing
+import wandb
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def make_tree(root: str, num_files: int, file_size: int) -> None:
+    data = os.urandom(file_size)
+    for i in range(num_files):
+        dirname = os.path.join(root, f"{i // 100:04d}")
+        os.makedirs(dirname, exist_ok=True)
+        with open(os.path.join(dirname, f"{i:06d}.bin"), "wb") as f:
+            f.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark Artifact.add_dir")
+    parser.add_argument("--num-files", type=int, default=1000)
+    parser.add_argument("--file-size-mb", type=float, default=1)
+    parser.add_argument("--dir", default=None, help="where to create the files")
+    parser.add_argument("--policy", default="mutable")
+    args = parser.parse_args()
+
+    file_size = int(args.file_size_mb * 1024 * 1024)
+    root = tempfile.mkdtemp(dir=args.dir)
+    try:
+        source = os.path.join(root, "source")
+        make_tree(source, args.num_files, file_size)
+        os.environ["WANDB_DATA_DIR"] = os.path.join(root, "data")
+
+        artifact = wandb.Artifact("bench", type="dataset")
+        start = time.perf_counter()
+        artifact.add_dir(source, policy=args.policy)
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    gb_per_s = args.num_files * file_size / elapsed / 1e9
+    print(f"add_dir: {elapsed:.2f}s, {gb_per_s:.2f} GB/s")
+    _timing.write(
+        BENCH_OUTFILE,
+        [_timing.FunctionTiming("add_dir", elapsed)],
+        prefix_list=[
+            VERSION,
+            "add_dir",
+            "",
+            f"files={args.num_files},size={args.file_size_mb}MB,{args.policy}",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Measure what storing a new version of an appended-to file uploads.
+
+Stores a file with the chunked storage policy into a local chunk store, then
+appends to it and stores it again, counting the bytes of chunks written to
+the chunk store for the new version. The upload to W&B goes to a mock API.
+"""
+
+import argparse
+import os
+import queue
+import tempfile
+import time
+from unittest.mock import Mock
+
+import _timing
+from wandb.filesync.step_prepare import ResponsePrepare
+from wandb.sdk.artifacts.artifact_file_cache import ArtifactFileCache
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.storage_policies import ChunkedStoragePolicy
+from wandb.sdk.artifacts.storage_policies.chunked_storage_policy import LocalChunkStore
+from wandb.sdk.lib.hashutil import md5_file_b64
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+class CountingChunkStore(LocalChunkStore):
+    uploaded = 0
+
+    def put(self, digest, data):
+        self.uploaded += len(data)
+        super().put(digest, data)
+
+
+def store(policy, path):
+    entry = ArtifactManifestEntry(
+        path="data.bin",
+        digest=md5_file_b64(path),
+        local_path=path,
+        size=os.path.getsize(path),
+    )
+    policy.store_file("artifact", "manifest", entry, Mock(prepare=prepare))
+
+
+def prepare(spec):
+    q = queue.Queue()
+    q.put(
+        ResponsePrepare(
+            birth_artifact_id="artifact",
+            upload_url="http://wandb-test/upload-url",
+            upload_headers=[],
+            upload_id=None,
+            storage_path="wandb_artifact/1",
+            multipart_upload_urls=None,
+        )
+    )
+    return q
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark chunked storage")
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--append-mb", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        chunk_store = CountingChunkStore(os.path.join(tmp, "chunks"))
+        policy = ChunkedStoragePolicy(
+            cache=ArtifactFileCache(os.path.join(tmp, "cache")),
+            api=Mock(),
+            chunk_store=chunk_store,
+        )
+        path = os.path.join(tmp, "data.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(args.size_mb * 1024**2))
+        store(policy, path)
+
+        with open(path, "ab") as f:
+            f.write(os.urandom(args.append_mb * 1024**2))
+        chunk_store.uploaded = 0
+        start = time.perf_counter()
+        store(policy, path)
+        elapsed = time.perf_counter() - start
+
+    size = args.size_mb + args.append_mb
+    print(
+        f"store_file: {elapsed:.2f}s, stored "
+        f"{chunk_store.uploaded / 1024**2:.1f}MB of {size}MB in the chunk store"
+    )
+    _timing.write(
+        BENCH_OUTFILE,
+        [_timing.FunctionTiming("store_file", elapsed)],
+        prefix_list=[
+            VERSION,
+            "chunked",
+            "",
+            f"size_mb={args.size_mb},append_mb={args.append_mb}",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Measure the CPU a run's directory watcher uses while no files change.
+
+For each backend and file count, fills a run files directory with that many
+files (split between media/ and user directories), starts a DirWatcher on it,
+and records the CPU time the process spends over an idle interval.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import types
+from unittest import mock
+
+import _timing
+from wandb.filesync.dir_watcher import DirWatcher
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def make_files(root: str, num_files: int) -> None:
+    for i in range(num_files):
+        subdir = os.path.join(root, "media" if i % 2 else "data", str(i // 1000))
+        os.makedirs(subdir, exist_ok=True)
+        with open(os.path.join(subdir, f"{i}.txt"), "w") as f:
+            f.write(str(i))
+
+
+def idle_cpu(backend: str, num_files: int, idle_seconds: float) -> float:
+    os.environ["WANDB_DIR_WATCHER"] = backend
+    with tempfile.TemporaryDirectory() as files_dir:
+        make_files(files_dir, num_files)
+        settings = types.SimpleNamespace(
+            files_dir=files_dir,
+            ignore_globs=[],
+            _live_policy_rate_limit=None,
+            _live_policy_wait_time=None,
+        )
+        watcher = DirWatcher(settings, mock.Mock(), files_dir)  # type: ignore[arg-type]
+        # Let the watcher take its initial snapshot before measuring.
+        time.sleep(2)
+        start = time.process_time()
+        time.sleep(idle_seconds)
+        used = time.process_time() - start
+        watcher.finish()
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark DirWatcher idle CPU")
+    parser.add_argument(
+        "--backends", nargs="+", default=["polling", "inotify"], help="watchers"
+    )
+    parser.add_argument(
+        "--num_files", nargs="+", type=int, default=[100, 1000, 10000, 50000]
+    )
+    parser.add_argument("--idle_seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    for backend in args.backends:
+        for num_files in args.num_files:
+            used = idle_cpu(backend, num_files, args.idle_seconds)
+            timings = [_timing.FunctionTiming("idle_cpu", used)]
+            variant = f"backend={backend},num_files={num_files}"
+            print(f"{variant}: {used:.3f}s CPU over {args.idle_seconds}s idle")
+            _timing.write(
+                BENCH_OUTFILE,
+                timings,
+                prefix_list=[VERSION, "dir_watcher_idle", "", variant],
+            )
+
+
+if __name__ == "__main__":
+    main()
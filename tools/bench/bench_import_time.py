@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Measure how long `import wandb` takes.
+
+Imports each module in fresh interpreters with `-X importtime` and records the
+median cumulative import time. With `--max_seconds`, exits with an error if
+the median is over the limit, so this can be used to catch regressions.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import _timing
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """Import a module in a new interpreter; return (self, cumulative) us per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header
+        times.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark import time")
+    parser.add_argument("--modules", nargs="+", default=["wandb"])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--top", type=int, default=0, help="show the slowest imported modules"
+    )
+    parser.add_argument(
+        "--max_seconds", type=float, help="fail if the median import is slower"
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        runs: List[Dict[str, Tuple[int, int]]] = [
+            import_times(module) for _ in range(args.repeat)
+        ]
+        seconds = statistics.median(run[module][1] for run in runs) / 1e6
+        print(f"{module}: {seconds:.3f}s, {len(runs[-1])} modules imported")
+        if args.top:
+            slowest = sorted(runs[-1].items(), key=lambda item: -item[1][0])
+            for name, (self_us, _) in slowest[: args.top]:
+                print(f"  {self_us / 1e3:8.1f}ms  {name}")
+        _timing.write(
+            BENCH_OUTFILE,
+            [_timing.FunctionTiming("import", seconds)],
+            prefix_list=[VERSION, "import_time", "", f"module={module}"],
+        )
+        if args.max_seconds is not None and seconds > args.max_seconds:
+            print(f"{module}: import took longer than {args.max_seconds}s")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Measure the time and memory it takes to load and use a large artifact manifest.
+
+Downloading an artifact loads its whole `wandb_manifest.json`, and computing
+its digest or creating a new version from it goes over all of its entries.
+"""
+
+import argparse
+import base64
+import gc
+import hashlib
+import json
+import time
+import tracemalloc
+
+import _timing
+from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
+from wandb.sdk.artifacts.artifact_manifests import artifact_manifest_v1  # noqa: F401
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def manifest_text(num_files: int) -> str:
+    contents = {}
+    for i in range(num_files):
+        digest = base64.b64encode(hashlib.md5(str(i).encode()).digest()).decode()
+        contents[f"images/{i // 1000:05d}/{i:08d}.png"] = {
+            "digest": digest,
+            "birthArtifactID": "QXJ0aWZhY3Q6MTIzNDU2Nzg=",
+            "size": 1000 + i,
+        }
+    return json.dumps(
+        {
+            "version": 1,
+            "storagePolicy": "wandb-storage-policy-v1",
+            "storagePolicyConfig": {"storageLayout": "V2"},
+            "contents": contents,
+        }
+    )
+
+
+def load(text: str) -> ArtifactManifest:
+    from_chunks = getattr(ArtifactManifest, "from_manifest_chunks", None)
+    if from_chunks is None:
+        return ArtifactManifest.from_manifest_json(json.loads(text))
+    chunk_size = 1024 * 1024
+    return from_chunks(
+        text[i : i + chunk_size] for i in range(0, len(text), chunk_size)
+    )
+
+
+def record(name: str, seconds: float, num_files: int) -> None:
+    _timing.write(
+        BENCH_OUTFILE,
+        [_timing.FunctionTiming(name, seconds)],
+        prefix_list=[VERSION, "manifest", "", f"files={num_files}"],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark artifact manifests")
+    parser.add_argument("--num-files", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    text = manifest_text(args.num_files)
+    gc.collect()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    manifest = load(text)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"load: {elapsed:.2f}s, {retained / 2**20:.0f} MiB, peak {peak / 2**20:.0f} MiB"
+    )
+    record("load", elapsed, args.num_files)
+
+    # Timed without tracemalloc, which slows down allocations.
+    del manifest
+    gc.collect()
+    start = time.perf_counter()
+    manifest = load(text)
+    elapsed = time.perf_counter() - start
+    print(f"load (untraced): {elapsed:.2f}s")
+    record("load_untraced", elapsed, args.num_files)
+
+    paths = [f"images/00000/{i:08d}.png" for i in range(1000)]
+    for name, fn in [
+        ("digest", manifest.digest),
+        ("digest_again", manifest.digest),
+        ("to_manifest_json", manifest.to_manifest_json),
+        ("get_entry", lambda: [manifest.get_entry_by_path(p) for p in paths]),
+    ]:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {elapsed:.3f}s")
+        record(name, elapsed, args.num_files)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""Measure how long it takes to write the manifest of a large artifact.
+
+This is what `ArtifactSaver` does before committing an artifact: write
+`wandb_manifest.json` with the entries sorted by path, and compute its MD5.
+The entries of a new artifact are added in a random order, as they would be
+from a directory listing. A loaded artifact has had entries added to it, and
+its digest is computed too, as it is when the new version is logged.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+import _timing
+from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.artifact_manifests.artifact_manifest_v1 import (
+    ArtifactManifestV1,
+)
+from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
+from wandb.sdk.lib.hashutil import md5_file_b64, md5_string
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def write(manifest, path):
+    if hasattr(manifest, "write_manifest_json"):
+        with open(path, "wb") as fp:
+            return manifest.write_manifest_json(fp)
+
+    # Before manifests could be written in one pass.
+    with open(path, "w") as fp:
+        json.dump(manifest.to_manifest_json(), fp, indent=4)
+    return md5_file_b64(path)
+
+
+def entry(path):
+    return ArtifactManifestEntry(path=path, digest=md5_string(path), size=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark writing manifests")
+    parser.add_argument("--num-entries", type=int, default=1_000_000)
+    parser.add_argument("--num-added", type=int, default=1000)
+    args = parser.parse_args()
+
+    paths = [f"data/{i % 1000:04d}/{i:08d}.bin" for i in range(args.num_entries)]
+    random.Random(0).shuffle(paths)
+    manifest = ArtifactManifestV1(WandbStoragePolicy())
+    for path in paths:
+        manifest.add_entry(entry(path))
+
+    timings = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "wandb_manifest.json")
+        start = time.perf_counter()
+        write(manifest, path)
+        timings.append(_timing.FunctionTiming("write_new", time.perf_counter() - start))
+
+        with open(path) as f:
+            loaded = ArtifactManifest.from_manifest_json(json.load(f))
+        loaded.digest()
+        start = time.perf_counter()
+        for i in range(args.num_added):
+            loaded.add_entry(entry(f"data/added/{i:08d}.bin"))
+        loaded.digest()
+        write(loaded, path)
+        timings.append(
+            _timing.FunctionTiming("write_loaded", time.perf_counter() - start)
+        )
+
+    for timing in timings:
+        print(f"{timing.function_name}: {timing.runtime_seconds:.2f}s")
+    _timing.write(
+        BENCH_OUTFILE,
+        timings,
+        prefix_list=[
+            VERSION,
+            "manifest_write",
+            "",
+            f"entries={args.num_entries},added={args.num_added}",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
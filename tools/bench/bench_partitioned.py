@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""Measure how long it takes to read a partitioned table from an artifact.
+
+The artifact is a stand-in for a logged one, whose entries take `--latency`
+seconds to download the first time. Like `Artifact.get`, getting a table from
+it downloads the whole artifact first.
+"""
+
+import argparse
+import json
+import time
+
+import _timing
+import wandb
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+class LoggedArtifact:
+    def __init__(self, artifact, latency):
+        self.artifact = artifact
+        self.manifest = artifact.manifest
+        self.latency = latency
+        self.downloaded = set()
+
+    def get_entry(self, name):
+        bench_artifact = self
+        entry = self.artifact.manifest.entries[name]
+
+        class Entry:
+            def download(self):
+                if name not in bench_artifact.downloaded:
+                    time.sleep(bench_artifact.latency)
+                    bench_artifact.downloaded.add(name)
+                return entry.local_path
+
+        return Entry()
+
+    def get(self, name):
+        for entry_name in self.manifest.entries:
+            self.get_entry(entry_name).download()
+        with open(self.get_entry(name).download()) as f:
+            return wandb.Table.from_json(json.load(f), self)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark partitioned tables")
+    parser.add_argument("--num-parts", type=int, default=50)
+    parser.add_argument("--rows-per-part", type=int, default=20_000)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--read-ahead", type=int, default=4)
+    args = parser.parse_args()
+
+    artifact = wandb.Artifact("bench", "dataset")
+    for part in range(args.num_parts):
+        table = wandb.Table(
+            columns=["id", "score"],
+            data=[[i, i / 2] for i in range(args.rows_per_part)],
+        )
+        artifact.add(table, f"parts/{part:04d}")
+
+    timings = []
+    for name, read in [
+        ("iterrows", lambda table: (row for _, row in table.iterrows())),
+        (
+            "iter_batches",
+            lambda table: table.iter_batches(
+                convert_to="numpy", read_ahead=args.read_ahead
+            ),
+        ),
+    ]:
+        logged = LoggedArtifact(artifact, args.latency)
+        table = wandb.data_types.PartitionedTable.from_json(
+            {"parts_path": "parts"}, logged
+        )
+        start = time.perf_counter()
+        first = None
+        for _ in read(table):
+            if first is None:
+                first = time.perf_counter() - start
+        total = time.perf_counter() - start
+        print(f"{name}: first {first:.2f}s, total {total:.2f}s")
+        timings.append(_timing.FunctionTiming(f"{name}_first", first))
+        timings.append(_timing.FunctionTiming(f"{name}_total", total))
+
+    _timing.write(
+        BENCH_OUTFILE,
+        timings,
+        prefix_list=[
+            VERSION,
+            "partitioned",
+            "",
+            f"parts={args.num_parts},rows={args.rows_per_part},latency={args.latency}",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
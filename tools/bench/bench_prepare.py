@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Measure how fast upload URLs are handed out to artifact upload workers.
+
+The API is a stand-in that takes `--overhead` seconds plus `--per-file`
+seconds for each file in a batch, and each worker spends `--upload` seconds
+"uploading" every file it gets a URL for.
+"""
+
+import argparse
+import threading
+import time
+
+import _timing
+from wandb.filesync.step_prepare import StepPrepare
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+UPLOAD_WORKERS = 64
+
+
+class Api:
+    def __init__(self, overhead, per_file):
+        self.overhead = overhead
+        self.per_file = per_file
+        self.requests = 0
+
+    def create_artifact_files(self, specs):
+        self.requests += 1
+        time.sleep(self.overhead + self.per_file * len(specs))
+        return {
+            spec["name"]: {
+                "uploadUrl": f"https://bucket/{spec['name']}",
+                "uploadHeaders": [],
+                "uploadMultipartUrls": None,
+                "storagePath": None,
+                "artifact": {"id": "artifact"},
+            }
+            for spec in specs
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark upload URL prepare")
+    parser.add_argument("--num-files", type=int, default=20_000)
+    parser.add_argument("--overhead", type=float, default=0.1)
+    parser.add_argument("--per-file", type=float, default=0.001)
+    parser.add_argument("--upload", type=float, default=0.01)
+    args = parser.parse_args()
+
+    api = Api(args.overhead, args.per_file)
+    specs = [
+        {"artifactID": "artifact", "name": f"file-{i:08d}", "md5": str(i)}
+        for i in range(args.num_files)
+    ]
+    step_prepare = StepPrepare(
+        api, batch_time=0.1, inter_event_time=0.01, max_batch_size=1000
+    )
+    step_prepare.start()
+    start = time.perf_counter()
+    if hasattr(step_prepare, "prefetch"):
+        step_prepare.prefetch(specs)
+
+    lock = threading.Lock()
+    remaining = iter(specs)
+
+    def worker():
+        while True:
+            with lock:
+                spec = next(remaining, None)
+            if spec is None:
+                return
+            step_prepare.prepare(spec).get()
+            time.sleep(args.upload)
+
+    workers = [threading.Thread(target=worker) for _ in range(UPLOAD_WORKERS)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    step_prepare.shutdown()
+
+    print(f"prepare: {elapsed:.2f}s, {api.requests} requests")
+    if hasattr(step_prepare, "stats"):
+        print(step_prepare.stats())
+    _timing.write(
+        BENCH_OUTFILE,
+        [_timing.FunctionTiming("prepare", elapsed)],
+        prefix_list=[
+            VERSION,
+            "prepare",
+            "",
+            f"files={args.num_files},overhead={args.overhead},"
+            f"per_file={args.per_file},upload={args.upload}",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""Measure how long it takes to add a reference to a large S3 prefix.
+
+The bucket is a stand-in that answers both the boto3 resource and client
+calls the S3 handler makes, waiting `--latency` seconds for each request the
+way a real bucket would.
+"""
+
+import argparse
+import bisect
+import functools
+import time
+
+import _timing
+import botocore.exceptions
+import wandb
+from wandb.sdk.artifacts.storage_handlers.s3_handler import S3Handler
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+PAGE_SIZE = 1000
+
+
+class Bucket:
+    def __init__(self, keys, latency):
+        self.keys = sorted(keys)
+        self.latency = latency
+        self.requests = 0
+
+    def request(self):
+        self.requests += 1
+        time.sleep(self.latency)
+
+    def listing(self, prefix, delimiter=None):
+        """Yield pages of (key, is_common_prefix) under a prefix."""
+        items = {}
+        for key in self.keys[bisect.bisect_left(self.keys, prefix) :]:
+            if not key.startswith(prefix):
+                break
+            rest = key[len(prefix) :]
+            if delimiter and delimiter in rest:
+                items[prefix + rest.split(delimiter)[0] + delimiter] = True
+            else:
+                items[key] = False
+        items = list(items.items())
+        for i in range(0, max(len(items), 1), PAGE_SIZE):
+            self.request()
+            yield items[i : i + PAGE_SIZE]
+
+
+class ObjectSummary:
+    def __init__(self, key):
+        self.bucket_name = "bucket"
+        self.key = key
+        self.e_tag = f'"{key}"'
+        self.size = 10
+
+
+class Resource:
+    """The boto3 S3 resource and client calls made while adding references."""
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.meta = self
+        self.client = self
+
+    # Resource API
+    def Object(self, bucket, key):  # noqa: N802
+        resource = self
+
+        class Object:
+            content_type = "binary/octet-stream"
+
+            def load(self):
+                resource.bucket.request()
+                raise botocore.exceptions.ClientError(
+                    {"Error": {"Code": "404"}}, "HeadObject"
+                )
+
+            @functools.cached_property
+            def version_id(self):
+                resource.bucket.request()
+                return "v1"
+
+        return Object()
+
+    def Bucket(self, name):  # noqa: N802
+        resource = self
+
+        class Objects:
+            def filter(self, Prefix):  # noqa: N803
+                self.prefix = Prefix
+                return self
+
+            def limit(self, count):
+                for page in resource.bucket.listing(self.prefix):
+                    for key, _ in page:
+                        yield ObjectSummary(key)
+
+        return type("Bucket", (), {"objects": Objects()})()
+
+    def BucketVersioning(self, name):  # noqa: N802
+        self.bucket.request()
+        return type("BucketVersioning", (), {"status": "Enabled"})()
+
+    # Client API
+    def get_paginator(self, operation):
+        return self
+
+    def paginate(self, Bucket, Prefix, Delimiter=None):  # noqa: N803
+        for page in self.bucket.listing(Prefix, Delimiter):
+            yield {
+                "Versions": [
+                    {
+                        "Key": key,
+                        "ETag": f'"{key}"',
+                        "Size": 10,
+                        "VersionId": "v1",
+                        "IsLatest": True,
+                    }
+                    for key, common in page
+                    if not common
+                ],
+                "CommonPrefixes": [{"Prefix": key} for key, common in page if common],
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark S3 references")
+    parser.add_argument("--num-objects", type=int, default=100_000)
+    parser.add_argument("--num-dirs", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    bucket = Bucket(
+        [f"data/{i % args.num_dirs:04d}/{i:08d}.bin" for i in range(args.num_objects)],
+        args.latency,
+    )
+    handler = S3Handler()
+    handler._s3 = Resource(bucket)
+    handler._botocore = botocore
+
+    start = time.perf_counter()
+    entries = handler.store_path(
+        wandb.Artifact("bench", "dataset"),
+        "s3://bucket/data",
+        max_objects=args.num_objects,
+    )
+    elapsed = time.perf_counter() - start
+    assert len(entries) == args.num_objects
+
+    print(f"store_path: {elapsed:.2f}s, {bucket.requests} requests")
+    _timing.write(
+        BENCH_OUTFILE,
+        [_timing.FunctionTiming("store_path", elapsed)],
+        prefix_list=[
+            VERSION,
+            "references",
+            "",
+            f"objects={args.num_objects},dirs={args.num_dirs},latency={args.latency}",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
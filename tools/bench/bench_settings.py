@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""Measure how fast Settings objects are created, copied and serialized.
+
+`wandb.init` creates and copies Settings several times and sends them to the
+internal process as a protobuf, where they are loaded into a SettingsStatic.
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+import _timing
+from wandb.sdk.internal.settings_static import SettingsStatic
+from wandb.sdk.wandb_settings import Settings
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def operations() -> Dict[str, Callable[[], object]]:
+    settings = Settings(project="bench", run_tags=("a", "b"))
+    proto = settings.to_proto()
+    return {
+        "create": Settings,
+        "copy": settings.copy,
+        "to_proto": settings.to_proto,
+        "from_proto": lambda: SettingsStatic(proto),
+    }
+
+
+def main():
+    ops = operations()
+    parser = argparse.ArgumentParser(description="benchmark Settings")
+    parser.add_argument("--operations", nargs="+", default=list(ops), choices=list(ops))
+    parser.add_argument("--num", type=int, default=2000)
+    args = parser.parse_args()
+
+    for name in args.operations:
+        fn = ops[name]
+        fn()  # warm up
+        start = time.perf_counter()
+        for _ in range(args.num):
+            fn()
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {args.num / elapsed:.0f}/s")
+        _timing.write(
+            BENCH_OUTFILE,
+            [_timing.FunctionTiming(name, elapsed)],
+            prefix_list=[VERSION, "settings", "", f"num={args.num}"],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Measure how long it takes to save a large table to an artifact and load it.
+
+Loading reads the table's JSON from the artifact's staging directory, the way
+`Artifact.get` would after downloading it.
+"""
+
+import argparse
+import json
+import time
+
+import _timing
+import numpy as np
+import pandas as pd
+import wandb
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+class LoggedArtifact:
+    """Gives a table the files of a draft artifact as if they were downloaded."""
+
+    def __init__(self, artifact):
+        self.artifact = artifact
+
+    def get_entry(self, name):
+        entry = self.artifact.manifest.entries[name]
+        return type("Entry", (), {"download": lambda self: entry.local_path})()
+
+
+def make_table(num_rows, columnar):
+    rng = np.random.default_rng(0)
+    return wandb.Table(
+        dataframe=pd.DataFrame(
+            {
+                "id": np.arange(num_rows),
+                "score": rng.random(num_rows),
+                "flag": rng.random(num_rows) > 0.5,
+                "label": rng.choice(["cat", "dog", "bird"], num_rows),
+            }
+        ),
+        columnar=columnar,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark table artifacts")
+    parser.add_argument("--num-rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--columnar", action="store_true", help="save the table as column arrays"
+    )
+    args = parser.parse_args()
+
+    wandb.Table.MAX_ARTIFACT_ROWS = args.num_rows
+    table = make_table(args.num_rows, args.columnar)
+    artifact = wandb.Artifact("bench", "dataset")
+
+    timings = []
+    start = time.perf_counter()
+    entry = artifact.add(table, "table")
+    timings.append(_timing.FunctionTiming("write", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    with open(entry.local_path) as f:
+        loaded = wandb.Table.from_json(json.load(f), LoggedArtifact(artifact))
+    timings.append(_timing.FunctionTiming("read", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    score = loaded.get_column("score", convert_to="numpy")
+    timings.append(_timing.FunctionTiming("get_column", time.perf_counter() - start))
+    assert len(score) == args.num_rows
+
+    for timing in timings:
+        print(f"{timing.function_name}: {timing.runtime_seconds:.2f}s")
+    _timing.write(
+        BENCH_OUTFILE,
+        timings,
+        prefix_list=[
+            VERSION,
+            "table_io",
+            "",
+            f"rows={args.num_rows},columnar={args.columnar}",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
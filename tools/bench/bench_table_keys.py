@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Measure how long it takes to link an evaluation table to a dataset table.
+
+The evaluation table is built a row at a time with keys and indexes into the
+dataset table, and then joined with it.
+"""
+
+import argparse
+import time
+
+import _timing
+import wandb
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark table keys and joins")
+    parser.add_argument("--num-rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    dataset = wandb.Table(
+        columns=["id", "input"],
+        data=[[str(i), i] for i in range(args.num_rows)],
+    )
+    dataset.set_pk("id")
+    keys = [row[0] for row in dataset.data]
+
+    timings = []
+    start = time.perf_counter()
+    evaluation = wandb.Table(columns=["id", "pred"])
+    for i, key in enumerate(keys):
+        evaluation.add_data(key, i % 10)
+    timings.append(_timing.FunctionTiming("add_data_fk", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    indexed = wandb.Table(columns=["row", "pred"])
+    for i, index in enumerate(dataset.get_index()):
+        indexed.add_data(index, i % 10)
+    timings.append(_timing.FunctionTiming("add_data_fi", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    joined = wandb.JoinedTable(dataset, evaluation, "id").get_table()
+    timings.append(_timing.FunctionTiming("join", time.perf_counter() - start))
+    assert len(joined.data) == args.num_rows
+
+    for timing in timings:
+        print(f"{timing.function_name}: {timing.runtime_seconds:.2f}s")
+    _timing.write(
+        BENCH_OUTFILE,
+        timings,
+        prefix_list=[VERSION, "table_keys", "", f"rows={args.num_rows}"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""Measure how long it takes to build tables from dataframes and rows."""
+
+import argparse
+import time
+
+import _timing
+import numpy as np
+import pandas as pd
+import wandb
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def make_dataframe(num_rows):
+    rng = np.random.default_rng(0)
+    floats = rng.random(num_rows)
+    floats[::10] = np.nan
+    return pd.DataFrame(
+        {
+            "id": np.arange(num_rows),
+            "score": floats,
+            "flag": rng.random(num_rows) > 0.5,
+            "label": rng.choice(["cat", "dog", None], num_rows),
+            "when": pd.date_range("2020-01-01", periods=num_rows, freq="min"),
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark table construction")
+    parser.add_argument("--num-rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    dataframe = make_dataframe(args.num_rows)
+    rows = dataframe.astype(object).values.tolist()
+
+    timings = []
+    start = time.perf_counter()
+    wandb.Table(dataframe=dataframe)
+    timings.append(
+        _timing.FunctionTiming("from_dataframe", time.perf_counter() - start)
+    )
+
+    start = time.perf_counter()
+    table = wandb.Table(columns=list(dataframe.columns))
+    for row in rows:
+        table.add_data(*row)
+    timings.append(_timing.FunctionTiming("add_data", time.perf_counter() - start))
+
+    for timing in timings:
+        print(f"{timing.function_name}: {timing.runtime_seconds:.2f}s")
+    _timing.write(
+        BENCH_OUTFILE,
+        timings,
+        prefix_list=[VERSION, "tables", "", f"rows={args.num_rows}"],
+    )
+
+
+if __name__ == "__main__":
+    main()
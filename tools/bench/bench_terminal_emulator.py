@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Measure the throughput of the terminal emulator used for console capture.
+
+Replays recorded-style console output (a tqdm progress bar, a Keras-style
+progress bar and colored log lines) through a TerminalEmulator, in batches
+like the console redirect does, reading the emulator after every batch.
+"""
+
+import argparse
+import io
+import time
+from typing import Callable, Dict, List
+
+import _timing
+import tqdm
+from wandb.sdk.lib.redirect import TerminalEmulator
+
+VERSION: str = "v1-2024-04-11-0"
+BENCH_OUTFILE: str = "bench.csv"
+
+
+def record_tqdm(steps: int) -> List[str]:
+    writes: List[str] = []
+
+    class Recorder(io.StringIO):
+        def write(self, s: str) -> int:
+            writes.append(s)
+            return len(s)
+
+    for _ in tqdm.tqdm(
+        range(steps), file=Recorder(), mininterval=0, miniters=1, ncols=100
+    ):
+        pass
+    return writes
+
+
+def record_keras(steps: int) -> List[str]:
+    writes = []
+    prev_len = 0
+    for i in range(1, steps + 1):
+        done = 30 * i // steps
+        bar = f"{i}/{steps} [{'=' * done}>{'.' * (30 - done)}] - ETA: {steps - i}s"
+        line = f"{bar} - loss: {1 / i:.4f} - accuracy: {i / steps:.4f}"
+        writes.append("\b" * prev_len + "\r" + line)
+        prev_len = len(line)
+    writes.append("\n")
+    return writes
+
+
+def record_colored_logs(steps: int) -> List[str]:
+    levels = ["\033[32mINFO\033[0m", "\033[33mWARNING\033[0m", "\033[1mDEBUG\033[22m"]
+    return [
+        f"{levels[i % 3]} step {i}: loss={1 / (i + 1):.6f} lr=0.001\n"
+        for i in range(steps)
+    ]
+
+
+RECORDINGS: Dict[str, Callable[[int], List[str]]] = {
+    "tqdm": record_tqdm,
+    "keras": record_keras,
+    "colored_logs": record_colored_logs,
+}
+
+
+def replay(writes: List[str], batch_size: int) -> float:
+    emulator = TerminalEmulator()
+    start = time.perf_counter()
+    for i in range(0, len(writes), batch_size):
+        emulator.write("".join(writes[i : i + batch_size]))
+        emulator.read()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark TerminalEmulator")
+    parser.add_argument(
+        "--recordings", nargs="+", default=list(RECORDINGS), choices=list(RECORDINGS)
+    )
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--batch_size", type=int, default=50)
+    args = parser.parse_args()
+
+    for name in args.recordings:
+        writes = RECORDINGS[name](args.steps)
+        nbytes = sum(len(w) for w in writes)
+        elapsed = replay(writes, args.batch_size)
+        print(f"{name}: {nbytes / elapsed / 1e6:.2f} MB/s ({elapsed:.3f}s)")
+        _timing.write(
+            BENCH_OUTFILE,
+            [_timing.FunctionTiming("replay", elapsed)],
+            prefix_list=[VERSION, "terminal_emulator", "", f"recording={name}"],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,66 +23,100 @@ import wandb
 
 wandb.wandb_lib = wandb_sdk.lib  # type: ignore
 
-init = wandb_sdk.init
 setup = wandb_sdk.setup
-_attach = wandb_sdk._attach
-_sync = wandb_sdk._sync
 _teardown = wandb_sdk.teardown
 watch = wandb_sdk.watch
 unwatch = wandb_sdk.unwatch
-finish = wandb_sdk.finish
-join = finish
-login = wandb_sdk.login
 helper = wandb_sdk.helper
-sweep = wandb_sdk.sweep
-controller = wandb_sdk.controller
 require = wandb_sdk.require
-Artifact = wandb_sdk.Artifact
 AlertLevel = wandb_sdk.AlertLevel
 Settings = wandb_sdk.Settings
 Config = wandb_sdk.Config
 
-from wandb.apis import InternalApi, PublicApi
 from wandb.errors import CommError, UsageError
 
-_preinit = wandb.wandb_lib.preinit  # type: ignore
-_lazyloader = wandb.wandb_lib.lazyloader  # type: ignore
+from wandb.sdk.lib import lazyloader as _lazyloader
+from wandb.sdk.lib import preinit as _preinit
+
+
+def _preinit_run_method(name):
+    def create():
+        return _preinit.PreInitCallable(
+            f"wandb.{name}", getattr(wandb_sdk.wandb_run.Run, name)
+        )
+
+    return create
+
+
+# The rest of the namespace is imported on first use, so that `import wandb`
+# doesn't load the backend, the public API, the data types and so on.
+_lazy = _lazyloader.LazyAttributes(
+    globals(),
+    {
+        "init": "wandb.sdk.wandb_init:init",
+        "_attach": "wandb.sdk.wandb_init:_attach",
+        "attach": "wandb.sdk.wandb_init:_attach",
+        "_sync": "wandb.sdk.wandb_sync:_sync",
+        "finish": "wandb.sdk.wandb_run:finish",
+        "join": "wandb.sdk.wandb_run:finish",
+        "restore": "wandb.sdk.wandb_run:restore",
+        "login": "wandb.sdk.wandb_login:login",
+        "sweep": "wandb.sdk.wandb_sweep:sweep",
+        "controller": "wandb.sdk.wandb_sweep:controller",
+        "agent": "wandb.wandb_agent:agent",
+        "Artifact": "wandb.sdk.artifacts.artifact:Artifact",
+        "ArtifactTTL": "wandb.sdk.artifacts.artifact_ttl:ArtifactTTL",
+        "Api": "wandb.apis:PublicApi",
+        "InternalApi": "wandb.apis:InternalApi",
+        "PublicApi": "wandb.apis:PublicApi",
+        "api": lambda: wandb.apis.InternalApi(),
+        "wandb_torch": "wandb.integration.torch.wandb_torch",
+        "visualize": "wandb.plot.viz:visualize",
+        "sagemaker_auth": "wandb.integration.sagemaker:sagemaker_auth",
+        "profiler": "wandb.sdk.internal.profiler",
+        "Graph": "wandb.data_types:Graph",
+        "Image": "wandb.data_types:Image",
+        "Plotly": "wandb.data_types:Plotly",
+        "Video": "wandb.data_types:Video",
+        "Audio": "wandb.data_types:Audio",
+        "Table": "wandb.data_types:Table",
+        "Html": "wandb.data_types:Html",
+        "box3d": "wandb.data_types:box3d",
+        "Object3D": "wandb.data_types:Object3D",
+        "Molecule": "wandb.data_types:Molecule",
+        "Histogram": "wandb.data_types:Histogram",
+        "Classes": "wandb.data_types:Classes",
+        "JoinedTable": "wandb.data_types:JoinedTable",
+        **{
+            name: _preinit_run_method(name)
+            for name in (
+                "log",
+                "save",
+                "use_artifact",
+                "log_artifact",
+                "log_model",
+                "use_model",
+                "link_model",
+                "define_metric",
+                "mark_preempting",
+                "plot_table",
+                "alert",
+            )
+        },
+    },
+)
+__getattr__ = _lazy.getattr
+__dir__ = _lazy.dir
+
 
 # Call import module hook to set up any needed require hooks
 wandb.sdk.wandb_require._import_module_hook()
 
-from wandb.integration.torch import wandb_torch
-
 # Move this (keras.__init__ expects it at top level)
 from wandb.sdk.data_types._private import _cleanup_media_tmp_dir
 
 _cleanup_media_tmp_dir()
 
-from wandb.data_types import Graph
-from wandb.data_types import Image
-from wandb.data_types import Plotly
-
-# from wandb.data_types import Bokeh # keeping out of top level for now since Bokeh plots have poor UI
-from wandb.data_types import Video
-from wandb.data_types import Audio
-from wandb.data_types import Table
-from wandb.data_types import Html
-from wandb.data_types import box3d
-from wandb.data_types import Object3D
-from wandb.data_types import Molecule
-from wandb.data_types import Histogram
-from wandb.data_types import Classes
-from wandb.data_types import JoinedTable
-
-from wandb.wandb_agent import agent
-
-from wandb.plot.viz import visualize
-from wandb.integration.sagemaker import sagemaker_auth
-from wandb.sdk.internal import profiler
-
-# Artifact import types
-from wandb.sdk.artifacts.artifact_ttl import ArtifactTTL
-
 # Used to make sure we don't use some code in the incorrect process context
 _IS_INTERNAL_PROCESS = False
 
@@ -110,41 +144,9 @@ def _assert_is_user_process():
 
 
 # globals
-Api = PublicApi
-api = InternalApi()
 run: Optional["wandb_sdk.wandb_run.Run"] = None
 config = _preinit.PreInitObject("wandb.config", wandb_sdk.wandb_config.Config)
 summary = _preinit.PreInitObject("wandb.summary", wandb_sdk.wandb_summary.Summary)
-log = _preinit.PreInitCallable("wandb.log", wandb_sdk.wandb_run.Run.log)  # type: ignore
-save = _preinit.PreInitCallable("wandb.save", wandb_sdk.wandb_run.Run.save)  # type: ignore
-restore = wandb_sdk.wandb_run.restore
-use_artifact = _preinit.PreInitCallable(
-    "wandb.use_artifact", wandb_sdk.wandb_run.Run.use_artifact  # type: ignore
-)
-log_artifact = _preinit.PreInitCallable(
-    "wandb.log_artifact", wandb_sdk.wandb_run.Run.log_artifact  # type: ignore
-)
-log_model = _preinit.PreInitCallable(
-    "wandb.log_model", wandb_sdk.wandb_run.Run.log_model  # type: ignore
-)
-use_model = _preinit.PreInitCallable(
-    "wandb.use_model", wandb_sdk.wandb_run.Run.use_model  # type: ignore
-)
-link_model = _preinit.PreInitCallable(
-    "wandb.link_model", wandb_sdk.wandb_run.Run.link_model  # type: ignore
-)
-define_metric = _preinit.PreInitCallable(
-    "wandb.define_metric", wandb_sdk.wandb_run.Run.define_metric  # type: ignore
-)
-
-mark_preempting = _preinit.PreInitCallable(
-    "wandb.mark_preempting", wandb_sdk.wandb_run.Run.mark_preempting  # type: ignore
-)
-
-plot_table = _preinit.PreInitCallable(
-    "wandb.plot_table", wandb_sdk.wandb_run.Run.plot_table
-)
-alert = _preinit.PreInitCallable("wandb.alert", wandb_sdk.wandb_run.Run.alert)  # type: ignore
 
 # record of patched libraries
 patched = {"tensorboard": [], "keras": [], "gym": []}  # type: ignore
@@ -174,7 +176,7 @@ sacred = _lazyloader.LazyLoader("wandb.sacred", globals(), "wandb.integration.sa
 
 def ensure_configured():
     global api
-    api = InternalApi()
+    api = wandb.apis.InternalApi()
 
 
 def set_trace():
@@ -1,12 +1,13 @@
 """api."""
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 import requests
 from urllib3.exceptions import InsecureRequestWarning
 
 import wandb
 from wandb import env, util
+from wandb.sdk.lib import lazyloader
 
 
 def _disable_ssl() -> Callable[[], None]:
@@ -38,11 +39,27 @@ if env.ssl_disabled():
     _disable_ssl()
 
 
+# Modules under wandb.apis import the vendored gql package.
 reset_path = util.vendor_setup()
 
-from .internal import Api as InternalApi  # noqa
-from .public import Api as PublicApi  # noqa
+import wandb_gql  # noqa
 
 reset_path()
 
+if TYPE_CHECKING:
+    from .internal import Api as InternalApi
+    from .public import Api as PublicApi
+
+# Importing the APIs here would make `import wandb.apis.normalize` load the
+# whole public API, and make `internal_api` import itself circularly.
+_lazy = lazyloader.LazyAttributes(
+    globals(),
+    {
+        "InternalApi": "wandb.apis.internal:Api",
+        "PublicApi": "wandb.apis.public:Api",
+    },
+)
+__getattr__ = _lazy.getattr
+__dir__ = _lazy.dir
+
 __all__ = ["InternalApi", "PublicApi"]
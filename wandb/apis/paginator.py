@@ -1,17 +1,41 @@
-from typing import TYPE_CHECKING, Any, MutableMapping, Optional
+import concurrent.futures
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, MutableMapping, Optional, Tuple
 
 if TYPE_CHECKING:
     from wandb_gql import Client
 
+# Shared by all paginators that prefetch pages.
+_prefetch_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def _get_prefetch_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _prefetch_executor
+    with _prefetch_executor_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="wandb-paginator"
+            )
+        return _prefetch_executor
+
 
 class Paginator:
     QUERY = None
 
+    # With prefetching, the page size is adjusted so that fetching a page takes
+    # between these many seconds, up to MAX_PER_PAGE objects.
+    MIN_PAGE_SECONDS = 0.5
+    MAX_PAGE_SECONDS = 2.0
+    MAX_PER_PAGE = 500
+
     def __init__(
         self,
         client: "Client",
         variables: MutableMapping[str, Any],
         per_page: Optional[int] = None,
+        prefetch: bool = False,
     ):
         self.client = client
         self.variables = variables
@@ -22,6 +46,10 @@ class Paginator:
         self.objects = []
         self.index = -1
         self.last_response = None
+        # Whether to fetch the next page in the background while the current
+        # one is being processed.
+        self._prefetch = prefetch
+        self._next_page: Optional[concurrent.futures.Future] = None
 
     def __iter__(self):
         self.index = -1
@@ -52,16 +80,39 @@ class Paginator:
     def update_variables(self):
         self.variables.update({"perPage": self.per_page, "cursor": self.cursor})
 
+    def _execute(self, variables: Dict[str, Any]) -> Tuple[Any, float]:
+        start = time.monotonic()
+        response = self.client.execute(self.QUERY, variable_values=variables)
+        return response, time.monotonic() - start
+
     def _load_page(self):
         if not self.more:
             return False
-        self.update_variables()
-        self.last_response = self.client.execute(
-            self.QUERY, variable_values=self.variables
-        )
+        if self._next_page is not None:
+            next_page, self._next_page = self._next_page, None
+            self.last_response, elapsed = next_page.result()
+        else:
+            self.update_variables()
+            self.last_response, elapsed = self._execute(dict(self.variables))
         self.objects.extend(self.convert_objects())
+
+        if self._prefetch and self.more:
+            self._adjust_page_size(elapsed)
+            self.update_variables()
+            self._next_page = _get_prefetch_executor().submit(
+                self._execute, dict(self.variables)
+            )
         return True
 
+    def _adjust_page_size(self, elapsed: float) -> None:
+        """Fetch more objects per page if pages are fast, fewer if they are slow."""
+        if elapsed < self.MIN_PAGE_SECONDS:
+            self.per_page = min(
+                2 * self.per_page, max(self.per_page, self.MAX_PER_PAGE)
+            )
+        elif elapsed > self.MAX_PAGE_SECONDS:
+            self.per_page = max(self.per_page // 2, 1)
+
     def __getitem__(self, index):
         loaded = True
         stop = index.stop if isinstance(index, slice) else index
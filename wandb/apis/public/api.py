@@ -15,11 +15,13 @@ import json
 import logging
 import os
 import urllib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from wandb_gql import Client, gql
 from wandb_gql.client import RetryError
+from wandb_graphql.language import ast
+from wandb_graphql.language.printer import print_ast
 
 import wandb
 from wandb import env, util
@@ -30,7 +32,7 @@ from wandb.apis.public.const import RETRY_TIMEDELTA
 from wandb.sdk.artifacts._validators import is_artifact_registry_project
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
 from wandb.sdk.launch.utils import LAUNCH_DEFAULT_PROJECT
-from wandb.sdk.lib import retry, runid
+from wandb.sdk.lib import query_cache, retry, runid
 from wandb.sdk.lib.deprecate import Deprecated, deprecate
 from wandb.sdk.lib.gql_request import GraphQLSession
 
@@ -53,9 +55,25 @@ class RetryingClient:
         """
     )
 
-    def __init__(self, client: Client):
+    RUN_VALIDATOR_QUERY = gql(
+        """
+        query RunHeartbeat($project: String!, $entity: String!, $name: String!) {
+            project(name: $project, entityName: $entity) {
+                run(name: $name) {
+                    heartbeatAt
+                    state
+                }
+            }
+        }
+        """
+    )
+
+    def __init__(
+        self, client: Client, query_cache: Optional[query_cache.QueryCache] = None
+    ):
         self._server_info = None
         self._client = client
+        self._query_cache = query_cache
 
     @property
     def app_url(self):
@@ -66,7 +84,7 @@ class RetryingClient:
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def execute(self, *args, **kwargs):  # noqa: D102  # User not encouraged to use this class directly
+    def _execute(self, *args, **kwargs):
         try:
             return self._client.execute(*args, **kwargs)
         except requests.exceptions.ReadTimeout:
@@ -79,6 +97,45 @@ class RetryingClient:
                 )
             raise
 
+    def execute(self, document, *args, **kwargs):  # noqa: D102  # User not encouraged to use this class directly
+        if self._query_cache is None:
+            return self._execute(document, *args, **kwargs)
+        operation = next(
+            definition
+            for definition in document.definitions
+            if isinstance(definition, ast.OperationDefinition)
+        )
+        if operation.operation != "query":
+            result = self._execute(document, *args, **kwargs)
+            self._query_cache.invalidate()
+            return result
+        variables = args[0] if args else kwargs.get("variable_values")
+        return self._query_cache.execute(
+            operation.name.value if operation.name else "",
+            print_ast(document),
+            variables,
+            fetch=lambda: self._execute(document, *args, **kwargs),
+            validate_run=self._validate_run,
+        )
+
+    def _validate_run(self, run: query_cache.RunKey) -> Optional[Tuple[str, str]]:
+        entity, project, name = run
+        try:
+            res = self._execute(
+                self.RUN_VALIDATOR_QUERY,
+                variable_values={"entity": entity, "project": project, "name": name},
+            )
+        except Exception:
+            return None
+        run_attrs = (res.get("project") or {}).get("run")
+        if not run_attrs:
+            return None
+        return run_attrs["heartbeatAt"], run_attrs["state"]
+
+    @property
+    def query_cache(self) -> Optional[query_cache.QueryCache]:  # noqa: D102
+        return self._query_cache
+
     @property
     def server_info(self):
         if self._server_info is None:
@@ -104,6 +161,10 @@ class Api:
         overrides: (dict) You can set `base_url` if you are using a wandb server
             other than https://api.wandb.ai.
             You can also set defaults for `entity`, `project`, and `run`.
+        cache: (bool) Whether to cache query results on disk, so that repeated
+            queries about the same runs and artifacts are served locally.
+            Defaults to the `WANDB_QUERY_CACHE` environment variable. See
+            `Api.query_cache_stats` for how effective the cache is.
     """
 
     _HTTP_TIMEOUT = env.get_http_timeout(19)
@@ -233,6 +294,7 @@ class Api:
         overrides: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
         api_key: Optional[str] = None,
+        cache: Optional[bool] = None,
     ) -> None:
         self.settings = InternalApi().settings()
         _overrides = overrides or {}
@@ -277,7 +339,17 @@ class Api:
                 proxies=proxies,
             )
         )
-        self._client = RetryingClient(self._base_client)
+        if cache is None:
+            cache = env.use_query_cache()
+        self._client = RetryingClient(
+            self._base_client,
+            query_cache=query_cache.get_cache(
+                self.settings["base_url"],
+                json.dumps([self.api_key, _thread_local_api_settings.cookies]),
+            )
+            if cache
+            else None,
+        )
 
     def create_project(self, name: str, entity: str) -> None:
         """Create a new project.
@@ -577,6 +649,18 @@ class Api:
     def client(self) -> RetryingClient:
         return self._client
 
+    def query_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Return statistics about the query cache, or None if it is disabled.
+
+        Returns:
+            A dict with the number of `hits`, `misses`, `revalidations` (expired
+            results that were found to still be current) and `evictions`, and
+            the `size` of the cache in bytes.
+        """
+        if self._client.query_cache is None:
+            return None
+        return self._client.query_cache.stats()
+
     @property
     def user_agent(self) -> str:
         return "W&B Public Client {}".format(wandb.__version__)
@@ -886,6 +970,8 @@ class Api:
         order: str = "+created_at",
         per_page: int = 50,
         include_sweeps: bool = True,
+        prefetch: bool = False,
+        fields: Optional[List[str]] = None,
     ):
         """Return a set of runs from a project that match the filters provided.
 
@@ -940,6 +1026,12 @@ class Api:
                 The default order is run.created_at from oldest to newest.
             per_page: (int) Sets the page size for query pagination.
             include_sweeps: (bool) Whether to include the sweep runs in the results.
+            prefetch: (bool) Whether to fetch the next page of runs in the background
+                while the current one is used. The page size is then adjusted to
+                how long pages take to fetch.
+            fields: (list) Only fetch these run fields, e.g. `["state", "tags"]`,
+                which is faster for projects with large configs or summaries.
+                Other fields are fetched for each run when they are first used.
 
         Returns:
             A `Runs` object, which is an iterable collection of `Run` objects.
@@ -947,6 +1039,8 @@ class Api:
         entity, project = self._parse_project_path(path)
         filters = filters or {}
         key = (path or "") + str(filters) + str(order)
+        if prefetch or fields is not None:
+            key += str(prefetch) + str(fields if fields is None else sorted(fields))
         if not self._runs.get(key):
             self._runs[key] = public.Runs(
                 self.client,
@@ -956,6 +1050,8 @@ class Api:
                 order=order,
                 per_page=per_page,
                 include_sweeps=include_sweeps,
+                prefetch=prefetch,
+                fields=fields,
             )
         return self._runs[key]
 
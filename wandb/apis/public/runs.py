@@ -1,5 +1,7 @@
 """Public API: runs."""
 
+import copy
+import functools
 import json
 import os
 import sys
@@ -23,7 +25,8 @@ from wandb.apis.internal import Api as InternalApi
 from wandb.apis.normalize import normalize_exceptions
 from wandb.apis.paginator import Paginator
 from wandb.apis.public.const import RETRY_TIMEDELTA
-from wandb.sdk.lib import ipython, json_util, runid
+from wandb.errors import CommError
+from wandb.sdk.lib import file_downloader, ipython, json_util, runid
 from wandb.sdk.lib.paths import LogicalPath
 
 if TYPE_CHECKING:
@@ -57,6 +60,45 @@ RUN_FRAGMENT = """fragment RunFragment on Run {
     historyKeys
 }"""
 
+# Run attributes that are always queried, even if `fields` are given to `Runs`.
+_REQUIRED_RUN_FIELDS = {"id", "name", "displayName", "state", "sweepName"}
+
+# Run attributes that don't share the name of the RUN_FRAGMENT field they come from.
+_RUN_ATTRIBUTE_FIELDS = {"rawconfig": "config"}
+
+
+@functools.lru_cache(maxsize=None)
+def _run_fragment_fields():
+    (definition,) = gql(RUN_FRAGMENT).definitions
+    return frozenset(
+        selection.name.value for selection in definition.selection_set.selections
+    )
+
+
+def _select_run_fields(query, fields):
+    """Return a copy of a query that only selects some fields of RunFragment."""
+    query = copy.deepcopy(query)
+    available = _run_fragment_fields()
+    for definition in query.definitions:
+        if definition.name.value != "RunFragment":
+            continue
+        selections = definition.selection_set.selections
+        selected = set(_REQUIRED_RUN_FIELDS)
+        for field in fields:
+            if field not in available:
+                # also accept the snake case attribute names of `Run`
+                head, *rest = field.split("_")
+                field = head + "".join(part.title() for part in rest)
+            if field not in available:
+                raise ValueError(
+                    f"Unknown run field {field!r}, expected one of {sorted(available)}"
+                )
+            selected.add(field)
+        definition.selection_set.selections = [
+            selection for selection in selections if selection.name.value in selected
+        ]
+    return query
+
 
 class Runs(Paginator):
     """An iterable collection of runs associated with a project and optional filter.
@@ -97,6 +139,8 @@ class Runs(Paginator):
         order: Optional[str] = None,
         per_page: int = 50,
         include_sweeps: bool = True,
+        prefetch: bool = False,
+        fields: Optional[Collection[str]] = None,
     ):
         self.entity = entity
         self.project = project
@@ -104,13 +148,15 @@ class Runs(Paginator):
         self.order = order
         self._sweeps = {}
         self._include_sweeps = include_sweeps
+        if fields is not None:
+            self.QUERY = _select_run_fields(self.QUERY, fields)
         variables = {
             "project": self.project,
             "entity": self.entity,
             "order": self.order,
             "filters": json.dumps(self.filters),
         }
-        super().__init__(client, variables, per_page)
+        super().__init__(client, variables, per_page, prefetch=prefetch)
 
     @property
     def length(self):
@@ -318,17 +364,43 @@ class Run(Attrs):
         self.id = run_id
         self.sweep = None
         self._include_sweeps = include_sweeps
-        self.dir = os.path.join(self._base_dir, *self.path)
-        try:
-            os.makedirs(self.dir)
-        except OSError:
-            pass
+        self._dir = os.path.join(self._base_dir, *self.path)
         self._summary = None
         self._metadata: Optional[Dict[str, Any]] = None
         self._state = _attrs.get("state", "not found")
 
         self.load(force=not _attrs)
 
+    def __getattr__(self, name):
+        # Runs listed with only some fields (see `Runs`) load the rest on first use.
+        if "_attrs" in self.__dict__:
+            field = _RUN_ATTRIBUTE_FIELDS.get(name) or self.snake_to_camel(name)
+            if field in _run_fragment_fields() and field not in self._attrs:
+                self._load_missing_fields()
+                if field in self._attrs:
+                    return getattr(self, name)
+        return super().__getattr__(name)
+
+    def _load_missing_fields(self):
+        """Load the run's fields, keeping the ones that are already loaded.
+
+        The loaded fields may have been changed locally, e.g. the config before
+        a call to `update`, so the server's values don't replace them.
+        """
+        attrs = self._attrs
+        self.load(force=True)
+        self._attrs.update(attrs)
+        self._state = self._attrs["state"]
+
+    @property
+    def dir(self):
+        """A local directory for files downloaded from the run."""
+        try:
+            os.makedirs(self._dir)
+        except OSError:
+            pass
+        return self._dir
+
     @property
     def state(self):
         return self._state
@@ -445,35 +517,39 @@ class Run(Attrs):
                     withRuns=False,
                 )
 
-        try:
-            self._attrs["summaryMetrics"] = (
-                json.loads(self._attrs["summaryMetrics"])
-                if self._attrs.get("summaryMetrics")
+        # Fields that weren't queried are left out, and loaded when accessed.
+        if "summaryMetrics" in self._attrs:
+            try:
+                self._attrs["summaryMetrics"] = (
+                    json.loads(self._attrs["summaryMetrics"])
+                    if self._attrs.get("summaryMetrics")
+                    else {}
+                )
+            except json.decoder.JSONDecodeError:
+                # ignore invalid utf-8 or control characters
+                self._attrs["summaryMetrics"] = json.loads(
+                    self._attrs["summaryMetrics"],
+                    strict=False,
+                )
+        if "systemMetrics" in self._attrs:
+            self._attrs["systemMetrics"] = (
+                json.loads(self._attrs["systemMetrics"])
+                if self._attrs.get("systemMetrics")
                 else {}
             )
-        except json.decoder.JSONDecodeError:
-            # ignore invalid utf-8 or control characters
-            self._attrs["summaryMetrics"] = json.loads(
-                self._attrs["summaryMetrics"],
-                strict=False,
-            )
-        self._attrs["systemMetrics"] = (
-            json.loads(self._attrs["systemMetrics"])
-            if self._attrs.get("systemMetrics")
-            else {}
-        )
         if self._attrs.get("user"):
             self.user = public.User(self.client, self._attrs["user"])
-        config_user, config_raw = {}, {}
-        for key, value in json.loads(self._attrs.get("config") or "{}").items():
-            config = config_raw if key in WANDB_INTERNAL_KEYS else config_user
-            if isinstance(value, dict) and "value" in value:
-                config[key] = value["value"]
-            else:
-                config[key] = value
-        config_raw.update(config_user)
-        self._attrs["config"] = config_user
-        self._attrs["rawconfig"] = config_raw
+        if "config" in self._attrs:
+            config_user, config_raw = {}, {}
+            for key, value in json.loads(self._attrs.get("config") or "{}").items():
+                config = config_raw if key in WANDB_INTERNAL_KEYS else config_user
+                if isinstance(value, dict) and "value" in value:
+                    config[key] = value["value"]
+                else:
+                    config[key] = value
+            config_raw.update(config_user)
+            self._attrs["config"] = config_user
+            self._attrs["rawconfig"] = config_raw
         return self._attrs
 
     @normalize_exceptions
@@ -630,6 +706,53 @@ class Run(Attrs):
         """
         return public.Files(self.client, self, [name])[0]
 
+    @normalize_exceptions
+    def download_files(
+        self,
+        root=".",
+        names=None,
+        replace=True,
+        max_workers=file_downloader.DEFAULT_MAX_WORKERS,
+    ):
+        """Download files saved by the run, several at a time.
+
+        Files that already exist with the same contents are not downloaded
+        again. If the download is interrupted, calling this again with the same
+        `root` continues where it stopped.
+
+        Arguments:
+            root (str): Local directory to save the files to. Defaults to ".".
+            names (list, optional): Names of the files to download. Defaults to
+                all of the run's files.
+            replace (bool): Whether to replace existing local files that differ
+                from the run's files. Defaults to `True`.
+            max_workers (int): The maximum number of files to download at once.
+
+        Returns:
+            A list of the local paths of the files.
+
+        Raises:
+            `CommError` if any of the files could not be downloaded.
+        """
+        api = InternalApi(
+            default_settings={"entity": self.entity, "project": self.project},
+            retry_timedelta=RETRY_TIMEDELTA,
+        )
+        downloader = file_downloader.FileDownloader(
+            api.download_file, root=root, max_workers=max_workers, replace=replace
+        )
+        results = downloader.download(
+            file_downloader.RemoteFile(file.name, file.url, file.md5)
+            for file in self.files(names)
+        )
+        errors = [result.error for result in results if result.error is not None]
+        if errors:
+            raise CommError(
+                f"Failed to download {len(errors)} of {len(results)} files",
+                errors[0],
+            )
+        return [result.path for result in results]
+
     @normalize_exceptions
     def upload_file(self, path, root="."):
         """Upload a file.
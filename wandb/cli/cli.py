@@ -43,7 +43,7 @@ from wandb.sdk.launch._launch_add import _launch_add
 from wandb.sdk.launch.errors import ExecutionError, LaunchError
 from wandb.sdk.launch.sweeps import utils as sweep_utils
 from wandb.sdk.launch.sweeps.scheduler import Scheduler
-from wandb.sdk.lib import filesystem
+from wandb.sdk.lib import file_downloader, filesystem
 from wandb.sdk.lib.wburls import wburls
 from wandb.sync import SyncManager, get_run_from_path, get_runs
 from wandb.util import get_core_path
@@ -2635,8 +2635,15 @@ def cleanup(target_size, remove_temp):
     envvar=env.ENTITY,
     help="The entity to scope the listing to.",
 )
+@click.option(
+    "--max-workers",
+    type=int,
+    default=file_downloader.DEFAULT_MAX_WORKERS,
+    show_default=True,
+    help="The maximum number of files to download at once.",
+)
 @display_error
-def pull(run, project, entity):
+def pull(run, project, entity, max_workers):
     api = InternalApi()
     project, run = api.parse_slug(run, project=project)
     urls = api.download_urls(project, run=run, entity=entity)
@@ -2644,25 +2651,30 @@ def pull(run, project, entity):
         raise ClickException("Run has no files")
     click.echo(f"Downloading: {click.style(project, bold=True)}/{run}")
 
-    for name in urls:
-        if api.file_current(name, urls[name]["md5"]):
-            click.echo("File {} is up to date".format(name))
+    def echo(result):
+        if result.error is not None:
+            click.echo(f"File {result.name} failed: {result.error}", err=True)
+        elif result.downloaded:
+            click.echo(f"File {result.name}")
         else:
-            length, response = api.download_file(urls[name]["url"])
-            # TODO: I had to add this because some versions in CI broke click.progressbar
-            sys.stdout.write("File {}\r".format(name))
-            dirname = os.path.dirname(name)
-            if dirname != "":
-                filesystem.mkdir_exists_ok(dirname)
-            with click.progressbar(
-                length=length,
-                label="File {}".format(name),
-                fill_char=click.style("&", fg="green"),
-            ) as bar:
-                with open(name, "wb") as f:
-                    for data in response.iter_content(chunk_size=4096):
-                        f.write(data)
-                        bar.update(len(data))
+            click.echo(f"File {result.name} is up to date")
+
+    downloader = file_downloader.FileDownloader(
+        api.download_file, max_workers=max_workers
+    )
+    results = downloader.download(
+        (
+            file_downloader.RemoteFile(name, urls[name]["url"], urls[name]["md5"])
+            for name in urls
+        ),
+        callback=echo,
+    )
+    failed = sum(result.error is not None for result in results)
+    if failed:
+        raise ClickException(
+            f"Failed to download {failed} of {len(results)} files, "
+            "run the command again to resume"
+        )
 
 
 @cli.command(
@@ -51,6 +51,13 @@ RUN_DIR = "WANDB_RUN_DIR"
 SWEEP_ID = "WANDB_SWEEP_ID"
 HTTP_TIMEOUT = "WANDB_HTTP_TIMEOUT"
 FILE_PUSHER_TIMEOUT = "WANDB_FILE_PUSHER_TIMEOUT"
+HTTP_POOL_CONNECTIONS = "WANDB_HTTP_POOL_CONNECTIONS"
+HTTP_POOL_MAXSIZE = "WANDB_HTTP_POOL_MAXSIZE"
+HTTP_MAX_CONCURRENCY_PER_HOST = "WANDB_HTTP_MAX_CONCURRENCY_PER_HOST"
+DIR_WATCHER = "WANDB_DIR_WATCHER"
+LIVE_APPEND_UPLOADS = "WANDB_LIVE_APPEND_UPLOADS"
+ASYNC_MEDIA = "WANDB_ASYNC_MEDIA"
+MEDIA_INFLIGHT_BYTES = "WANDB_MEDIA_INFLIGHT_BYTES"
 API_KEY = "WANDB_API_KEY"
 IDENTITY_TOKEN_FILE = "WANDB_IDENTITY_TOKEN_FILE"
 CREDENTIALS_FILE = "WANDB_CREDENTIALS_FILE"
@@ -78,6 +85,9 @@ DATA_DIR = "WANDB_DATA_DIR"
 ARTIFACT_DIR = "WANDB_ARTIFACT_DIR"
 ARTIFACT_FETCH_FILE_URL_BATCH_SIZE = "WANDB_ARTIFACT_FETCH_FILE_URL_BATCH_SIZE"
 CACHE_DIR = "WANDB_CACHE_DIR"
+INTROSPECTION_CACHE_TTL = "WANDB_INTROSPECTION_CACHE_TTL"
+QUERY_CACHE = "WANDB_QUERY_CACHE"
+QUERY_CACHE_SIZE = "WANDB_QUERY_CACHE_SIZE"
 DISABLE_SSL = "WANDB_INSECURE_DISABLE_SSL"
 SERVICE = "WANDB_SERVICE"
 _DISABLE_SERVICE = "WANDB_DISABLE_SERVICE"
@@ -226,6 +236,57 @@ def get_http_timeout(default: int = 20, env: Optional[Env] = None) -> int:
     return int(env.get(HTTP_TIMEOUT, default))
 
 
+def get_http_pool_connections(default: int = 64, env: Optional[Env] = None) -> int:
+    if env is None:
+        env = os.environ
+
+    return int(env.get(HTTP_POOL_CONNECTIONS, default))
+
+
+def get_http_pool_maxsize(default: int = 64, env: Optional[Env] = None) -> int:
+    if env is None:
+        env = os.environ
+
+    return int(env.get(HTTP_POOL_MAXSIZE, default))
+
+
+def get_http_max_concurrency_per_host(
+    default: int = 0, env: Optional[Env] = None
+) -> int:
+    if env is None:
+        env = os.environ
+
+    return int(env.get(HTTP_MAX_CONCURRENCY_PER_HOST, default))
+
+
+def get_dir_watcher(default: str = "auto", env: Optional[Env] = None) -> str:
+    """Return the run files watcher backend: "auto", "inotify" or "polling"."""
+    if env is None:
+        env = os.environ
+
+    return env.get(DIR_WATCHER, default).lower()
+
+
+def live_append_uploads(env: Optional[Env] = None) -> bool:
+    """Whether live files that only grow are streamed instead of re-uploaded."""
+    return _env_as_bool(LIVE_APPEND_UPLOADS, default="False", env=env)
+
+
+def async_media(env: Optional[Env] = None) -> bool:
+    """Whether media is encoded in the background instead of in constructors."""
+    return _env_as_bool(ASYNC_MEDIA, default="False", env=env)
+
+
+def get_media_inflight_bytes(
+    default: int = 256 * 1024 * 1024, env: Optional[Env] = None
+) -> int:
+    """Return how many bytes of unencoded media may be held at once."""
+    if env is None:
+        env = os.environ
+
+    return int(env.get(MEDIA_INFLIGHT_BYTES, default))
+
+
 def get_file_pusher_timeout(
     default: Optional[int] = None,
     env: Optional[Env] = None,
@@ -419,6 +480,27 @@ def get_cache_dir(env: Optional[Env] = None) -> Path:
     return Path(env.get(CACHE_DIR, platformdirs.user_cache_dir("wandb")))
 
 
+def get_introspection_cache_ttl(default: int = 86400, env: Optional[Env] = None) -> int:
+    """Seconds to keep GraphQL introspection results on disk; 0 disables caching."""
+    if env is None:
+        env = os.environ
+    return int(env.get(INTROSPECTION_CACHE_TTL, default))
+
+
+def use_query_cache(env: Optional[Env] = None) -> bool:
+    """Whether the public API caches query results on disk by default."""
+    return _env_as_bool(QUERY_CACHE, default="False", env=env)
+
+
+def get_query_cache_size(
+    default: int = 1024 * 1024 * 1024, env: Optional[Env] = None
+) -> int:
+    """Bytes of public API query results to keep on disk."""
+    if env is None:
+        env = os.environ
+    return int(env.get(QUERY_CACHE_SIZE, default))
+
+
 def get_use_v1_artifacts(env: Optional[Env] = None) -> bool:
     if env is None:
         env = os.environ
@@ -1,13 +1,27 @@
 import abc
 import fnmatch
 import glob
+import hashlib
 import logging
 import os
 import queue
 import time
-from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, MutableSet, Optional
-
-from wandb import util
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    List,
+    Mapping,
+    MutableMapping,
+    MutableSet,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from wandb import env, util
+from wandb.filesync import inotify
 from wandb.sdk.interface.interface import GlobStr
 from wandb.sdk.lib.paths import LogicalPath
 
@@ -97,17 +111,41 @@ class PolicyEnd(FileEventHandler):
         return "end"
 
 
+class _AppendState(NamedTuple):
+    """How much of an append-only file PolicyLive has sent."""
+
+    inode: int
+    # Offset just past the last complete line sent, and the number of lines.
+    sent: int
+    lines: int
+    # The file's size when last synced, and digests of its start and of the
+    # bytes just before that size, used to detect changes to that content.
+    size: int
+    digests: Tuple[bytes, bytes]
+
+
 class PolicyLive(FileEventHandler):
     """Event handler that uploads respecting throttling.
 
     Uploads files every RATE_LIMIT_SECONDS, which changes as the size increases to deal
     with throttling.
+
+    With WANDB_LIVE_APPEND_UPLOADS set, text files that only ever grow, like
+    logs and CSVs, are uploaded in full once; after that, lines appended to
+    them are streamed through the file stream as they are written, and the
+    file is uploaded in full again at the end of the run. If their existing
+    content changes, they fall back to the throttled full uploads.
     """
 
     RATE_LIMIT_SECONDS = 15
     unit_dict = dict(util.POW_10_BYTES)
     # Wait to upload until size has increased 20% from last upload
     RATE_LIMIT_SIZE_INCREASE = 1.2
+    APPEND_EXTENSIONS = (".log", ".txt", ".csv", ".tsv", ".jsonl", ".out")
+    # Bytes compared at the start and at the end of the sent content.
+    APPEND_CHECK_BYTES = 64 * 1024
+    # Larger jumps in size are uploaded in full instead of streamed.
+    APPEND_MAX_BYTES = 10 * 1024 * 1024
 
     def __init__(
         self,
@@ -121,6 +159,10 @@ class PolicyLive(FileEventHandler):
         super().__init__(file_path, save_name, file_pusher, *args, **kwargs)
         self._last_uploaded_time: Optional[float] = None
         self._last_uploaded_size: int = 0
+        self._append_only = env.live_append_uploads() and save_name.endswith(
+            self.APPEND_EXTENSIONS
+        )
+        self._append_state: Optional[_AppendState] = None
         if settings is not None:
             if settings._live_policy_rate_limit is not None:
                 self.RATE_LIMIT_SECONDS = settings._live_policy_rate_limit
@@ -168,6 +210,8 @@ class PolicyLive(FileEventHandler):
             return
         if self._last_sync == os.path.getmtime(self.file_path):
             return
+        if not force and self._stream_appended():
+            return
         if force or self.should_update():
             self.save_file()
 
@@ -176,6 +220,78 @@ class PolicyLive(FileEventHandler):
         self._last_uploaded_time = time.time()
         self._last_uploaded_size = self.current_size
         self._file_pusher.file_changed(self.save_name, self.file_path)
+        if self._append_only and self._append_state is None:
+            self._append_state = self._scan_lines()
+
+    def _digests(self, f: IO[bytes], size: int) -> Tuple[bytes, bytes]:
+        f.seek(0)
+        head = hashlib.blake2b(f.read(min(size, self.APPEND_CHECK_BYTES)))
+        edge_start = max(0, size - self.APPEND_CHECK_BYTES)
+        f.seek(edge_start)
+        edge = hashlib.blake2b(f.read(size - edge_start))
+        return head.digest(), edge.digest()
+
+    def _scan_lines(self) -> Optional[_AppendState]:
+        """Record the complete lines of the file as sent."""
+        sent = lines = size = 0
+        try:
+            with open(self.file_path, "rb") as f:
+                inode = os.fstat(f.fileno()).st_ino
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    newlines = block.count(b"\n")
+                    if newlines:
+                        lines += newlines
+                        sent = size + block.rindex(b"\n") + 1
+                    size += len(block)
+                digests = self._digests(f, size)
+        except OSError:
+            self._append_only = False
+            return None
+        return _AppendState(inode, sent, lines, size, digests)
+
+    def _stream_appended(self) -> bool:
+        """Stream lines appended since the last sync.
+
+        Returns False, and stops treating the file as append-only, if content
+        that was already sent has changed.
+        """
+        state = self._append_state
+        if not self._append_only or state is None:
+            return False
+        try:
+            with open(self.file_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if (
+                    st.st_ino != state.inode
+                    or not state.size
+                    <= st.st_size
+                    <= state.size + self.APPEND_MAX_BYTES
+                    or self._digests(f, state.size) != state.digests
+                ):
+                    logger.info(f"{self.save_name} is not append-only, uploading it")
+                    self._append_only = False
+                    self._append_state = None
+                    return False
+                f.seek(state.sent)
+                tail = f.read(st.st_size - state.sent)
+                size = state.sent + len(tail)
+                digests = self._digests(f, size)
+        except OSError:
+            return False
+
+        # Only complete lines are sent.
+        end = tail.rfind(b"\n") + 1
+        lines: List[str] = []
+        if end:
+            text = tail[: end - 1].decode("utf-8", errors="replace")
+            lines = [line.rstrip("\r") for line in text.split("\n")]
+            self._file_pusher.file_appended(
+                self.save_name, lines, state.lines, size, end
+            )
+        self._append_state = _AppendState(
+            state.inode, state.sent + end, state.lines + len(lines), size, digests
+        )
+        return True
 
     def finish(self) -> None:
         self.on_modified(force=True)
@@ -203,15 +319,55 @@ class DirWatcher:
         }
         self._file_pusher = file_pusher
         self._file_event_handlers: MutableMapping[LogicalPath, FileEventHandler] = {}
-        self._file_observer = wd_polling.PollingObserver()
-        self._file_observer.schedule(
-            self._per_file_event_handler(), self._dir, recursive=True
-        )
-        self._file_observer.start()
+        self._file_observer = self._start_file_observer()
         logger.info("watching files in: %s", settings.files_dir)
 
+    def _start_file_observer(
+        self,
+    ) -> Union["wd_polling.PollingObserverVFS", inotify.InotifyWatcher]:
+        """Watch the files dir with inotify where possible, otherwise by polling."""
+        handler = self._per_file_event_handler()
+        backend = env.get_dir_watcher()
+        if backend in ("auto", "inotify") and inotify.is_supported():
+            try:
+                watcher = inotify.InotifyWatcher(
+                    self._dir, handler, exclude=self._is_excluded_dir
+                )
+            except OSError as e:
+                logger.warning(
+                    f"Unable to watch {self._dir} with inotify, polling instead: {e}"
+                )
+            else:
+                watcher.start()
+                return watcher
+        elif backend == "inotify":
+            logger.warning("inotify is not supported on this platform, polling instead")
+
+        observer = wd_polling.PollingObserverVFS(os.stat, self._listdir)
+        observer.schedule(handler, self._dir, recursive=True)
+        observer.start()
+        return observer
+
+    def _is_excluded_dir(self, path: PathStr) -> bool:
+        """Whether a directory holds only SDK-managed files that need no watching.
+
+        Files under media/ are written by the SDK, which uploads them through
+        `update_policy` as soon as they're logged.
+        """
+        return os.path.relpath(path, self._dir) == "media"
+
+    def _listdir(self, path: PathStr) -> List[str]:
+        names = os.listdir(path)
+        if os.path.normpath(path) == os.path.normpath(self._dir):
+            names = [
+                n for n in names if not self._is_excluded_dir(os.path.join(path, n))
+            ]
+        return names
+
     @property
     def emitter(self) -> Optional["wd_api.EventEmitter"]:
+        if isinstance(self._file_observer, inotify.InotifyWatcher):
+            return None
         try:
             return next(iter(self._file_observer.emitters))
         except StopIteration:
@@ -357,8 +513,10 @@ class DirWatcher:
     def finish(self) -> None:
         logger.info("shutting down directory watcher")
         try:
+            if isinstance(self._file_observer, inotify.InotifyWatcher):
+                self._file_observer.stop()
             # avoid hanging if we crashed before the observer was started
-            if self._file_observer.is_alive():
+            elif self._file_observer.is_alive():
                 # rather unfortunately we need to manually do a final scan of the dir
                 # with `queue_events`, then iterate through all events before stopping
                 # the observer to catch all files written.  First we need to prevent the
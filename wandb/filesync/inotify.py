@@ -0,0 +1,279 @@
+"""Event-driven watching of a run's files directory with Linux inotify.
+
+Polling re-stats the whole directory tree on every interval, so its cost grows
+with the number of files in the run. `InotifyWatcher` instead asks the kernel
+to report changes, so an idle run directory costs nothing however large it is.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from wandb import util
+
+if TYPE_CHECKING:
+    import wandb.vendor.watchdog_0_9_0.watchdog.events as wd_events
+else:
+    wd_events = util.vendor_import("wandb_watchdog.events")
+
+# Flags from <sys/inotify.h>.
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+_libc: Optional[Any] = None
+_libc_lock = threading.Lock()
+
+
+def _load_libc() -> Optional[Any]:
+    global _libc
+    if not sys.platform.startswith("linux"):
+        return None
+    with _libc_lock:
+        if _libc is None:
+            try:
+                libc = ctypes.CDLL(
+                    ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+                )
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [
+                    ctypes.c_int,
+                    ctypes.c_char_p,
+                    ctypes.c_uint32,
+                ]
+            except (OSError, AttributeError):
+                return None
+            _libc = libc
+    return _libc
+
+
+def is_supported() -> bool:
+    """Whether inotify is available on this platform."""
+    return _load_libc() is not None
+
+
+class InotifyWatcher:
+    """Watches a directory tree with inotify and dispatches batched events.
+
+    Once an event arrives, events are collected for `batch_interval` seconds,
+    repeated modifications of the same file are coalesced, and the batch is
+    dispatched to a watchdog event handler, in the same form the polling
+    observer produces. Directories for which `exclude` returns True are never
+    watched.
+
+    Raises `OSError` if the directory can't be watched, e.g. because the
+    inotify watch limit was reached.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        handler: "wd_events.FileSystemEventHandler",
+        exclude: Callable[[str], bool] = lambda path: False,
+        batch_interval: float = 0.25,
+    ) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not supported on this platform")
+        self._libc = libc
+        self._path = path
+        self._handler = handler
+        self._exclude = exclude
+        self._batch_interval = batch_interval
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._paths: Dict[int, str] = {}
+        # Held while reading and dispatching a batch.
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._thread_body, name="InotifyWatcher", daemon=True
+        )
+        try:
+            self._watch_tree(path)
+        except OSError:
+            self._close()
+            raise
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Stop watching, dispatching any events that are still pending."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        os.write(self._wakeup_w, b"\0")
+        if self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+        self._close()
+
+    def flush(self) -> None:
+        """Read and dispatch all pending events."""
+        with self._lock:
+            if self._fd < 0:
+                return
+            try:
+                events = self._translate(self._read())
+            except OSError as e:
+                logger.warning(f"Error reading file events in {self._path}: {e}")
+                return
+            for event in events:
+                try:
+                    self._handler.dispatch(event)
+                except Exception:
+                    logger.exception(f"Error handling file event: {event}")
+
+    def _close(self) -> None:
+        for fd in (self._fd, self._wakeup_r, self._wakeup_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd = -1
+
+    def _thread_body(self) -> None:
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([self._fd, self._wakeup_r], [], [])
+            if self._wakeup_r in readable:
+                break
+            # Let a burst of writes accumulate so it is handled as one batch.
+            if self._stopped.wait(self._batch_interval):
+                break
+            self.flush()
+
+    def _add_watch(self, path: str) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                # The directory was removed before we got to it.
+                return False
+            if err == errno.ENOSPC:
+                raise OSError(err, "inotify watch limit reached")
+            raise OSError(err, os.strerror(err))
+        self._paths[wd] = path
+        return True
+
+    def _watch_tree(self, top: str) -> List[str]:
+        """Watch a directory and its subdirectories; return the files in them."""
+        files: List[str] = []
+        if self._exclude(top) or not self._add_watch(top):
+            return files
+        for dirpath, dirnames, filenames in os.walk(top):
+            watched = []
+            for dirname in dirnames:
+                subdir = os.path.join(dirpath, dirname)
+                if (
+                    not os.path.islink(subdir)
+                    and not self._exclude(subdir)
+                    and self._add_watch(subdir)
+                ):
+                    watched.append(dirname)
+            dirnames[:] = watched
+            files.extend(os.path.join(dirpath, name) for name in filenames)
+        return files
+
+    def _read(self) -> List[Tuple[int, int, str]]:
+        """Drain the inotify queue into (mask, cookie, path) tuples."""
+        events: List[Tuple[int, int, str]] = []
+        while True:
+            try:
+                buf = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    events.append((mask, cookie, self._path))
+                    continue
+                if mask & IN_IGNORED:
+                    self._paths.pop(wd, None)
+                    continue
+                parent = self._paths.get(wd)
+                if parent is None:
+                    continue
+                path = os.path.join(parent, os.fsdecode(name)) if name else parent
+                events.append((mask, cookie, path))
+
+    def _translate(
+        self, raw_events: List[Tuple[int, int, str]]
+    ) -> List["wd_events.FileSystemEvent"]:
+        events: List[wd_events.FileSystemEvent] = []
+        seen: Set[Tuple[str, str]] = set()
+        moved_from: Dict[int, str] = {}
+
+        def add(event: "wd_events.FileSystemEvent") -> None:
+            # A modification is redundant after a creation or another
+            # modification of the same file in this batch.
+            key = ("changed", event.src_path)
+            if event.event_type in ("created", "modified"):
+                if key in seen:
+                    return
+                seen.add(key)
+            events.append(event)
+
+        for mask, cookie, path in raw_events:
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost: rescan everything.
+                for file_path in self._watch_tree(self._path):
+                    add(wd_events.FileModifiedEvent(file_path))
+            elif mask & IN_ISDIR:
+                if mask & IN_MOVED_FROM:
+                    moved_from[cookie] = path
+                elif mask & (IN_CREATE | IN_MOVED_TO):
+                    src_dir = moved_from.pop(cookie, None)
+                    for file_path in self._watch_tree(path):
+                        if src_dir is None:
+                            add(wd_events.FileCreatedEvent(file_path))
+                        else:
+                            old_path = os.path.join(
+                                src_dir, os.path.relpath(file_path, path)
+                            )
+                            add(wd_events.FileMovedEvent(old_path, file_path))
+            elif mask & IN_CREATE:
+                add(wd_events.FileCreatedEvent(path))
+            elif mask & (IN_MODIFY | IN_CLOSE_WRITE):
+                add(wd_events.FileModifiedEvent(path))
+            elif mask & IN_MOVED_FROM:
+                moved_from[cookie] = path
+            elif mask & IN_MOVED_TO:
+                src_path = moved_from.pop(cookie, None)
+                if src_path is None:
+                    add(wd_events.FileCreatedEvent(path))
+                else:
+                    add(wd_events.FileMovedEvent(src_path, path))
+        return events
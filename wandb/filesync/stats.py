@@ -1,7 +1,8 @@
 import threading
-from typing import MutableMapping, NamedTuple
+import time
+from typing import Dict, MutableMapping, NamedTuple
 
-import wandb
+from wandb.sdk.lib import filenames
 
 
 class FileStats(NamedTuple):
@@ -18,6 +19,17 @@ class Summary(NamedTuple):
     deduped_bytes: int
 
 
+class DeltaSummary(NamedTuple):
+    streamed_bytes: int
+    saved_bytes: int
+
+
+class ClassBandwidth(NamedTuple):
+    uploaded_bytes: int
+    total_bytes: int
+    bytes_per_sec: float
+
+
 class FileCountsByCategory(NamedTuple):
     artifact: int
     wandb: int
@@ -29,6 +41,15 @@ class Stats:
     def __init__(self) -> None:
         self._stats: MutableMapping[str, FileStats] = {}
         self._lock = threading.Lock()
+        # Upload scheduling class of each file, and when each class first
+        # started and last made upload progress.
+        self._upload_classes: MutableMapping[str, str] = {}
+        self._class_started: MutableMapping[str, float] = {}
+        self._class_updated: MutableMapping[str, float] = {}
+        # Bytes of appended data streamed instead of re-uploading whole files,
+        # and the upload bytes that saved.
+        self._delta_streamed_bytes = 0
+        self._delta_saved_bytes = 0
 
     def init_file(
         self, save_name: str, size: int, is_artifact_file: bool = False
@@ -50,11 +71,19 @@ class Stats:
                 uploaded=orig.total,
             )
 
+    def set_upload_class(self, save_name: str, upload_class: str) -> None:
+        with self._lock:
+            self._upload_classes[save_name] = upload_class
+            self._class_started.setdefault(upload_class, time.monotonic())
+
     def update_uploaded_file(self, save_name: str, total_uploaded: int) -> None:
         with self._lock:
             self._stats[save_name] = self._stats[save_name]._replace(
                 uploaded=total_uploaded,
             )
+            upload_class = self._upload_classes.get(save_name)
+            if upload_class is not None:
+                self._class_updated[upload_class] = time.monotonic()
 
     def update_failed_file(self, save_name: str) -> None:
         with self._lock:
@@ -63,6 +92,24 @@ class Stats:
                 failed=True,
             )
 
+    def update_delta_upload(self, file_size: int, streamed_bytes: int) -> None:
+        """Record that only the appended part of a file was sent.
+
+        Arguments:
+            file_size: The size of the file, which a full re-upload would send.
+            streamed_bytes: The bytes that were sent instead.
+        """
+        with self._lock:
+            self._delta_streamed_bytes += streamed_bytes
+            self._delta_saved_bytes += max(0, file_size - streamed_bytes)
+
+    def delta_summary(self) -> DeltaSummary:
+        with self._lock:
+            return DeltaSummary(
+                streamed_bytes=self._delta_streamed_bytes,
+                saved_bytes=self._delta_saved_bytes,
+            )
+
     def summary(self) -> Summary:
         # Need to use list to ensure we get a copy, since other threads may
         # modify this while we iterate
@@ -74,6 +121,35 @@ class Stats:
             deduped_bytes=sum(f.total for f in stats if f.deduped),
         )
 
+    def bandwidth_by_class(self) -> Dict[str, ClassBandwidth]:
+        """Return upload progress and throughput for each scheduling class.
+
+        Throughput is measured from when the class's first upload started to
+        its most recent upload progress.
+        """
+        with self._lock:
+            file_stats = [
+                (self._upload_classes[save_name], stats)
+                for save_name, stats in self._stats.items()
+                if save_name in self._upload_classes
+            ]
+            started = dict(self._class_started)
+            updated = dict(self._class_updated)
+        uploaded: Dict[str, int] = {}
+        total: Dict[str, int] = {}
+        for upload_class, stats in file_stats:
+            uploaded[upload_class] = uploaded.get(upload_class, 0) + stats.uploaded
+            total[upload_class] = total.get(upload_class, 0) + stats.total
+        result = {}
+        for upload_class in total:
+            elapsed = updated.get(upload_class, 0.0) - started[upload_class]
+            result[upload_class] = ClassBandwidth(
+                uploaded_bytes=uploaded[upload_class],
+                total_bytes=total[upload_class],
+                bytes_per_sec=uploaded[upload_class] / elapsed if elapsed > 0 else 0.0,
+            )
+        return result
+
     def file_counts_by_category(self) -> FileCountsByCategory:
         artifact_files = 0
         wandb_files = 0
@@ -86,7 +162,7 @@ class Stats:
         for save_name, stats in file_stats:
             if stats.artifact_file:
                 artifact_files += 1
-            elif wandb.wandb_lib.filenames.is_wandb_file(save_name):  # type: ignore[attr-defined]  # TODO(spencerpearson): this is probably synonymous with wandb.sdk.lib.filenames...?
+            elif filenames.is_wandb_file(save_name):
                 wandb_files += 1
             elif save_name.startswith("media"):
                 media_files += 1
@@ -1,5 +1,7 @@
 """Batching file prepare requests to our API."""
 
+import concurrent.futures
+import logging
 import queue
 import threading
 import time
@@ -7,11 +9,14 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -23,6 +28,18 @@ if TYPE_CHECKING:
         CreateArtifactFilesResponseFile,
     )
 
+logger = logging.getLogger(__name__)
+
+# Size of the first batch, before any requests have been timed.
+INITIAL_BATCH_SIZE = 100
+
+# How long a batch request should take. Batches are made smaller when the
+# server takes longer than this, and bigger while it answers well within it.
+TARGET_BATCH_LATENCY = 1.0
+
+# How many batch requests can be waiting on the server at once.
+MAX_BATCHES_IN_FLIGHT = 4
+
 
 # Request for a file to be prepared.
 class RequestPrepare(NamedTuple):
@@ -46,6 +63,15 @@ class ResponsePrepare(NamedTuple):
 Request = Union[RequestPrepare, RequestFinish]
 
 
+class PrepareStats(NamedTuple):
+    batches: int
+    files: int
+    prefetched_files: int
+    request_secs: float
+    url_wait_secs: float
+    upload_secs: float
+
+
 def _clamp(x: float, low: float, high: float) -> float:
     return max(low, min(x, high))
 
@@ -102,11 +128,47 @@ def prepare_response(response: "CreateArtifactFilesResponseFile") -> ResponsePre
     )
 
 
+class BatchSizer:
+    """Picks batch sizes that keep batch requests close to a target latency.
+
+    A batch that takes longer than the target shrinks the next ones in
+    proportion. A full batch that takes under half the target doubles them.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        max_size: int,
+        target_latency: float = TARGET_BATCH_LATENCY,
+    ) -> None:
+        self._max_size = max_size
+        self._size = max(1, min(initial_size, max_size))
+        self._target_latency = target_latency
+        self._lock = threading.Lock()
+
+    def size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def observe(self, batch_size: int, latency: float) -> None:
+        with self._lock:
+            if latency > self._target_latency:
+                scaled = int(batch_size * self._target_latency / latency)
+                self._size = max(1, min(self._size, scaled))
+            elif latency < self._target_latency / 2 and batch_size >= self._size:
+                self._size = min(self._max_size, self._size * 2)
+
+
 class StepPrepare:
     """A thread that batches requests to our file prepare API.
 
     Any number of threads may call prepare() in parallel. The PrepareBatcher thread
-    will batch requests up and send them all to the backend at once.
+    will batch requests up and send them to the backend, with up to
+    `max_in_flight` batches waiting on it at once. Batch sizes are picked by a
+    BatchSizer, up to `max_batch_size`.
+
+    The files an artifact will upload can be passed to prefetch() ahead of time,
+    so that their upload URLs are already on their way when prepare() is called.
     """
 
     def __init__(
@@ -116,33 +178,87 @@ class StepPrepare:
         inter_event_time: float,
         max_batch_size: int,
         request_queue: Optional["queue.Queue[Request]"] = None,
+        max_in_flight: int = MAX_BATCHES_IN_FLIGHT,
+        max_prefetch: Optional[int] = None,
+        target_latency: float = TARGET_BATCH_LATENCY,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._api = api
         self._inter_event_time = inter_event_time
         self._batch_time = batch_time
-        self._max_batch_size = max_batch_size
+        self._sizer = BatchSizer(INITIAL_BATCH_SIZE, max_batch_size, target_latency)
+        self._max_in_flight = max_in_flight
+        self._in_flight = threading.Semaphore(max_in_flight)
         self._request_queue: queue.Queue[Request] = request_queue or queue.Queue()
+        self._clock = clock
         self._thread = threading.Thread(target=self._thread_body)
         self._thread.daemon = True
 
+        self._max_prefetch = (
+            max_prefetch if max_prefetch is not None else max_batch_size * max_in_flight
+        )
+        # Prefetched files that prepare() hasn't been called for yet, and the
+        # files prepare() was called for while prefetching, which the
+        # prefetchers may yet get to. The latter are forgotten once no
+        # prefetcher is running.
+        self._prefetched: Dict[
+            str, Tuple[CreateArtifactFileSpecInput, queue.Queue[ResponsePrepare]]
+        ] = {}
+        self._claimed: Set[str] = set()
+        self._prefetchers = 0
+        self._stopping = False
+        self._prefetch_cond = threading.Condition()
+
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._files = 0
+        self._prefetched_files = 0
+        self._request_secs = 0.0
+        self._url_wait_secs = 0.0
+        self._upload_secs = 0.0
+
     def _thread_body(self) -> None:
-        while True:
-            finish, batch = gather_batch(
-                request_queue=self._request_queue,
-                batch_time=self._batch_time,
-                inter_event_time=self._inter_event_time,
-                max_batch_size=self._max_batch_size,
-            )
-            if batch:
-                batch_response = self._prepare_batch(batch)
-                # send responses
-                for prepare_request in batch:
-                    name = prepare_request.file_spec["name"]
-                    response_file = batch_response[name]
-                    response = prepare_response(response_file)
-                    prepare_request.response_channel.put(response)
-            if finish:
-                break
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_in_flight,
+            thread_name_prefix="StepPrepare",
+        ) as executor:
+            while True:
+                # Only gather a batch once it can be sent, so requests keep
+                # piling up into bigger batches while the server is busy.
+                self._in_flight.acquire()
+                finish, batch = gather_batch(
+                    request_queue=self._request_queue,
+                    batch_time=self._batch_time,
+                    inter_event_time=self._inter_event_time,
+                    max_batch_size=self._sizer.size(),
+                )
+                if batch:
+                    executor.submit(self._send_batch, batch)
+                else:
+                    self._in_flight.release()
+                if finish:
+                    break
+
+    def _send_batch(self, batch: Sequence[RequestPrepare]) -> None:
+        try:
+            start = self._clock()
+            batch_response = self._prepare_batch(batch)
+            latency = self._clock() - start
+            self._sizer.observe(len(batch), latency)
+            with self._stats_lock:
+                self._batches += 1
+                self._files += len(batch)
+                self._request_secs += latency
+            # send responses
+            for prepare_request in batch:
+                name = prepare_request.file_spec["name"]
+                response_file = batch_response[name]
+                response = prepare_response(response_file)
+                prepare_request.response_channel.put(response)
+        except Exception:
+            logger.exception("failed to prepare a batch of artifact files")
+        finally:
+            self._in_flight.release()
 
     def _prepare_batch(
         self, batch: Sequence[RequestPrepare]
@@ -161,10 +277,91 @@ class StepPrepare:
     def prepare(
         self, file_spec: "CreateArtifactFileSpecInput"
     ) -> "queue.Queue[ResponsePrepare]":
+        name = file_spec["name"]
+        with self._prefetch_cond:
+            prefetched = self._prefetched.pop(name, None)
+            if prefetched is not None:
+                self._prefetch_cond.notify()
+            elif self._prefetchers:
+                self._claimed.add(name)
+        if prefetched is not None and prefetched[0] == file_spec:
+            with self._stats_lock:
+                self._prefetched_files += 1
+            return prefetched[1]
+
         response_queue: queue.Queue[ResponsePrepare] = queue.Queue()
         self._request_queue.put(RequestPrepare(file_spec, response_queue))
         return response_queue
 
+    def prefetch(self, file_specs: Iterable["CreateArtifactFileSpecInput"]) -> None:
+        """Request upload URLs for files before prepare() is called for them.
+
+        The specs are consumed on a background thread, in order, staying at
+        most `max_prefetch` files ahead of the prepare() calls. prepare() must
+        later be called with an identical spec to use the prefetched URL.
+        """
+        with self._prefetch_cond:
+            self._prefetchers += 1
+        thread = threading.Thread(
+            target=self._prefetch_body,
+            args=(iter(file_specs),),
+            name="StepPreparePrefetch",
+            daemon=True,
+        )
+        thread.start()
+
+    def _prefetch_body(
+        self, file_specs: Iterator["CreateArtifactFileSpecInput"]
+    ) -> None:
+        try:
+            self._prefetch_specs(file_specs)
+        finally:
+            with self._prefetch_cond:
+                self._prefetchers -= 1
+                if not self._prefetchers:
+                    self._claimed.clear()
+
+    def _prefetch_specs(
+        self, file_specs: Iterator["CreateArtifactFileSpecInput"]
+    ) -> None:
+        for file_spec in file_specs:
+            name = file_spec["name"]
+            with self._prefetch_cond:
+                while (
+                    len(self._prefetched) >= self._max_prefetch and not self._stopping
+                ):
+                    self._prefetch_cond.wait()
+                if self._stopping:
+                    return
+                if name in self._claimed:
+                    # prepare() got to this file first.
+                    self._claimed.discard(name)
+                    continue
+                response_queue: queue.Queue[ResponsePrepare] = queue.Queue()
+                self._prefetched[name] = (file_spec, response_queue)
+                self._request_queue.put(RequestPrepare(file_spec, response_queue))
+
+    def record_url_wait(self, secs: float) -> None:
+        """Record time an uploader spent waiting for prepare() to respond."""
+        with self._stats_lock:
+            self._url_wait_secs += secs
+
+    def record_upload(self, secs: float) -> None:
+        """Record time an uploader spent uploading a prepared file."""
+        with self._stats_lock:
+            self._upload_secs += secs
+
+    def stats(self) -> PrepareStats:
+        with self._stats_lock:
+            return PrepareStats(
+                batches=self._batches,
+                files=self._files,
+                prefetched_files=self._prefetched_files,
+                request_secs=self._request_secs,
+                url_wait_secs=self._url_wait_secs,
+                upload_secs=self._upload_secs,
+            )
+
     def start(self) -> None:
         self._thread.start()
 
@@ -175,5 +372,8 @@ class StepPrepare:
         return self._thread.is_alive()
 
     def shutdown(self) -> None:
+        with self._prefetch_cond:
+            self._stopping = True
+            self._prefetch_cond.notify_all()
         self.finish()
         self._thread.join()
@@ -2,6 +2,7 @@
 
 import concurrent.futures
 import logging
+import os
 import queue
 import sys
 import threading
@@ -9,7 +10,6 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     MutableMapping,
-    MutableSequence,
     MutableSet,
     NamedTuple,
     Optional,
@@ -17,7 +17,7 @@ from typing import (
 )
 
 from wandb.errors.term import termerror
-from wandb.filesync import upload_job
+from wandb.filesync import upload_job, upload_scheduler
 from wandb.sdk.lib.paths import LogicalPath
 
 if TYPE_CHECKING:
@@ -99,7 +99,7 @@ class StepUpload:
 
         # Indexed by files' `save_name`'s, which are their ID's in the Run.
         self._running_jobs: MutableMapping[LogicalPath, RequestUpload] = {}
-        self._pending_jobs: MutableSequence[RequestUpload] = []
+        self._scheduler = upload_scheduler.UploadScheduler(max_threads)
 
         self._artifacts: MutableMapping[str, ArtifactStatus] = {}
 
@@ -129,7 +129,7 @@ class StepUpload:
                 event = None
             if event:
                 self._handle_event(event)
-            elif not self._running_jobs:
+            elif not self._running_jobs and not self._scheduler:
                 # Queue was empty and no jobs left.
                 self._pool.shutdown(wait=False)
                 if finish_callback:
@@ -156,10 +156,8 @@ class StepUpload:
                         )
                     self._fail_artifact_futures(job.artifact_id, event.exc)
             self._running_jobs.pop(job.save_name)
-            # If we have any pending jobs, start one now
-            if self._pending_jobs:
-                event = self._pending_jobs.pop(0)
-                self._start_upload_job(event)
+            self._scheduler.done(job)
+            self._start_upload_jobs()
         elif isinstance(event, RequestCommitArtifact):
             if event.artifact_id not in self._artifacts:
                 self._init_artifact(event.artifact_id)
@@ -177,19 +175,27 @@ class StepUpload:
                 if event.artifact_id not in self._artifacts:
                     self._init_artifact(event.artifact_id)
                 self._artifacts[event.artifact_id]["pending_count"] += 1
-            self._start_upload_job(event)
+            superseded = self._scheduler.push(event)
+            if superseded is not None:
+                self._discard_upload(superseded, event)
+            self._start_upload_jobs()
         else:
             raise Exception("Programming error: unhandled event: {}".format(str(event)))
 
-    def _start_upload_job(self, event: RequestUpload) -> None:
-        # Operations on a single backend file must be serialized. if
-        # we're already uploading this file, put the event on the
-        # end of the queue
-        if event.save_name in self._running_jobs:
-            self._pending_jobs.append(event)
-            return
+    def _start_upload_jobs(self) -> None:
+        # Operations on a single backend file must be serialized, so the
+        # scheduler skips files that are already being uploaded.
+        while True:
+            event = self._scheduler.pop(self._running_jobs.keys())
+            if event is None:
+                return
+            self._spawn_upload(event)
 
-        self._spawn_upload(event)
+    def _discard_upload(self, event: RequestUpload, newer: RequestUpload) -> None:
+        """Drop a pending upload that a newer version of the file replaced."""
+        logger.info("Coalescing pending uploads of %s", event.save_name)
+        if event.copied and event.path != newer.path and os.path.isfile(event.path):
+            os.remove(event.path)
 
     def _spawn_upload(self, event: RequestUpload) -> None:
         """Spawn an upload job, and handles the bookkeeping of `self._running_jobs`.
@@ -217,6 +223,9 @@ class StepUpload:
         # This would be very bad!
         # So, this line has to happen _outside_ the `pool.submit()`.
         self._running_jobs[event.save_name] = event
+        upload_class = self._scheduler.upload_class(event.save_name)
+        if upload_class is not None:
+            self._stats.set_upload_class(event.save_name, upload_class.name.lower())
 
         def run_and_notify() -> None:
             try:
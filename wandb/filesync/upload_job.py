@@ -3,6 +3,7 @@ import os
 from typing import TYPE_CHECKING, Optional
 
 import wandb
+from wandb.sdk.internal import resumable_upload
 from wandb.sdk.lib.paths import LogicalPath
 
 if TYPE_CHECKING:
@@ -120,13 +121,27 @@ class UploadJob:
             if upload_url.startswith("/"):
                 upload_url = f"{self._api.api_url}{upload_url}"
             try:
-                with open(self.save_path, "rb") as f:
-                    self._api.upload_file_retry(
-                        upload_url,
-                        f,
-                        lambda _, t: self.progress(t),
-                        extra_headers=extra_headers,
-                    )
+                if self._use_resumable_upload(upload_url, extra_headers):
+                    try:
+                        self._api.upload_file_resumable_retry(
+                            upload_url,
+                            self.save_path,
+                            lambda _, t: self.progress(t),
+                            extra_headers=extra_headers,
+                        )
+                    except Exception:
+                        # The copy is deleted after this job, so its session
+                        # can never be resumed.
+                        self._api.discard_upload_session(upload_url, self.save_path)
+                        raise
+                else:
+                    with open(self.save_path, "rb") as f:
+                        self._api.upload_file_retry(
+                            upload_url,
+                            f,
+                            lambda _, t: self.progress(t),
+                            extra_headers=extra_headers,
+                        )
                 logger.info("Uploaded file %s", self.save_path)
             except Exception as e:
                 self._stats.update_failed_file(self.save_name)
@@ -140,3 +155,19 @@ class UploadJob:
 
     def progress(self, total_bytes: int) -> None:
         self._stats.update_uploaded_file(self.save_name, total_bytes)
+
+    def _use_resumable_upload(self, upload_url: str, extra_headers: dict) -> bool:
+        """Whether to upload in resumable chunks instead of a single PUT.
+
+        Only private copies of files are uploaded in chunks, since the file
+        must not change after the upload session starts.
+        """
+        if not self.copied:
+            return False
+        if not resumable_upload.resumable_protocol(upload_url, extra_headers):
+            return False
+        try:
+            size = os.path.getsize(self.save_path)
+        except OSError:
+            return False
+        return size >= resumable_upload.MIN_RESUMABLE_SIZE
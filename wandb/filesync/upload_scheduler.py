@@ -0,0 +1,167 @@
+"""Priority scheduling of file uploads."""
+
+import collections
+import enum
+import os
+from typing import (
+    TYPE_CHECKING,
+    Collection,
+    Deque,
+    Dict,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+)
+
+from wandb.sdk.lib import filenames
+from wandb.sdk.lib.paths import LogicalPath
+
+if TYPE_CHECKING:
+    from wandb.filesync.step_upload import RequestUpload
+
+
+class UploadClass(enum.IntEnum):
+    """Upload priority classes, most urgent first."""
+
+    METADATA = 0
+    MEDIA = 1
+    ARTIFACT = 2
+    BULK = 3
+
+
+# Relative share of upload slots each class gets while several are waiting.
+CLASS_WEIGHTS = {
+    UploadClass.METADATA: 8,
+    UploadClass.MEDIA: 4,
+    UploadClass.ARTIFACT: 2,
+    UploadClass.BULK: 1,
+}
+# Files at least this large are bulk uploads, whatever else they are.
+BULK_THRESHOLD = 64 * 1024 * 1024
+# Every upload is charged at least this many bytes, so that a flood of tiny
+# files can't monopolize the slots either.
+MIN_CHARGE = 64 * 1024
+
+
+def classify(job: "RequestUpload", size: int) -> UploadClass:
+    if job.artifact_id is None and filenames.is_wandb_file(job.save_name):
+        return UploadClass.METADATA
+    if size >= BULK_THRESHOLD:
+        return UploadClass.BULK
+    if job.artifact_id is not None:
+        return UploadClass.ARTIFACT
+    return UploadClass.MEDIA
+
+
+class _Pending(NamedTuple):
+    job: "RequestUpload"
+    upload_class: UploadClass
+    size: int
+
+
+class UploadScheduler:
+    """Orders pending uploads by class, with byte-weighted fairness.
+
+    Each class keeps a FIFO of pending uploads. The next upload comes from the
+    class that has been charged the fewest bytes relative to its weight
+    (weighted fair queuing), so small metadata and media files go out ahead of
+    large ones without starving them. While metadata or media uploads are
+    waiting, artifact and bulk uploads can't take the last running slots, so
+    a few huge files can't block everything else. When nothing else is
+    waiting they may use every slot, and the next metadata or media upload
+    starts as soon as one of them finishes.
+
+    Pending uploads of a run file (one without an artifact or a custom save
+    function) are coalesced by save name: only its latest version is kept.
+    """
+
+    def __init__(self, max_running: int) -> None:
+        self._max_running = max_running
+        # Slots artifact and bulk uploads may not use while other uploads wait.
+        self._reserved = max(1, max_running // 4) if max_running > 1 else 0
+        self._queues: Dict[UploadClass, Deque[LogicalPath]] = {
+            c: collections.deque() for c in UploadClass
+        }
+        self._pending: MutableMapping[LogicalPath, _Pending] = {}
+        # Queue entries for jobs that may not be coalesced, keyed uniquely.
+        self._serial = 0
+        self._charged: Dict[UploadClass, float] = {c: 0.0 for c in UploadClass}
+        self._clock = 0.0
+        self._running: Dict[LogicalPath, UploadClass] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def push(self, job: "RequestUpload") -> Optional["RequestUpload"]:
+        """Add an upload; return the pending upload it superseded, if any."""
+        try:
+            size = os.path.getsize(job.path)
+        except OSError:
+            size = 0
+        upload_class = classify(job, size)
+
+        if job.artifact_id is None and job.save_fn is None:
+            key = job.save_name
+            previous = self._pending.get(key)
+            if previous is not None:
+                # Keep the original place in line, but upload the new version.
+                self._pending[key] = _Pending(job, previous.upload_class, size)
+                return previous.job
+        else:
+            key = LogicalPath(f"{job.save_name}\0{self._serial}")
+            self._serial += 1
+
+        queue = self._queues[upload_class]
+        if not queue:
+            # A class that was idle resumes at the current virtual time
+            # instead of spending credit it built up while idle.
+            self._charged[upload_class] = max(self._charged[upload_class], self._clock)
+        queue.append(key)
+        self._pending[key] = _Pending(job, upload_class, size)
+        return None
+
+    def pop(self, busy: Collection[LogicalPath]) -> Optional["RequestUpload"]:
+        """Take the next upload to start, or None if none can start now.
+
+        Arguments:
+            busy: Save names currently being uploaded. Uploads of the same
+                file are serialized, so these are skipped.
+        """
+        if len(self._running) >= self._max_running:
+            return None
+        low_priority_running = sum(
+            1 for c in self._running.values() if c >= UploadClass.ARTIFACT
+        )
+        high_priority_waiting = any(
+            self._queues[c] for c in UploadClass if c < UploadClass.ARTIFACT
+        )
+        low_priority_allowed = (
+            not high_priority_waiting
+            or low_priority_running < self._max_running - self._reserved
+        )
+        for upload_class in sorted(
+            UploadClass, key=lambda c: (self._charged[c], c.value)
+        ):
+            if upload_class >= UploadClass.ARTIFACT and not low_priority_allowed:
+                continue
+            queue = self._queues[upload_class]
+            for key in queue:
+                pending = self._pending[key]
+                if pending.job.save_name in busy:
+                    continue
+                queue.remove(key)
+                del self._pending[key]
+                self._clock = self._charged[upload_class]
+                self._charged[upload_class] += (
+                    max(pending.size, MIN_CHARGE) / CLASS_WEIGHTS[upload_class]
+                )
+                self._running[pending.job.save_name] = upload_class
+                return pending.job
+        return None
+
+    def upload_class(self, save_name: LogicalPath) -> Optional[UploadClass]:
+        """Return the class of a running upload."""
+        return self._running.get(save_name)
+
+    def done(self, job: "RequestUpload") -> None:
+        self._running.pop(job.save_name, None)
@@ -2,14 +2,18 @@ import json
 import os
 import time
 
-from wandb_gql import gql
-
 import wandb
 from wandb import util
 from wandb.apis.internal import Api
 from wandb.sdk import lib as wandb_lib
 from wandb.sdk.data_types.utils import val_to_json
 
+reset_path = util.vendor_setup()
+
+from wandb_gql import gql  # noqa: E402
+
+reset_path()
+
 DEEP_SUMMARY_FNAME = "wandb.h5"
 H5_TYPES = ("numpy.ndarray", "tensorflow.Tensor", "torch.Tensor")
 h5py = util.get_module("h5py")
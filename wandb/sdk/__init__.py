@@ -21,17 +21,40 @@ __all__ = (
     "helper",
 )
 
+from typing import TYPE_CHECKING
+
 from . import wandb_helper as helper
-from .artifacts.artifact import Artifact
+from .lib import lazyloader
 from .wandb_alerts import AlertLevel
 from .wandb_config import Config
-from .wandb_init import _attach, init
-from .wandb_login import login
 from .wandb_require import require
-from .wandb_run import finish
 from .wandb_settings import Settings
 from .wandb_setup import setup, teardown
 from .wandb_summary import Summary
-from .wandb_sweep import controller, sweep
-from .wandb_sync import _sync
 from .wandb_watch import unwatch, watch
+
+if TYPE_CHECKING:
+    from .artifacts.artifact import Artifact
+    from .wandb_init import _attach, init
+    from .wandb_login import login
+    from .wandb_run import finish
+    from .wandb_sweep import controller, sweep
+    from .wandb_sync import _sync
+
+# These pull in the backend, the public API and the data types, so they are
+# only imported when first used.
+_lazy = lazyloader.LazyAttributes(
+    globals(),
+    {
+        "Artifact": "wandb.sdk.artifacts.artifact:Artifact",
+        "init": "wandb.sdk.wandb_init:init",
+        "_attach": "wandb.sdk.wandb_init:_attach",
+        "login": "wandb.sdk.wandb_login:login",
+        "finish": "wandb.sdk.wandb_run:finish",
+        "sweep": "wandb.sdk.wandb_sweep:sweep",
+        "controller": "wandb.sdk.wandb_sweep:controller",
+        "_sync": "wandb.sdk.wandb_sync:_sync",
+    },
+)
+__getattr__ = _lazy.getattr
+__dir__ = _lazy.dir
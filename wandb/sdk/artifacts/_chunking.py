@@ -0,0 +1,122 @@
+"""Content-defined chunking of files.
+
+A file is cut wherever a rolling hash of the bytes just before a position
+matches a pattern, so where the cuts fall depends only on nearby content.
+Appending to or editing part of a file only changes the chunks around the
+edit, and the rest of the file splits into the same chunks as before.
+
+The hash is a gear hash: each byte adds a fixed pseudorandom value to the
+hash, which is shifted left a bit per byte, so that after 32 bytes a byte no
+longer affects the 32-bit hash. Hashes are computed for a block at a time
+with numpy.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from wandb import util
+from wandb.sdk.lib.hashutil import HexMD5, _md5
+
+if TYPE_CHECKING:
+    from wandb.sdk.lib.paths import StrPath
+
+MIN_CHUNK_SIZE = 256 * 1024
+AVG_CHUNK_SIZE = 1024**2
+MAX_CHUNK_SIZE = 4 * 1024**2
+
+# The number of bytes the hash at each position depends on.
+_WINDOW = 32
+
+# Files are read and hashed this much at a time.
+_READ_SIZE = 4 * 1024**2
+
+
+class Chunk(NamedTuple):
+    offset: int
+    size: int
+    digest: HexMD5
+
+
+def _gear_table(np: Any) -> Any:
+    # The value each byte adds to the hash. Changing these would change where
+    # every file is cut, so none of the chunks stored before would be reused.
+    raw = b"".join(_md5(bytes([byte])).digest()[:4] for byte in range(256))
+    return np.frombuffer(raw, dtype="<u4").astype(np.uint32)
+
+
+def _rolling_hashes(np: Any, gear: Any, data: bytes) -> Any:
+    """Return the hash of the window of `data` ending at each of its bytes.
+
+    The hash over a window of 2n bytes is the hash over its last n bytes,
+    plus the hash over its first n bytes shifted left n bits, so the hashes
+    for the whole window take log2(_WINDOW) passes over the data.
+    """
+    hashes = gear[np.frombuffer(data, dtype=np.uint8)]
+    shifted = np.empty_like(hashes)
+    span = 1
+    while span < _WINDOW:
+        np.left_shift(hashes[:-span], np.uint32(span), out=shifted[:-span])
+        hashes[span:] += shifted[:-span]
+        span *= 2
+    return hashes
+
+
+def chunk_file(
+    path: StrPath,
+    min_size: int = MIN_CHUNK_SIZE,
+    avg_size: int = AVG_CHUNK_SIZE,
+    max_size: int = MAX_CHUNK_SIZE,
+) -> list[Chunk]:
+    """Split a file into content-defined chunks.
+
+    Chunks end where the hash matches, which happens once every `avg_size`
+    bytes on average, as long as the chunk would be at least `min_size`
+    bytes. Chunks that reach `max_size` bytes without a match are cut there.
+    """
+    if not 0 < min_size <= avg_size <= max_size:
+        raise ValueError(
+            f"Chunk sizes must satisfy 0 < min <= avg <= max, got {min_size}, "
+            f"{avg_size}, {max_size}"
+        )
+    np = util.get_module("numpy", required="Chunking artifact files requires numpy")
+    gear = _gear_table(np)
+    bits = min(avg_size.bit_length() - 1, 32)
+    # Match on the high bits, which depend on the whole window.
+    mask = np.uint32(((1 << bits) - 1) << (32 - bits))
+
+    chunks: list[Chunk] = []
+    hasher = _md5()
+    start = 0  # Where the current chunk starts.
+    offset = 0  # Where the current block starts.
+    context = b""  # The bytes before the current block that its hashes depend on.
+
+    def cut(end: int, block: bytes, hashed: int) -> int:
+        nonlocal hasher, start
+        hasher.update(block[hashed - offset : end - offset])
+        chunks.append(Chunk(start, end - start, HexMD5(hasher.hexdigest())))
+        hasher = _md5()
+        start = end
+        return end
+
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_READ_SIZE)
+            if not block:
+                break
+            hashes = _rolling_hashes(np, gear, context + block)[len(context) :]
+            block_end = offset + len(block)
+            hashed = offset
+            for end in (np.flatnonzero((hashes & mask) == 0) + offset + 1).tolist():
+                while end - start > max_size:
+                    hashed = cut(start + max_size, block, hashed)
+                if end - start >= min_size:
+                    hashed = cut(end, block, hashed)
+            while block_end - start > max_size:
+                hashed = cut(start + max_size, block, hashed)
+            hasher.update(block[hashed - offset :])
+            context = (context + block)[-(_WINDOW - 1) :]
+            offset = block_end
+    if offset > start:
+        chunks.append(Chunk(start, offset - start, HexMD5(hasher.hexdigest())))
+    return chunks
@@ -0,0 +1,531 @@
+"""Compact storage for the entries of large artifact manifests.
+
+A manifest loaded from the server can have millions of entries. Rather than
+keeping an `ArtifactManifestEntry` per file, `CompactManifestEntries` keeps the
+fields of all entries in packed columns and creates entries on access.
+"""
+
+from __future__ import annotations
+
+import binascii
+import json
+import os
+import re
+import threading
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    ValuesView,
+)
+
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.lib.paths import LogicalPath
+
+if TYPE_CHECKING:
+    from wandb.sdk.artifacts.artifact import Artifact
+
+# Up to this many entries added since the manifest was last sorted are
+# inserted into the sorted entries, rather than sorting them all again.
+_MAX_INSERTED_ROWS = 1000
+
+# Entry fields stored in the columns, which entries write back to when set.
+_COLUMN_FIELDS = frozenset(
+    ["digest", "size", "birth_artifact_id", "ref", "extra", "local_path", "skip_cache"]
+)
+
+
+def _pack_md5(digest: str) -> bytes | None:
+    """Return the bytes of a base64 MD5 digest, or None for other digests."""
+    if len(digest) != 24 or not digest.endswith("=="):
+        return None
+    try:
+        raw = binascii.a2b_base64(digest)
+    except (binascii.Error, ValueError):
+        return None
+    # Only pack digests that encode back to the same string.
+    if binascii.b2a_base64(raw, newline=False) != digest.encode("ascii"):
+        return None
+    return raw
+
+
+class _CompactEntry(ArtifactManifestEntry):
+    """An entry created from, and writing changes back to, compact storage."""
+
+    _store: CompactManifestEntries
+    _row: int
+
+    def __repr__(self) -> str:
+        return (
+            ArtifactManifestEntry.__name__
+            + super().__repr__()[len(type(self).__name__) :]
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _COLUMN_FIELDS:
+            self._store._update(self._row, name, value)
+        elif name == "_parent_artifact":
+            self._store._parent_artifact = value
+
+
+class CompactManifestEntries(MutableMapping[str, ArtifactManifestEntry]):
+    """Manifest entries by path, stored in columns.
+
+    Paths are split into a directory, interned in a table, and a name, so the
+    directories of many files are only stored once. MD5 digests are stored as
+    16 bytes, and sizes and birth artifacts in arrays. The less common fields
+    are stored only for the entries that have them.
+
+    Entries returned by the mapping are created on each access, and changes to
+    their fields are written back.
+    """
+
+    def __init__(self, entries: Mapping[str, ArtifactManifestEntry] | None = None):
+        self._lock = threading.Lock()
+        self._parent_artifact: Artifact | None = None
+        # Changes to the entries, and to which paths there are.
+        self.version = 0
+        self._paths_version = 0
+        # The rows sorted by path, as of a paths version and number of rows.
+        self._sorted_rows: tuple[int, list[int], int] | None = None
+
+        self._dir_ids: dict[str, int] = {}
+        self._dirs: list[str] = []
+        # The row of each name in each directory.
+        self._children: list[dict[str, int]] = []
+        self._len = 0
+
+        # Columns, with a row per entry. Rows of removed entries have no name.
+        self._row_dirs = array("I")
+        self._row_names: list[str | None] = []
+        self._digests = bytearray()
+        self._other_digests: dict[int, str] = {}
+        self._sizes = array("q")
+        self._birth_ids: list[str | None] = [None]
+        self._birth_id_index: dict[str | None, int] = {None: 0}
+        self._row_birth_ids = array("I")
+        self._ref_prefixes: list[str] = []
+        self._ref_prefix_index: dict[str, int] = {}
+        self._row_ref_prefixes = array("i")
+        self._ref_names: dict[int, str] = {}
+        self._extras: dict[int, dict] = {}
+        self._local_paths: dict[int, str] = {}
+        self._skip_cache: set[int] = set()
+
+        if entries:
+            for path, entry in entries.items():
+                self[path] = entry
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # Mapping interface.
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self._find(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for row in range(len(self._row_names)):
+            if self._row_names[row] is not None:
+                yield self._path(row)
+
+    def __getitem__(self, path: str) -> ArtifactManifestEntry:
+        row = self._find(path) if isinstance(path, str) else None
+        if row is None:
+            raise KeyError(path)
+        return self._entry(row)
+
+    def get(self, path: str, default: Any = None) -> Any:  # type: ignore[override]
+        row = self._find(path) if isinstance(path, str) else None
+        return default if row is None else self._entry(row)
+
+    def values(self) -> ValuesView[ArtifactManifestEntry]:
+        return _Values(self)
+
+    def __setitem__(self, path: str, entry: ArtifactManifestEntry) -> None:
+        if isinstance(entry, _CompactEntry) and entry._store is self:
+            if self._find(path) == entry._row:
+                return
+        self._store(
+            path,
+            entry.digest,
+            entry.size,
+            entry.birth_artifact_id,
+            entry.ref,
+            entry.extra,
+            entry.local_path,
+            entry.skip_cache,
+        )
+
+    def __delitem__(self, path: str) -> None:
+        row = self._find(path) if isinstance(path, str) else None
+        if row is None:
+            raise KeyError(path)
+        with self._lock:
+            name = self._row_names[row]
+            assert name is not None
+            del self._children[self._row_dirs[row]][name]
+            self._row_names[row] = None
+            self._other_digests.pop(row, None)
+            self._ref_names.pop(row, None)
+            self._extras.pop(row, None)
+            self._local_paths.pop(row, None)
+            self._skip_cache.discard(row)
+            self._len -= 1
+            self.version += 1
+            self._paths_version += 1
+
+    # Fast paths used by the manifest.
+
+    def add_json(self, path: str, value: dict[str, Any]) -> None:
+        """Add an entry from its representation in `wandb_manifest.json`."""
+        size = value.get("size")
+        local_path = value.get("local_path")
+        if local_path and size is None:
+            size = os.path.getsize(local_path)
+        self._store(
+            path,
+            value["digest"],
+            size,
+            value.get("birthArtifactID"),
+            value.get("ref"),
+            value.get("extra"),
+            local_path,
+            value.get("skip_cache"),
+        )
+
+    def sorted_json(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield the path and manifest JSON of each entry, sorted by path."""
+        for row in self._sorted():
+            json_entry: dict[str, Any] = {"digest": self._digest(row)}
+            birth_artifact_id = self._birth_ids[self._row_birth_ids[row]]
+            if birth_artifact_id:
+                json_entry["birthArtifactID"] = birth_artifact_id
+            ref = self._ref(row)
+            if ref:
+                json_entry["ref"] = ref
+            extra = self._extras.get(row)
+            if extra:
+                json_entry["extra"] = extra
+            size = self._sizes[row]
+            if size >= 0:
+                json_entry["size"] = size
+            yield self._path(row), json_entry
+
+    def sorted_digests(self) -> Iterator[tuple[str, str]]:
+        """Yield the path and digest of each entry, sorted by path."""
+        for row in self._sorted():
+            yield self._path(row), self._digest(row)
+
+    def in_directory(self, directory: str) -> list[ArtifactManifestEntry]:
+        """Return the entries under a directory, at any depth."""
+        prefix = directory + "/"
+        rows: list[int] = []
+        for dir_id, dir_name in enumerate(self._dirs):
+            if dir_name == directory or dir_name.startswith(prefix):
+                rows.extend(self._children[dir_id].values())
+        return [self._entry(row) for row in sorted(rows)]
+
+    # Internals.
+
+    def _find(self, path: str) -> int | None:
+        directory, _, name = path.rpartition("/")
+        dir_id = self._dir_ids.get(directory)
+        if dir_id is None:
+            return None
+        return self._children[dir_id].get(name)
+
+    def _path(self, row: int) -> str:
+        directory = self._dirs[self._row_dirs[row]]
+        name = self._row_names[row]
+        assert name is not None
+        return f"{directory}/{name}" if directory else name
+
+    def _store(
+        self,
+        path: str,
+        digest: str,
+        size: int | None,
+        birth_artifact_id: str | None,
+        ref: str | None,
+        extra: dict | None,
+        local_path: str | None,
+        skip_cache: bool | None,
+    ) -> None:
+        directory, _, name = path.rpartition("/")
+        with self._lock:
+            self.version += 1
+            dir_id = self._dir_ids.get(directory)
+            if dir_id is None:
+                dir_id = self._dir_ids[directory] = len(self._dirs)
+                self._dirs.append(directory)
+                self._children.append({})
+            children = self._children[dir_id]
+
+            row = children.get(name)
+            if row is not None:
+                self._set_field(row, "digest", digest)
+                self._set_field(row, "size", size)
+                self._set_field(row, "birth_artifact_id", birth_artifact_id)
+                self._set_field(row, "ref", ref)
+                self._set_field(row, "extra", extra)
+                self._set_field(row, "local_path", local_path)
+                self._set_field(row, "skip_cache", skip_cache)
+                return
+
+            # Appending is the common case when loading a manifest, so the
+            # columns are extended directly.
+            row = children[name] = len(self._row_names)
+            self._row_dirs.append(dir_id)
+            self._row_names.append(name)
+            packed = _pack_md5(digest)
+            if packed is None:
+                self._other_digests[row] = digest
+                packed = bytes(16)
+            self._digests += packed
+            self._sizes.append(-1 if size is None else size)
+            self._row_birth_ids.append(0)
+            self._row_ref_prefixes.append(-1)
+            if birth_artifact_id is not None:
+                self._set_field(row, "birth_artifact_id", birth_artifact_id)
+            if ref is not None:
+                self._set_field(row, "ref", ref)
+            if extra:
+                self._extras[row] = extra
+            if local_path:
+                self._local_paths[row] = str(local_path)
+            if skip_cache:
+                self._skip_cache.add(row)
+            self._len += 1
+            self._paths_version += 1
+
+    def _update(self, row: int, name: str, value: Any) -> None:
+        with self._lock:
+            if self._row_names[row] is None:
+                return
+            self._set_field(row, name, value)
+            self.version += 1
+
+    def _set_field(self, row: int, name: str, value: Any) -> None:
+        if name == "digest":
+            packed = _pack_md5(value)
+            if packed is None:
+                self._other_digests[row] = value
+            else:
+                self._other_digests.pop(row, None)
+                self._digests[16 * row : 16 * row + 16] = packed
+        elif name == "size":
+            self._sizes[row] = -1 if value is None else value
+        elif name == "birth_artifact_id":
+            index = self._birth_id_index.get(value)
+            if index is None:
+                index = self._birth_id_index[value] = len(self._birth_ids)
+                self._birth_ids.append(value)
+            self._row_birth_ids[row] = index
+        elif name == "ref":
+            if value is None:
+                self._row_ref_prefixes[row] = -1
+                self._ref_names.pop(row, None)
+                return
+            prefix, sep, ref_name = value.rpartition("/")
+            prefix += sep
+            index = self._ref_prefix_index.get(prefix)
+            if index is None:
+                index = self._ref_prefix_index[prefix] = len(self._ref_prefixes)
+                self._ref_prefixes.append(prefix)
+            self._row_ref_prefixes[row] = index
+            self._ref_names[row] = ref_name
+        elif name == "extra":
+            if value:
+                self._extras[row] = value
+            else:
+                self._extras.pop(row, None)
+        elif name == "local_path":
+            if value:
+                self._local_paths[row] = str(value)
+            else:
+                self._local_paths.pop(row, None)
+        elif name == "skip_cache":
+            if value:
+                self._skip_cache.add(row)
+            else:
+                self._skip_cache.discard(row)
+
+    def _digest(self, row: int) -> str:
+        other = self._other_digests.get(row)
+        if other is not None:
+            return other
+        return binascii.b2a_base64(
+            self._digests[16 * row : 16 * row + 16], newline=False
+        ).decode("ascii")
+
+    def _ref(self, row: int) -> str | None:
+        prefix = self._row_ref_prefixes[row]
+        if prefix < 0:
+            return None
+        return self._ref_prefixes[prefix] + self._ref_names[row]
+
+    def _entry(self, row: int) -> ArtifactManifestEntry:
+        entry = _CompactEntry.__new__(_CompactEntry)
+        size = self._sizes[row]
+        # Set directly, since setting attributes writes them back.
+        entry.__dict__.update(
+            _store=self,
+            _row=row,
+            path=LogicalPath(self._path(row)),
+            digest=self._digest(row),
+            ref=self._ref(row),
+            birth_artifact_id=self._birth_ids[self._row_birth_ids[row]],
+            size=None if size < 0 else size,
+            extra=self._extras.get(row) or {},
+            local_path=self._local_paths.get(row),
+            skip_cache=row in self._skip_cache,
+            _parent_artifact=self._parent_artifact,
+        )
+        return entry
+
+    def _sorted(self) -> list[int]:
+        """Return the rows of all entries, sorted by path.
+
+        A few entries added since the last sort are inserted into the sorted
+        rows, since sorting computes the path of every entry.
+        """
+        cached = self._sorted_rows
+        if cached is not None and cached[0] == self._paths_version:
+            return cached[1]
+        version = self._paths_version
+        num_rows = len(self._row_names)
+        names = self._row_names
+        if cached is None or num_rows - cached[2] > _MAX_INSERTED_ROWS:
+            rows = [row for row, name in enumerate(names) if name is not None]
+            rows.sort(key=self._path)
+        else:
+            rows = [row for row in cached[1] if names[row] is not None]
+            added = [
+                row for row in range(cached[2], num_rows) if names[row] is not None
+            ]
+            for row in sorted(added, key=self._path):
+                path = self._path(row)
+                lo, hi = 0, len(rows)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if self._path(rows[mid]) < path:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                rows.insert(lo, row)
+        self._sorted_rows = (version, rows, num_rows)
+        return rows
+
+
+class _Values(ValuesView):
+    _mapping: CompactManifestEntries
+
+    def __iter__(self) -> Iterator[ArtifactManifestEntry]:
+        mapping = self._mapping
+        for row, name in enumerate(mapping._row_names):
+            if name is not None:
+                yield mapping._entry(row)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+class _JSONReader:
+    """Reads JSON values one at a time from chunks of text."""
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._pos = 0
+
+    def _read_more(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer = self._buffer[self._pos :] + chunk
+                self._pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Return the next character that isn't whitespace."""
+        if self._pos < len(self._buffer):
+            char = self._buffer[self._pos]
+            if char not in " \t\n\r":
+                return char
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._read_more():
+                continue
+            self._pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Yield the keys of an object, leaving the reader at each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.expect("}")
+            return
+
+
+def parse_manifest_json(chunks: Iterable[str]) -> dict[str, Any]:
+    """Parse `wandb_manifest.json` from chunks of text.
+
+    The entries are added to a `CompactManifestEntries` as they are read,
+    without holding a dict for each of them at once.
+    """
+    reader = _JSONReader(chunks)
+    manifest: dict[str, Any] = {}
+    for key in reader.members():
+        if key == "contents":
+            entries = manifest[key] = CompactManifestEntries()
+            for path in reader.members():
+                entries.add_json(path, reader.value())
+        else:
+            manifest[key] = reader.value()
+    return manifest
@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import atexit
+import codecs
 import concurrent.futures
 import contextlib
+import itertools
 import json
 import logging
 import multiprocessing.dummy
 import os
 import re
-import shutil
-import stat
 import sys
 import tempfile
 import time
@@ -55,9 +55,12 @@ from wandb.sdk.artifacts.artifact_manifests.artifact_manifest_v1 import (
 from wandb.sdk.artifacts.artifact_state import ArtifactState
 from wandb.sdk.artifacts.artifact_ttl import ArtifactTTL
 from wandb.sdk.artifacts.exceptions import ArtifactNotLoggedError, WaitTimeoutError
-from wandb.sdk.artifacts.staging import get_staging_dir
+from wandb.sdk.artifacts.staging import get_staging_dir, get_staging_threads, stage_file
 from wandb.sdk.artifacts.storage_layout import StorageLayout
-from wandb.sdk.artifacts.storage_policies import WANDB_STORAGE_POLICY
+from wandb.sdk.artifacts.storage_policies import (
+    CHUNKED_STORAGE_POLICY,
+    WANDB_STORAGE_POLICY,
+)
 from wandb.sdk.artifacts.storage_policy import StoragePolicy
 from wandb.sdk.data_types._dtypes import Type as WBType
 from wandb.sdk.data_types._dtypes import TypeRegistry
@@ -107,6 +110,11 @@ class Artifact:
             description as markdown in the W&B App.
         metadata: Additional information about an artifact. Specify metadata as a
             dictionary of key-value pairs. You can specify no more than 100 total keys.
+        chunk_store: The URL of a chunk store, such as `file:///mnt/shared/chunks`.
+            If set, the artifact's files are also split into content-defined chunks
+            that are kept in the chunk store. New versions of a file then only add
+            the chunks that changed, and downloads reassemble files from the chunk
+            store when it has all of their chunks.
 
     Returns:
         An `Artifact` object.
@@ -123,6 +131,7 @@ class Artifact:
         metadata: dict[str, Any] | None = None,
         incremental: bool = False,
         use_as: str | None = None,
+        chunk_store: str | None = None,
     ) -> None:
         if not re.match(r"^[a-zA-Z0-9_\-.]+$", name):
             raise ValueError(
@@ -143,6 +152,9 @@ class Artifact:
         storage_policy_cls = StoragePolicy.lookup_by_name(WANDB_STORAGE_POLICY)
         layout = StorageLayout.V1 if env.get_use_v1_artifacts() else StorageLayout.V2
         policy_config = {"storageLayout": layout}
+        if chunk_store is not None:
+            storage_policy_cls = StoragePolicy.lookup_by_name(CHUNKED_STORAGE_POLICY)
+            policy_config["chunkStore"] = chunk_store
         self._storage_policy = storage_policy_cls.from_config(config=policy_config)
 
         self._tmp_dir: tempfile.TemporaryDirectory | None = None
@@ -1231,7 +1243,7 @@ class Artifact:
             raise ValueError("Path is not a file: {}".format(local_path))
 
         name = LogicalPath(name or os.path.basename(local_path))
-        digest = md5_file_b64(local_path)
+        upload_path, digest = self._stage_local_file(local_path, policy=policy)
 
         if is_tmp:
             file_path, file_name = os.path.split(name)
@@ -1240,7 +1252,12 @@ class Artifact:
             name = os.path.join(file_path, ".".join(file_name_parts))
 
         return self._add_local_file(
-            name, local_path, digest=digest, skip_cache=skip_cache, policy=policy
+            name,
+            local_path,
+            digest=digest,
+            skip_cache=skip_cache,
+            policy=policy,
+            upload_path=upload_path,
         )
 
     @ensure_not_finalized
@@ -1297,7 +1314,10 @@ class Artifact:
                 policy=policy,
             )
 
-        num_threads = 8
+        if policy == "immutable":
+            num_threads = get_staging_threads(local_path)
+        else:
+            num_threads = get_staging_threads(local_path, get_staging_dir())
         pool = multiprocessing.dummy.Pool(num_threads)
         pool.map(add_manifest_file, paths)
         pool.close()
@@ -1351,8 +1371,10 @@ class Artifact:
                 a new version will only be created if the reference URI changes.
             max_objects: The maximum number of objects to consider when adding a
                 reference that points to directory or bucket store prefix. By default,
-                the maximum number of objects allowed for Amazon S3,
-                GCS, Azure, and local files is 10,000,000. Other URI schemas do not have a maximum.
+                the maximum number of objects allowed for Amazon S3, GCS, Azure, and
+                local files is 10,000,000. For Amazon S3 and GCS, only the first
+                objects by key are added; Azure and local files raise an error when
+                there are more. Other URI schemas do not have a maximum.
 
         Returns:
             The added manifest entries.
@@ -1494,24 +1516,16 @@ class Artifact:
         digest: B64MD5 | None = None,
         skip_cache: bool | None = False,
         policy: Literal["mutable", "immutable"] | None = "mutable",
+        upload_path: StrPath | None = None,
     ) -> ArtifactManifestEntry:
-        policy = policy or "mutable"
-        if policy not in ["mutable", "immutable"]:
-            raise ValueError(
-                f"Invalid policy `{policy}`. Policy may only be `mutable` or `immutable`."
-            )
-        upload_path = path
-        if policy == "mutable":
-            with tempfile.NamedTemporaryFile(dir=get_staging_dir(), delete=False) as f:
-                staging_path = f.name
-                shutil.copyfile(path, staging_path)
-                # Set as read-only to prevent changes to the file during upload process
-                os.chmod(staging_path, stat.S_IRUSR)
-                upload_path = staging_path
+        if upload_path is None:
+            upload_path, digest = self._stage_local_file(path, digest, policy)
+        elif digest is None:
+            digest = md5_file_b64(upload_path)
 
         entry = ArtifactManifestEntry(
             path=name,
-            digest=digest or md5_file_b64(upload_path),
+            digest=digest,
             size=os.path.getsize(upload_path),
             local_path=upload_path,
             skip_cache=skip_cache,
@@ -1520,6 +1534,23 @@ class Artifact:
         self._added_local_paths[os.fspath(path)] = entry
         return entry
 
+    def _stage_local_file(
+        self,
+        path: StrPath,
+        digest: B64MD5 | None = None,
+        policy: Literal["mutable", "immutable"] | None = "mutable",
+    ) -> tuple[StrPath, B64MD5]:
+        """Return the path to upload a local file from, and its digest."""
+        policy = policy or "mutable"
+        if policy not in ["mutable", "immutable"]:
+            raise ValueError(
+                f"Invalid policy `{policy}`. Policy may only be `mutable` or `immutable`."
+            )
+        if policy == "mutable":
+            # The staged copy is what gets uploaded, so its digest is the one used.
+            return stage_file(path)
+        return path, digest or md5_file_b64(path)
+
     @ensure_not_finalized
     def remove(self, item: StrPath | ArtifactManifestEntry) -> None:
         """Remove an item from the artifact.
@@ -1840,6 +1871,18 @@ class Artifact:
             headers=_thread_local_api_settings.headers,
         )
 
+        def in_prefix(entry: ArtifactManifestEntry) -> bool:
+            return not path_prefix or entry.path.startswith(str(path_prefix))
+
+        # Files that were only stored in a chunk store aren't listed by the server.
+        unlisted: set[str] = set()
+        if self.manifest.storage_policy.name() == CHUNKED_STORAGE_POLICY:
+            unlisted = {
+                path
+                for path, entry in self.manifest.entries.items()
+                if "chunks" in entry.extra and in_prefix(entry)
+            }
+
         with concurrent.futures.ThreadPoolExecutor(64) as executor:
             active_futures = set()
             has_next_page = True
@@ -1855,8 +1898,9 @@ class Artifact:
                     # if require_core and entry.ref is None:
                     #     # Handled by core
                     #     continue
+                    unlisted.discard(entry.path)
                     entry._download_url = edge["node"]["directUrl"]
-                    if (not path_prefix) or entry.path.startswith(str(path_prefix)):
+                    if in_prefix(entry):
                         active_futures.add(executor.submit(download_entry, entry))
                 # Wait for download threads to catch up.
                 max_backlog = fetch_url_batch_size
@@ -1866,6 +1910,10 @@ class Artifact:
                         active_futures.remove(future)
                         if len(active_futures) <= max_backlog:
                             break
+            for path in unlisted:
+                active_futures.add(
+                    executor.submit(download_entry, self.get_entry(path))
+                )
             # Check for errors.
             for future in concurrent.futures.as_completed(active_futures):
                 future.result()
@@ -2317,10 +2365,15 @@ class Artifact:
         )
 
     def _load_manifest(self, url: str) -> None:
-        with requests.get(url) as request:
+        with requests.get(url, stream=True) as request:
             request.raise_for_status()
-            self._manifest = ArtifactManifest.from_manifest_json(
-                json.loads(util.ensure_text(request.content))
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            chunks = (
+                decoder.decode(chunk)
+                for chunk in request.iter_content(chunk_size=1024 * 1024)
+            )
+            self._manifest = ArtifactManifest.from_manifest_chunks(
+                itertools.chain(chunks, [decoder.decode(b"", final=True)])
             )
 
     @staticmethod
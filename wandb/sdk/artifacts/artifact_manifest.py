@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Mapping
+import json
+from typing import IO, TYPE_CHECKING, Iterable, Mapping, MutableMapping
 
+from wandb.sdk.artifacts._compact_entries import (
+    CompactManifestEntries,
+    parse_manifest_json,
+)
 from wandb.sdk.internal.internal_api import Api as InternalApi
-from wandb.sdk.lib.hashutil import HexMD5
+from wandb.sdk.lib.hashutil import B64MD5, HexMD5, _b64_from_hasher, _md5
 
 if TYPE_CHECKING:
     from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
@@ -13,7 +18,17 @@ if TYPE_CHECKING:
 
 
 class ArtifactManifest:
-    entries: dict[str, ArtifactManifestEntry]
+    entries: MutableMapping[str, ArtifactManifestEntry]
+
+    @classmethod
+    def from_manifest_chunks(
+        cls, chunks: Iterable[str], api: InternalApi | None = None
+    ) -> ArtifactManifest:
+        """Load a manifest from chunks of the text of `wandb_manifest.json`.
+
+        Unlike parsing the JSON first, this doesn't build a dict per entry.
+        """
+        return cls.from_manifest_json(parse_manifest_json(chunks), api=api)
 
     @classmethod
     def from_manifest_json(
@@ -37,7 +52,10 @@ class ArtifactManifest:
         entries: Mapping[str, ArtifactManifestEntry] | None = None,
     ) -> None:
         self.storage_policy = storage_policy
-        self.entries = dict(entries) if entries else {}
+        if isinstance(entries, CompactManifestEntries):
+            self.entries = entries
+        else:
+            self.entries = dict(entries) if entries else {}
 
     def __len__(self) -> int:
         return len(self.entries)
@@ -45,6 +63,12 @@ class ArtifactManifest:
     def to_manifest_json(self) -> dict:
         raise NotImplementedError
 
+    def write_manifest_json(self, fp: IO[bytes]) -> B64MD5:
+        """Write `wandb_manifest.json` to a file, returning the MD5 of its contents."""
+        data = json.dumps(self.to_manifest_json(), indent=4).encode()
+        fp.write(data)
+        return _b64_from_hasher(_md5(data))
+
     def digest(self) -> HexMD5:
         raise NotImplementedError
 
@@ -65,6 +89,8 @@ class ArtifactManifest:
         return self.entries.get(path)
 
     def get_entries_in_directory(self, directory: str) -> list[ArtifactManifestEntry]:
+        if isinstance(self.entries, CompactManifestEntries):
+            return self.entries.in_directory(directory)
         return [
             self.entries[entry_key]
             for entry_key in self.entries
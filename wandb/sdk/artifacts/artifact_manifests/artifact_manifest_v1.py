@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+import itertools
+import json
+from typing import IO, Any, Iterator, Mapping
 
+from wandb.sdk.artifacts._compact_entries import CompactManifestEntries
 from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
 from wandb.sdk.artifacts.storage_policy import StoragePolicy
 from wandb.sdk.internal.internal_api import Api as InternalApi
-from wandb.sdk.lib.hashutil import HexMD5, _md5
+from wandb.sdk.lib.hashutil import B64MD5, HexMD5, _b64_from_hasher, _md5
+
+# How many entries to serialize at a time when writing the manifest.
+_WRITE_CHUNK_ENTRIES = 10000
 
 
 class ArtifactManifestV1(ArtifactManifest):
@@ -29,20 +35,13 @@ class ArtifactManifestV1(ArtifactManifest):
         storage_policy_config = manifest_json.get("storagePolicyConfig", {})
         storage_policy_cls = StoragePolicy.lookup_by_name(storage_policy_name)
 
-        entries: Mapping[str, ArtifactManifestEntry]
-        entries = {
-            name: ArtifactManifestEntry(
-                path=name,
-                digest=val["digest"],
-                birth_artifact_id=val.get("birthArtifactID"),
-                ref=val.get("ref"),
-                size=val.get("size"),
-                extra=val.get("extra"),
-                local_path=val.get("local_path"),
-                skip_cache=val.get("skip_cache"),
-            )
-            for name, val in manifest_json["contents"].items()
-        }
+        contents = manifest_json["contents"]
+        if isinstance(contents, CompactManifestEntries):
+            entries = contents
+        else:
+            entries = CompactManifestEntries()
+            for name, val in contents.items():
+                entries.add_json(name, val)
 
         return cls(
             storage_policy_cls.from_config(storage_policy_config, api=api), entries
@@ -54,6 +53,7 @@ class ArtifactManifestV1(ArtifactManifest):
         entries: Mapping[str, ArtifactManifestEntry] | None = None,
     ) -> None:
         super().__init__(storage_policy, entries=entries)
+        self._digest_cache: tuple[CompactManifestEntries, int, HexMD5] | None = None
 
     def to_manifest_json(self) -> dict:
         """This is the JSON that's stored in wandb_manifest.json.
@@ -63,7 +63,74 @@ class ArtifactManifestV1(ArtifactManifest):
         system. We don't need to include the local paths in the artifact manifest
         contents.
         """
-        contents = {}
+        if isinstance(self.entries, CompactManifestEntries):
+            contents = dict(self.entries.sorted_json())
+        else:
+            contents = self._contents_json()
+        return {
+            "version": self.__class__.version(),
+            "storagePolicy": self.storage_policy.name(),
+            "storagePolicyConfig": self.storage_policy.config() or {},
+            "contents": contents,
+        }
+
+    def write_manifest_json(self, fp: IO[bytes]) -> B64MD5:
+        """Write `wandb_manifest.json` to a file, returning the MD5 of its contents.
+
+        Entries are serialized and written a chunk at a time, without
+        indentation, instead of building the whole manifest JSON first. For
+        compact entries the digest is computed in the same pass, so `digest()`
+        doesn't sort the entries again.
+        """
+        file_hasher = _md5()
+
+        def write(text: str) -> None:
+            data = text.encode()
+            fp.write(data)
+            file_hasher.update(data)
+
+        entries = self.entries
+        digest_hasher = None
+        if isinstance(entries, CompactManifestEntries):
+            version = entries.version
+            digest_hasher = _md5()
+            digest_hasher.update(b"wandb-artifact-manifest-v1\n")
+            contents = entries.sorted_json()
+        else:
+            contents = self._sorted_contents_json()
+
+        header = json.dumps(
+            {
+                "version": self.__class__.version(),
+                "storagePolicy": self.storage_policy.name(),
+                "storagePolicyConfig": self.storage_policy.config() or {},
+            }
+        )
+        write(header[:-1] + ', "contents": {')
+        separator = ""
+        while True:
+            chunk = dict(itertools.islice(contents, _WRITE_CHUNK_ENTRIES))
+            if not chunk:
+                break
+            write(separator + json.dumps(chunk)[1:-1])
+            separator = ", "
+            if digest_hasher is not None:
+                digest_hasher.update(
+                    "".join(
+                        f"{path}:{json_entry['digest']}\n"
+                        for path, json_entry in chunk.items()
+                    ).encode()
+                )
+        write("}}\n")
+
+        if isinstance(entries, CompactManifestEntries) and digest_hasher is not None:
+            self._digest_cache = (entries, version, HexMD5(digest_hasher.hexdigest()))
+        return _b64_from_hasher(file_hasher)
+
+    def _contents_json(self) -> dict[str, Any]:
+        return dict(self._sorted_contents_json())
+
+    def _sorted_contents_json(self) -> Iterator[tuple[str, dict[str, Any]]]:
         for entry in sorted(self.entries.values(), key=lambda k: k.path):
             json_entry: dict[str, Any] = {
                 "digest": entry.digest,
@@ -76,17 +143,27 @@ class ArtifactManifestV1(ArtifactManifest):
                 json_entry["extra"] = entry.extra
             if entry.size is not None:
                 json_entry["size"] = entry.size
-            contents[entry.path] = json_entry
-        return {
-            "version": self.__class__.version(),
-            "storagePolicy": self.storage_policy.name(),
-            "storagePolicyConfig": self.storage_policy.config() or {},
-            "contents": contents,
-        }
+            yield entry.path, json_entry
 
     def digest(self) -> HexMD5:
+        entries = self.entries
+        if isinstance(entries, CompactManifestEntries):
+            # Compact entries keep track of changes, so the digest can be reused.
+            cached = self._digest_cache
+            if cached and cached[0] is entries and cached[1] == entries.version:
+                return cached[2]
+            version = entries.version
+            digests = entries.sorted_digests()
+        else:
+            digests = (
+                (name, entry.digest)
+                for name, entry in sorted(entries.items(), key=lambda kv: kv[0])
+            )
         hasher = _md5()
         hasher.update(b"wandb-artifact-manifest-v1\n")
-        for name, entry in sorted(self.entries.items(), key=lambda kv: kv[0]):
-            hasher.update(f"{name}:{entry.digest}\n".encode())
-        return HexMD5(hasher.hexdigest())
+        for name, digest in digests:
+            hasher.update(f"{name}:{digest}\n".encode())
+        result = HexMD5(hasher.hexdigest())
+        if isinstance(entries, CompactManifestEntries):
+            self._digest_cache = (entries, version, result)
+        return result
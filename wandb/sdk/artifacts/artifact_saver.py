@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import concurrent.futures
-import json
+import logging
 import os
 import sys
 import tempfile
@@ -13,7 +13,7 @@ import wandb
 import wandb.filesync.step_prepare
 from wandb import util
 from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
-from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id, md5_file_b64
+from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id
 from wandb.sdk.lib.paths import URIStr
 
 if TYPE_CHECKING:
@@ -40,6 +40,9 @@ if TYPE_CHECKING:
             pass
 
 
+logger = logging.getLogger(__name__)
+
+
 class ArtifactSaver:
     _server_artifact: dict | None  # TODO better define this dict
 
@@ -173,9 +176,15 @@ class ArtifactSaver:
         )
 
         step_prepare = wandb.filesync.step_prepare.StepPrepare(
-            self._api, 0.1, 0.01, 1000
-        )  # TODO: params
+            self._api, batch_time=0.1, inter_event_time=0.01, max_batch_size=1000
+        )
         step_prepare.start()
+        self._manifest.storage_policy.prefetch_files(
+            artifact_id,
+            artifact_manifest_id,
+            list(self._manifest.entries.values()),
+            step_prepare,
+        )
 
         # Upload Artifact "L1" files, the actual artifact contents
         self._file_pusher.store_manifest_files(
@@ -192,10 +201,9 @@ class ArtifactSaver:
 
         def before_commit() -> None:
             self._resolve_client_id_manifest_references()
-            with tempfile.NamedTemporaryFile("w+", suffix=".json", delete=False) as fp:
+            with tempfile.NamedTemporaryFile("wb", suffix=".json", delete=False) as fp:
                 path = os.path.abspath(fp.name)
-                json.dump(self._manifest.to_manifest_json(), fp, indent=4)
-            digest = md5_file_b64(path)
+                digest = self._manifest.write_manifest_json(fp)
             if distributed_id or incremental:
                 # If we're in the distributed flow, we want to update the
                 # patch manifest we created with our finalized digest.
@@ -246,6 +254,7 @@ class ArtifactSaver:
             commit_result.result()
         finally:
             step_prepare.shutdown()
+            logger.info("artifact file upload stats: %s", step_prepare.stats())
 
         if finalize and use_after_commit:
             self._api.use_artifact(artifact_id)
@@ -5,11 +5,41 @@ in order to avoid file changes corrupting the artifact. Once the upload is compl
 file should be moved to the artifact cache.
 """
 
+import contextlib
+import errno
 import os
+import platform
+import stat
+import tempfile
+from typing import Optional, Set, Tuple
 
 from wandb import env
+from wandb.sdk.lib import filesystem
 from wandb.sdk.lib.filesystem import mkdir_exists_ok
-from wandb.sdk.lib.paths import FilePathStr
+from wandb.sdk.lib.hashutil import B64MD5, copy_md5_file, md5_file_b64, remember_md5
+from wandb.sdk.lib.paths import FilePathStr, StrPath
+
+# Filesystems where reading a file is bound by latency rather than bandwidth.
+_NETWORK_FILESYSTEMS = frozenset(
+    {
+        "9p",
+        "afs",
+        "beegfs",
+        "ceph",
+        "cifs",
+        "glusterfs",
+        "gpfs",
+        "lustre",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+        "wekafs",
+    }
+)
+
+# Pairs of source and staging devices that reflinks failed between.
+_no_reflink_devices: Set[Tuple[int, int]] = set()
 
 
 def get_staging_dir() -> FilePathStr:
@@ -23,3 +53,121 @@ def get_staging_dir() -> FilePathStr:
         ) from e
 
     return FilePathStr(os.path.abspath(os.path.expanduser(path)))
+
+
+def stage_file(path: StrPath) -> Tuple[FilePathStr, B64MD5]:
+    """Make a read-only copy of a file in the staging area.
+
+    The copy is a reflink where the filesystem supports them, so no data is copied.
+    Otherwise the file is hashed as it is copied, so its data is only read once.
+
+    Returns:
+        The path to the copy, and its MD5.
+    """
+    fd, staging_path = tempfile.mkstemp(dir=get_staging_dir())
+    os.close(fd)
+    try:
+        if _reflink(path, staging_path):
+            digest = md5_file_b64(staging_path)
+            remember_md5(staging_path, digest, written=True)
+        else:
+            digest = copy_md5_file(path, staging_path)
+        # Set as read-only to prevent changes to the file during upload process
+        os.chmod(staging_path, stat.S_IRUSR)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(staging_path)
+        raise
+    return FilePathStr(staging_path), digest
+
+
+def _reflink(source_path: StrPath, staging_path: str) -> bool:
+    """Replace `staging_path` with a reflink to `source_path`, if possible."""
+    try:
+        devices = (os.stat(source_path).st_dev, os.stat(staging_path).st_dev)
+    except OSError:
+        return False
+    if devices in _no_reflink_devices:
+        return False
+
+    # Reflinks can't overwrite files on every platform.
+    os.remove(staging_path)
+    try:
+        filesystem.reflink(source_path, staging_path)
+    except ValueError:
+        # Raised when the files are on different filesystems.
+        _no_reflink_devices.add(devices)
+        return False
+    except OSError as e:
+        if e.errno in (errno.ENOTSUP, errno.EOPNOTSUPP):
+            _no_reflink_devices.add(devices)
+        return False
+    return True
+
+
+def get_staging_threads(*paths: StrPath) -> int:
+    """Return how many files to stage at once, given the paths read and written.
+
+    Network filesystems are slow to respond but can serve many requests at once,
+    and staging on SSDs is bound by hashing, so it scales with the CPUs. Virtual
+    disks often claim to be spinning disks, so those get the default.
+    """
+    kinds = {_storage_kind(path) for path in paths}
+    if "network" in kinds:
+        return 32
+    if kinds == {"solid_state"}:
+        return min(32, max(8, os.cpu_count() or 1))
+    return 8
+
+
+def _storage_kind(path: StrPath) -> Optional[str]:
+    if platform.system() != "Linux":
+        return None
+    fstype = _mount_fstype(path)
+    if fstype is not None and (
+        fstype in _NETWORK_FILESYSTEMS or fstype.startswith("fuse.")
+    ):
+        return "network"
+    rotational = _is_rotational(path)
+    if rotational is None:
+        return None
+    return "rotational" if rotational else "solid_state"
+
+
+def _mount_fstype(path: StrPath) -> Optional[str]:
+    """Return the type of the filesystem `path` is on."""
+    try:
+        with open("/proc/self/mounts") as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return None
+
+    path = os.path.realpath(path)
+    mount_point, fstype = "", None
+    for fields in mounts:
+        if len(fields) < 3:
+            continue
+        point = fields[1].replace("\\040", " ")
+        if path != point and not path.startswith(point.rstrip("/") + "/"):
+            continue
+        # Later mounts hide earlier ones on the same mount point.
+        if len(point) >= len(mount_point):
+            mount_point, fstype = point, fields[2]
+    return fstype
+
+
+def _is_rotational(path: StrPath) -> Optional[bool]:
+    """Return whether `path` is on a spinning disk."""
+    try:
+        device = os.stat(path).st_dev
+    except OSError:
+        return None
+    block = f"/sys/dev/block/{os.major(device)}:{os.minor(device)}"
+    # Partitions don't have a queue of their own; their disk does.
+    for queue in (os.path.join(block, "queue"), os.path.join(block, "..", "queue")):
+        try:
+            with open(os.path.join(queue, "rotational")) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return None
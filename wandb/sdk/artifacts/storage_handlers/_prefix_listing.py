@@ -0,0 +1,160 @@
+"""List the objects under a bucket prefix concurrently.
+
+Object stores list keys a page of about a thousand at a time, and each page
+can only be requested once the previous one has arrived, so listing a prefix
+with millions of objects in one go takes a long time. Listing with a "/"
+delimiter instead returns the objects directly under a prefix and the common
+prefixes of the others, and everything under each of those common prefixes
+can then be listed independently of the rest.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Yields pages of the objects directly under a prefix, with the common
+# prefixes of the objects further down.
+ListLevelFn = Callable[[str], Iterable[Tuple[List[T], List[str]]]]
+
+# Yields pages of all the objects under a prefix.
+ListTreeFn = Callable[[str], Iterable[List[T]]]
+
+DEFAULT_THREADS = 16
+
+# How many levels to list with a delimiter, looking for enough prefixes to
+# split the listing between threads.
+_MAX_DEPTH = 3
+
+
+class _Counter:
+    """Counts listed objects across threads, and stops them at a limit."""
+
+    def __init__(self, limit: int | None) -> None:
+        self._limit = limit
+        self._count = 0
+        self._lock = threading.Lock()
+        self.stopped = False
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self._count += count
+            if self._limit is not None and self._count > self._limit:
+                self.stopped = True
+                raise ValueError(
+                    f"Exceeded {self._limit} objects tracked, pass max_objects to "
+                    f"add_reference"
+                )
+
+
+def list_prefix(
+    prefix: str,
+    list_level: ListLevelFn[T],
+    list_tree: ListTreeFn[T],
+    max_objects: int | None = None,
+    key: Callable[[T], str] | None = None,
+    threads: int = DEFAULT_THREADS,
+) -> list[T]:
+    """Return the objects under `prefix`, listing parts of it concurrently.
+
+    Levels under the prefix are listed with a delimiter until there are enough
+    common prefixes to keep `threads` busy, and then everything under each of
+    them is listed. The order of the objects doesn't depend on timing.
+
+    If `key` gives the key of each object in the bucket, the listing is
+    truncated to the first `max_objects` objects in key order, as a listing
+    limited to that many objects would be. Otherwise listing more than
+    `max_objects` objects is an error.
+
+    Raises:
+        ValueError: More than `max_objects` objects were listed, and `key` wasn't
+            given.
+    """
+    truncate = key is not None and max_objects is not None
+    counter = _Counter(None if truncate else max_objects)
+    # Whatever a listing returns after its first `max_objects` objects can't be
+    # among the first `max_objects` overall.
+    per_listing = max_objects if truncate else None
+
+    def full(objects: list[T]) -> bool:
+        return per_listing is not None and len(objects) >= per_listing
+
+    def level(level_prefix: str) -> tuple[list[T], list[str]]:
+        objects: list[T] = []
+        prefixes: list[str] = []
+        for page_objects, page_prefixes in list_level(level_prefix):
+            if counter.stopped:
+                break
+            counter.add(len(page_objects))
+            objects.extend(page_objects)
+            prefixes.extend(page_prefixes)
+            if full(objects):
+                break
+        return objects, prefixes
+
+    def tree(tree_prefix: str) -> list[T]:
+        objects: list[T] = []
+        for page_objects in list_tree(tree_prefix):
+            if counter.stopped:
+                break
+            counter.add(len(page_objects))
+            objects.extend(page_objects)
+            if full(objects):
+                break
+        return objects
+
+    results: list[list[T]] = []
+    with ThreadPoolExecutor(threads) as executor:
+        try:
+            frontier = [prefix]
+            for _ in range(_MAX_DEPTH):
+                next_frontier: list[str] = []
+                for objects, prefixes in executor.map(level, frontier):
+                    results.append(objects)
+                    next_frontier.extend(prefixes)
+                frontier = next_frontier
+                if len(frontier) >= threads:
+                    break
+            if key is None or max_objects is None:
+                results.extend(executor.map(tree, frontier))
+            else:
+                _list_trees_in_order(
+                    executor, tree, sorted(frontier), results, max_objects, key, threads
+                )
+        except BaseException:
+            # Don't wait for the other listings to finish.
+            counter.stopped = True
+            raise
+    listed = [obj for objects in results for obj in objects]
+    if truncate:
+        listed.sort(key=key)
+        del listed[max_objects:]
+    return listed
+
+
+def _list_trees_in_order(
+    executor: ThreadPoolExecutor,
+    tree: Callable[[str], list[T]],
+    frontier: list[str],
+    results: list[list[T]],
+    max_objects: int,
+    key: Callable[[T], str],
+    batch_size: int,
+) -> None:
+    """List the prefixes in `frontier` until the first objects are all known.
+
+    The prefixes are listed a batch at a time, in order. Everything under the
+    prefixes that are left sorts after the next of them, so there is no need
+    to list them once enough of the objects so far sort before it.
+    """
+    for start in range(0, len(frontier), batch_size):
+        results.extend(executor.map(tree, frontier[start : start + batch_size]))
+        rest = frontier[start + batch_size :]
+        if not rest:
+            break
+        before = sum(1 for objects in results for obj in objects if key(obj) < rest[0])
+        if before >= max_objects:
+            break
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import PurePosixPath
 from types import ModuleType
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Iterator, Sequence
 from urllib.parse import ParseResult, parse_qsl, urlparse
 
 import wandb
@@ -12,6 +12,7 @@ from wandb import util
 from wandb.sdk.artifacts.artifact_file_cache import get_artifact_file_cache
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
 from wandb.sdk.artifacts.storage_handler import DEFAULT_MAX_OBJECTS, StorageHandler
+from wandb.sdk.artifacts.storage_handlers._prefix_listing import list_prefix
 from wandb.sdk.lib.hashutil import ETag
 from wandb.sdk.lib.paths import FilePathStr, LogicalPath, StrPath, URIStr
 
@@ -129,29 +130,41 @@ class AzureHandler(StorageHandler):
                     )
                 ]
 
-        entries: list[ArtifactManifestEntry] = []
         container_client = blob_service_client.get_container_client(container_name)
-        max_objects = max_objects or DEFAULT_MAX_OBJECTS
-        for blob_properties in container_client.list_blobs(
-            name_starts_with=f"{blob_name}/"
-        ):
-            if len(entries) >= max_objects:
-                raise ValueError(
-                    f"Exceeded {max_objects} objects tracked, pass max_objects to "
-                    f"add_reference"
-                )
-            if not self._is_directory_stub(blob_properties):
-                suffix = PurePosixPath(blob_properties.name).relative_to(blob_name)
-                entries.append(
-                    self._create_entry(
-                        blob_properties,
-                        path=LogicalPath(name) / suffix if name else suffix,
-                        ref=URIStr(
-                            f"{account_url}/{container_name}/{blob_properties.name}"
-                        ),
-                    )
+        blob_prefix_class = self._get_module("azure.storage.blob").BlobPrefix
+
+        def pages(prefix: str, delimiter: str | None = None) -> Iterator[tuple]:
+            if delimiter is None:
+                items = container_client.list_blobs(name_starts_with=prefix)
+            else:
+                items = container_client.walk_blobs(
+                    name_starts_with=prefix, delimiter=delimiter
                 )
-        return entries
+            for page in items.by_page():
+                entries: list[ArtifactManifestEntry] = []
+                prefixes: list[str] = []
+                for item in page:
+                    if isinstance(item, blob_prefix_class):
+                        prefixes.append(item.name)
+                    elif not self._is_directory_stub(item):
+                        suffix = PurePosixPath(item.name).relative_to(blob_name)
+                        entries.append(
+                            self._create_entry(
+                                item,
+                                path=LogicalPath(name) / suffix if name else suffix,
+                                ref=URIStr(
+                                    f"{account_url}/{container_name}/{item.name}"
+                                ),
+                            )
+                        )
+                yield entries, prefixes
+
+        return list_prefix(
+            f"{blob_name}/",
+            lambda prefix: pages(prefix, delimiter="/"),
+            lambda prefix: (entries for entries, _ in pages(prefix)),
+            max_objects=max_objects or DEFAULT_MAX_OBJECTS,
+        )
 
     def _get_module(self, name: str) -> ModuleType:
         module = util.get_module(
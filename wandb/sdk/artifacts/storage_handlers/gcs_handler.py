@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import time
+from operator import itemgetter
 from pathlib import PurePosixPath
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Iterator, Sequence
 from urllib.parse import ParseResult, urlparse
 
 from wandb import util
@@ -12,6 +13,7 @@ from wandb.errors.term import termlog
 from wandb.sdk.artifacts.artifact_file_cache import get_artifact_file_cache
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
 from wandb.sdk.artifacts.storage_handler import DEFAULT_MAX_OBJECTS, StorageHandler
+from wandb.sdk.artifacts.storage_handlers._prefix_listing import list_prefix
 from wandb.sdk.lib.hashutil import ETag
 from wandb.sdk.lib.paths import FilePathStr, StrPath, URIStr
 
@@ -127,37 +129,44 @@ class GCSHandler(StorageHandler):
         if not checksum:
             return [ArtifactManifestEntry(path=name or key, ref=path, digest=path)]
 
-        start_time = None
         obj = self._client.bucket(bucket).get_blob(key, generation=version)
         if obj is None and version is not None:
             raise ValueError(f"Object does not exist: {path}#{version}")
-        multi = obj is None
-        if multi:
-            start_time = time.time()
-            termlog(
-                'Generating checksum for up to %i objects with prefix "%s"... '
-                % (max_objects, key),
-                newline=False,
-            )
-            objects = self._client.bucket(bucket).list_blobs(
-                prefix=key, max_results=max_objects
-            )
-        else:
-            objects = [obj]
-
-        entries = [
-            self._entry_from_obj(obj, path, name, prefix=key, multi=multi)
-            for obj in objects
-            if not obj.name.endswith("/")
-        ]
-        if start_time is not None:
-            termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
-        if len(entries) > max_objects:
-            raise ValueError(
-                "Exceeded %i objects tracked, pass max_objects to add_reference"
-                % max_objects
-            )
-        return entries
+        if obj is not None:
+            if obj.name.endswith("/"):
+                return []
+            return [self._entry_from_obj(obj, path, name, prefix=key)]
+
+        start_time = time.time()
+        termlog(
+            'Generating checksum for up to %i objects with prefix "%s"... '
+            % (max_objects, key),
+            newline=False,
+        )
+        bucket_obj = self._client.bucket(bucket)
+
+        def pages(prefix: str, delimiter: str | None = None) -> Iterator[tuple]:
+            blobs = bucket_obj.list_blobs(prefix=prefix, delimiter=delimiter)
+            for page in blobs.pages:
+                entries = [
+                    (
+                        obj.name,
+                        self._entry_from_obj(obj, path, name, prefix=key, multi=True),
+                    )
+                    for obj in page
+                    if not obj.name.endswith("/")
+                ]
+                yield entries, sorted(page.prefixes)
+
+        listed = list_prefix(
+            key,
+            lambda prefix: pages(prefix, delimiter="/"),
+            lambda prefix: (entries for entries, _ in pages(prefix)),
+            max_objects=max_objects,
+            key=itemgetter(0),
+        )
+        termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
+        return [entry for _, entry in listed]
 
     def _entry_from_obj(
         self,
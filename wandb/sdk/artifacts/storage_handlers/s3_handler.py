@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import os
 import time
+from operator import itemgetter
 from pathlib import PurePosixPath
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Iterator, Sequence
 from urllib.parse import parse_qsl, urlparse
 
 from wandb import util
@@ -14,6 +15,7 @@ from wandb.errors.term import termlog
 from wandb.sdk.artifacts.artifact_file_cache import get_artifact_file_cache
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
 from wandb.sdk.artifacts.storage_handler import DEFAULT_MAX_OBJECTS, StorageHandler
+from wandb.sdk.artifacts.storage_handlers._prefix_listing import list_prefix
 from wandb.sdk.lib.hashutil import ETag
 from wandb.sdk.lib.paths import FilePathStr, StrPath, URIStr
 
@@ -32,6 +34,22 @@ if TYPE_CHECKING:
     from wandb.sdk.artifacts.artifact import Artifact
 
 
+class _ListedObject:
+    """An object from a bucket listing, with the attributes of an ObjectSummary.
+
+    If the bucket's versioning status is unknown, the object has no
+    `version_id`, and it is looked up when the object is added.
+    """
+
+    def __init__(self, bucket: str, obj: dict, versioned: bool | None) -> None:
+        self.bucket_name = bucket
+        self.key = obj["Key"]
+        self.e_tag = obj["ETag"]
+        self.size = obj["Size"]
+        if versioned is not None:
+            self.version_id = obj.get("VersionId")
+
+
 class S3Handler(StorageHandler):
     _s3: boto3.resources.base.ServiceResource | None
     _scheme: str
@@ -170,7 +188,6 @@ class S3Handler(StorageHandler):
             if version
             else [self._s3.Object(bucket, key)]
         )
-        start_time = None
         multi = False
         if key != "":
             try:
@@ -193,37 +210,83 @@ class S3Handler(StorageHandler):
         else:
             multi = True
 
-        if multi:
-            start_time = time.time()
-            termlog(
-                'Generating checksum for up to %i objects in "%s/%s"... '
-                % (max_objects, bucket, key),
-                newline=False,
-            )
-            if key != "":
-                objs = (
-                    self._s3.Bucket(bucket)
-                    .objects.filter(Prefix=key)
-                    .limit(max_objects)
-                )
-            else:
-                objs = self._s3.Bucket(bucket).objects.limit(max_objects)
-        # Weird iterator scoping makes us assign this to a local function
-        size = self._size_from_obj
-        entries = [
-            self._entry_from_obj(obj, path, name, prefix=key, multi=multi)
-            for obj in objs
-            if size(obj) > 0
-        ]
-        if start_time is not None:
-            termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
-        if len(entries) > max_objects:
-            raise ValueError(
-                "Exceeded %i objects tracked, pass max_objects to add_reference"
-                % max_objects
-            )
+        if not multi:
+            obj = objs[0]
+            if self._size_from_obj(obj) == 0:
+                return []
+            return [self._entry_from_obj(obj, path, name, prefix=key, multi=multi)]
+
+        start_time = time.time()
+        termlog(
+            'Generating checksum for up to %i objects in "%s/%s"... '
+            % (max_objects, bucket, key),
+            newline=False,
+        )
+        entries = self._list_entries(bucket, key, path, name, max_objects)
+        termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
         return entries
 
+    def _list_entries(
+        self,
+        bucket: str,
+        key: str,
+        path: str,
+        name: StrPath | None,
+        max_objects: int,
+    ) -> list[ArtifactManifestEntry]:
+        """List the first `max_objects` objects under a prefix, with their versions.
+
+        Versioned buckets are listed with their object versions, so that the
+        version of each object doesn't have to be looked up separately.
+        """
+        assert self._s3 is not None  # mypy: unwraps optionality
+        client = self._s3.meta.client
+        versioned = self._is_versioned(bucket)
+        if versioned:
+            operation, contents = "list_object_versions", "Versions"
+        else:
+            operation, contents = "list_objects_v2", "Contents"
+
+        def pages(prefix: str, delimiter: str | None = None) -> Iterator[tuple]:
+            kwargs = {"Bucket": bucket, "Prefix": prefix}
+            if delimiter is not None:
+                kwargs["Delimiter"] = delimiter
+            for page in client.get_paginator(operation).paginate(**kwargs):
+                entries = [
+                    (
+                        obj["Key"],
+                        self._entry_from_obj(
+                            _ListedObject(bucket, obj, versioned),
+                            path,
+                            name,
+                            prefix=key,
+                            multi=True,
+                        ),
+                    )
+                    for obj in page.get(contents, [])
+                    if obj["Size"] > 0 and obj.get("IsLatest", True)
+                ]
+                prefixes = [p["Prefix"] for p in page.get("CommonPrefixes", [])]
+                yield entries, prefixes
+
+        listed = list_prefix(
+            key,
+            lambda prefix: pages(prefix, delimiter="/"),
+            lambda prefix: (entries for entries, _ in pages(prefix)),
+            max_objects=max_objects,
+            key=itemgetter(0),
+        )
+        return [entry for _, entry in listed]
+
+    def _is_versioned(self, bucket: str) -> bool | None:
+        """Return whether a bucket has ever had versioning, or None if we can't tell."""
+        assert self._s3 is not None  # mypy: unwraps optionality
+        try:
+            status = self._s3.BucketVersioning(bucket).status
+        except self._botocore.exceptions.ClientError:
+            return None
+        return status in ("Enabled", "Suspended")
+
     def _size_from_obj(self, obj: boto3.s3.Object | boto3.s3.ObjectSummary) -> int:
         # ObjectSummary has size, Object has content_length
         size: int
@@ -1,4 +1,15 @@
-from wandb.sdk.artifacts.storage_policies.register import WANDB_STORAGE_POLICY
+from wandb.sdk.artifacts.storage_policies.chunked_storage_policy import (
+    ChunkedStoragePolicy,
+)
+from wandb.sdk.artifacts.storage_policies.register import (
+    CHUNKED_STORAGE_POLICY,
+    WANDB_STORAGE_POLICY,
+)
 from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
 
-__all__ = ["WANDB_STORAGE_POLICY", "WandbStoragePolicy"]
+__all__ = [
+    "CHUNKED_STORAGE_POLICY",
+    "WANDB_STORAGE_POLICY",
+    "ChunkedStoragePolicy",
+    "WandbStoragePolicy",
+]
@@ -0,0 +1,203 @@
+"""Chunked storage policy."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from wandb.sdk.artifacts._chunking import (
+    AVG_CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    chunk_file,
+)
+from wandb.sdk.artifacts.storage_policies.register import CHUNKED_STORAGE_POLICY
+from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
+from wandb.sdk.lib.hashutil import B64MD5, HexMD5, _md5
+
+if TYPE_CHECKING:
+    from wandb.filesync.step_prepare import StepPrepare
+    from wandb.sdk.artifacts.artifact import Artifact
+    from wandb.sdk.artifacts.artifact_file_cache import ArtifactFileCache
+    from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+    from wandb.sdk.internal import progress
+    from wandb.sdk.internal.internal_api import Api as InternalApi
+    from wandb.sdk.lib.paths import FilePathStr, StrPath
+
+
+class ChunkStore:
+    """Stores the chunks of artifact files by their MD5."""
+
+    def url(self) -> str:
+        raise NotImplementedError
+
+    def has(self, digest: HexMD5) -> bool:
+        raise NotImplementedError
+
+    def missing(self, digests: Iterable[HexMD5]) -> set[HexMD5]:
+        """Return the digests of the chunks that aren't stored yet."""
+        return {digest for digest in digests if not self.has(digest)}
+
+    def put(self, digest: HexMD5, data: bytes) -> None:
+        raise NotImplementedError
+
+    def get(self, digest: HexMD5) -> bytes:
+        raise NotImplementedError
+
+
+class LocalChunkStore(ChunkStore):
+    """Stores chunks as files in a local directory."""
+
+    def __init__(self, root: StrPath) -> None:
+        self._root = Path(root)
+
+    def url(self) -> str:
+        return self._root.absolute().as_uri()
+
+    def _path(self, digest: HexMD5) -> Path:
+        return self._root / digest[:2] / digest[2:]
+
+    def has(self, digest: HexMD5) -> bool:
+        return self._path(digest).is_file()
+
+    def put(self, digest: HexMD5, data: bytes) -> None:
+        path = self._path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+
+    def get(self, digest: HexMD5) -> bytes:
+        return self._path(digest).read_bytes()
+
+
+def chunk_store_from_url(url: str) -> ChunkStore:
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        return LocalChunkStore(url2pathname(parsed.path))
+    raise ValueError(f"Unsupported chunk store: {url}")
+
+
+class ChunkedStoragePolicy(WandbStoragePolicy):
+    """Also stores artifact files as content-defined chunks in a chunk store.
+
+    Files are uploaded to W&B the same way as by `WandbStoragePolicy`, so the
+    artifact can be used wherever W&B can be reached. In addition, only the
+    chunks missing from the chunk store are written to it, so a new version
+    of a file that was appended to or edited in place only adds the chunks
+    around the changes. Each entry lists the digests and sizes of its chunks
+    in `extra["chunks"]`, and downloads reassemble the file from the chunk
+    store when it has all of them, or download it from W&B otherwise.
+    References are stored the same way as by `WandbStoragePolicy`.
+
+    The config must have a `chunkStore` URL, and can set `minChunkSize`,
+    `avgChunkSize` and `maxChunkSize`.
+    """
+
+    @classmethod
+    def name(cls) -> str:
+        return CHUNKED_STORAGE_POLICY
+
+    @classmethod
+    def from_config(
+        cls, config: dict, api: InternalApi | None = None
+    ) -> ChunkedStoragePolicy:
+        return cls(config=config, api=api)
+
+    def __init__(
+        self,
+        config: dict | None = None,
+        cache: ArtifactFileCache | None = None,
+        api: InternalApi | None = None,
+        chunk_store: ChunkStore | None = None,
+    ) -> None:
+        config = dict(config or {})
+        if chunk_store is not None:
+            config["chunkStore"] = chunk_store.url()
+        elif config.get("chunkStore"):
+            chunk_store = chunk_store_from_url(config["chunkStore"])
+        else:
+            raise ValueError("ChunkedStoragePolicy requires a chunkStore URL")
+        super().__init__(config=config, cache=cache, api=api)
+        self._chunk_store = chunk_store
+
+    def load_file(
+        self,
+        artifact: Artifact,
+        manifest_entry: ArtifactManifestEntry,
+        dest_path: str | None = None,
+    ) -> FilePathStr:
+        chunks = manifest_entry.extra.get("chunks")
+        if chunks is None or self._chunk_store.missing(digest for digest, _ in chunks):
+            return super().load_file(artifact, manifest_entry, dest_path=dest_path)
+
+        if dest_path is not None:
+            self._cache._override_cache_path = dest_path
+
+        path, hit, cache_open = self._cache.check_md5_obj_path(
+            B64MD5(manifest_entry.digest),
+            manifest_entry.size if manifest_entry.size is not None else 0,
+        )
+        if hit:
+            return path
+
+        with cache_open(mode="wb") as file:
+            for digest, size in chunks:
+                data = self._chunk_store.get(digest)
+                if len(data) != size or _md5(data).hexdigest() != digest:
+                    raise ValueError(
+                        f"Chunk {digest} of {manifest_entry.path} doesn't match "
+                        f"its digest"
+                    )
+                file.write(data)
+        return path
+
+    def store_file(
+        self,
+        artifact_id: str,
+        artifact_manifest_id: str,
+        entry: ArtifactManifestEntry,
+        preparer: StepPrepare,
+        progress_callback: progress.ProgressFn | None = None,
+    ) -> bool:
+        """Upload a file to W&B and its chunks that aren't in the chunk store yet.
+
+        Returns:
+            True if the file was a duplicate (did not need to be uploaded to
+            W&B), False otherwise.
+        """
+        if entry.local_path is None:
+            return super().store_file(
+                artifact_id, artifact_manifest_id, entry, preparer, progress_callback
+            )
+
+        chunks = chunk_file(
+            entry.local_path,
+            min_size=self._config.get("minChunkSize", MIN_CHUNK_SIZE),
+            avg_size=self._config.get("avgChunkSize", AVG_CHUNK_SIZE),
+            max_size=self._config.get("maxChunkSize", MAX_CHUNK_SIZE),
+        )
+        missing = self._chunk_store.missing(chunk.digest for chunk in chunks)
+        with open(entry.local_path, "rb") as f:
+            for chunk in chunks:
+                if chunk.digest in missing:
+                    f.seek(chunk.offset)
+                    self._chunk_store.put(chunk.digest, f.read(chunk.size))
+                    # The same chunk can appear more than once in a file.
+                    missing.discard(chunk.digest)
+
+        entry.extra = {
+            **entry.extra,
+            "chunks": [[chunk.digest, chunk.size] for chunk in chunks],
+        }
+        deduped = super().store_file(
+            artifact_id, artifact_manifest_id, entry, preparer, progress_callback
+        )
+        if deduped:
+            # Uploads write the file cache, but duplicates aren't uploaded.
+            self._write_cache(entry)
+        return deduped
@@ -1 +1,2 @@
 WANDB_STORAGE_POLICY = "wandb-storage-policy-v1"
+CHUNKED_STORAGE_POLICY = "wandb-chunked-storage-policy-v1"
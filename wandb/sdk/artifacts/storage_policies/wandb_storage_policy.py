@@ -6,10 +6,10 @@ import hashlib
 import math
 import os
 import shutil
-from typing import TYPE_CHECKING, Any, Sequence
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
 from urllib.parse import quote
 
-import requests
 import urllib3
 
 from wandb.errors.term import termwarn
@@ -34,6 +34,7 @@ from wandb.sdk.artifacts.storage_policies.register import WANDB_STORAGE_POLICY
 from wandb.sdk.artifacts.storage_policy import StoragePolicy
 from wandb.sdk.internal.internal_api import Api as InternalApi
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
+from wandb.sdk.lib import shared_transport
 from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id, hex_to_b64_id
 from wandb.sdk.lib.paths import FilePathStr, URIStr
 
@@ -42,6 +43,7 @@ if TYPE_CHECKING:
     from wandb.sdk.artifacts.artifact import Artifact
     from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
     from wandb.sdk.internal import progress
+    from wandb.sdk.internal.internal_api import CreateArtifactFileSpecInput
 
 # Sleep length: 0, 2, 4, 8, 16, 32, 64, 120, 120, 120, 120, 120, 120, 120, 120, 120
 # seconds, i.e. a total of 20min 6s.
@@ -50,8 +52,6 @@ _REQUEST_RETRY_STRATEGY = urllib3.util.retry.Retry(
     total=16,
     status_forcelist=(308, 408, 409, 429, 500, 502, 503, 504),
 )
-_REQUEST_POOL_CONNECTIONS = 64
-_REQUEST_POOL_MAXSIZE = 64
 
 # AWS S3 max upload parts without having to make additional requests for extra parts
 S3_MAX_PART_NUMBERS = 1000
@@ -78,14 +78,9 @@ class WandbStoragePolicy(StoragePolicy):
     ) -> None:
         self._cache = cache or get_artifact_file_cache()
         self._config = config or {}
-        self._session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(
-            max_retries=_REQUEST_RETRY_STRATEGY,
-            pool_connections=_REQUEST_POOL_CONNECTIONS,
-            pool_maxsize=_REQUEST_POOL_MAXSIZE,
+        self._session = shared_transport.new_session(
+            max_retries=_REQUEST_RETRY_STRATEGY
         )
-        self._session.mount("http://", adapter)
-        self._session.mount("https://", adapter)
 
         s3 = S3Handler()
         gcs = GCSHandler()
@@ -308,15 +303,12 @@ class WandbStoragePolicy(StoragePolicy):
                     hex_digests[part_number] = hex_digest
                     part_number += 1
 
+        wait_start = time.monotonic()
         resp = preparer.prepare(
-            {
-                "artifactID": artifact_id,
-                "artifactManifestID": artifact_manifest_id,
-                "name": entry.path,
-                "md5": entry.digest,
-                "uploadPartsInput": upload_parts,
-            }
+            self._file_spec(artifact_id, artifact_manifest_id, entry, upload_parts)
         ).get()
+        upload_start = time.monotonic()
+        preparer.record_url_wait(upload_start - wait_start)
 
         entry.birth_artifact_id = resp.birth_artifact_id
 
@@ -350,10 +342,47 @@ class WandbStoragePolicy(StoragePolicy):
             self._api.complete_multipart_upload_artifact(
                 artifact_id, resp.storage_path, etags, resp.upload_id
             )
+        preparer.record_upload(time.monotonic() - upload_start)
         self._write_cache(entry)
 
         return False
 
+    def prefetch_files(
+        self,
+        artifact_id: str,
+        artifact_manifest_id: str,
+        entries: Iterable[ArtifactManifestEntry],
+        preparer: StepPrepare,
+    ) -> None:
+        """Start preparing uploads of files before store_file is called for them.
+
+        Multipart uploads need the digests of their parts, so files big enough
+        for one are left for store_file to prepare.
+        """
+
+        def file_specs() -> Iterator[CreateArtifactFileSpecInput]:
+            for entry in entries:
+                size = entry.size if entry.size is not None else 0
+                if entry.local_path and size < S3_MIN_MULTI_UPLOAD_SIZE:
+                    yield self._file_spec(artifact_id, artifact_manifest_id, entry, [])
+
+        preparer.prefetch(file_specs())
+
+    @staticmethod
+    def _file_spec(
+        artifact_id: str,
+        artifact_manifest_id: str,
+        entry: ArtifactManifestEntry,
+        upload_parts: list[dict[str, Any]],
+    ) -> CreateArtifactFileSpecInput:
+        return {
+            "artifactID": artifact_id,
+            "artifactManifestID": artifact_manifest_id,
+            "name": entry.path,
+            "md5": entry.digest,
+            "uploadPartsInput": upload_parts,
+        }
+
     def _write_cache(self, entry: ArtifactManifestEntry) -> None:
         if entry.local_path is None:
             return
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 from wandb.sdk.internal.internal_api import Api as InternalApi
 from wandb.sdk.lib.paths import FilePathStr, URIStr
@@ -19,9 +19,12 @@ class StoragePolicy:
     def lookup_by_name(cls, name: str) -> type[StoragePolicy]:
         import wandb.sdk.artifacts.storage_policies  # noqa: F401
 
-        for sub in cls.__subclasses__():
+        subclasses = cls.__subclasses__()
+        while subclasses:
+            sub = subclasses.pop()
             if sub.name() == name:
                 return sub
+            subclasses.extend(sub.__subclasses__())
         raise NotImplementedError(f"Failed to find storage policy '{name}'")
 
     @classmethod
@@ -53,6 +56,16 @@ class StoragePolicy:
     ) -> bool:
         raise NotImplementedError
 
+    def prefetch_files(
+        self,
+        artifact_id: str,
+        artifact_manifest_id: str,
+        entries: Iterable[ArtifactManifestEntry],
+        preparer: StepPrepare,
+    ) -> None:
+        """Start preparing uploads of files before store_file is called for them."""
+        pass
+
     def store_reference(
         self,
         artifact: Artifact,
@@ -871,6 +871,129 @@ class TypedDictType(Type):
         return "{}".format(self.params["type_map"])
 
 
+# Types whose assignment results only depend on the class of the assigned value
+# (see _value_class). Subclasses may override assign, so classes are matched
+# exactly.
+_CLASS_ASSIGNABLE_TYPES = (
+    InvalidType,
+    AnyType,
+    UnknownType,
+    NoneType,
+    StringType,
+    NumberType,
+    TimestampType,
+    BooleanType,
+    PythonObjectType,
+)
+
+# Types that TypeRegistry.type_of gives for a value based on its class alone.
+_VALUE_CLASS_TYPES = (NoneType, StringType, NumberType, TimestampType, BooleanType)
+
+# Numpy dtype kinds whose values all map to one of _VALUE_CLASS_TYPES.
+_VALUE_CLASS_DTYPE_KINDS = "biufcM"
+
+
+def _value_class(py_obj: t.Optional[t.Any]) -> t.Optional[type]:
+    """Return a class shared by all values that type_of maps to the same type.
+
+    Returns None if the type of the value depends on more than its class.
+    """
+    cls = py_obj.__class__
+    if cls is float and math.isnan(py_obj):  # type: ignore
+        return None.__class__
+    if TypeRegistry.types_by_class().get(cls) not in _VALUE_CLASS_TYPES:
+        return None
+    if cls is str and _is_artifact_string(py_obj):
+        return None
+    return cls
+
+
+def _assigns_by_class(wb_type: Type) -> bool:
+    if wb_type.__class__ is UnionType:
+        return all(_assigns_by_class(st) for st in wb_type.params["allowed_types"])
+    return wb_type.__class__ in _CLASS_ASSIGNABLE_TYPES
+
+
+class _AssignmentCache:
+    """Results of assigning values to types, by type and by the value's class.
+
+    Types are looked up by id, and kept alive by the cache so that their ids
+    aren't reused. Assignments that return a type equal to the assignee return
+    the assignee itself, so that a column's type settles on one object whose
+    results are cached.
+    """
+
+    _MAX_TYPES = 4096
+
+    def __init__(self) -> None:
+        self._results: t.Dict[int, t.Tuple[Type, t.Optional[t.Dict[type, Type]]]] = {}
+
+    def assign(self, wb_type: Type, py_obj: t.Optional[t.Any]) -> Type:
+        value_class = _value_class(py_obj)
+        if value_class is None:
+            return wb_type.assign(py_obj)
+
+        entry = self._results.get(id(wb_type))
+        if entry is None:
+            if len(self._results) >= self._MAX_TYPES:
+                self._results.clear()
+            entry = (wb_type, {} if _assigns_by_class(wb_type) else None)
+            self._results[id(wb_type)] = entry
+        results = entry[1]
+        if results is None:
+            return wb_type.assign(py_obj)
+
+        result = results.get(value_class)
+        if result is None:
+            result = wb_type.assign(py_obj)
+            if result == wb_type:
+                result = wb_type
+            results[value_class] = result
+        return result
+
+
+_assignment_cache = _AssignmentCache()
+
+
+def assign_cached(wb_type: Type, py_obj: t.Optional[t.Any]) -> Type:
+    """Same as `wb_type.assign(py_obj)`, reusing earlier results where possible."""
+    return _assignment_cache.assign(wb_type, py_obj)
+
+
+def assign_column(
+    wb_type: Type, values: t.Sequence[t.Any]
+) -> t.Tuple[Type, t.Optional[int]]:
+    """Assign each value of a column to a type in turn.
+
+    Returns:
+        The resulting type, or an InvalidType and the index of the first value
+        that could not be assigned.
+    """
+    if (
+        is_numpy_array(values)
+        and values.dtype.kind in _VALUE_CLASS_DTYPE_KINDS  # type: ignore
+        and len(values) > 0
+        and _assigns_by_class(wb_type)
+    ):
+        # All the values are of the same numpy scalar class, so each is assigned
+        # alike and the type stops changing once assigning one leaves it as is.
+        sample = values[0]
+        for ndx in range(len(values)):
+            result = _assignment_cache.assign(wb_type, sample)
+            if isinstance(result, InvalidType):
+                return result, ndx
+            if result == wb_type:
+                break
+            wb_type = result
+        return wb_type, None
+
+    for ndx, value in enumerate(values):
+        wb_type = _assignment_cache.assign(wb_type, value)
+        if isinstance(wb_type, InvalidType):
+            return wb_type, ndx
+    return wb_type, None
+
+
 # Special Types
 TypeRegistry.add(InvalidType)
 TypeRegistry.add(AnyType)
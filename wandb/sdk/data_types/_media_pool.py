@@ -0,0 +1,164 @@
+"""Background encoding of media files.
+
+Turning logged data into a media file (for example compressing an image to
+PNG) and hashing that file is the slow part of creating a media object. When
+`WANDB_ASYNC_MEDIA` is set, media constructors keep a reference to their data
+and hand this work to a pool of worker threads instead, and history rows that
+contain such media are published once it is done.
+
+Data passed to a media constructor must not be modified in place afterwards,
+since it may not have been encoded yet. The rest of a history row is
+serialized or copied when it's logged.
+"""
+
+import copy
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from wandb import env
+from wandb.errors.term import termwarn
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class MediaEncodingPool:
+    """Runs encoding jobs on worker threads, bounded by memory.
+
+    Every job declares how many bytes of data it keeps alive until it
+    finishes. `submit` blocks while accepting another job would take the total
+    over `max_inflight_bytes`; a single job larger than the budget is accepted
+    once nothing else is in flight.
+    """
+
+    def __init__(self, max_workers: int, max_inflight_bytes: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="MediaEncode"
+        )
+        self._max_inflight_bytes = max_inflight_bytes
+        self._inflight_bytes = 0
+        self._cond = threading.Condition()
+
+    @property
+    def inflight_bytes(self) -> int:
+        return self._inflight_bytes
+
+    def submit(self, fn: Callable[[], _T], nbytes: int) -> "Future[_T]":
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._inflight_bytes == 0
+                or self._inflight_bytes + nbytes <= self._max_inflight_bytes
+            )
+            self._inflight_bytes += nbytes
+        try:
+            future = self._executor.submit(fn)
+        except BaseException:
+            self._release(nbytes)
+            raise
+        future.add_done_callback(lambda _: self._release(nbytes))
+        return future
+
+    def _release(self, nbytes: int) -> None:
+        with self._cond:
+            self._inflight_bytes -= nbytes
+            self._cond.notify_all()
+
+
+_pool: Optional[MediaEncodingPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> Optional[MediaEncodingPool]:
+    """Return the process's encoding pool, or None if media is encoded inline."""
+    global _pool, _pool_pid
+    if not env.async_media():
+        return None
+    with _pool_lock:
+        # Worker threads don't survive a fork, so a child needs its own pool.
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = MediaEncodingPool(
+                max_workers=min(8, os.cpu_count() or 1),
+                max_inflight_bytes=env.get_media_inflight_bytes(),
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def has_pending_media(value: Any) -> bool:
+    """Whether a logged value contains media that is still being encoded."""
+    from .base_types.media import Media
+
+    if isinstance(value, Media):
+        return value._pending is not None and not value._pending.done()
+    if isinstance(value, dict):
+        return any(has_pending_media(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(isinstance(v, Media) and has_pending_media(v) for v in value)
+    return False
+
+
+def snapshot(value: Any) -> Any:
+    """Copy a logged value so that changes to it aren't logged, except for media."""
+    from .base_types.media import Media
+
+    if isinstance(value, Media):
+        return value
+    if isinstance(value, dict):
+        return {k: snapshot(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [snapshot(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(snapshot(v) for v in value)
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return value
+
+
+class DeferredPublisher:
+    """Publishes records in order, off the caller's thread when asked to.
+
+    A deferred publish runs on a single background thread, where it may wait
+    for media to be encoded. While any deferred publish is outstanding, later
+    publishes are queued behind it too, so records keep the order in which
+    they were made.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queued = 0
+        self._lock = threading.Lock()
+
+    def publish(self, fn: Callable[[], None], defer: bool) -> None:
+        with self._lock:
+            if not defer and not self._queued:
+                fn()
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="DeferredPublisher"
+                )
+            self._queued += 1
+            self._executor.submit(self._run, fn)
+
+    def _run(self, fn: Callable[[], None]) -> None:
+        try:
+            fn()
+        except Exception as e:
+            logger.exception("Failed to publish deferred record")
+            termwarn(f"Failed to log a history row: {e}")
+        finally:
+            with self._lock:
+                self._queued -= 1
+
+    def flush(self) -> None:
+        """Wait until every deferred publish has run."""
+        with self._lock:
+            executor = self._executor
+        if executor is not None:
+            executor.submit(lambda: None).result()
@@ -49,10 +49,14 @@ class Audio(BatchableMedia):
             )
 
             tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + ".wav")
-            soundfile.write(tmp_path, data_or_path, sample_rate)
             self._duration = len(data_or_path) / float(sample_rate)
 
-            self._set_file(tmp_path, is_tmp=True)
+            self._set_file_async(
+                tmp_path,
+                lambda: soundfile.write(tmp_path, data_or_path, sample_rate),
+                getattr(data_or_path, "nbytes", 0),
+                is_tmp=True,
+            )
 
     @classmethod
     def get_media_subdir(cls):
@@ -1,19 +1,22 @@
-import hashlib
+import logging
 import os
 import platform
 import re
 import shutil
-from typing import TYPE_CHECKING, Optional, Sequence, Type, Union, cast
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Tuple, Type, Union, cast
 
 import wandb
 from wandb import util
 from wandb._globals import _datatypes_callback
-from wandb.sdk.lib import filesystem
+from wandb.sdk.lib import filesystem, hashutil
 from wandb.sdk.lib.paths import LogicalPath
 
+from .. import _media_pool
 from .wb_value import WBValue
 
 if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+
     import numpy as np
 
     from wandb.sdk.artifacts.artifact import Artifact
@@ -23,6 +26,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 SYS_PLATFORM = platform.system()
 
+logger = logging.getLogger(__name__)
+
 
 def _wb_filename(
     key: Union[str, int], step: Union[str, int], id: Union[str, int], extension: str
@@ -30,6 +35,11 @@ def _wb_filename(
     return f"{str(key)}_{str(step)}_{str(id)}{extension}"
 
 
+def _file_digest(path: str, is_tmp: bool) -> Tuple[str, int]:
+    sha256, _, size = hashutil.sha256_md5_file(path, written=is_tmp)
+    return sha256, size
+
+
 class Media(WBValue):
     """A WBValue stored as a file outside JSON that can be rendered in a media panel.
 
@@ -44,6 +54,8 @@ class Media(WBValue):
     _extension: Optional[str]
     _sha256: Optional[str]
     _size: Optional[int]
+    _pending: Optional["Future[Tuple[str, int]]"] = None
+    _write_and_digest: Optional[Callable[[], Tuple[str, int]]] = None
 
     def __init__(self, caption: Optional[str] = None) -> None:
         super().__init__()
@@ -62,9 +74,57 @@ class Media(WBValue):
             extension
         ), f'Media file extension "{extension}" must occur at the end of path "{path}".'
 
-        with open(self._path, "rb") as f:
-            self._sha256 = hashlib.sha256(f.read()).hexdigest()
-        self._size = os.path.getsize(self._path)
+        self._sha256, self._size = _file_digest(self._path, is_tmp)
+
+    def _set_file_async(
+        self,
+        path: str,
+        write: Callable[[], None],
+        nbytes: int,
+        is_tmp: bool = False,
+        extension: Optional[str] = None,
+    ) -> None:
+        """Like `_set_file`, but for a file that `write` has yet to create.
+
+        If background encoding is enabled, `write` and the hashing of its
+        output run on the media encoding pool; `nbytes` is the amount of
+        memory the pending job keeps alive.
+        """
+        pool = _media_pool.get_pool()
+        if pool is None:
+            write()
+            self._set_file(path, is_tmp=is_tmp, extension=extension)
+            return
+
+        self._path = path
+        self._is_tmp = is_tmp
+        self._extension = extension
+        self._sha256 = None
+        self._size = None
+
+        def write_and_digest() -> Tuple[str, int]:
+            write()
+            return _file_digest(path, is_tmp)
+
+        self._write_and_digest = write_and_digest
+        self._pending = pool.submit(write_and_digest, nbytes)
+
+    def _wait_for_file(self) -> None:
+        """Wait for a file set with `_set_file_async` to be written.
+
+        If writing the file on the encoding pool failed, it is written again
+        on this thread, so that the error, if any, is raised here.
+        """
+        pending = self._pending
+        if pending is not None:
+            try:
+                self._sha256, self._size = pending.result()
+            except Exception:
+                logger.exception("Failed to encode %s in the background", self._path)
+                assert self._write_and_digest is not None
+                self._sha256, self._size = self._write_and_digest()
+            self._pending = None
+            self._write_and_digest = None
 
     @classmethod
     def get_media_subdir(cls: Type["Media"]) -> str:
@@ -83,6 +143,7 @@ class Media(WBValue):
         return self._run is not None
 
     def file_is_set(self) -> bool:
+        self._wait_for_file()
         return self._path is not None and self._sha256 is not None
 
     def bind_to_run(
@@ -98,6 +159,7 @@ class Media(WBValue):
         Calling this function is necessary so that we have somewhere specific to put the
         file associated with this object, from which other Runs can refer to it.
         """
+        self._wait_for_file()
         assert self.file_is_set(), "bind_to_run called before _set_file"
 
         if SYS_PLATFORM == "Windows" and not util.check_windows_valid_filename(key):
@@ -126,20 +188,22 @@ class Media(WBValue):
         media_path = os.path.join(self.get_media_subdir(), file_path)
         new_path = os.path.join(self._run.dir, media_path)
         filesystem.mkdir_exists_ok(os.path.dirname(new_path))
+        md5 = hashutil.recall_md5(self._path)
 
         if self._is_tmp:
             shutil.move(self._path, new_path)
             self._path = new_path
             self._is_tmp = False
-            _datatypes_callback(media_path)
         else:
             try:
-                shutil.copy(self._path, new_path)
+                filesystem.link_or_copy(self._path, new_path)
             except shutil.SameFileError as e:
                 if not ignore_copy_err:
                     raise e
             self._path = new_path
-            _datatypes_callback(media_path)
+        if md5 is not None:
+            hashutil.remember_md5(new_path, md5, written=True)
+        _datatypes_callback(media_path)
 
     def to_json(self, run: Union["LocalRun", "Artifact"]) -> dict:
         """Serialize the object into a JSON blob.
@@ -161,6 +225,7 @@ class Media(WBValue):
         from wandb.data_types import Audio
         from wandb.sdk.wandb_run import Run
 
+        self._wait_for_file()
         json_obj = {}
 
         if isinstance(run, Run):
@@ -257,6 +322,9 @@ class Media(WBValue):
 
     def __eq__(self, other: object) -> bool:
         """Likely will need to override for any more complicated media objects."""
+        if isinstance(other, Media):
+            self._wait_for_file()
+            other._wait_for_file()
         return (
             isinstance(other, self.__class__)
             and hasattr(self, "_sha256")
@@ -243,7 +243,7 @@ class Image(BatchableMedia):
                     for key in total_classes.keys()
                 ]
             )
-        if self.image is not None:
+        if self._width is None and self.image is not None:
             self._width, self._height = self.image.size
         self._free_ram()
 
@@ -259,6 +259,8 @@ class Image(BatchableMedia):
         self._extension = wbimage._extension
         self._sha256 = wbimage._sha256
         self._size = wbimage._size
+        self._pending = wbimage._pending
+        self._write_and_digest = wbimage._write_and_digest
         self.format = wbimage.format
         self._file_type = wbimage._file_type
         self._artifact_source = wbimage._artifact_source
@@ -298,6 +300,16 @@ class Image(BatchableMedia):
             "PIL.Image",
             required='wandb.Image needs the PIL package. To get it, run "pip install pillow".',
         )
+        accepted_formats = ["png", "jpg", "jpeg", "bmp"]
+        if file_type is None:
+            self.format = "png"
+        else:
+            self.format = file_type
+        assert (
+            self.format in accepted_formats
+        ), f"file_type must be one of {accepted_formats}"
+        tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + "." + self.format)
+
         if util.is_matplotlib_typename(util.get_full_typename(data)):
             buf = BytesIO()
             util.ensure_matplotlib_figure(data).savefig(buf, format="png")
@@ -321,21 +333,27 @@ class Image(BatchableMedia):
                 data = data.numpy()
             if data.ndim > 2:
                 data = data.squeeze()  # get rid of trivial dimensions as a convenience
-            self._image = pil_image.fromarray(
-                self.to_uint8(data), mode=mode or self.guess_mode(data)
-            )
-        accepted_formats = ["png", "jpg", "jpeg", "bmp"]
-        if file_type is None:
-            self.format = "png"
-        else:
-            self.format = file_type
-        assert (
-            self.format in accepted_formats
-        ), f"file_type must be one of {accepted_formats}"
-        tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + "." + self.format)
-        assert self._image is not None
-        self._image.save(tmp_path, transparency=None)
-        self._set_file(tmp_path, is_tmp=True)
+            array = cast("np.ndarray", data)
+            array_mode = mode or self.guess_mode(array)
+            self._height, self._width = array.shape[:2]
+
+            def write() -> None:
+                # The array is converted to an image along with the encoding.
+                image = pil_image.fromarray(self.to_uint8(array), mode=array_mode)
+                image.save(tmp_path, transparency=None)
+
+            self._set_file_async(tmp_path, write, array.nbytes, is_tmp=True)
+            return
+
+        image = self._image
+        assert image is not None
+        self._width, self._height = image.size
+        self._set_file_async(
+            tmp_path,
+            lambda: image.save(tmp_path, transparency=None),
+            image.width * image.height * len(image.getbands()),
+            is_tmp=True,
+        )
 
     @classmethod
     def from_json(
@@ -680,6 +698,7 @@ class Image(BatchableMedia):
     @property
     def image(self) -> Optional["PILImage"]:
         if self._image is None:
+            self._wait_for_file()
             if self._path is not None and not self.path_is_reference(self._path):
                 pil_image = util.get_module(
                     "PIL.Image",
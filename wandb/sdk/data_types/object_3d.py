@@ -319,17 +319,21 @@ class Object3D(BatchableMedia):
                     """
                 )
 
-            list_data = np_data.tolist()
             tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + ".pts.json")
-            with codecs.open(tmp_path, "w", encoding="utf-8") as fp:
-                json.dump(
-                    list_data,
-                    fp,
-                    separators=(",", ":"),
-                    sort_keys=True,
-                    indent=4,
-                )
-            self._set_file(tmp_path, is_tmp=True, extension=".pts.json")
+
+            def write() -> None:
+                with codecs.open(tmp_path, "w", encoding="utf-8") as fp:
+                    json.dump(
+                        np_data.tolist(),
+                        fp,
+                        separators=(",", ":"),
+                        sort_keys=True,
+                        indent=4,
+                    )
+
+            self._set_file_async(
+                tmp_path, write, np_data.nbytes, is_tmp=True, extension=".pts.json"
+            )
         else:
             raise ValueError("data must be a numpy array, dict or a file object")
 
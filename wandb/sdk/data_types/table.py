@@ -2,8 +2,10 @@ import base64
 import binascii
 import codecs
 import datetime
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import wandb
 from wandb import util
@@ -27,6 +29,18 @@ class _TableKey(str, _TableLinkMixin):
         self._table = table
         self._col_name = col_name
 
+    def get_row(self):
+        row = {}
+        if self._table:
+            row_ndx = self._table._find_row(self._col_name, self)
+            if row_ndx is not None:
+                row = {
+                    c: self._table.data[row_ndx][i]
+                    for i, c in enumerate(self._table.columns)
+                }
+
+        return row
+
 
 class _TableIndex(int, _TableLinkMixin):
     def get_row(self):
@@ -180,6 +194,84 @@ class _ForeignIndexType(_dtypes.Type):
         return cls(table)
 
 
+def _columnar_kind(col_type):
+    """Returns the type of a column's values if they can be stored as arrays."""
+    if isinstance(col_type, _dtypes.UnionType):
+        allowed_types = [
+            t
+            for t in col_type.params["allowed_types"]
+            if t.__class__ is not _dtypes.NoneType
+        ]
+        if len(allowed_types) != 1:
+            return None
+        col_type = allowed_types[0]
+    if col_type.__class__ in (
+        _dtypes.NumberType,
+        _dtypes.BooleanType,
+        _dtypes.StringType,
+        _dtypes.TimestampType,
+    ):
+        return col_type.__class__
+    return None
+
+
+def _encode_column(np, kind, values):
+    """Returns the arrays to store a column's values as, or None if it can't be.
+
+    Missing values are stored as a mask, and strings as their concatenated
+    UTF-8 bytes with the offsets where each one starts. Timestamps are stored
+    as milliseconds, the same as in JSON.
+    """
+    arrays = {}
+    mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    if mask.any():
+        arrays["mask"] = mask
+        fill = {_dtypes.StringType: "", _dtypes.BooleanType: False}.get(kind, 0)
+        values = [fill if v is None else v for v in values]
+
+    if kind is _dtypes.StringType:
+        if not all(v.__class__ is str for v in values):
+            return None
+        encoded = [v.encode("utf-8") for v in values]
+        arrays["offsets"] = np.cumsum([0] + [len(e) for e in encoded], dtype=np.int64)
+        arrays["values"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    elif kind is _dtypes.TimestampType:
+        arrays["values"] = np.array(
+            [_json_helper(v, None) for v in values], dtype=np.float64
+        )
+    else:
+        array = np.asarray(values)
+        if array.dtype.kind not in ("b" if kind is _dtypes.BooleanType else "iuf"):
+            return None
+        arrays["values"] = array
+    return arrays
+
+
+def _decode_column(np, kind, arrays):
+    """Returns the values of a column stored by _encode_column."""
+    values = arrays["values"]
+    if kind is _dtypes.StringType:
+        buffer = values.tobytes()
+        offsets = arrays["offsets"].tolist()
+        column = [
+            buffer[start:end].decode("utf-8")
+            for start, end in zip(offsets, offsets[1:])
+        ]
+    elif kind is _dtypes.TimestampType:
+        column = [
+            datetime.datetime.fromtimestamp(ms / 1000, tz=datetime.timezone.utc)
+            for ms in values.tolist()
+        ]
+    else:
+        column = values.tolist()
+
+    mask = arrays.get("mask")
+    if mask is not None:
+        for ndx in np.flatnonzero(mask).tolist():
+            column[ndx] = None
+    return column
+
+
 class Table(Media):
     """The Table class used to display and analyze tabular data.
 
@@ -205,6 +297,11 @@ class Table(Media):
             applies to all columns. A list of bool values applies to each respective column.
         allow_mixed_types: (bool) Determines if columns are allowed to have mixed types
             (disables type validation). Defaults to False
+        columnar: (bool) Determines if the table is saved to artifacts as column
+            arrays instead of JSON rows, when all of its columns hold numbers,
+            booleans, strings or timestamps. Loading such tables is much faster,
+            but the W&B UI and older versions of wandb see them as empty. Tables
+            logged with `run.log` are always saved as rows. Defaults to False
     """
 
     MAX_ROWS = 10000
@@ -221,6 +318,7 @@ class Table(Media):
         dtype=None,
         optional=True,
         allow_mixed_types=False,
+        columnar=False,
     ):
         """Initializes a Table object.
 
@@ -230,6 +328,11 @@ class Table(Media):
         super().__init__()
         self._pk_col = None
         self._fk_cols = set()
+        # The index of the first row with each primary key.
+        self._pk_index = {}
+        # Arrays of column values loaded from an artifact, by column name.
+        self._column_arrays = {}
+        self._columnar = columnar
         if allow_mixed_types:
             dtype = _dtypes.AnyType
 
@@ -283,6 +386,10 @@ class Table(Media):
         self._assert_valid_columns(columns)
         self.columns = columns
         self._make_column_types(dtype, optional)
+        if ndarray.ndim == 2 and self._add_columns(
+            [ndarray[:, ndx] for ndx in range(ndarray.shape[1])]
+        ):
+            return
         for row in ndarray:
             self.add_data(*row)
 
@@ -295,9 +402,58 @@ class Table(Media):
         self._assert_valid_columns(columns)
         self.columns = columns
         self._make_column_types(dtype, optional)
+        if len(set(self.columns)) == len(self.columns) and self._add_columns(
+            [self._dataframe_column_values(dataframe[col]) for col in self.columns]
+        ):
+            return
         for row in range(len(dataframe)):
             self.add_data(*tuple(dataframe[col].values[row] for col in self.columns))
 
+    @staticmethod
+    def _dataframe_column_values(series):
+        values = series.values
+        if util.is_numpy_array(values):
+            return values
+        # Extension arrays, like pandas' string and nullable dtypes, can give
+        # different values when iterated over than when indexed.
+        return [values[ndx] for ndx in range(len(values))]
+
+    def _add_columns(self, columns):
+        """Adds rows to an empty table from its columns' values, if possible.
+
+        Infers each column's type from all of its values at once, which is
+        much faster than adding the rows one by one for large tables.
+
+        Returns:
+            False if the rows need to be added with add_data instead, either
+            because a value needs the column to be cast as a key or because the
+            values don't match the column types, in which case add_data raises
+            the error.
+        """
+        if (
+            not columns
+            or len(columns) != len(self.columns)
+            or self._pk_col is not None
+            or self._fk_cols
+        ):
+            return False
+        type_map = dict(self._column_types.params["type_map"])
+        for col_name, values in zip(self.columns, columns):
+            is_object = not util.is_numpy_array(values) or values.dtype.kind == "O"
+            if is_object and any(
+                isinstance(value, _TableLinkMixin) for value in values
+            ):
+                return False
+            type_map[col_name], invalid_ndx = _dtypes.assign_column(
+                type_map[col_name], values
+            )
+            if invalid_ndx is not None:
+                return False
+
+        self._column_types = _dtypes.TypedDictType(type_map)
+        self.data.extend([list(row) for row in zip(*columns)])
+        return True
+
     def _make_column_types(self, dtype=None, optional=True):
         if dtype is None:
             dtype = _dtypes.UnknownType()
@@ -332,17 +488,19 @@ class Table(Media):
 
         # Cast each value in the row, raising an error if there are invalid entries.
         col_ndx = self.columns.index(col_name)
-        for row in self.data:
-            result_type = wbtype.assign(row[col_ndx])
-            if isinstance(result_type, _dtypes.InvalidType):
-                raise TypeError(
-                    "Existing data {}, of type {} cannot be cast to {}".format(
-                        row[col_ndx],
-                        _dtypes.TypeRegistry.type_of(row[col_ndx]),
-                        wbtype,
-                    )
+        values = [row[col_ndx] for row in self.data]
+        result_type, invalid_ndx = _dtypes.assign_column(wbtype, values)
+        if invalid_ndx is not None:
+            # Find the type the value was assigned to, for the error message.
+            wbtype, _ = _dtypes.assign_column(wbtype, values[:invalid_ndx])
+            raise TypeError(
+                "Existing data {}, of type {} cannot be cast to {}".format(
+                    values[invalid_ndx],
+                    _dtypes.TypeRegistry.type_of(values[invalid_ndx]),
+                    wbtype,
                 )
-            wbtype = result_type
+            )
+        wbtype = result_type
 
         # Assert valid options
         is_pk = isinstance(wbtype, _PrimaryKeyType)
@@ -436,6 +594,15 @@ class Table(Media):
         # Needed as String.assign(Key) is invalid
         for ndx, item in enumerate(data):
             if isinstance(item, _TableLinkMixin):
+                # Casting checks every row, so skip it when the column is
+                # already a key into the same table.
+                col_type = self._column_types.params["type_map"][self.columns[ndx]]
+                item_type = _dtypes.TypeRegistry.type_of(item)
+                if (
+                    col_type.__class__ is item_type.__class__
+                    and col_type.assign_type(item_type) is col_type
+                ):
+                    continue
                 self.cast(
                     self.columns[ndx],
                     _dtypes.TypeRegistry.type_of(item),
@@ -445,6 +612,7 @@ class Table(Media):
         # Update the table's column types
         result_type = self._get_updated_result_type(data)
         self._column_types = result_type
+        self._column_arrays = {}
 
         # rows need to be mutable
         if isinstance(data, tuple):
@@ -465,14 +633,20 @@ class Table(Media):
             col_key: row[ndx] for ndx, col_key in enumerate(self.columns)
         }
         current_type = self._column_types
-        result_type = current_type.assign(incoming_row_dict)
-        if isinstance(result_type, _dtypes.InvalidType):
-            raise TypeError(
-                "Data row contained incompatible types:\n{}".format(
-                    current_type.explain(incoming_row_dict)
-                )
+        # Same as current_type.assign(incoming_row_dict), assigning a column's
+        # values through the cache since rows tend to repeat the same types.
+        type_map = {}
+        for col_key, col_type in current_type.params["type_map"].items():
+            type_map[col_key] = _dtypes.assign_cached(
+                col_type, incoming_row_dict.get(col_key)
             )
-        return result_type
+            if isinstance(type_map[col_key], _dtypes.InvalidType):
+                raise TypeError(
+                    "Data row contained incompatible types:\n{}".format(
+                        current_type.explain(incoming_row_dict)
+                    )
+                )
+        return _dtypes.TypedDictType(type_map)
 
     def _to_table_json(self, max_rows=None, warn=True):
         # separate this method for easier testing
@@ -583,9 +757,68 @@ class Table(Media):
         if column_types is not None:
             new_obj._column_types = column_types
 
+        new_obj._load_columns(json_obj, source_artifact)
+
         new_obj._update_keys()
         return new_obj
 
+    def _save_columns(self, artifact, data):
+        """Saves the columns of the data to an artifact file as arrays, if possible.
+
+        Returns:
+            The path of the file in the artifact, or None if any of the columns
+            can't be stored as arrays.
+        """
+        np = util.get_module("numpy")
+        if np is None or not self.columns:
+            return None
+
+        arrays = {}
+        for col_ndx, col_name in enumerate(self.columns):
+            kind = _columnar_kind(self._column_types.params["type_map"][col_name])
+            if kind is None:
+                return None
+            column = _encode_column(np, kind, [row[col_ndx] for row in data])
+            if column is None:
+                return None
+            arrays.update({f"{col_ndx}.{key}": array for key, array in column.items()})
+
+        file_name = f"{runid.generate_id()}.table.npz"
+        npz_file_name = os.path.join(MEDIA_TMP.name, file_name)
+        np.savez(npz_file_name, **arrays)
+        entry = artifact.add_file(
+            npz_file_name, "media/serialized_data/" + file_name, is_tmp=True
+        )
+        return entry.path
+
+    def _load_columns(self, json_obj, source_artifact):
+        """Loads the table's data from columns saved by _save_columns, if any."""
+        if json_obj.get("columnar") is None:
+            return
+        path = json_obj["columnar"]["path"]
+        np = util.get_module(
+            "numpy", required="Deserializing columnar tables requires NumPy."
+        )
+        columns = []
+        with np.load(source_artifact.get_entry(path).download()) as npz:
+            for col_ndx, col_name in enumerate(self.columns):
+                kind = _columnar_kind(self._column_types.params["type_map"][col_name])
+                prefix = f"{col_ndx}."
+                arrays = {
+                    key[len(prefix) :]: npz[key]
+                    for key in npz.files
+                    if key.startswith(prefix)
+                }
+                columns.append(_decode_column(np, kind, arrays))
+                if "mask" not in arrays and kind in (
+                    _dtypes.NumberType,
+                    _dtypes.BooleanType,
+                ):
+                    arrays["values"].setflags(write=False)
+                    self._column_arrays[col_name] = arrays["values"]
+        self.data = [list(row) for row in zip(*columns)]
+        self._columnar = True
+
     def to_json(self, run_or_artifact):
         json_dict = super().to_json(run_or_artifact)
 
@@ -647,14 +880,22 @@ class Table(Media):
                     ndarray_type._set_serialization_path(entry.path, str(col_name))
                     ndarray_col_ndxs.add(col_ndx)
 
-            for row in data:
-                mapped_row = []
-                for ndx, v in enumerate(row):
-                    if ndx in ndarray_col_ndxs:
-                        mapped_row.append(None)
-                    else:
-                        mapped_row.append(_json_helper(v, artifact))
-                mapped_data.append(mapped_row)
+            columnar_path = None
+            # The UI reads the rows of tables logged to runs.
+            if self._columnar and artifact.type != "run_table":
+                columnar_path = self._save_columns(artifact, data)
+
+            if columnar_path is None:
+                for row in data:
+                    mapped_row = []
+                    for ndx, v in enumerate(row):
+                        if ndx in ndarray_col_ndxs:
+                            mapped_row.append(None)
+                        else:
+                            mapped_row.append(_json_helper(v, artifact))
+                    mapped_data.append(mapped_row)
+            else:
+                json_dict["columnar"] = {"path": columnar_path}
 
             json_dict.update(
                 {
@@ -662,7 +903,7 @@ class Table(Media):
                     "columns": self.columns,
                     "data": mapped_data,
                     "ncols": len(self.columns),
-                    "nrows": len(mapped_data),
+                    "nrows": len(data),
                     "column_types": self._column_types.to_json(artifact),
                 }
             )
@@ -754,45 +995,43 @@ class Table(Media):
             applied to the column types)
         """
         c_types = self._column_types.params["type_map"]
-
-        # Define a helper function which will wrap the data of a single row
-        # in the appropriate class wrapper.
-        def update_row(row_ndx):
-            for fk_col in self._fk_cols:
-                col_ndx = self.columns.index(fk_col)
-
-                # Wrap the Foreign Keys
-                if isinstance(c_types[fk_col], _ForeignKeyType) and not isinstance(
-                    self.data[row_ndx][col_ndx], _TableKey
-                ):
-                    self.data[row_ndx][col_ndx] = _TableKey(self.data[row_ndx][col_ndx])
-                    self.data[row_ndx][col_ndx].set_table(
-                        c_types[fk_col].params["table"],
-                        c_types[fk_col].params["col_name"],
-                    )
-
-                # Wrap the Foreign Indexes
-                elif isinstance(c_types[fk_col], _ForeignIndexType) and not isinstance(
-                    self.data[row_ndx][col_ndx], _TableIndex
-                ):
-                    self.data[row_ndx][col_ndx] = _TableIndex(
-                        self.data[row_ndx][col_ndx]
-                    )
-                    self.data[row_ndx][col_ndx].set_table(
-                        c_types[fk_col].params["table"]
-                    )
-
-            # Wrap the Primary Key
-            if self._pk_col is not None:
-                col_ndx = self.columns.index(self._pk_col)
-                self.data[row_ndx][col_ndx] = _TableKey(self.data[row_ndx][col_ndx])
-                self.data[row_ndx][col_ndx].set_table(self, self._pk_col)
-
+        self._column_arrays = {}
         if only_last:
-            update_row(len(self.data) - 1)
+            rows = self.data[-1:]
+            first_ndx = len(self.data) - 1
         else:
-            for row_ndx in range(len(self.data)):
-                update_row(row_ndx)
+            rows = self.data
+            first_ndx = 0
+            self._pk_index = {}
+
+        # Wrap a column at a time, in the appropriate class wrapper.
+        for fk_col in self._fk_cols:
+            col_ndx = self.columns.index(fk_col)
+            col_type = c_types[fk_col]
+
+            # Wrap the Foreign Keys
+            if isinstance(col_type, _ForeignKeyType):
+                for row in rows:
+                    if not isinstance(row[col_ndx], _TableKey):
+                        row[col_ndx] = _TableKey(row[col_ndx])
+                        row[col_ndx].set_table(
+                            col_type.params["table"], col_type.params["col_name"]
+                        )
+
+            # Wrap the Foreign Indexes
+            elif isinstance(col_type, _ForeignIndexType):
+                for row in rows:
+                    if not isinstance(row[col_ndx], _TableIndex):
+                        row[col_ndx] = _TableIndex(row[col_ndx])
+                        row[col_ndx].set_table(col_type.params["table"])
+
+        # Wrap the Primary Key, and index the rows by it
+        if self._pk_col is not None:
+            col_ndx = self.columns.index(self._pk_col)
+            for row_ndx, row in enumerate(rows, first_ndx):
+                row[col_ndx] = _TableKey(row[col_ndx])
+                row[col_ndx].set_table(self, self._pk_col)
+                self._pk_index.setdefault(row[col_ndx], row_ndx)
 
     def add_column(self, name, data, optional=False):
         """Adds a column of data to the table.
@@ -849,6 +1088,8 @@ class Table(Media):
             np = util.get_module(
                 "numpy", required="Converting to NumPy requires installing NumPy"
             )
+            if name in self._column_arrays:
+                return self._column_arrays[name]
         col = []
         col_ndx = self.columns.index(name)
         for row in self.data:
@@ -860,6 +1101,61 @@ class Table(Media):
             col = np.array(col)
         return col
 
+    def iter_batches(self, batch_size=10000, columns=None, convert_to=None):
+        """Iterates over the rows of the table in batches.
+
+        Arguments:
+            batch_size: (int) - the most rows in a batch
+            columns: (List[str], optional) - the names of the columns to include,
+                defaults to all of them
+            convert_to: (str, optional)
+                - "numpy": yields a dict of a numpy array per column name
+                - "pandas": yields a `pandas.DataFrame`
+                - None: yields a list of rows
+
+        Yields:
+            The batches of rows, in order.
+        """
+        assert convert_to in (None, "numpy", "pandas")
+        if columns is None:
+            columns = self.columns
+        assert all(name in self.columns for name in columns)
+        col_ndxs = [self.columns.index(name) for name in columns]
+        if convert_to == "numpy":
+            np = util.get_module(
+                "numpy", required="Converting to NumPy requires installing NumPy"
+            )
+        elif convert_to == "pandas":
+            pd = util.get_module(
+                "pandas",
+                required="Converting to pandas.DataFrame requires installing pandas",
+            )
+
+        for start in range(0, len(self.data), batch_size):
+            rows = self.data[start : start + batch_size]
+            if convert_to == "numpy":
+                batch = {}
+                for name, col_ndx in zip(columns, col_ndxs):
+                    if name in self._column_arrays:
+                        batch[name] = self._column_arrays[name][
+                            start : start + len(rows)
+                        ]
+                        continue
+                    col = []
+                    for row in rows:
+                        item = row[col_ndx]
+                        if isinstance(item, WBValue):
+                            item = item.to_data_array()
+                        col.append(item)
+                    batch[name] = np.array(col)
+                yield batch
+            else:
+                rows = [[row[col_ndx] for col_ndx in col_ndxs] for row in rows]
+                if convert_to == "pandas":
+                    yield pd.DataFrame.from_records(rows, columns=columns)
+                else:
+                    yield rows
+
     def get_index(self):
         """Returns an array of row indexes for use in other tables to create links."""
         ndxs = []
@@ -869,6 +1165,16 @@ class Table(Media):
             ndxs.append(index)
         return ndxs
 
+    def _find_row(self, col_name, value):
+        """Returns the index of the first row with the value in the column, if any."""
+        if col_name == self._pk_col:
+            return self._pk_index.get(value)
+        col_ndx = self.columns.index(col_name)
+        for row_ndx, row in enumerate(self.data):
+            if row[col_ndx] == value:
+                return row_ndx
+        return None
+
     def get_dataframe(self):
         """Returns a `pandas.DataFrame` of the table."""
         pd = util.get_module(
@@ -922,6 +1228,19 @@ class _PartitionTablePartEntry:
             self._part = self.source_artifact.get(self.entry.path)
         return self._part
 
+    def download(self):
+        return self.source_artifact.get_entry(self.entry.path).download()
+
+    def load_part(self):
+        """Loads the part, only downloading the files it refers to.
+
+        Unlike get_part, this doesn't download the rest of the artifact.
+        """
+        with open(self.download()) as file:
+            part = Table.from_json(json.load(file), self.source_artifact)
+        part._set_artifact_source(self.source_artifact, self.entry.path)
+        return part
+
     def free(self):
         self._part = None
 
@@ -997,6 +1316,69 @@ class PartitionedTable(Media):
 
             self._loaded_part_entries[entry_path].free()
 
+    def iter_batches(
+        self,
+        batch_size=10000,
+        columns=None,
+        convert_to=None,
+        part_filter=None,
+        read_ahead=1,
+    ):
+        """Iterates over the rows of the parts in batches, loading a part at a time.
+
+        Parts are downloaded as they're needed, along with the next `read_ahead`
+        parts, rather than downloading the whole artifact. Batches don't span
+        parts.
+
+        Arguments:
+            batch_size: (int) - the most rows in a batch
+            columns: (List[str], optional) - the names of the columns to include,
+                defaults to all of them
+            convert_to: (str, optional) - the format of the batches, as for
+                `Table.iter_batches`
+            part_filter: (Callable, optional) - called with the artifact manifest
+                entry of each part; parts it returns False for are skipped
+                without being downloaded
+            read_ahead: (int) - how many of the following parts to download while
+                a part is being read
+
+        Yields:
+            The batches of rows, in order.
+        """
+        part_entries = [
+            part_entry
+            for part_entry in self._loaded_part_entries.values()
+            if part_filter is None or part_filter(part_entry.entry)
+        ]
+        part_columns = None
+        downloads = {}
+        with ThreadPoolExecutor(max(read_ahead, 1)) as executor:
+            try:
+                for ndx, part_entry in enumerate(part_entries):
+                    for next_entry in part_entries[ndx + 1 : ndx + 1 + read_ahead]:
+                        if next_entry.entry.path not in downloads:
+                            downloads[next_entry.entry.path] = executor.submit(
+                                next_entry.download
+                            )
+                    download = downloads.pop(part_entry.entry.path, None)
+                    if download is not None:
+                        download.result()
+
+                    part = part_entry.load_part()
+                    if part_columns is None:
+                        part_columns = part.columns
+                    elif columns is None and part_columns != part.columns:
+                        raise ValueError(
+                            "Table parts have non-matching columns. {} != {}".format(
+                                part_columns, part.columns
+                            )
+                        )
+                    yield from part.iter_batches(batch_size, columns, convert_to)
+            finally:
+                # Don't wait for parts that won't be read.
+                for download in downloads.values():
+                    download.cancel()
+
     def _add_part_entry(self, entry, source_artifact):
         self._loaded_part_entries[entry.path] = _PartitionTablePartEntry(
             entry, source_artifact
@@ -1104,6 +1486,46 @@ class JoinedTable(Media):
 
         return table
 
+    def get_table(self):
+        """Returns the inner join of the two tables as a `wandb.Table`.
+
+        The columns of the first table are prefixed with "0." and those of the
+        second table with "1.". Rows are matched by looking up the join key of
+        each row of the first table in an index of the second table.
+        """
+        if not isinstance(self._table1, Table) or not isinstance(self._table2, Table):
+            raise ValueError("JoinedTable.get_table requires two wandb.Table objects")
+        if isinstance(self._join_key, str):
+            key1, key2 = self._join_key, self._join_key
+        else:
+            key1, key2 = self._join_key
+        key1_ndx = self._table1.columns.index(key1)
+        key2_ndx = self._table2.columns.index(key2)
+
+        index = {}
+        for row_ndx, row in enumerate(self._table2.data):
+            index.setdefault(row[key2_ndx], []).append(row_ndx)
+        data = [
+            row + self._table2.data[row_ndx]
+            for row in self._table1.data
+            for row_ndx in index.get(row[key1_ndx], ())
+        ]
+
+        column_types = {}
+        for prefix, table in (("0.", self._table1), ("1.", self._table2)):
+            for col_name in table.columns:
+                col_type = table._column_types.params["type_map"][col_name]
+                # The keys stay the primary keys of their own tables.
+                if isinstance(col_type, _PrimaryKeyType):
+                    col_type = _dtypes.StringType()
+                column_types[f"{prefix}{col_name}"] = col_type
+
+        joined = Table(columns=list(column_types))
+        joined.data = data
+        joined._column_types = _dtypes.TypedDictType(column_types)
+        joined._update_keys()
+        return joined
+
     def to_json(self, artifact_or_run):
         json_obj = {
             "_type": JoinedTable._log_type,
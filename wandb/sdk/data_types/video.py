@@ -134,13 +134,20 @@ class Video(BatchableMedia):
         )
         tensor = self._prepare_video(self.data)
         _, self._height, self._width, self._channels = tensor.shape  # type: ignore
+        filename = os.path.join(
+            MEDIA_TMP.name, runid.generate_id() + "." + self._format
+        )
+        self._set_file_async(
+            filename,
+            lambda: self._write(mpy, tensor, filename),
+            tensor.nbytes,
+            is_tmp=True,
+        )
 
+    def _write(self, mpy: Any, tensor: "np.ndarray", filename: str) -> None:
         # encode sequence of images into gif string
         clip = mpy.ImageSequenceClip(list(tensor), fps=self._fps)
 
-        filename = os.path.join(
-            MEDIA_TMP.name, runid.generate_id() + "." + self._format
-        )
         if TYPE_CHECKING:
             kwargs: Dict[str, Optional[bool]] = {}
         try:  # older versions of moviepy do not support logger argument
@@ -164,7 +171,6 @@ class Video(BatchableMedia):
                     clip.write_gif(filename, **kwargs)
                 else:
                     clip.write_videofile(filename, **kwargs)
-        self._set_file(filename, is_tmp=True)
 
     @classmethod
     def get_media_subdir(cls: Type["Video"]) -> str:
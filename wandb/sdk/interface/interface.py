@@ -45,6 +45,7 @@ from wandb.util import (
     maybe_compress_summary,
 )
 
+from ..data_types import _media_pool
 from ..data_types.utils import history_dict_to_json, val_to_json
 from ..lib.mailbox import MailboxHandle
 from . import summary_record as sr
@@ -100,6 +101,8 @@ class InterfaceBase:
     def __init__(self) -> None:
         self._run = None
         self._drop = False
+        # Publishes history rows whose media is still being encoded.
+        self._deferred_history = _media_pool.DeferredPublisher()
 
     def _hack_set_run(self, run: "Run") -> None:
         self._run = run
@@ -183,6 +186,8 @@ class InterfaceBase:
     ) -> None:
         cfg = self._make_config(data=data, key=key, val=val)
 
+        # Deferred history rows were logged first, so they must be applied first.
+        self._deferred_history.flush()
         self._publish_config(cfg)
 
     @abstractmethod
@@ -274,6 +279,8 @@ class InterfaceBase:
 
     def publish_summary(self, summary_record: sr.SummaryRecord) -> None:
         pb_summary_record = self._make_summary(summary_record)
+        # A deferred history row must not overwrite this update of the summary.
+        self._deferred_history.flush()
         self._publish_summary(pb_summary_record)
 
     @abstractmethod
@@ -627,26 +634,59 @@ class InterfaceBase:
         run: Optional["Run"] = None,
     ) -> None:
         run = run or self._run
-
-        data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
-        data.pop("_step", None)
-
         # add timestamp to the history request, if not already present
         # the timestamp might come from the tensorboard log logic
+        keys = [key for key in data if key != "_step"]
+        items = {}
         if "_timestamp" not in data:
-            data["_timestamp"] = time.time()
+            keys.append("_timestamp")
+            items["_timestamp"] = json_dumps_safer_history(time.time())
+
+        # Media that is still being encoded is serialized once the encoding is
+        # done, so as not to block the caller. Everything else is serialized
+        # now, since the caller may change it after this returns.
+        pending = {
+            key: _media_pool.snapshot(data[key])
+            for key in keys
+            if key in data and _media_pool.has_pending_media(data[key])
+        }
+        items.update(
+            self._history_items(
+                run,
+                {key: data[key] for key in keys if key in data and key not in pending},
+                user_step,
+            )
+        )
 
-        partial_history = pb.PartialHistoryRequest()
-        for k, v in data.items():
-            item = partial_history.item.add()
-            item.key = k
-            item.value_json = json_dumps_safer_history(v)
+        def publish() -> None:
+            for key, value in pending.items():
+                try:
+                    items.update(self._history_items(run, {key: value}, user_step))
+                except Exception as e:
+                    logger.exception("Failed to serialize history key %s", key)
+                    termwarn(f"Failed to log {key!r} to history, skipping it: {e}")
+            partial_history = pb.PartialHistoryRequest()
+            ordered = {key: items[key] for key in keys if key in items}
+            ordered.update(items)
+            for key, value in ordered.items():
+                item = partial_history.item.add()
+                item.key = key
+                item.value_json = value
+
+            if publish_step and step is not None:
+                partial_history.step.num = step
+            if flush is not None:
+                partial_history.action.flush = flush
+            self._publish_partial_history(partial_history)
+
+        self._deferred_history.publish(publish, defer=bool(pending))
 
-        if publish_step and step is not None:
-            partial_history.step.num = step
-        if flush is not None:
-            partial_history.action.flush = flush
-        self._publish_partial_history(partial_history)
+    @staticmethod
+    def _history_items(
+        run: Optional["Run"], data: dict, user_step: int
+    ) -> Dict[str, str]:
+        data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
+        return {key: json_dumps_safer_history(value) for key, value in data.items()}
 
     @abstractmethod
     def _publish_partial_history(self, history: pb.PartialHistoryRequest) -> None:
@@ -660,6 +700,7 @@ class InterfaceBase:
         publish_step: bool = True,
     ) -> None:
         run = run or self._run
+        self._deferred_history.flush()
         data = history_dict_to_json(run, data, step=step)
         history = pb.HistoryRecord()
         if publish_step:
@@ -761,6 +802,7 @@ class InterfaceBase:
         return exit
 
     def publish_exit(self, exit_code: Optional[int]) -> None:
+        self._deferred_history.flush()
         exit_data = self._make_exit(exit_code)
         self._publish_exit(exit_data)
 
@@ -920,6 +962,7 @@ class InterfaceBase:
         raise NotImplementedError
 
     def deliver_get_summary(self) -> MailboxHandle:
+        self._deferred_history.flush()
         get_summary = pb.GetSummaryRequest()
         return self._deliver_get_summary(get_summary)
 
@@ -938,6 +981,7 @@ class InterfaceBase:
         raise NotImplementedError
 
     def deliver_exit(self, exit_code: Optional[int]) -> MailboxHandle:
+        self._deferred_history.flush()
         exit_data = self._make_exit(exit_code)
         return self._deliver_exit(exit_data)
 
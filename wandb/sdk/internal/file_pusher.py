@@ -5,11 +5,12 @@ import queue
 import tempfile
 import threading
 import time
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import wandb
 import wandb.util
 from wandb.filesync import stats, step_checksum, step_upload
+from wandb.sdk.internal.file_stream import DefaultFilePolicy
 from wandb.sdk.lib.paths import LogicalPath
 
 if TYPE_CHECKING:
@@ -40,6 +41,7 @@ class FilePusher:
         settings: Optional["SettingsStatic"] = None,
     ) -> None:
         self._api = api
+        self._file_stream = file_stream
 
         # Temporary directory for copies we make of some file types to
         # reduce the probability that the file gets changed while we're
@@ -83,6 +85,8 @@ class FilePusher:
     def _file_pusher_stats(self) -> None:
         while not self._stats_thread_stop.is_set():
             logger.info(f"FilePusher stats: {self._stats._stats}")
+            logger.info(f"FilePusher bandwidth: {self._stats.bandwidth_by_class()}")
+            logger.info(f"FilePusher delta uploads: {self._stats.delta_summary()}")
             time.sleep(1)
 
     def get_status(self) -> Tuple[bool, stats.Summary]:
@@ -143,6 +147,32 @@ class FilePusher:
         event = step_checksum.RequestUpload(path, save_name, copy)
         self._incoming_queue.put(event)
 
+    def file_appended(
+        self,
+        save_name: LogicalPath,
+        lines: List[str],
+        first_line: int,
+        file_size: int,
+        nbytes: int,
+    ) -> None:
+        """Stream lines appended to a file instead of re-uploading all of it.
+
+        Arguments:
+            save_name: string logical location of the file relative to the run
+                directory.
+            lines: the appended lines, without line terminators.
+            first_line: the line number of the first appended line. This must
+                only change between calls by the number of lines streamed.
+            file_size: the size of the whole file.
+            nbytes: the size of the appended data.
+        """
+        self._file_stream.set_default_file_policy(
+            save_name, DefaultFilePolicy(start_chunk_id=first_line)
+        )
+        for line in lines:
+            self._file_stream.push(save_name, line)
+        self._stats.update_delta_upload(file_size, nbytes)
+
     def store_manifest_files(
         self,
         manifest: "ArtifactManifest",
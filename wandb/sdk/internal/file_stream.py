@@ -45,7 +45,7 @@ import wandb
 from wandb import util
 from wandb.sdk.internal import internal_api
 
-from ..lib import file_stream_utils
+from ..lib import file_stream_utils, shared_transport
 
 logger = logging.getLogger(__name__)
 
@@ -340,7 +340,7 @@ class FileStreamApi:
         self._api = api
         self._run_id = run_id
         self._start_time = start_time
-        self._client = requests.Session()
+        self._client = shared_transport.new_session()
         timeout = timeout or 0
         if timeout > 0:
             self._client.post = functools.partial(self._client.post, timeout=timeout)  # type: ignore[method-assign]
@@ -32,8 +32,6 @@ from typing import (
 import click
 import requests
 import yaml
-from wandb_gql import Client, gql
-from wandb_gql.client import RetryError
 
 import wandb
 from wandb import env, util
@@ -46,12 +44,19 @@ from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
 from wandb.sdk.lib.gql_request import GraphQLSession
 from wandb.sdk.lib.hashutil import B64MD5, md5_file_b64
 
-from ..lib import credentials, retry
+from ..lib import credentials, introspection_cache, retry, shared_transport
 from ..lib.filenames import DIFF_FNAME, METADATA_FNAME
 from ..lib.gitlib import GitRepo
-from . import context
+from . import context, resumable_upload
 from .progress import Progress
 
+reset_path = util.vendor_setup()
+
+from wandb_gql import Client, gql  # noqa: E402
+from wandb_gql.client import RetryError  # noqa: E402
+
+reset_path()
+
 logger = logging.getLogger(__name__)
 
 LAUNCH_DEFAULT_PROJECT = "model-registry"
@@ -279,7 +284,7 @@ class Api:
         )
         self._current_run_id: Optional[str] = None
         self._file_stream_api = None
-        self._upload_file_session = requests.Session()
+        self._upload_file_session = shared_transport.new_session()
         if self.FILE_PUSHER_TIMEOUT:
             self._upload_file_session.put = functools.partial(  # type: ignore
                 self._upload_file_session.put,
@@ -297,6 +302,10 @@ class Api:
                 self.upload_multipart_file_chunk
             )
         )
+        self.upload_file_resumable_retry = normalize_exceptions(
+            retry.retriable(retry_timedelta=retry_timedelta)(self.upload_file_resumable)
+        )
+        self._upload_session_store = resumable_upload.UploadSessionStore()
         self._client_id_mapping: Dict[str, str] = {}
         # Large file uploads to azure can optionally use their SDK
         self._azure_blob_module = util.get_module("azure.storage.blob")
@@ -354,8 +363,71 @@ class Api:
             logger.error(response.text)
             for error in parse_backend_error_messages(response):
                 wandb.termerror(f"Error while calling W&B API: {error} ({response})")
+            self._check_schema_mismatch(response.text)
+            raise
+        except Exception as err:
+            self._check_schema_mismatch(str(err))
             raise
 
+    @property
+    def introspection_cache(self) -> introspection_cache.IntrospectionCache:
+        return introspection_cache.get_cache(self.settings("base_url"))
+
+    def _introspect(self, query_string: str) -> Dict[str, Any]:
+        """Execute a schema introspection query, consulting the on-disk cache.
+
+        Cached results are only used after checking that the server's version
+        hasn't changed since they were recorded.
+        """
+        if self.introspection_cache.needs_version_check:
+            try:
+                server_version = self._server_version()
+            except Exception as e:
+                # The version is unknown, so the cache is left as it is and
+                # not used until the version can be checked.
+                logger.debug(f"Unable to query the server version: {e}")
+            else:
+                self.introspection_cache.set_server_version(server_version)
+        res = self.introspection_cache.get(query_string)
+        if res is None:
+            res = self.gql(gql(query_string))
+            if isinstance(res, dict):
+                self.introspection_cache.set(query_string, res)
+        return res
+
+    def _server_version(self) -> Optional[str]:
+        """Return the server's version, or None if it doesn't report one.
+
+        Raises if the server couldn't be queried.
+        """
+        query = gql(
+            """
+            query ServerVersion {
+                serverInfo {
+                    latestLocalVersionInfo {
+                        versionOnThisInstanceString
+                    }
+                }
+            }
+            """
+        )
+        try:
+            res = self.client.execute(query)
+        except Exception as e:
+            # Older servers don't have latestLocalVersionInfo.
+            if introspection_cache.is_schema_mismatch(str(e)):
+                return None
+            raise
+        server_info = res.get("serverInfo") or {}
+        return (server_info.get("latestLocalVersionInfo") or {}).get(
+            "versionOnThisInstanceString"
+        )
+
+    def _check_schema_mismatch(self, message: str) -> None:
+        """Drop cached introspection results if the server rejected our schema."""
+        if introspection_cache.is_schema_mismatch(message):
+            self.introspection_cache.invalidate()
+
     def disabled(self) -> Union[str, bool]:
         return self._settings.get(Settings.DEFAULT_SECTION, "disabled", fallback=False)  # type: ignore
 
@@ -557,8 +629,7 @@ class Api:
             or self.mutation_types is None
             or self.server_info_types is None
         ):
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
 
             self.query_types = [
                 field.get("name", "")
@@ -590,8 +661,7 @@ class Api:
             }
         """
         if self._server_settings_type is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             self._server_settings_type = (
                 [
                     field.get("name", "")
@@ -614,8 +684,7 @@ class Api:
         """
 
         if self.server_use_artifact_input_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             self.server_use_artifact_input_info = [
                 field.get("name", "")
                 for field in res.get("UseArtifactInputInfoType", {}).get(
@@ -626,17 +695,15 @@ class Api:
 
     @normalize_exceptions
     def launch_agent_introspection(self) -> Optional[str]:
-        query = gql(
-            """
+        query_string = """
             query LaunchAgentIntrospection {
                 LaunchAgentType: __type(name: "LaunchAgent") {
                     name
                 }
             }
         """
-        )
 
-        res = self.gql(query)
+        res = self._introspect(query_string)
         return res.get("LaunchAgentType") or None
 
     @normalize_exceptions
@@ -656,8 +723,7 @@ class Api:
             self.server_create_run_queue_supports_drc is None
             or self.server_create_run_queue_supports_priority is None
         ):
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             if res is None:
                 raise CommError("Could not get CreateRunQueue input from GQL.")
             self.server_create_run_queue_supports_drc = "defaultResourceConfigID" in [
@@ -700,8 +766,7 @@ class Api:
             self.server_supports_template_variables is None
             or self.server_push_to_run_queue_supports_priority is None
         ):
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             self.server_supports_template_variables = "templateVariableValues" in [
                 x["name"]
                 for x in (
@@ -744,8 +809,7 @@ class Api:
             }
         """
 
-        query = gql(query_string)
-        res = self.gql(query)
+        res = self._introspect(query_string)
 
         self.fail_run_queue_item_input_info = [
             field.get("name", "")
@@ -942,7 +1006,12 @@ class Api:
         )
         query = gql(query_string)
         res = self.gql(query)
-        return res.get("viewer") or {}, res.get("serverInfo") or {}
+        server_info = res.get("serverInfo") or {}
+        server_version = (server_info.get("latestLocalVersionInfo") or {}).get(
+            "versionOnThisInstanceString"
+        )
+        self.introspection_cache.set_server_version(server_version)
+        return res.get("viewer") or {}, server_info
 
     @normalize_exceptions
     def list_projects(self, entity: Optional[str] = None) -> List[Dict[str, str]]:
@@ -1963,8 +2032,7 @@ class Api:
             }
         """
 
-        query = gql(query_string)
-        res = self.gql(query)
+        res = self._introspect(query_string)
 
         self.create_launch_agent_input_info = [
             field.get("name", "")
@@ -2824,7 +2892,7 @@ class Api:
         size, response = self.download_file(metadata["url"])
 
         with util.fsync_open(path, "wb") as file:
-            for data in response.iter_content(chunk_size=1024):
+            for data in response.iter_content(chunk_size=1024 * 1024):
                 file.write(data)
 
         return path, response
@@ -2987,6 +3055,64 @@ class Api:
 
         return response
 
+    def upload_file_resumable(
+        self,
+        url: str,
+        path: str,
+        callback: Optional["ProgressFn"] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[requests.Response]:
+        """Upload a file in chunks through a resumable upload session.
+
+        The session is kept in memory, so retrying an upload that failed
+        part way continues from the last chunk the storage backend
+        acknowledged instead of from the start. Only use this for urls that
+        `resumable_upload.resumable_protocol` accepts, and for files that
+        won't change while they're uploaded.
+
+        Arguments:
+            url: The url to upload to
+            path: The path to the file you want to upload
+            callback: A callback which is passed the number of
+            bytes uploaded since the last time it was called, used to report progress
+            extra_headers: A dictionary of extra headers to send with the request
+
+        Returns:
+            The `requests` library response object
+        """
+        check_httpclient_logger_handler()
+        upload = resumable_upload.GCSResumableUpload(
+            self._upload_file_session,
+            url,
+            path,
+            extra_headers or {},
+            self._upload_session_store,
+            callback=callback,
+        )
+        try:
+            if env.is_debug(env=self._environ):
+                logger.debug("upload_file_resumable: %s", url)
+            response = upload.upload()
+            if env.is_debug(env=self._environ):
+                logger.debug("upload_file_resumable: %s complete", url)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"upload_file_resumable exception {url}: {e}")
+            status_code = e.response.status_code if e.response is not None else 0
+            # Retry errors from cloud storage or local network issues; the
+            # retry resumes the session.
+            if status_code in (408, 409, 429, 500, 502, 503, 504) or isinstance(
+                e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+            ):
+                _e = retry.TransientError(exc=e)
+                raise _e.with_traceback(sys.exc_info()[2])
+            else:
+                wandb._sentry.reraise(e)
+        return response
+
+    def discard_upload_session(self, url: str, path: str) -> None:
+        """Forget the resumable upload session of a file that won't be retried."""
+        self._upload_session_store.discard(path, url)
+
     @normalize_exceptions
     def register_agent(
         self,
@@ -3672,8 +3798,7 @@ class Api:
         """
 
         if self.server_organization_type_fields_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             input_fields = res.get("OrganizationInfoType", {}).get("fields", [{}])
             self.server_organization_type_fields_info = [
                 field["name"] for field in input_fields if "name" in field
@@ -3735,8 +3860,7 @@ class Api:
         """
 
         if self.server_artifact_fields_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             input_fields = res.get("ArtifactInfoType", {}).get("fields", [{}])
             self.server_artifact_fields_info = [
                 field["name"] for field in input_fields if "name" in field
@@ -3756,8 +3880,7 @@ class Api:
         """
 
         if self.server_create_artifact_input_info is None:
-            query = gql(query_string)
-            res = self.gql(query)
+            res = self._introspect(query_string)
             input_fields = res.get("CreateArtifactInputInfoType", {}).get(
                 "inputFields", [{}]
             )
@@ -4186,8 +4309,7 @@ class Api:
             }
         """
 
-        query = gql(query_string)
-        res = self.gql(query)
+        res = self._introspect(query_string)
         create_artifact_file_spec_input_info = [
             field.get("name", "")
             for field in res.get("CreateArtifactFileSpecInputInfoType", {}).get(
@@ -0,0 +1,235 @@
+"""Resumable, chunked uploads of run files.
+
+A plain presigned PUT has to restart from the first byte after any failure,
+so large files on unreliable links may never finish. When the storage backend
+supports it, files are instead uploaded in chunks through a resumable upload
+session, and the session is kept for the rest of the upload job so that a
+retry continues from the last offset the backend acknowledged.
+
+Currently the only resumable protocol is GCS's resumable upload protocol. It
+is only used when the backend asks for it, by handing out a GCS session URI
+or a URL signed for starting a session (a POST with `x-goog-resumable:
+start`, which it then includes in the upload headers). Presigned PUT URLs,
+which is what createRunFiles returns today, use a single PUT of the whole
+file.
+
+The file must not change while it's uploaded, so callers upload a private
+copy of files that may still be written to. Sessions are not persisted across
+processes, since that copy is deleted once its upload job ends.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+if TYPE_CHECKING:
+    from .progress import ProgressFn
+
+logger = logging.getLogger(__name__)
+
+GCS_PROTOCOL = "gcs"
+
+# GCS requires every chunk but the last to be a multiple of 256 KiB.
+CHUNK_SIZE = 32 * 256 * 1024
+# Smaller files are uploaded in a single request.
+MIN_RESUMABLE_SIZE = 4 * CHUNK_SIZE
+
+_RANGE_RE = re.compile(r"bytes=0-(\d+)")
+
+
+def resumable_protocol(url: str, headers: Mapping[str, str]) -> Optional[str]:
+    """Return the resumable protocol the backend asked for an upload, if any.
+
+    A URL that's only signed for PUT can't start a resumable session, so a
+    URL isn't treated as resumable unless it's a session URI or the upload
+    headers ask for a session to be started.
+    """
+    parsed = urlsplit(url)
+    hostname = parsed.hostname or ""
+    if hostname != "storage.googleapis.com" and not hostname.endswith(
+        ".storage.googleapis.com"
+    ):
+        return None
+    if "upload_id" in parse_qs(parsed.query):
+        return GCS_PROTOCOL
+    if any(
+        k.lower() == "x-goog-resumable" and v.strip().lower() == "start"
+        for k, v in headers.items()
+    ):
+        return GCS_PROTOCOL
+    return None
+
+
+class UploadSessionStore:
+    """Keeps upload sessions in memory, one per (local file, destination)."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def key(self, path: str, url: str) -> str:
+        """Identify an upload of the current contents of path to url's object.
+
+        The key ignores the URL's query, which holds a signature that changes
+        every time the URL is requested, and includes the file's size and
+        modification time, so that a modified file never resumes an upload of
+        its previous contents.
+        """
+        st = os.stat(path)
+        parsed = urlsplit(url)
+        identity = (
+            f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}:"
+            f"{parsed.netloc}{parsed.path}"
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._sessions.get(key)
+        return dict(session) if session is not None else None
+
+    def save(self, key: str, session: Dict[str, Any]) -> None:
+        with self._lock:
+            self._sessions[key] = dict(session)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._sessions.pop(key, None)
+
+    def discard(self, path: str, url: str) -> None:
+        """Delete the session of an upload that won't be resumed."""
+        try:
+            key = self.key(path, url)
+        except OSError:
+            return
+        self.delete(key)
+
+
+class GCSResumableUpload:
+    """Upload a file through a GCS resumable upload session.
+
+    Raises `requests.exceptions.RequestException` on failure; the session is
+    left in the store so that calling `upload` again resumes it.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        url: str,
+        path: str,
+        headers: Mapping[str, str],
+        store: UploadSessionStore,
+        callback: Optional["ProgressFn"] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self._session = session
+        self._url = url
+        self._path = path
+        self._headers = dict(headers)
+        self._store = store
+        self._callback = callback
+        self._chunk_size = chunk_size
+        self._size = os.path.getsize(path)
+        self._key = store.key(path, url)
+
+    def _report(self, new_bytes: int, total_bytes: int) -> None:
+        if self._callback is not None:
+            self._callback(new_bytes, total_bytes)
+
+    def _start(self) -> str:
+        if "upload_id" in parse_qs(urlsplit(self._url).query):
+            return self._url
+        headers = {**self._headers, "x-goog-resumable": "start"}
+        response = self._session.post(self._url, headers=headers)
+        response.raise_for_status()
+        session_url: str = response.headers["Location"]
+        return session_url
+
+    def _committed_offset(self, session_url: str) -> Optional[int]:
+        """Ask GCS how many bytes it has persisted; None if already complete."""
+        response = self._session.put(
+            session_url,
+            headers={"Content-Range": f"bytes */{self._size}"},
+            allow_redirects=False,
+        )
+        if response.status_code in (200, 201):
+            return None
+        if response.status_code != 308:
+            response.raise_for_status()
+        return self._parse_offset(response)
+
+    @staticmethod
+    def _parse_offset(response: requests.Response) -> int:
+        match = _RANGE_RE.match(response.headers.get("Range", ""))
+        return int(match.group(1)) + 1 if match else 0
+
+    def _resume(self) -> Optional[Dict[str, Any]]:
+        state = self._store.load(self._key)
+        if state is None:
+            return None
+        try:
+            offset = self._committed_offset(state["session_url"])
+        except requests.exceptions.HTTPError as e:
+            # 404 and 410 mean the session expired or was cancelled.
+            if e.response is not None and e.response.status_code in (404, 410):
+                self._store.delete(self._key)
+                return None
+            raise
+        if offset is None:
+            state["offset"] = self._size
+        else:
+            state["offset"] = offset
+        return state
+
+    def _read_chunk(self, f: Any, offset: int) -> bytes:
+        # The session's size was fixed when it started, so never send more.
+        f.seek(offset)
+        chunk: bytes = f.read(min(self._chunk_size, self._size - offset))
+        if offset + len(chunk) < self._size and len(chunk) < self._chunk_size:
+            raise ValueError(f"{self._path} was truncated while uploading it")
+        return chunk
+
+    def upload(self) -> Optional[requests.Response]:
+        state = self._resume()
+        if state is None:
+            state = {
+                "protocol": GCS_PROTOCOL,
+                "session_url": self._start(),
+                "offset": 0,
+                "size": self._size,
+            }
+            self._store.save(self._key, state)
+        elif state["offset"]:
+            logger.info(f"Resuming upload of {self._path} at byte {state['offset']}")
+
+        offset: int = state["offset"]
+        self._report(offset, offset)
+        response = None
+        with open(self._path, "rb") as f:
+            while offset < self._size:
+                chunk = self._read_chunk(f, offset)
+                end = offset + len(chunk) - 1
+                response = self._session.put(
+                    state["session_url"],
+                    data=chunk,
+                    headers={"Content-Range": f"bytes {offset}-{end}/{self._size}"},
+                    allow_redirects=False,
+                )
+                if response.status_code in (200, 201):
+                    self._report(end + 1 - offset, self._size)
+                    break
+                if response.status_code != 308:
+                    response.raise_for_status()
+                new_offset = self._parse_offset(response)
+                self._report(new_offset - offset, new_offset)
+                offset = new_offset
+                state["offset"] = offset
+                self._store.save(self._key, state)
+        self._store.delete(self._key)
+        return response
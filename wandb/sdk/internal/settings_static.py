@@ -1,10 +1,19 @@
 from dataclasses import fields
-from typing import Any, Iterable, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
 
 from wandb.proto import wandb_settings_pb2
 from wandb.sdk.lib import RunMoment
 from wandb.sdk.wandb_settings import SettingsData
 
+# Computed once: the settings fields, and how to convert the repeated
+# fields of the proto for the fields that are sequences.
+_FIELD_NAMES = tuple(field.name for field in fields(SettingsData))
+_SEQUENCE_FIELDS: Dict[str, Callable[[Iterable[str]], Any]] = {
+    field.name: list if field.type == Sequence[str] else tuple
+    for field in fields(SettingsData)
+    if field.type in (Sequence[str], Tuple[str])
+}
+
 
 class SettingsStatic(SettingsData):
     """A readonly object that wraps a protobuf Settings message.
@@ -18,47 +27,43 @@ class SettingsStatic(SettingsData):
         object.__setattr__(self, "_proto", proto)
 
     def _from_proto(self, proto: wandb_settings_pb2.Settings) -> None:
+        # settings that are not set in the proto are None
+        values: Dict[str, Any] = dict.fromkeys(_FIELD_NAMES)
         forks_specified: list[str] = []
-        for field in fields(SettingsData):
-            key = field.name
+        for descriptor, message in proto.ListFields():
+            key = descriptor.name
+            if key not in values:
+                continue
             value: Any = None
             if key == "_stats_open_metrics_filters":
                 # todo: it's an underscored field, refactor into
                 #  something more elegant?
                 # I'm really about this. It's ugly, but it works.
                 # Do not try to repeat this at home.
-                value_type = getattr(proto, key).WhichOneof("value")
+                value_type = message.WhichOneof("value")
                 if value_type == "sequence":
-                    value = list(getattr(proto, key).sequence.value)
+                    value = list(message.sequence.value)
                 elif value_type == "mapping":
                     unpacked_mapping = {}
-                    for outer_key, outer_value in getattr(
-                        proto, key
-                    ).mapping.value.items():
+                    for outer_key, outer_value in message.mapping.value.items():
                         unpacked_inner = {}
                         for inner_key, inner_value in outer_value.value.items():
                             unpacked_inner[inner_key] = inner_value
                         unpacked_mapping[outer_key] = unpacked_inner
                     value = unpacked_mapping
             elif key == "fork_from" or key == "resume_from":
-                value = getattr(proto, key)
-                if value.run:
+                if message.run:
                     value = RunMoment(
-                        run=value.run, value=value.value, metric=value.metric
+                        run=message.run, value=message.value, metric=message.metric
                     )
                     forks_specified.append(key)
-                else:
-                    value = None
             else:
-                if proto.HasField(key):  # type: ignore [arg-type]
-                    value = getattr(proto, key).value
-                    if field.type == Sequence[str]:
-                        value = list(value)
-                    elif field.type == Tuple[str]:
-                        value = tuple(value)
-                else:
-                    value = None
-            object.__setattr__(self, key, value)
+                value = message.value
+                convert = _SEQUENCE_FIELDS.get(key)
+                if convert is not None:
+                    value = convert(value)
+            values[key] = value
+        self.__dict__.update(values)
 
         if len(forks_specified) > 1:
             raise ValueError(
@@ -17,6 +17,7 @@ from .build import (
     get_requirements_section,
     get_user_setup,
 )
+from .context_staging import replace_file, stage_build_context
 from .templates.dockerfile import DOCKERFILE_TEMPLATE
 
 _logger = logging.getLogger(__name__)
@@ -135,19 +136,15 @@ class BuildContextManager:
             )
             if not os.path.exists(full_path):
                 raise LaunchError(f"Dockerfile does not exist at {full_path}")
-            shutil.copytree(
-                build_context_root_dir,
-                self._directory,
-                symlinks=True,
-                dirs_exist_ok=True,
-                ignore=shutil.ignore_patterns("fsmonitor--daemon.ipc"),
-            )
-            shutil.copy(
-                full_path,
+            stage_build_context(build_context_root_dir, self._directory)
+            with open(full_path) as f:
+                docker_file_contents = f.read()
+            replace_file(
                 os.path.join(self._directory, _WANDB_DOCKERFILE_NAME),
+                docker_file_contents,
             )
             return self._directory, image_tag_from_dockerfile_and_source(
-                self._launch_project, open(full_path).read()
+                self._launch_project, docker_file_contents
             )
 
         # If the job specifies a Dockerfile, we use that as the Dockerfile.
@@ -156,19 +153,15 @@ class BuildContextManager:
             dockerfile_path = os.path.join(build_context_root_dir, job_dockerfile)
             if not os.path.exists(dockerfile_path):
                 raise LaunchError(f"Dockerfile does not exist at {dockerfile_path}")
-            shutil.copytree(
-                build_context_root_dir,
-                self._directory,
-                symlinks=True,
-                dirs_exist_ok=True,
-                ignore=shutil.ignore_patterns("fsmonitor--daemon.ipc"),
-            )
-            shutil.copy(
-                dockerfile_path,
+            stage_build_context(build_context_root_dir, self._directory)
+            with open(dockerfile_path) as f:
+                docker_file_contents = f.read()
+            replace_file(
                 os.path.join(self._directory, _WANDB_DOCKERFILE_NAME),
+                docker_file_contents,
             )
             return self._directory, image_tag_from_dockerfile_and_source(
-                self._launch_project, open(dockerfile_path).read()
+                self._launch_project, docker_file_contents
             )
 
         # This is the case where we find Dockerfile.wandb adjacent to the
@@ -185,12 +178,11 @@ class BuildContextManager:
         if os.path.exists(
             path
         ):  # We found a Dockerfile.wandb adjacent to the entrypoint.
-            shutil.copytree(
+            # Docker always sends the Dockerfile, even if it's ignored.
+            stage_build_context(
                 os.path.dirname(path),
                 self._directory,
-                symlinks=True,
-                dirs_exist_ok=True,
-                ignore=shutil.ignore_patterns("fsmonitor--daemon.ipc"),
+                always_include=[_WANDB_DOCKERFILE_NAME],
             )
             # TODO: remove this once we make things more explicit for users
             if entrypoint_dir:
@@ -208,27 +200,22 @@ class BuildContextManager:
         # the user code into a src directory in the build context.
         dst_path = os.path.join(self._directory, "src")
         assert self._launch_project.project_dir is not None
-        shutil.copytree(
-            src=self._launch_project.project_dir,
-            dst=dst_path,
-            symlinks=True,
-            ignore=shutil.ignore_patterns("fsmonitor--daemon.ipc"),
-        )
+        stage_build_context(self._launch_project.project_dir, dst_path)
         shutil.copy(
             os.path.join(os.path.dirname(__file__), "templates", "_wandb_bootstrap.py"),
             os.path.join(self._directory),
         )
         if self._launch_project.python_version:
             runtime_path = os.path.join(dst_path, "runtime.txt")
-            with open(runtime_path, "w") as fp:
-                fp.write(f"python-{self._launch_project.python_version}")
-
-        # TODO: we likely don't need to pass the whole git repo into the container
-        # with open(os.path.join(directory, ".dockerignore"), "w") as f:
-        #    f.write("**/.git")
-        with open(os.path.join(self._directory, _WANDB_DOCKERFILE_NAME), "w") as handle:
-            docker_file_contents = self._generate_dockerfile(builder_type=builder_type)
-            handle.write(docker_file_contents)
+            # Staged files may be hard links into the project dir, so replace
+            # rather than overwrite them.
+            replace_file(runtime_path, f"python-{self._launch_project.python_version}")
+
+        docker_file_contents = self._generate_dockerfile(builder_type=builder_type)
+        replace_file(
+            os.path.join(self._directory, _WANDB_DOCKERFILE_NAME),
+            docker_file_contents,
+        )
         image_tag = image_tag_from_dockerfile_and_source(
             self._launch_project, docker_file_contents
         )
@@ -0,0 +1,198 @@
+"""Staging of launch build contexts.
+
+Copying a whole project directory into a fresh temporary build context for
+every build is slow for large repositories. This module stages the build
+context by hard-linking files (falling back to a copy when linking is not
+possible), skipping files matched by the project's `.dockerignore`, so no file
+contents are read or copied when the project and build context share a
+filesystem.
+"""
+
+import logging
+import os
+import re
+import shutil
+from typing import FrozenSet, Iterable, Iterator, List, Pattern, Tuple
+
+_logger = logging.getLogger(__name__)
+
+_DOCKERIGNORE_NAME = ".dockerignore"
+# Files that are never part of a build context.
+_ALWAYS_IGNORED = ("fsmonitor--daemon.ipc",)
+
+
+def _translate_pattern(pattern: str) -> Pattern[str]:
+    """Translate a .dockerignore pattern into a regular expression.
+
+    Patterns follow Docker's semantics: `*` and `?` do not cross path
+    separators, `**` matches any number of directories, and a pattern that
+    matches a directory also matches everything beneath it.
+    """
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "*":
+            if pattern[i : i + 2] == "**":
+                if pattern[i : i + 3] == "**/":
+                    regex += "(?:.*/)?"
+                    i += 3
+                else:
+                    regex += ".*"
+                    i += 2
+                continue
+            regex += "[^/]*"
+        elif c == "?":
+            regex += "[^/]"
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(c)
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("^") or body.startswith("!"):
+                    body = "^" + body[1:]
+                regex += f"[{body}]"
+                i = end
+        elif c == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(c)
+        i += 1
+    return re.compile(f"^{regex}(?:/.*)?$")
+
+
+class DockerIgnore:
+    """Matcher for the patterns in a `.dockerignore` file.
+
+    Rules are evaluated in order and the last matching rule wins, so `!`
+    exceptions can re-include files excluded by an earlier pattern.
+    """
+
+    def __init__(self, patterns: List[str]) -> None:
+        self._rules: List[Tuple[Pattern[str], bool]] = []
+        for raw in patterns:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            exclude = True
+            if pattern.startswith("!"):
+                exclude = False
+                pattern = pattern[1:].strip()
+            pattern = os.path.normpath(pattern).replace(os.sep, "/").lstrip("/")
+            if pattern in ("", "."):
+                continue
+            self._rules.append((_translate_pattern(pattern), exclude))
+        self.has_exceptions = any(not exclude for _, exclude in self._rules)
+
+    @classmethod
+    def from_dir(cls, root: str) -> "DockerIgnore":
+        """Load the `.dockerignore` file at the root of a directory, if any."""
+        path = os.path.join(root, _DOCKERIGNORE_NAME)
+        if not os.path.isfile(path):
+            return cls([])
+        with open(path) as f:
+            return cls(f.read().splitlines())
+
+    def ignored(self, relpath: str) -> bool:
+        """Return whether a `/`-separated path relative to the root is ignored."""
+        ignored = False
+        for regex, exclude in self._rules:
+            if regex.match(relpath):
+                ignored = exclude
+        return ignored
+
+
+def _walk(
+    root: str, ignore: DockerIgnore, keep: FrozenSet[str] = frozenset()
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Yield `(relpath, entry)` for every entry below root not ignored.
+
+    Paths in `keep` are yielded even if they're ignored.
+    """
+    stack = [""]
+    while stack:
+        reldir = stack.pop()
+        with os.scandir(os.path.join(root, reldir)) as it:
+            for entry in it:
+                if entry.name in _ALWAYS_IGNORED:
+                    continue
+                relpath = f"{reldir}/{entry.name}" if reldir else entry.name
+                ignored = relpath not in keep and ignore.ignored(relpath)
+                if entry.is_dir(follow_symlinks=False):
+                    # An excluded directory may still contain re-included files.
+                    if ignored and not ignore.has_exceptions:
+                        continue
+                    if not ignored:
+                        yield relpath, entry
+                    stack.append(relpath)
+                elif not ignored:
+                    yield relpath, entry
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Place a file at dst sharing src's data when possible.
+
+    Hard links are attempted first. When the destination is on another
+    filesystem, `shutil.copy2` is used, which goes through the kernel's copy
+    offload (and reflinks on filesystems that support it).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def stage_build_context(
+    src: str,
+    dst: str,
+    always_include: Iterable[str] = (),
+) -> None:
+    """Stage the contents of src into dst.
+
+    Files matched by `src/.dockerignore` are skipped, except for the
+    `.dockerignore` itself, which Docker always sends. Staged files may be
+    hard links to the originals, so callers must replace rather than modify
+    files in dst (see `replace_file`).
+
+    Arguments:
+        src: The directory to stage.
+        dst: The destination directory; created if it does not exist.
+        always_include: Paths relative to src to stage even if they're
+            matched by `.dockerignore`, such as the Dockerfile.
+    """
+    ignore = DockerIgnore.from_dir(src)
+    os.makedirs(dst, exist_ok=True)
+    created_dirs = {""}
+    keep = frozenset([_DOCKERIGNORE_NAME, *always_include])
+    staged = 0
+    for relpath, entry in _walk(src, ignore, keep):
+        src_path = entry.path
+        dst_path = os.path.join(dst, relpath)
+        parent = os.path.dirname(relpath)
+        if parent not in created_dirs:
+            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            created_dirs.add(parent)
+        if entry.is_symlink():
+            if os.path.lexists(dst_path):
+                os.remove(dst_path)
+            os.symlink(os.readlink(src_path), dst_path)
+            staged += 1
+        elif entry.is_dir(follow_symlinks=False):
+            os.makedirs(dst_path, exist_ok=True)
+            created_dirs.add(relpath)
+        else:
+            if os.path.lexists(dst_path):
+                os.remove(dst_path)
+            _link_or_copy(src_path, dst_path)
+            staged += 1
+    _logger.debug(f"Staged build context from {src}: {staged} entries")
+
+
+def replace_file(path: str, contents: str) -> None:
+    """Write contents to path without modifying a file it may be linked to."""
+    if os.path.lexists(path):
+        os.remove(path)
+    with open(path, "w") as f:
+        f.write(contents)
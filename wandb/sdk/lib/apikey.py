@@ -19,7 +19,6 @@ import click
 from requests.utils import NETRC_FILES, get_netrc_auth
 
 import wandb
-from wandb.apis import InternalApi
 from wandb.errors import term
 from wandb.util import _is_databricks, isatty, prompt_choices
 
@@ -40,6 +39,7 @@ LOGIN_CHOICES = [
 Mode = Literal["allow", "must", "never", "false", "true"]
 
 if TYPE_CHECKING:
+    from wandb.apis import InternalApi
     from wandb.sdk.wandb_settings import Settings
 
 
@@ -75,7 +75,7 @@ def get_netrc_file_path() -> str:
 
 def prompt_api_key(  # noqa: C901
     settings: "Settings",
-    api: Optional[InternalApi] = None,
+    api: Optional["InternalApi"] = None,
     input_callback: Optional[Callable] = None,
     browser_callback: Optional[Callable] = None,
     no_offline: bool = False,
@@ -89,6 +89,8 @@ def prompt_api_key(  # noqa: C901
         None - if dryrun is selected
         False - if unconfigured (notty)
     """
+    from wandb.apis import InternalApi
+
     input_callback = input_callback or getpass
     log_string = term.LOG_STRING
     api = api or InternalApi(settings)
@@ -241,6 +243,8 @@ def write_key(
     if not key:
         raise ValueError("No API key specified.")
 
+    from wandb.apis import InternalApi
+
     # TODO(jhr): api shouldn't be optional or it shouldn't be passed, clean up callers
     api = api or InternalApi()
 
@@ -0,0 +1,237 @@
+"""Download many files concurrently, e.g. all the files saved by a run."""
+
+import concurrent.futures
+import json
+import logging
+import os
+import threading
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import requests
+
+from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
+from wandb.sdk.lib import filesystem, hashutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+CHUNK_SIZE = 1024 * 1024
+MANIFEST_NAME = ".wandb-download-manifest.jsonl"
+
+
+class RemoteFile(NamedTuple):
+    """A file to download, with its path relative to the download root."""
+
+    name: str
+    url: str
+    md5: Optional[str] = None
+
+
+class DownloadResult(NamedTuple):
+    name: str
+    path: str
+    # False if the local file was already up to date
+    downloaded: bool
+    error: Optional[Exception] = None
+
+
+class FileDownloader:
+    """Download files in a bounded thread pool.
+
+    Files whose local copy already has the expected MD5 are skipped. Each file
+    is streamed to a temporary file next to its destination and moved into
+    place once complete, so an interrupted download never leaves a truncated
+    file behind.
+
+    Completed files are recorded in a manifest in the download root, along with
+    their size and modification time. If a download is interrupted, running it
+    again skips the recorded files without hashing them. The manifest is
+    removed once every file has been downloaded.
+    """
+
+    def __init__(
+        self,
+        download_fn: Callable[[str], Tuple[int, requests.Response]],
+        root: str = ".",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        replace: bool = True,
+    ) -> None:
+        """Initialize the downloader.
+
+        Arguments:
+            download_fn: Starts a streaming download of a url, returning the
+                content length and the response, like
+                `InternalApi.download_file`.
+            root: The directory to download files into.
+            max_workers: The maximum number of concurrent downloads.
+            replace: Whether to replace existing files that differ from the
+                remote ones.
+        """
+        self._download_fn = download_fn
+        self._root = root
+        self._max_workers = max_workers
+        self._replace = replace
+        self._manifest_path = os.path.join(root, MANIFEST_NAME)
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._manifest_file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    def download(
+        self,
+        files: Iterable[RemoteFile],
+        callback: Optional[Callable[[DownloadResult], None]] = None,
+    ) -> List[DownloadResult]:
+        """Download files, calling `callback` in this thread as each one finishes.
+
+        Errors are reported in the results instead of being raised, so that one
+        failed file doesn't stop the others.
+        """
+        self._manifest = self._load_manifest()
+        filesystem.mkdir_exists_ok(self._root)
+        results: List[DownloadResult] = []
+
+        def finished(future: "concurrent.futures.Future[DownloadResult]") -> None:
+            result = future.result()
+            results.append(result)
+            if callback is not None:
+                callback(result)
+
+        # Requests made by the worker threads should use this thread's settings.
+        download_file = _with_thread_local_api_settings(
+            self._download_file,
+            api_key=_thread_local_api_settings.api_key,
+            cookies=_thread_local_api_settings.cookies,
+            headers=_thread_local_api_settings.headers,
+        )
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(self._max_workers) as executor:
+                active_futures: Set[concurrent.futures.Future[DownloadResult]] = set()
+                for file in files:
+                    active_futures.add(executor.submit(download_file, file))
+                    # Don't queue up more files than the workers can keep up with.
+                    if len(active_futures) > 2 * self._max_workers:
+                        done, active_futures = concurrent.futures.wait(
+                            active_futures,
+                            return_when=concurrent.futures.FIRST_COMPLETED,
+                        )
+                        for future in done:
+                            finished(future)
+                for future in concurrent.futures.as_completed(active_futures):
+                    finished(future)
+        finally:
+            if self._manifest_file is not None:
+                self._manifest_file.close()
+                self._manifest_file = None
+
+        if all(result.error is None for result in results):
+            try:
+                os.remove(self._manifest_path)
+            except FileNotFoundError:
+                pass
+        return results
+
+    def _download_file(self, file: RemoteFile) -> DownloadResult:
+        path = os.path.join(self._root, file.name)
+        try:
+            if self._is_current(file, path):
+                return DownloadResult(file.name, path, downloaded=False)
+
+            _, response = self._download_fn(file.url)
+            filesystem.mkdir_exists_ok(os.path.dirname(path) or ".")
+            tmp_path = f"{path}.part"
+            md5 = hashutil._md5()
+            try:
+                with open(tmp_path, "wb") as f:
+                    for data in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(data)
+                        md5.update(data)
+                os.replace(tmp_path, path)
+            finally:
+                response.close()
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            digest = hashutil._b64_from_hasher(md5)
+            hashutil.remember_md5(path, digest, written=True)
+            self._record(file.name, path, digest)
+            return DownloadResult(file.name, path, downloaded=True)
+        except Exception as e:
+            logger.exception(f"Failed to download {file.name}")
+            return DownloadResult(file.name, path, downloaded=False, error=e)
+
+    def _is_current(self, file: RemoteFile, path: str) -> bool:
+        """Return whether the local file doesn't need to be downloaded."""
+        if not os.path.isfile(path):
+            return False
+        if not self._replace:
+            return True
+        if not file.md5:
+            return False
+
+        entry = self._manifest.get(file.name)
+        if entry is not None and entry["md5"] == file.md5:
+            stat = os.stat(path)
+            if (stat.st_size, stat.st_mtime_ns) == (entry["size"], entry["mtime_ns"]):
+                return True
+
+        if hashutil.md5_file_b64(path) != file.md5:
+            return False
+        self._record(file.name, path, file.md5)
+        return True
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        manifest: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self._manifest_path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # the last line is incomplete if we were interrupted
+                        continue
+                    manifest[entry["name"]] = entry
+        except FileNotFoundError:
+            pass
+        return manifest
+
+    def _record(self, name: str, path: str, md5: str) -> None:
+        stat = os.stat(path)
+        entry = {
+            "name": name,
+            "md5": md5,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        with self._lock:
+            if self._manifest_file is None:
+                self._manifest_file = open(self._manifest_path, "a")
+            self._manifest_file.write(json.dumps(entry) + "\n")
+            self._manifest_file.flush()
+
+
+def _with_thread_local_api_settings(
+    fn: Callable[[RemoteFile], DownloadResult],
+    api_key: Optional[str],
+    cookies: Optional[Dict],
+    headers: Optional[Dict],
+) -> Callable[[RemoteFile], DownloadResult]:
+    def wrapper(file: RemoteFile) -> DownloadResult:
+        _thread_local_api_settings.api_key = api_key
+        _thread_local_api_settings.cookies = cookies
+        # copied because requests may add headers to it
+        _thread_local_api_settings.headers = dict(headers) if headers else headers
+        return fn(file)
+
+    return wrapper
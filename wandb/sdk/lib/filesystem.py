@@ -6,6 +6,7 @@ import os
 import platform
 import re
 import shutil
+import stat
 import tempfile
 import threading
 from pathlib import Path
@@ -342,6 +343,38 @@ def reflink(existing_path: StrPath, new_path: StrPath, overwrite: bool = False)
         raise
 
 
+def link_or_copy(source_path: StrPath, target_path: StrPath) -> None:
+    """Put a copy of `source_path` at `target_path` without copying data if possible.
+
+    Uses a reflink where the filesystem supports them. Otherwise, a read-only
+    source is hard linked, since nothing can change it under the link. Other
+    files are copied. Like `shutil.copy`, an existing target is overwritten,
+    and `shutil.SameFileError` is raised if both paths are the same file.
+    """
+    if os.path.exists(target_path):
+        if os.path.samefile(source_path, target_path):
+            raise shutil.SameFileError(
+                f"{source_path!s} and {target_path!s} are the same file"
+            )
+        os.remove(target_path)
+
+    try:
+        reflink(source_path, target_path)
+        return
+    except (OSError, ValueError):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(target_path)
+
+    if not os.stat(source_path).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH):
+        try:
+            os.link(source_path, target_path)
+            return
+        except OSError:
+            pass
+
+    shutil.copy(source_path, target_path)
+
+
 def check_exists(path: StrPath) -> Optional[StrPath]:
     """Look for variations of `path` and return the first found.
 
@@ -1,16 +1,23 @@
 """A simple GraphQL client for sending queries and mutations.
 
 Note: This was originally wandb/vendor/gql-0.2.0/wandb_gql/transport/requests.py
-The only substantial change is to re-use a requests.Session object.
+The only substantial change is to re-use a requests.Session object, whose
+connections come from the process-wide pool in `shared_transport`.
 """
 
 from typing import Any, Callable, Dict, Optional, Tuple, Union
 
-import requests
-from wandb_gql.transport.http import HTTPTransport
-from wandb_graphql.execution import ExecutionResult
-from wandb_graphql.language import ast
-from wandb_graphql.language.printer import print_ast
+from wandb import util
+from wandb.sdk.lib import shared_transport
+
+reset_path = util.vendor_setup()
+
+from wandb_gql.transport.http import HTTPTransport  # noqa: E402
+from wandb_graphql.execution import ExecutionResult  # noqa: E402
+from wandb_graphql.language import ast  # noqa: E402
+from wandb_graphql.language.printer import print_ast  # noqa: E402
+
+reset_path()
 
 
 class GraphQLSession(HTTPTransport):
@@ -32,7 +39,7 @@ class GraphQLSession(HTTPTransport):
             timeout (int, float): Specifies a default timeout for requests (Default: None)
         """
         super().__init__(url, **kwargs)
-        self.session = requests.Session()
+        self.session = shared_transport.new_session()
         if proxies:
             self.session.proxies.update(proxies)
         self.session.auth = auth
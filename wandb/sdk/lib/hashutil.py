@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import base64
+import collections
 import hashlib
 import mmap
+import os
 import sys
-from typing import TYPE_CHECKING, NewType
+import threading
+import time
+from typing import TYPE_CHECKING, NewType, OrderedDict, Tuple
 
 from wandb.sdk.lib.paths import StrPath
 
@@ -44,6 +48,10 @@ def hex_to_b64_id(encoded_string: str | bytes) -> B64MD5:
 
 
 def md5_file_b64(*paths: StrPath) -> B64MD5:
+    if len(paths) == 1:
+        known = recall_md5(paths[0])
+        if known is not None:
+            return known
     return _b64_from_hasher(_md5_file_hasher(*paths))
 
 
@@ -82,3 +90,109 @@ def _md5_file_hasher(*paths: StrPath) -> _hashlib.HASH:
                 pass
 
     return md5_hash
+
+
+_BLOCKSIZE: int = 1_024 * _KB
+"""Block size (in bytes) for hashing a file with several hashers at once."""
+
+
+def sha256_md5_file(path: StrPath, written: bool = False) -> tuple[str, B64MD5, int]:
+    """Hash a file in fixed-size blocks; return its hex SHA-256, MD5 and size.
+
+    Both digests are computed from a single read of the file, and the MD5 is
+    remembered so that adding the unchanged file to an artifact doesn't hash
+    it again. See `remember_md5` for the meaning of `written`.
+    """
+    sha256_hash = hashlib.sha256()
+    md5_hash = _md5()
+    size = 0
+    buf = bytearray(_BLOCKSIZE)
+    view = memoryview(buf)
+    with open(path, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            sha256_hash.update(view[:n])
+            md5_hash.update(view[:n])
+            size += n
+    md5 = _b64_from_hasher(md5_hash)
+    remember_md5(path, md5, written=written)
+    return sha256_hash.hexdigest(), md5, size
+
+
+def copy_md5_file(source_path: StrPath, target_path: StrPath) -> B64MD5:
+    """Copy a file and return the MD5 of what was copied.
+
+    The file is hashed as it is copied, so its data is only read once. The MD5
+    is remembered for the copy, not the source, since the source may change.
+    """
+    md5_hash = _md5()
+    with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        # Small files are common; don't allocate a whole block for them.
+        size = os.fstat(src.fileno()).st_size
+        buf = bytearray(max(1, min(size + 1, _BLOCKSIZE)))
+        view = memoryview(buf)
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            md5_hash.update(view[:n])
+            dst.write(view[:n])
+    md5 = _b64_from_hasher(md5_hash)
+    remember_md5(target_path, md5, written=True)
+    return md5
+
+
+_FileKey = Tuple[int, int, int, int]
+
+_MAX_KNOWN_MD5S = 4_096
+_known_md5s: OrderedDict[str, tuple[_FileKey, B64MD5]] = collections.OrderedDict()
+_known_md5s_lock = threading.Lock()
+
+_RACY_WINDOW_NS: int = 2_000_000_000
+"""How recently a file may have been modified for its MD5 not to be remembered.
+
+A write within the filesystem's timestamp granularity of the hash leaves the
+file's size and mtime unchanged, so the remembered MD5 would be stale.
+"""
+
+
+def _file_key(path: StrPath) -> _FileKey:
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def remember_md5(path: StrPath, digest: B64MD5, written: bool = False) -> None:
+    """Record the MD5 of a file as it is now, for `md5_file_b64` to reuse.
+
+    The digest is forgotten once the file is replaced or modified. Unless
+    `written` says that wandb itself just wrote the file, it isn't remembered
+    at all if the file was modified too recently to tell a later write of the
+    same size apart by its mtime.
+    """
+    try:
+        key = _file_key(path)
+    except OSError:
+        return
+    if not written and key[3] > time.time_ns() - _RACY_WINDOW_NS:
+        return
+    with _known_md5s_lock:
+        _known_md5s[os.fspath(path)] = (key, digest)
+        _known_md5s.move_to_end(os.fspath(path))
+        while len(_known_md5s) > _MAX_KNOWN_MD5S:
+            _known_md5s.popitem(last=False)
+
+
+def recall_md5(path: StrPath) -> B64MD5 | None:
+    """Return the remembered MD5 of a file, if it hasn't changed since."""
+    with _known_md5s_lock:
+        known = _known_md5s.get(os.fspath(path))
+    if known is None:
+        return None
+    try:
+        if _file_key(path) == known[0]:
+            return known[1]
+    except OSError:
+        pass
+    return None
@@ -0,0 +1,198 @@
+"""On-disk cache for GraphQL schema introspection results.
+
+The SDK probes the server's GraphQL schema with `__type` introspection queries
+to decide which fields and mutations it may use. The schema only changes when
+the server is upgraded, so the results are cached on disk per base URL and
+shared by every process talking to that server.
+
+Cached results are only used once the server's version has been checked
+in this process within the last `VERSION_CHECK_INTERVAL` seconds, so results
+from before a server upgrade are never trusted. They are dropped when the
+server reports a different version than the one they were recorded against
+(a server that reports no version leaves them alone), when they are older than the TTL, or when the server rejects a query with a
+schema validation error. Servers that don't report a version keep results for
+at most `UNVERSIONED_TTL` seconds.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from wandb import env
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+
+# How long a check of the server's version is trusted for.
+VERSION_CHECK_INTERVAL = 600
+
+# How long results are kept for servers that don't report their version.
+UNVERSIONED_TTL = 600
+
+# Messages returned by GraphQL servers when a query does not match the schema.
+_SCHEMA_MISMATCH_RE = re.compile(
+    r"Cannot query field|Unknown argument|Unknown type|Unknown field"
+    r"|is not defined by type|Field \"[^\"]*\" argument \"[^\"]*\" of type"
+)
+
+
+def is_schema_mismatch(message: str) -> bool:
+    """Return whether an error message indicates a stale view of the schema."""
+    return bool(_SCHEMA_MISMATCH_RE.search(message))
+
+
+class IntrospectionCache:
+    """Introspection results for a single server, persisted to a JSON file.
+
+    Results are keyed by a hash of the query string. The file is re-read on
+    every cache miss so that results written by other processes are picked up.
+    """
+
+    def __init__(self, base_url: str, path: str, ttl: int) -> None:
+        self._base_url = base_url
+        self._path = path
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._server_version: Optional[str] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # When this process last checked the server's version.
+        self._version_checked_at: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @property
+    def needs_version_check(self) -> bool:
+        """Whether the server's version must be checked before using results."""
+        checked_at = self._version_checked_at
+        return self.enabled and (
+            checked_at is None or time.time() - checked_at >= VERSION_CHECK_INTERVAL
+        )
+
+    @staticmethod
+    def _key(query_string: str) -> str:
+        normalized = " ".join(query_string.split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _CACHE_VERSION or data.get("base_url") != (
+            self._base_url
+        ):
+            return
+        self._server_version = data.get("server_version")
+        self._entries = data.get("entries", {})
+
+    def _save(self) -> None:
+        data = {
+            "version": _CACHE_VERSION,
+            "base_url": self._base_url,
+            "server_version": self._server_version,
+            "entries": self._entries,
+        }
+        dirname = os.path.dirname(self._path)
+        try:
+            os.makedirs(dirname, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=dirname)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Unable to write introspection cache {self._path}: {e}")
+
+    def _fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        ttl = self._ttl
+        if self._server_version is None:
+            ttl = min(ttl, UNVERSIONED_TTL)
+        return entry is not None and time.time() - entry["time"] < ttl
+
+    def get(self, query_string: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result of an introspection query, if fresh.
+
+        Nothing is returned until the server's version has been checked with
+        `set_server_version`.
+        """
+        if self.needs_version_check:
+            return None
+        key = self._key(query_string)
+        with self._lock:
+            entry = self._entries.get(key)
+            if not self._fresh(entry):
+                self._load()
+                entry = self._entries.get(key)
+            if not self._fresh(entry):
+                return None
+            assert entry is not None
+            return entry["result"]
+
+    def set(self, query_string: str, result: Dict[str, Any]) -> None:
+        """Record the result of an introspection query."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._load()
+            self._entries[self._key(query_string)] = {
+                "time": time.time(),
+                "result": result,
+            }
+            self._save()
+
+    def set_server_version(self, server_version: Optional[str]) -> None:
+        """Record the server's version, dropping results from other versions.
+
+        A version of None means the server doesn't report one. It doesn't drop
+        results recorded against a version the server did report.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._version_checked_at = time.time()
+            self._load()
+            if server_version is None or self._server_version == server_version:
+                return
+            if self._server_version is not None:
+                logger.info(
+                    f"Server version changed from {self._server_version} to "
+                    f"{server_version}, invalidating introspection cache"
+                )
+            self._server_version = server_version
+            self._entries = {}
+            self._save()
+
+    def invalidate(self) -> None:
+        """Drop every cached result for this server."""
+        with self._lock:
+            self._entries = {}
+            if os.path.exists(self._path):
+                self._save()
+
+
+_caches: Dict[str, IntrospectionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(base_url: str) -> IntrospectionCache:
+    """Return the process-wide introspection cache for a server."""
+    base_url = base_url.rstrip("/")
+    ttl = env.get_introspection_cache_ttl()
+    cache_dir = env.get_cache_dir() / "introspection"
+    key = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:32]
+    path = str(cache_dir / f"{key}.json")
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None or cache._ttl != ttl:
+            cache = IntrospectionCache(base_url, path, ttl)
+            _caches[path] = cache
+        return cache
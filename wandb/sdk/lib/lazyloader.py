@@ -3,6 +3,7 @@
 import importlib
 import sys
 import types
+from typing import Any, Callable, Dict, List, Union
 
 
 class LazyLoader(types.ModuleType):
@@ -61,3 +62,59 @@ class LazyLoader(types.ModuleType):
         # print("dir")
         module = self._load()
         return dir(module)
+
+
+class LazyAttributes:
+    """Serve a module's attributes lazily, from a module-level `__getattr__`.
+
+    `attributes` maps each name to `"module:attribute"`, to `"module"` to serve
+    a whole module, or to a function that creates the value. A value is created
+    the first time it is looked up and stored in the module's globals, so
+    `__getattr__` is only consulted once per name. Other names are imported as
+    submodules of the module, so that `wandb.apis` and the like keep working
+    without being imported first.
+
+    Usage:
+
+    ```python
+    _lazy = LazyAttributes(globals(), {"Image": "wandb.data_types:Image"})
+    __getattr__ = _lazy.getattr
+    __dir__ = _lazy.dir
+    ```
+    """
+
+    def __init__(
+        self,
+        module_globals: Dict[str, Any],
+        attributes: Dict[str, Union[str, Callable[[], Any]]],
+    ) -> None:
+        self._module_globals = module_globals
+        self._module_name = module_globals["__name__"]
+        self._attributes = attributes
+
+    def getattr(self, name: str) -> Any:
+        spec = self._attributes.get(name)
+        if spec is None:
+            value = self._import_submodule(name)
+        elif callable(spec):
+            value = spec()
+        else:
+            module_name, _, attr = spec.partition(":")
+            value = importlib.import_module(module_name)
+            if attr:
+                value = getattr(value, attr)
+        # Another thread may have set the attribute in the meantime.
+        return self._module_globals.setdefault(name, value)
+
+    def _import_submodule(self, name: str) -> types.ModuleType:
+        submodule_name = f"{self._module_name}.{name}"
+        if not name.startswith("__"):
+            try:
+                return importlib.import_module(submodule_name)
+            except ModuleNotFoundError as e:
+                if e.name != submodule_name:
+                    raise
+        raise AttributeError(f"module {self._module_name!r} has no attribute {name!r}")
+
+    def dir(self) -> List[str]:
+        return sorted(set(self._module_globals) | set(self._attributes))
@@ -0,0 +1,349 @@
+"""Opt-in on-disk cache for public API GraphQL query results.
+
+Notebooks and dashboards tend to ask the public API for the same runs and
+artifacts over and over. When enabled, query results are stored on disk under
+the wandb cache dir, one file per query and variables, per server and
+credentials. The total size of the cache is bounded; the least recently used
+results are evicted first.
+
+How long a result is kept depends on what it describes:
+
+- Queries about a single run that has finished are kept indefinitely.
+- Other run queries are kept for a short time. Once they expire, the run's
+  heartbeat time is fetched with a small query, and if it didn't change the
+  cached result is used again instead of fetching it anew. GraphQL responses
+  have no ETags, so this is the closest thing to a conditional request.
+- Results with signed download URLs are never kept for longer than the URLs
+  are likely to stay valid.
+
+Any mutation drops every cached result for the server, since it may change
+objects the cache knows about.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from wandb import env
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+# Seconds to keep results for each kind of query.
+DEFAULT_TTLS: Dict[str, int] = {
+    "run": 60,
+    "artifact": 600,
+    "signed_url": 600,
+    "default": 300,
+}
+
+# Results of these queries are expected to change while they are polled.
+_UNCACHED_OPERATIONS = {"RunState", "ServerInfo"}
+
+# Runs in these states don't change anymore.
+_FINISHED_RUN_STATES = {"finished", "failed", "killed"}
+
+# Names of the variable holding the run name in single-run queries.
+_RUN_NAME_VARIABLES = ("name", "run", "runName")
+
+RunKey = Tuple[str, str, str]
+
+# Returns the heartbeat time and state of a run, or None if it can't be found.
+RunValidatorFn = Callable[[RunKey], Optional[Tuple[str, str]]]
+
+
+def _query_kind(operation_name: str) -> str:
+    if operation_name.startswith("Run") or operation_name.endswith("HistoryPage"):
+        return "run"
+    if "Artifact" in operation_name:
+        return "artifact"
+    return "default"
+
+
+def _walk(value: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every dict nested in a query result."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            yield value
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+class QueryCache:
+    """Query results for a single server and set of credentials.
+
+    Each result is a JSON file in `path`. Files are replaced atomically, so
+    several processes can share a cache.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttls: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        self._path = path
+        self._max_size = max_size
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        # What we've seen of runs in query results, used to decide how long
+        # to keep results about them.
+        self._finished_runs: set = set()
+        self._heartbeats: Dict[RunKey, str] = {}
+        self._stats = {"hits": 0, "misses": 0, "revalidations": 0, "evictions": 0}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss, revalidation and eviction counts, and the size."""
+        with self._lock:
+            return {**self._stats, "size": self._current_size()}
+
+    def execute(
+        self,
+        operation_name: str,
+        query_string: str,
+        variables: Optional[Mapping[str, Any]],
+        fetch: Callable[[], Dict[str, Any]],
+        validate_run: Optional[RunValidatorFn] = None,
+    ) -> Dict[str, Any]:
+        """Return the result of a query, calling `fetch` unless it is cached.
+
+        Arguments:
+            operation_name: The name of the query operation.
+            query_string: The query, which is part of the cache key.
+            variables: The query variables, which are part of the cache key.
+            fetch: Sends the query to the server.
+            validate_run: Fetches the heartbeat time and state of a run, to
+                revalidate expired results about it.
+        """
+        if operation_name in _UNCACHED_OPERATIONS:
+            return fetch()
+        variables = variables or {}
+        kind = _query_kind(operation_name)
+        run = self._run_key(variables) if kind == "run" else None
+        entry_path = os.path.join(self._path, self._key(query_string, variables))
+
+        entry = self._read(entry_path)
+        if entry is not None:
+            if entry["expires"] is None or time.time() < entry["expires"]:
+                self._hit(entry_path, "hits")
+                return entry["result"]
+            if self._revalidate(entry, run, validate_run):
+                self._write(entry_path, entry)
+                self._hit(entry_path, "revalidations")
+                return entry["result"]
+
+        with self._lock:
+            self._stats["misses"] += 1
+        result = fetch()
+        if kind == "run":
+            self._observe_runs(result, variables)
+        self._write(
+            entry_path,
+            {
+                "version": _CACHE_VERSION,
+                "expires": self._expires(kind, run, result),
+                "run": run,
+                "heartbeat": self._heartbeats.get(run) if run else None,
+                "result": result,
+            },
+        )
+        return result
+
+    def invalidate(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            for name in self._entry_names():
+                try:
+                    os.remove(os.path.join(self._path, name))
+                except OSError:
+                    pass
+            self._size = 0
+
+    @staticmethod
+    def _key(query_string: str, variables: Mapping[str, Any]) -> str:
+        normalized = " ".join(query_string.split())
+        payload = json.dumps(variables, sort_keys=True, default=str)
+        digest = hashlib.sha256(f"{normalized}\0{payload}".encode())
+        return digest.hexdigest() + ".json"
+
+    @staticmethod
+    def _run_key(variables: Mapping[str, Any]) -> Optional[RunKey]:
+        for name in _RUN_NAME_VARIABLES:
+            if variables.get(name) and variables.get("project"):
+                return (
+                    variables.get("entity") or "",
+                    variables["project"],
+                    variables[name],
+                )
+        return None
+
+    def _observe_runs(self, result: Any, variables: Mapping[str, Any]) -> None:
+        run = self._run_key(variables)
+        for node in _walk(result):
+            if "state" not in node and "heartbeatAt" not in node:
+                continue
+            if node.get("name"):
+                key: Optional[RunKey] = (
+                    variables.get("entity") or "",
+                    variables.get("project") or "",
+                    node["name"],
+                )
+            else:
+                key = run
+            if key is None:
+                continue
+            if node.get("state") in _FINISHED_RUN_STATES:
+                self._finished_runs.add(key)
+            if node.get("heartbeatAt"):
+                self._heartbeats[key] = node["heartbeatAt"]
+
+    def _expires(
+        self, kind: str, run: Optional[RunKey], result: Dict[str, Any]
+    ) -> Optional[float]:
+        signed_urls = any("directUrl" in node for node in _walk(result))
+        if run in self._finished_runs and not signed_urls:
+            return None
+        ttl = self._ttls[kind]
+        if signed_urls:
+            ttl = min(ttl, self._ttls["signed_url"])
+        return time.time() + ttl
+
+    def _revalidate(
+        self,
+        entry: Dict[str, Any],
+        run: Optional[RunKey],
+        validate_run: Optional[RunValidatorFn],
+    ) -> bool:
+        """Extend an expired entry about a run whose heartbeat didn't change."""
+        if run is None or validate_run is None or not entry.get("heartbeat"):
+            return False
+        validator = validate_run(run)
+        if validator is None:
+            return False
+        heartbeat, state = validator
+        if heartbeat != entry["heartbeat"]:
+            return False
+        self._heartbeats[run] = heartbeat
+        if state in _FINISHED_RUN_STATES:
+            self._finished_runs.add(run)
+        entry["expires"] = self._expires("run", run, entry["result"])
+        return True
+
+    def _hit(self, entry_path: str, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+        # The modification time orders entries for eviction.
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+    def _read(self, entry_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(entry_path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != _CACHE_VERSION:
+            return None
+        if entry.get("run") is not None:
+            entry["run"] = tuple(entry["run"])
+        return entry
+
+    def _write(self, entry_path: str, entry: Dict[str, Any]) -> None:
+        try:
+            data = json.dumps(entry)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Unable to cache query result: {e}")
+            return
+        with self._lock:
+            size = self._current_size()
+            try:
+                size -= os.path.getsize(entry_path)
+            except OSError:
+                pass
+            try:
+                os.makedirs(self._path, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, entry_path)
+            except OSError as e:
+                logger.debug(f"Unable to write query cache {self._path}: {e}")
+                return
+            self._size = size + len(data)
+            if self._size > self._max_size:
+                self._evict()
+
+    def _entry_names(self) -> Iterator[str]:
+        try:
+            names = os.listdir(self._path)
+        except OSError:
+            return iter(())
+        return (name for name in names if name.endswith(".json"))
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = 0
+            for name in self._entry_names():
+                try:
+                    self._size += os.path.getsize(os.path.join(self._path, name))
+                except OSError:
+                    pass
+        return self._size
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits."""
+        entries = []
+        for name in self._entry_names():
+            try:
+                stat = os.stat(os.path.join(self._path, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        entries.sort()
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, name in entries:
+            if size <= self._max_size:
+                break
+            try:
+                os.remove(os.path.join(self._path, name))
+            except OSError:
+                continue
+            size -= entry_size
+            self._stats["evictions"] += 1
+        self._size = size
+
+
+_caches: Dict[str, QueryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(base_url: str, credentials: str) -> QueryCache:
+    """Return the process-wide query cache for a server and credentials."""
+    base_url = base_url.rstrip("/")
+    max_size = env.get_query_cache_size()
+    key = hashlib.sha256(f"{base_url}\0{credentials}".encode())
+    path = str(env.get_cache_dir() / "queries" / key.hexdigest()[:32])
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None or cache._max_size != max_size:
+            cache = QueryCache(path, max_size)
+            _caches[path] = cache
+        return cache
@@ -17,42 +17,10 @@ import sys
 import threading
 import time
 from collections import defaultdict
+from typing import Dict, List, NamedTuple, Tuple
 
 import wandb
 
-
-class _Numpy:  # fallback in case numpy is not available
-    def where(self, x):
-        return ([i for i in range(len(x)) if x[i]],)
-
-    def diff(self, x):
-        return [x[i + 1] - x[i] for i in range(len(x) - 1)]
-
-    def arange(self, x):
-        class Arr(list):
-            def __getitem__(self, s):
-                if isinstance(s, slice):
-                    self._start = s.start
-                    return self
-                return super().__getitem__(s)
-
-            def __getslice__(self, i, j):
-                self._start = i
-                return self
-
-            def __iadd__(self, i):  # type: ignore
-                for j in range(self._start, len(self)):
-                    self[j] += i
-
-        return Arr(range(x))
-
-
-try:
-    import numpy as np  # type: ignore
-except ImportError:
-    np = _Numpy()  # type: ignore
-
-
 logger = logging.getLogger("wandb")
 
 _redirects = {"stdout": None, "stderr": None}
@@ -171,6 +139,143 @@ class Char:
 _defchar = Char()
 
 
+class _Style(NamedTuple):
+    """The colors and attributes of a character, as in `Char`."""
+
+    fg: str = ANSI_FG_DEFAULT
+    bg: str = ANSI_BG_DEFAULT
+    bold: bool = False
+    italics: bool = False
+    underscore: bool = False
+    blink: bool = False
+    strikethrough: bool = False
+    reverse: bool = False
+
+
+_DEFAULT_STYLE = _Style()
+
+
+def _char_style(char: Char) -> _Style:
+    return _Style(
+        char.fg,
+        char.bg,
+        char.bold,
+        char.italics,
+        char.underscore,
+        char.blink,
+        char.strikethrough,
+        char.reverse,
+    )
+
+
+def _style_codes(prev: _Style, style: _Style) -> str:
+    """Return the escape codes that switch from one style to another."""
+    if prev == style:
+        return ""
+    codes = []
+    if prev.fg != style.fg:
+        codes.append(_get_char(style.fg))
+    if prev.bg != style.bg:
+        codes.append(_get_char(style.bg))
+    for k in _Style._fields[2:]:
+        on = getattr(style, k)
+        if getattr(prev, k) != on:
+            codes.append(_get_char(ANSI_STYLES_REV[k if on else "/" + k]))
+    return "".join(codes)
+
+
+class _Line:
+    """A line of the terminal.
+
+    The text is a string, and its styles are run-length encoded as a list of
+    `(start, style)` pairs, each style applying up to the next start. A line
+    written entirely in the default style, which is most of them, has no runs
+    and is updated by string slicing alone. Positions that were never written
+    hold spaces in the default style, which are blank like in a terminal.
+    """
+
+    __slots__ = ("text", "runs")
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.runs: List[Tuple[int, _Style]] = []
+
+    def write(self, x: int, data: str, style: _Style) -> None:
+        text = self.text
+        if x > len(text):
+            if self.runs and self.runs[-1][1] != _DEFAULT_STYLE:
+                self.runs.append((len(text), _DEFAULT_STYLE))
+            text += " " * (x - len(text))
+        end = x + len(data)
+        self.text = text[:x] + data + text[end:]
+        if self.runs or style != _DEFAULT_STYLE:
+            self._set_style(x, end, style)
+
+    def erase(self, start: int, end: int) -> None:
+        end = min(end, len(self.text))
+        if start >= end:
+            return
+        self.text = self.text[:start] + " " * (end - start) + self.text[end:]
+        if self.runs:
+            self._set_style(start, end, _DEFAULT_STYLE)
+
+    def _style_at(self, x: int) -> _Style:
+        style = _DEFAULT_STYLE
+        for start, run_style in self.runs:
+            if start > x:
+                break
+            style = run_style
+        return style
+
+    def _set_style(self, start: int, end: int, style: _Style) -> None:
+        runs = self.runs or [(0, _DEFAULT_STYLE)]
+        style_after = self._style_at(end)
+        new_runs = [run for run in runs if run[0] < start]
+        new_runs.append((start, style))
+        if end < len(self.text):
+            new_runs.append((end, style_after))
+        new_runs.extend(run for run in runs if end < run[0] < len(self.text))
+
+        merged: List[Tuple[int, _Style]] = []
+        for run in new_runs:
+            if not merged or merged[-1][1] != run[1]:
+                merged.append(run)
+        if len(merged) == 1 and merged[0][1] == _DEFAULT_STYLE:
+            merged = []
+        self.runs = merged
+
+    def __len__(self) -> int:
+        """The length of the line, ignoring trailing blanks."""
+        if not self.runs:
+            return len(self.text.rstrip(" "))
+        end = len(self.text)
+        for start, style in reversed(self.runs):
+            if start < end:
+                if style != _DEFAULT_STYLE:
+                    return end
+                stripped = len(self.text[start:end].rstrip(" "))
+                if stripped:
+                    return start + stripped
+            end = start
+        return 0
+
+    def render(self) -> str:
+        """Return the line's text with the escape codes for its styles."""
+        length = len(self)
+        if not self.runs:
+            return self.text[:length]
+        out = []
+        prev = _DEFAULT_STYLE
+        for i, (start, style) in enumerate(self.runs):
+            if start >= length:
+                break
+            stop = self.runs[i + 1][0] if i + 1 < len(self.runs) else length
+            out.append(_style_codes(prev, style))
+            out.append(self.text[start : min(stop, length)])
+            prev = style
+        return "".join(out)
+
+
 class Cursor:
     """A 2D cursor.
 
@@ -193,13 +298,13 @@ class Cursor:
 class TerminalEmulator:
     """An FSM emulating a terminal.
 
-    Characters are stored in a 2D matrix (buffer) indexed by the cursor.
+    Lines are stored in a buffer indexed by the cursor's y-coordinate.
     """
 
     _MAX_LINES = 100
 
     def __init__(self):
-        self.buffer = defaultdict(lambda: defaultdict(lambda: _defchar))
+        self.buffer: Dict[int, _Line] = defaultdict(_Line)
         self.cursor = Cursor()
         self._num_lines = None  # Cache
 
@@ -239,16 +344,8 @@ class TerminalEmulator:
         self.carriage_return()
 
     def _get_line_len(self, n):
-        if n not in self.buffer:
-            return 0
-        line = self.buffer[n]
-        if not line:
-            return 0
-        n = max(line.keys())
-        for i in range(n, -1, -1):
-            if line[i] != _defchar:
-                return i + 1
-        return 0
+        line = self.buffer.get(n)
+        return len(line) if line is not None else 0
 
     @property
     def num_lines(self):
@@ -266,7 +363,7 @@ class TerminalEmulator:
 
     def display(self):
         return [
-            [self.buffer[i][j].data for j in range(self._get_line_len(i))]
+            list(self.buffer[i].text[: self._get_line_len(i)])
             for i in range(self.num_lines)
         ]
 
@@ -287,15 +384,11 @@ class TerminalEmulator:
     def erase_line(self, mode=0):
         curr_line = self.buffer[self.cursor.y]
         if mode == 0:
-            for i in range(self.cursor.x, self._get_line_len(self.cursor.y)):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(self.cursor.x, len(curr_line))
         elif mode == 1:
-            for i in range(self.cursor.x + 1):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(0, self.cursor.x + 1)
         else:
-            curr_line.clear()
+            del self.buffer[self.cursor.y]
 
     def insert_lines(self, n=1):
         for i in range(self.num_lines - 1, self.cursor.y, -1):
@@ -305,15 +398,18 @@ class TerminalEmulator:
                 del self.buffer[i]
 
     def _write_plain_text(self, plain_text):
-        self.buffer[self.cursor.y].update(
-            [
-                (self.cursor.x + i, self.cursor.char.copy(data=c))
-                for i, c in enumerate(plain_text)
-            ]
+        if not plain_text:
+            return
+        self.buffer[self.cursor.y].write(
+            self.cursor.x, plain_text, _char_style(self.cursor.char)
         )
         self.cursor.x += len(plain_text)
 
     def _write_text(self, text):
+        if text.isprintable():
+            # Fast path: no control characters.
+            self._write_plain_text(text)
+            return
         prev_end = 0
         for match in SEP_RE.finditer(text):
             start, end = match.span()
@@ -335,6 +431,10 @@ class TerminalEmulator:
 
     def write(self, data):
         self._num_lines = None  # invalidate cache
+        if "\033" not in data:
+            # Fast path: no escape sequences.
+            self._write_text(data)
+            return
         data = self._remove_osc(data)
         prev_end = 0
         for match in ANSI_CSI_RE.finditer(data):
@@ -398,53 +498,8 @@ class TerminalEmulator:
             pass
 
     def _get_line(self, n):
-        line = self.buffer[n]
-        line_len = self._get_line_len(n)
-        # We have to loop through each character in the line and check if foreground,
-        # background and other attributes (italics, bold, underline, etc) of the ith
-        # character are different from those of the (i-1)th character. If different, the
-        # appropriate ascii character for switching the color/attribute should be
-        # appended to the output string before appending the actual character. This loop
-        # and subsequent checks can be expensive, especially because 99% of terminal
-        # output use default colors and formatting. Even in outputs that do contain
-        # colors and styles, its unlikely that they will change on a per character
-        # basis.
-
-        # So instead we create a character list without any ascii codes (`out`), and a
-        # list of all the foregrounds in the line (`fgs`) on which we call np.diff() and
-        # np.where() to find the indices where the foreground change, and insert the
-        # ascii characters in the output list (`out`) on those indices. All of this is
-        # the done only if there are more than 1 foreground color in the line in the
-        # first place (`if len(set(fgs)) > 1 else None`). Same logic is repeated for
-        # background colors and other attributes.
-
-        out = [line[i].data for i in range(line_len)]
-
-        # for dynamic insert using original indices
-        idxs = np.arange(line_len)
-        insert = lambda i, c: (out.insert(idxs[i], c), idxs[i:].__iadd__(1))  # noqa
-
-        fgs = [int(_defchar.fg)] + [int(line[i].fg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].fg)) for i in np.where(np.diff(fgs))[0]
-        ] if len(set(fgs)) > 1 else None
-        bgs = [int(_defchar.bg)] + [int(line[i].bg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].bg)) for i in np.where(np.diff(bgs))[0]
-        ] if len(set(bgs)) > 1 else None
-        attrs = {
-            k: [False] + [line[i][k] for i in range(line_len)]
-            for k in Char.__slots__[3:]
-        }
-        [
-            [
-                insert(i, _get_char(ANSI_STYLES_REV[k if line[int(i)][k] else "/" + k]))
-                for i in np.where(np.diff(v))[0]
-            ]
-            for k, v in attrs.items()
-            if any(v)
-        ]
-        return "".join(out)
+        line = self.buffer.get(n)
+        return line.render() if line is not None else ""
 
     def read(self):
         num_lines = self.num_lines
@@ -477,9 +532,8 @@ class TerminalEmulator:
             shift = num_lines - self._MAX_LINES
             for i in range(shift, num_lines):
                 self.buffer[i - shift] = self.buffer[i]
-            for i in range(self._MAX_LINES, max(self.buffer.keys())):
-                if i in self.buffer:
-                    del self.buffer[i]
+            for i in [i for i in self.buffer if i >= self._MAX_LINES]:
+                del self.buffer[i]
             self.cursor.y -= min(self.cursor.y, shift)
             self._num_lines = num_lines = self._MAX_LINES
         self._prev_num_lines = num_lines
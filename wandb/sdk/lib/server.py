@@ -4,9 +4,9 @@ import json
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from wandb import util
-from wandb.apis import InternalApi
 
 if TYPE_CHECKING:
+    from wandb.apis import InternalApi
     from wandb.sdk.wandb_settings import Settings
 
 
@@ -17,10 +17,14 @@ class ServerError(Exception):
 class Server:
     def __init__(
         self,
-        api: Optional[InternalApi] = None,
+        api: Optional["InternalApi"] = None,
         settings: Optional["Settings"] = None,
     ) -> None:
-        self._api = api or InternalApi(default_settings=settings)
+        if api is None:
+            from wandb.apis import InternalApi
+
+            api = InternalApi(default_settings=settings)
+        self._api = api
         self._error_network: Optional[bool] = None
         self._viewer: Dict[str, Any] = {}
         self._flags: Dict[str, Any] = {}
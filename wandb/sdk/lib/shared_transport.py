@@ -0,0 +1,207 @@
+"""A process-wide HTTP connection pool shared by the SDK's network clients.
+
+The GraphQL client, the file stream and the file upload paths each hold their
+own `requests.Session` with its own auth, headers and retry policy. Giving
+each session its own connection pool means every one of them pays for its own
+TCP and TLS handshakes to the same hosts. Sessions created with `new_session`
+instead share a single urllib3 `PoolManager`, so keep-alive connections are
+reused across clients.
+
+The pool is sized with `WANDB_HTTP_POOL_CONNECTIONS` (number of hosts to keep
+pools for) and `WANDB_HTTP_POOL_MAXSIZE` (connections kept per host).
+`WANDB_HTTP_MAX_CONCURRENCY_PER_HOST` caps the number of in-flight requests
+to any single host; it is unlimited by default. A request holds its slot
+until its response headers arrive, so reading response bodies, including
+streamed ones, doesn't count towards the limit.
+
+Forked child processes get fresh pools, so they never share keep-alive
+connections with their parent.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+import requests.adapters
+import urllib3
+
+from wandb import env
+
+logger = logging.getLogger(__name__)
+
+
+class _SharedPoolAdapter(requests.adapters.HTTPAdapter):
+    """An HTTPAdapter whose connections come from a SharedTransport.
+
+    Each adapter keeps its own retry policy, but connection pools belong to
+    the transport and outlive any one session.
+    """
+
+    def __init__(
+        self,
+        transport: "SharedTransport",
+        max_retries: Union[int, urllib3.util.retry.Retry] = 0,
+    ) -> None:
+        self._transport = transport
+        super().__init__(
+            pool_connections=transport.pool_connections,
+            pool_maxsize=transport.pool_maxsize,
+            max_retries=max_retries,
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        # The pools belong to the transport, see `poolmanager`.
+        pass
+
+    @property
+    def poolmanager(self) -> urllib3.PoolManager:  # type: ignore[override]
+        # Looked up on each request so that sessions created before a fork
+        # use the child's pools.
+        return self._transport.poolmanager
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> Any:  # type: ignore[override]
+        with self._transport.limit(request.url or ""):
+            return super().send(request, **kwargs)
+
+    def close(self) -> None:
+        # The shared pools are closed with the transport, not the session.
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+
+
+class _HostLimit:
+    """Context manager that bounds concurrent requests to a single host."""
+
+    def __init__(self, semaphore: Optional[threading.BoundedSemaphore]) -> None:
+        self._semaphore = semaphore
+
+    def __enter__(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+    def __exit__(self, *args: Any) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class SharedTransport:
+    """Connection pools and per-host concurrency limits for one process."""
+
+    def __init__(
+        self,
+        pool_connections: int = 64,
+        pool_maxsize: int = 64,
+        max_concurrency_per_host: int = 0,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.poolmanager = urllib3.PoolManager(
+            num_pools=pool_connections, maxsize=pool_maxsize, block=False
+        )
+        self._lock = threading.Lock()
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+
+    def _reset_after_fork(self) -> None:
+        """Replace the pools and locks inherited from the parent process.
+
+        The parent's connections are dropped without being closed, since
+        closing them could affect the parent's use of them.
+        """
+        self.poolmanager = urllib3.PoolManager(
+            num_pools=self.pool_connections, maxsize=self.pool_maxsize, block=False
+        )
+        self._lock = threading.Lock()
+        self._host_limits = {}
+
+    def limit(self, url: str) -> _HostLimit:
+        """Return a context manager holding a request slot for url's host.
+
+        The slot is released when the response headers have arrived.
+        """
+        if self.max_concurrency_per_host <= 0:
+            return _HostLimit(None)
+        host = urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._host_limits.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_concurrency_per_host)
+                self._host_limits[host] = semaphore
+        return _HostLimit(semaphore)
+
+    def new_session(
+        self, max_retries: Union[int, urllib3.util.retry.Retry] = 0
+    ) -> requests.Session:
+        """Create a session that sends requests over the shared pools.
+
+        Arguments:
+            max_retries: The urllib3 retry policy for requests made with this
+                session. Defaults to no retries, like `requests.Session`.
+        """
+        session = requests.Session()
+        adapter = _SharedPoolAdapter(self, max_retries=max_retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return per-host request and connection counts.
+
+        `reused` is the number of requests that were sent over an existing
+        keep-alive connection instead of opening a new one.
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        with self.poolmanager.pools.lock:
+            pools = list(self.poolmanager.pools._container.values())
+        for pool in pools:
+            host = f"{pool.scheme}://{pool.host}:{pool.port}"
+            host_stats = stats.setdefault(
+                host, {"requests": 0, "connections": 0, "reused": 0}
+            )
+            host_stats["requests"] += pool.num_requests
+            host_stats["connections"] += pool.num_connections
+            host_stats["reused"] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
+    def close(self) -> None:
+        logger.debug(f"Closing shared HTTP transport, stats: {self.stats()}")
+        self.poolmanager.clear()
+
+
+_transport: Optional[SharedTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> SharedTransport:
+    """Return the process-wide transport, creating it on first use."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = SharedTransport(
+                pool_connections=env.get_http_pool_connections(),
+                pool_maxsize=env.get_http_pool_maxsize(),
+                max_concurrency_per_host=env.get_http_max_concurrency_per_host(),
+            )
+        return _transport
+
+
+def _after_fork_in_child() -> None:
+    global _transport_lock
+    # The lock may have been held by another thread when the process forked.
+    _transport_lock = threading.Lock()
+    if _transport is not None:
+        _transport._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def new_session(
+    max_retries: Union[int, urllib3.util.retry.Retry] = 0,
+) -> requests.Session:
+    """Create a session backed by the process-wide transport."""
+    return get_transport().new_session(max_retries=max_retries)
@@ -16,9 +16,8 @@ from typing import Any, Callable, Dict, List, Optional
 
 import psutil
 
-import wandb
-import wandb.util
 from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import internal
 from wandb.sdk.internal.settings_static import SettingsStatic
 from wandb.sdk.lib import progress
 from wandb.sdk.lib.mailbox import (
@@ -211,7 +210,7 @@ class StreamMux:
         # run_id = action.stream_id  # will want to fix if a streamid != runid
         settings = action._data
         thread = StreamThread(
-            target=wandb.wandb_sdk.internal.internal.wandb_internal,  # type: ignore
+            target=internal.wandb_internal,
             kwargs=dict(
                 settings=settings,
                 record_q=stream._record_q,
@@ -9,14 +9,20 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import click
 import requests
-from wandb_gql import gql
 
 import wandb
+from wandb import util
 from wandb.sdk.artifacts.artifact import Artifact
 from wandb.sdk.lib import runid
 
 from ...apis.internal import Api
 
+reset_path = util.vendor_setup()
+
+from wandb_gql import gql  # noqa: E402
+
+reset_path()
+
 PROJECT_NAME = "verify"
 GET_RUN_MAX_TIME = 10
 MIN_RETRYS = 3
@@ -11,6 +11,7 @@ from wandb.util import (
 )
 
 from . import wandb_helper
+from .data_types.base_types.wb_value import WBValue
 from .lib import config_util
 
 logger = logging.getLogger("wandb")
@@ -271,7 +272,7 @@ class Config:
     def _sanitize(self, key, val, allow_val_change=None):
         # TODO: enable WBValues in the config in the future
         # refuse all WBValues which is all Media and Histograms
-        if isinstance(val, wandb.sdk.data_types.base_types.wb_value.WBValue):
+        if isinstance(val, WBValue):
             raise ValueError("WBValue objects cannot be added to the run config")
         # Let jupyter change config freely by default
         if self._settings and self._settings._jupyter and allow_val_change is None:
@@ -15,7 +15,6 @@ from typing import Optional, Sequence, Union
 import wandb
 from wandb.env import _REQUIRE_LEGACY_SERVICE
 from wandb.errors import UnsupportedError
-from wandb.sdk import wandb_run
 from wandb.sdk.lib.wburls import wburls
 
 
@@ -33,6 +32,8 @@ class _Requires:
         pass
 
     def _require_service(self) -> None:
+        from wandb.sdk import wandb_run
+
         wandb.teardown = wandb._teardown  # type: ignore
         wandb.attach = wandb._attach  # type: ignore
         wandb_run.Run.detach = wandb_run.Run._detach  # type: ignore
@@ -92,6 +93,8 @@ def require(
 
 def _import_module_hook() -> None:
     """On wandb import, setup anything needed based on parent process require calls."""
-    # TODO: optimize by caching which pids this has been done for or use real import hooks
-    # TODO: make this more generic, but for now this works
-    require("service")
+    # The service features are always enabled. Of what `require("service")`
+    # sets up, `wandb.attach` is served lazily by the wandb module and
+    # `Run.detach` is defined on the class, so that importing wandb doesn't
+    # import wandb_run.
+    wandb.teardown = wandb._teardown  # type: ignore
@@ -292,7 +292,9 @@ class RunStatusChecker:
             if stop_status.run_should_stop:
                 # TODO(frz): This check is required
                 # until WB-3606 is resolved on server side.
-                if not wandb.agents.pyagent.is_running():  # type: ignore
+                from wandb.agents.pyagent import is_running
+
+                if not is_running():
                     thread.interrupt_main()
                     return
 
@@ -2918,6 +2920,8 @@ class Run:
     def _detach(self) -> None:
         pass
 
+    detach = _detach
+
     @_run_decorator._noop_on_finish()
     @_run_decorator._attach
     def link_artifact(
@@ -15,8 +15,7 @@ import tempfile
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from distutils.util import strtobool
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import (
     Any,
     Callable,
@@ -39,7 +38,6 @@ from google.protobuf.wrappers_pb2 import BoolValue, DoubleValue, Int32Value, Str
 import wandb
 import wandb.env
 from wandb import util
-from wandb.apis.internal import Api
 from wandb.errors import UsageError
 from wandb.proto import wandb_settings_pb2
 from wandb.sdk.internal.system.env_probe_helpers import is_aws_lambda
@@ -99,7 +97,7 @@ def _str_as_bool(val: Union[str, bool]) -> bool:
     if isinstance(val, bool):
         return val
     try:
-        ret_val = bool(strtobool(str(val)))
+        ret_val = bool(wandb.env.strtobool(str(val)))
         return ret_val
     except (AttributeError, ValueError):
         pass
@@ -486,6 +484,111 @@ class SettingsData:
     wandb_dir: str
 
 
+def _type_validator(type_hint: Any) -> Callable[[Any], bool]:
+    """Return a function that checks whether a value matches a type hint.
+
+    Most settings are plain classes or optional plain classes, which are
+    checked with a single isinstance call instead of `is_instance_recursive`.
+    """
+    if type_hint is Any:
+        return lambda value: True
+
+    origin = get_origin(type_hint)
+    if origin is None and isinstance(type_hint, type):
+        return lambda value: isinstance(value, type_hint)
+    if origin is Union:
+        args = get_args(type_hint)
+        if all(get_origin(arg) is None and isinstance(arg, type) for arg in args):
+            return lambda value: isinstance(value, args)
+
+    def helper(value: Any) -> bool:
+        try:
+            is_valid = is_instance_recursive(value, type_hint)
+        except Exception:
+            # instance check failed, but let's not crash and only print a warning
+            is_valid = False
+
+        return is_valid
+
+    return helper
+
+
+@lru_cache(maxsize=None)
+def _settings_type_validators() -> Dict[str, Callable[[Any], bool]]:
+    """Return the type validator for each setting, built once per process."""
+    return {
+        name: _type_validator(type_hint)
+        for name, type_hint in get_type_hints(SettingsData).items()
+    }
+
+
+@lru_cache(maxsize=32)
+def _parse_config_file(
+    file_name: str, section: str, mtime_ns: int, size: int
+) -> Dict[str, Any]:
+    """Parse a settings file; the modification time and size invalidate the cache."""
+    parser = configparser.ConfigParser()
+    parser.add_section(section)
+    parser.read(file_name)
+    config: Dict[str, Any] = dict()
+    for k in parser[section]:
+        config[k] = parser[section][k]
+        # TODO (cvp): we didn't do this in the old cli, but it seems necessary
+        if k == "ignore_globs":
+            config[k] = config[k].split(",")
+    return config
+
+
+_SPECIAL_ENV_VAR_NAMES = {
+    "WANDB_TRACELOG": "_tracelog",
+    "WANDB_DISABLE_SERVICE": "_disable_service",
+    "WANDB_SERVICE_TRANSPORT": "_service_transport",
+    "WANDB_DIR": "root_dir",
+    "WANDB_NAME": "run_name",
+    "WANDB_NOTES": "run_notes",
+    "WANDB_TAGS": "run_tags",
+    "WANDB_JOB_TYPE": "run_job_type",
+    "WANDB_HTTP_TIMEOUT": "_graphql_timeout_seconds",
+    "WANDB_FILE_PUSHER_TIMEOUT": "_file_transfer_timeout_seconds",
+    "WANDB_USER_EMAIL": "email",
+}
+
+
+@lru_cache(maxsize=8)
+def _parse_env_vars(
+    env_vars: Tuple[Tuple[str, str], ...],
+) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """Map WANDB_* environment variables to settings.
+
+    Returns the settings and the names of the variables that don't match any
+    setting.
+    """
+    env_prefix = "WANDB_"
+    known_settings = _settings_type_validators()
+    env: Dict[str, Any] = dict()
+    unknown = []
+    for setting, value in env_vars:
+        if setting in _SPECIAL_ENV_VAR_NAMES:
+            key = _SPECIAL_ENV_VAR_NAMES[setting]
+        else:
+            # otherwise, strip the prefix and convert to lowercase
+            key = setting[len(env_prefix) :].lower()
+
+        if key in known_settings:
+            if key in ("ignore_globs", "run_tags"):
+                env[key] = value.split(",")
+            else:
+                env[key] = value
+        else:
+            unknown.append(setting)
+    return env, tuple(unknown)
+
+
+def _copy_lists(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow-copy a cached settings dict so callers can't modify the cache."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in settings.items()}
+
+
 class Property:
     """A class to represent attributes (individual settings) of the Settings object.
 
@@ -498,6 +601,17 @@ class Property:
     E.g. if `is_policy` is True, the smallest `Source` value takes precedence.
     """
 
+    # Set through __dict__ in __init__, so declared here for type checkers.
+    name: str
+    _preprocessor: Union[Callable, Sequence[Callable], None]
+    _validator: Union[Callable, Sequence[Callable], None]
+    _hook: Union[Callable, Sequence[Callable], None]
+    _auto_hook: bool
+    _is_policy: bool
+    _source: int
+    _value: Any
+    __frozen: bool
+
     def __init__(  # pylint: disable=unused-argument
         self,
         name: str,
@@ -514,18 +628,21 @@ class Property:
         source: int = Source.BASE,
         **kwargs: Any,
     ):
-        self.name = name
-        self._preprocessor = preprocessor
-        self._validator = validator
-        self._hook = hook
-        self._auto_hook = auto_hook
-        self._is_policy = is_policy
-        self._source = source
+        # Settings creates one Property per setting, so bypass __setattr__ here
+        self.__dict__.update(
+            name=name,
+            _preprocessor=preprocessor,
+            _validator=validator,
+            _hook=hook,
+            _auto_hook=auto_hook,
+            _is_policy=is_policy,
+            _source=source,
+        )
 
         # preprocess and validate value
-        self._value = self._validate(self._preprocess(value))
+        self.__dict__["_value"] = self._validate(self._preprocess(value))
 
-        self.__frozen = frozen
+        self.__dict__["_Property__frozen"] = frozen
 
     @property
     def value(self) -> Any:
@@ -991,19 +1108,9 @@ class Settings(SettingsData):
 
     # helper methods for validating values
     @staticmethod
-    def _validator_factory(hint: Any) -> Callable[[Any], bool]:  # noqa: C901
+    def _validator_factory(hint: Any) -> Callable[[Any], bool]:
         """Return a factory for setting type validators."""
-
-        def helper(value: Any) -> bool:
-            try:
-                is_valid = is_instance_recursive(value, hint)
-            except Exception:
-                # instance check failed, but let's not crash and only print a warning
-                is_valid = False
-
-            return is_valid
-
-        return helper
+        return _type_validator(hint)
 
     @staticmethod
     def _validate_mode(value: str) -> bool:
@@ -1267,6 +1374,8 @@ class Settings(SettingsData):
             return self._jupyter_path
 
     def _get_url_query_string(self) -> str:
+        from wandb.apis.internal import Api
+
         # TODO(settings) use `wandb_setting` (if self.anonymous != "true":)
         if Api().settings().get("anonymous") != "true":
             return ""
@@ -1341,15 +1450,15 @@ class Settings(SettingsData):
         # Type hints of class attributes are used to generate a type validator function
         # for runtime checks for each attribute.
         # These are defaults, using Source.BASE for non-policy attributes and Source.RUN for policies.
-        for prop, type_hint in get_type_hints(SettingsData).items():
-            validators = [self._validator_factory(type_hint)]
+        for prop, type_validator in _settings_type_validators().items():
+            validators = [type_validator]
 
             if prop in default_props:
                 validator = default_props[prop].pop("validator", [])
                 # Property validator could be either Callable or Sequence[Callable]
                 if callable(validator):
                     validators.append(validator)
-                elif isinstance(validator, Sequence):
+                elif isinstance(validator, collections.abc.Sequence):
                     validators.extend(list(validator))
                 object.__setattr__(
                     self,
@@ -1430,19 +1539,16 @@ class Settings(SettingsData):
 
         Note that the copied object will not be frozen  todo? why is this needed?
         """
-        # get attributes that are instances of the Property class:
-        attributes = {k: v for k, v in self.__dict__.items() if isinstance(v, Property)}
         new = Settings()
-        # update properties that have deps or are dependent on in the topologically-sorted order
-        for prop in self.__modification_order:
-            new.update({prop: attributes[prop]._value}, source=attributes[prop].source)
-            attributes.pop(prop)
-
-        # update the remaining attributes
-        for k, v in attributes.items():
-            # make sure to use the raw property value (v._value),
-            # not the potential result of runtime hooks applied to it (v.value)
-            new.update({k: v._value}, source=v.source)
+        for k, v in self.__dict__.items():
+            if isinstance(v, Property):
+                # The values were preprocessed and validated when they were set,
+                # so copy them over as they are instead of going through update().
+                # Make sure to use the raw property value (v._value),
+                # not the potential result of runtime hooks applied to it (v.value)
+                prop = new.__dict__[k]
+                prop._value = v._value
+                prop._source = v._source
         new.unfreeze()
 
         return new
@@ -1556,12 +1662,8 @@ class Settings(SettingsData):
 
     def to_proto(self) -> wandb_settings_pb2.Settings:
         """Generate a protobuf representation of the settings."""
-        from dataclasses import fields
-
         settings = wandb_settings_pb2.Settings()
-        for field in fields(SettingsData):
-            k = field.name
-            v = getattr(self, k)
+        for k, v in self.to_dict().items():
             # special case for _stats_open_metrics_filters
             if k == "_stats_open_metrics_filters":
                 if isinstance(v, (list, set, tuple)):
@@ -1635,16 +1737,13 @@ class Settings(SettingsData):
 
     @staticmethod
     def _load_config_file(file_name: str, section: str = "default") -> dict:
-        parser = configparser.ConfigParser()
-        parser.add_section(section)
-        parser.read(file_name)
-        config: Dict[str, Any] = dict()
-        for k in parser[section]:
-            config[k] = parser[section][k]
-            # TODO (cvp): we didn't do this in the old cli, but it seems necessary
-            if k == "ignore_globs":
-                config[k] = config[k].split(",")
-        return config
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            return {}
+        return _copy_lists(
+            _parse_config_file(file_name, section, stat.st_mtime_ns, stat.st_size)
+        )
 
     def _apply_base(self, pid: int, _logger: Optional[_EarlyLogger] = None) -> None:
         if _logger is not None:
@@ -1675,38 +1774,17 @@ class Settings(SettingsData):
         _logger: Optional[_EarlyLogger] = None,
     ) -> None:
         env_prefix: str = "WANDB_"
-        special_env_var_names = {
-            "WANDB_TRACELOG": "_tracelog",
-            "WANDB_DISABLE_SERVICE": "_disable_service",
-            "WANDB_SERVICE_TRANSPORT": "_service_transport",
-            "WANDB_DIR": "root_dir",
-            "WANDB_NAME": "run_name",
-            "WANDB_NOTES": "run_notes",
-            "WANDB_TAGS": "run_tags",
-            "WANDB_JOB_TYPE": "run_job_type",
-            "WANDB_HTTP_TIMEOUT": "_graphql_timeout_seconds",
-            "WANDB_FILE_PUSHER_TIMEOUT": "_file_transfer_timeout_seconds",
-            "WANDB_USER_EMAIL": "email",
-        }
-        env = dict()
-        for setting, value in environ.items():
-            if not setting.startswith(env_prefix):
-                continue
-
-            if setting in special_env_var_names:
-                key = special_env_var_names[setting]
-            else:
-                # otherwise, strip the prefix and convert to lowercase
-                key = setting[len(env_prefix) :].lower()
-
-            if key in self.__dict__:
-                if key in ("ignore_globs", "run_tags"):
-                    value = value.split(",")
-                env[key] = value
-            elif _logger is not None:
-                _logger.warning(f"Unknown environment variable: {setting}")
-
+        env, unknown = _parse_env_vars(
+            tuple(
+                (setting, value)
+                for setting, value in environ.items()
+                if setting.startswith(env_prefix)
+            )
+        )
+        env = _copy_lists(env)
         if _logger is not None:
+            for setting in unknown:
+                _logger.warning(f"Unknown environment variable: {setting}")
             _logger.info(
                 f"Loading settings from environment variables: {_redact_dict(env)}"
             )
@@ -1323,7 +1323,7 @@ def download_file_from_url(
     if os.sep in dest_path:
         filesystem.mkdir_exists_ok(os.path.dirname(dest_path))
     with fsync_open(dest_path, "wb") as file:
-        for data in response.iter_content(chunk_size=1024):
+        for data in response.iter_content(chunk_size=1024 * 1024):
             file.write(data)
 
 